@@ -17,11 +17,15 @@ A cache is useful for two reasons:
 
 from __future__ import annotations
 
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, Literal
 
-from typing_extensions import override
+from typing_extensions import TypedDict, override
 
 from langchain_core.outputs import Generation
 from langchain_core.runnables import run_in_executor
@@ -45,6 +49,18 @@ class BaseCache(ABC):
     and provide async implementations to avoid unnecessary overhead.
     """
 
+    hash_prompt_keys: bool = False
+    """Whether chat models may pass a hash of the messages as the `prompt` key.
+
+    By default, chat models serialize the whole conversation to build the `prompt`
+    key, which is costly for long conversations. Caches that set this to `True`
+    receive a fixed-size BLAKE2 digest of the messages instead. Message ids are
+    ignored in both cases.
+
+    Keys built one way never match keys built the other way, so toggling this
+    invalidates existing entries.
+    """
+
     @abstractmethod
     def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
         """Look up based on `prompt` and `llm_string`.
@@ -152,9 +168,43 @@ class BaseCache(ABC):
         return await run_in_executor(None, self.clear, **kwargs)
 
 
+class InMemoryCacheStats(TypedDict):
+    """Counters reported by `InMemoryCache.stats`."""
+
+    hits: int
+    """Number of lookups that returned a cached value."""
+
+    misses: int
+    """Number of lookups that found no live entry."""
+
+    evictions: int
+    """Number of entries removed to respect `maxsize` or `max_bytes`."""
+
+    expirations: int
+    """Number of entries dropped because their `ttl` elapsed."""
+
+    size: int
+    """Number of entries currently stored."""
+
+    bytes: int
+    """Approximate memory held by the stored prompts, keys and generation texts."""
+
+
+def _entry_size(prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> int:
+    """Approximate the memory held by a cache entry, in bytes."""
+    return (
+        sys.getsizeof(prompt)
+        + sys.getsizeof(llm_string)
+        + sum(sys.getsizeof(generation.text) for generation in return_val)
+    )
+
+
 class InMemoryCache(BaseCache):
     """Cache that stores things in memory.
 
+    All operations are O(1) and thread-safe, so a single cache can be shared by
+    concurrent `batch` calls.
+
     Example:
         ```python
         from langchain_core.caches import InMemoryCache
@@ -177,9 +227,29 @@ class InMemoryCache(BaseCache):
         )
         # result is [Generation(text="Paris")]
         ```
+
+    Example:
+        ```python
+        # Keep the 10,000 most recently used entries, for at most an hour each,
+        # within roughly 100 MB.
+        cache = InMemoryCache(
+            maxsize=10_000, policy="lru", ttl=3600, max_bytes=100_000_000
+        )
+        cache.stats()
+        # {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'size': 0,
+        #  'bytes': 0}
+        ```
     """
 
-    def __init__(self, *, maxsize: int | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        maxsize: int | None = None,
+        policy: Literal["fifo", "lru"] = "fifo",
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        hash_prompt_keys: bool = False,
+    ) -> None:
         """Initialize with empty cache.
 
         Args:
@@ -187,16 +257,96 @@ class InMemoryCache(BaseCache):
 
                 If `None`, the cache has no maximum size.
 
-                If the cache exceeds the maximum size, the oldest items are removed.
+                If the cache exceeds the maximum size, items are evicted according
+                to `policy`.
+            policy: Which item to evict when the cache is full.
+
+                `'fifo'` evicts the oldest inserted item. `'lru'` evicts the least
+                recently used item; lookups and updates count as uses.
+            ttl: Time-to-live of an item in seconds, measured from its last update.
+
+                If `None`, items do not expire.
+            max_bytes: Approximate memory budget for the cache, in bytes.
+
+                Items are evicted according to `policy` until the cache fits.
+                Items larger than the whole budget are not cached.
+            hash_prompt_keys: Whether chat models should pass a hash of the
+                messages instead of their serialization as the `prompt` key.
+
+                See `BaseCache.hash_prompt_keys`.
 
         Raises:
-            ValueError: If `maxsize` is less than or equal to `0`.
+            ValueError: If `maxsize`, `ttl` or `max_bytes` is less than or equal to
+                `0`, or if `policy` is not supported.
         """
-        self._cache: dict[tuple[str, str], RETURN_VAL_TYPE] = {}
+        self._cache: OrderedDict[tuple[str, str], RETURN_VAL_TYPE] = OrderedDict()
         if maxsize is not None and maxsize <= 0:
             msg = "maxsize must be greater than 0"
             raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = "ttl must be greater than 0"
+            raise ValueError(msg)
+        if max_bytes is not None and max_bytes <= 0:
+            msg = "max_bytes must be greater than 0"
+            raise ValueError(msg)
+        if policy not in {"fifo", "lru"}:
+            msg = f"policy must be 'fifo' or 'lru', got {policy!r}"
+            raise ValueError(msg)
         self._maxsize = maxsize
+        self._policy = policy
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self.hash_prompt_keys = hash_prompt_keys
+        self._expires_at: dict[tuple[str, str], float] = {}
+        self._sizes: dict[tuple[str, str], int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state for pickling and copying, without the lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state and create a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _pop(self, key: tuple[str, str]) -> None:
+        """Remove `key` and its bookkeeping. Must be called with the lock held."""
+        del self._cache[key]
+        self._expires_at.pop(key, None)
+        self._bytes -= self._sizes.pop(key)
+
+    def _evict(self) -> None:
+        """Evict items until within limits. Must be called with the lock held."""
+        while self._cache and (
+            (self._maxsize is not None and len(self._cache) > self._maxsize)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            self._pop(next(iter(self._cache)))
+            self._evictions += 1
+
+    def stats(self) -> InMemoryCacheStats:
+        """Return hit, miss and eviction counters along with the current size.
+
+        Returns:
+            A snapshot of the cache statistics.
+        """
+        with self._lock:
+            return InMemoryCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._cache),
+                bytes=self._bytes,
+            )
 
     def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
         """Look up based on `prompt` and `llm_string`.
@@ -211,7 +361,21 @@ class InMemoryCache(BaseCache):
         Returns:
             On a cache miss, return `None`. On a cache hit, return the cached value.
         """
-        return self._cache.get((prompt, llm_string), None)
+        key = (prompt, llm_string)
+        with self._lock:
+            return_val = self._cache.get(key)
+            if return_val is None:
+                self._misses += 1
+                return None
+            if self._ttl is not None and self._expires_at[key] <= time.monotonic():
+                self._pop(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            if self._policy == "lru":
+                self._cache.move_to_end(key)
+            self._hits += 1
+            return return_val
 
     def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
         """Update cache based on `prompt` and `llm_string`.
@@ -226,14 +390,33 @@ class InMemoryCache(BaseCache):
 
                 The value is a list of `Generation` (or subclasses).
         """
-        if self._maxsize is not None and len(self._cache) == self._maxsize:
-            del self._cache[next(iter(self._cache))]
-        self._cache[prompt, llm_string] = return_val
+        key = (prompt, llm_string)
+        size = _entry_size(prompt, llm_string, return_val)
+        with self._lock:
+            if self._max_bytes is not None and size > self._max_bytes:
+                if key in self._cache:
+                    self._pop(key)
+                return
+            self._bytes += size - self._sizes.get(key, 0)
+            self._cache[key] = return_val
+            self._sizes[key] = size
+            if self._policy == "lru":
+                self._cache.move_to_end(key)
+            if self._ttl is not None:
+                self._expires_at[key] = time.monotonic() + self._ttl
+            self._evict()
 
     @override
     def clear(self, **kwargs: Any) -> None:
-        """Clear cache."""
-        self._cache = {}
+        """Clear cache.
+
+        Hit, miss and eviction counters are kept.
+        """
+        with self._lock:
+            self._cache = OrderedDict()
+            self._expires_at = {}
+            self._sizes = {}
+            self._bytes = 0
 
     async def alookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
         """Async look up based on `prompt` and `llm_string`.
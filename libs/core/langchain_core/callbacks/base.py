@@ -509,6 +509,13 @@ class BaseCallbackHandler(
     run_inline: bool = False
     """Whether to run the callback inline."""
 
+    run_in_background: bool = False
+    """Whether sync code may dispatch the async callbacks without waiting for them.
+
+    The callbacks still start in the order they are dispatched, but may not finish
+    before the run continues. Pending callbacks are waited for at interpreter exit.
+    """
+
     @property
     def ignore_llm(self) -> bool:
         """Whether to ignore LLM callbacks."""
@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import concurrent.futures
 import functools
 import inspect
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Mapping
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager
-from contextvars import copy_context
+from contextvars import ContextVar, copy_context
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from typing_extensions import Self, override
@@ -301,6 +304,7 @@ def handle_event(
 
     """
     coros: list[Coroutine[Any, Any, Any]] = []
+    background_coros: list[Coroutine[Any, Any, Any]] = []
 
     try:
         message_strings: list[str] | None = None
@@ -315,7 +319,10 @@ def handle_event(
                             event = _achat_model_start_fallback(
                                 event, handler, *args, **kwargs
                             )
-                        coros.append(event)
+                        if handler.run_in_background:
+                            background_coros.append(event)
+                        else:
+                            coros.append(event)
             except NotImplementedError as e:
                 if event_name == "on_chat_model_start":
                     if message_strings is None:
@@ -347,24 +354,72 @@ def handle_event(
                 if handler.raise_error:
                     raise
     finally:
-        if coros:
+        if coros or background_coros:
             try:
-                # Raises RuntimeError if there is no current event loop.
-                asyncio.get_running_loop()
-                loop_running = True
+                if background_coros:
+                    _callback_loop().submit(background_coros, wait=False)
+                    background_coros = []
+                if coros:
+                    _callback_loop().submit(coros, wait=True)
             except RuntimeError:
-                loop_running = False
-
-            if loop_running:
-                # If we try to submit this coroutine to the running loop
-                # we end up in a deadlock, as we'd have gotten here from a
-                # running coroutine, which we cannot interrupt to run this one.
-                # The solution is to run the synchronous function on the globally shared
-                # thread pool executor to avoid blocking the main event loop.
-                _executor().submit(copy_context().run, _run_coros, coros).result()
-            else:
-                # If there's no running loop, we can run the coroutines directly.
-                _run_coros(coros)
+                # From the callback loop's thread, e.g. if an async handler invokes
+                # sync code, or once the callback loop is shut down at exit.
+                _run_coros_in_new_loop(background_coros + coros)
+
+
+def _run_coros_in_new_loop(coros: list[Coroutine[Any, Any, Any]]) -> None:
+    try:
+        # Raises RuntimeError if there is no current event loop.
+        asyncio.get_running_loop()
+        loop_running = True
+    except RuntimeError:
+        loop_running = False
+
+    if loop_running:
+        # If we try to submit this coroutine to the running loop
+        # we end up in a deadlock, as we'd have gotten here from a
+        # running coroutine, which we cannot interrupt to run this one.
+        # The solution is to run the synchronous function on the globally shared
+        # thread pool executor to avoid blocking the main event loop.
+        _executor().submit(copy_context().run, _run_coros, coros).result()
+    else:
+        # If there's no running loop, we can run the coroutines directly.
+        _run_coros(coros)
+
+
+_callback_tasks: ContextVar[list[asyncio.Task[Any]] | None] = ContextVar(
+    "_callback_tasks", default=None
+)
+
+
+async def _arun_coros(coros: list[Coroutine[Any, Any, Any]]) -> None:
+    """Run `coros` in order, then wait for the tasks they created, like `_run_coros`.
+
+    The same caveat about exceptions applies.
+    """
+    tasks: list[asyncio.Task[Any]] = []
+    _callback_tasks.set(tasks)
+    for coro in coros:
+        try:
+            await coro
+        except Exception as e:
+            logger.warning("Error in callback coroutine: %s", repr(e))
+
+    while tasks:
+        pending = tasks.copy()
+        tasks.clear()
+        await asyncio.wait(pending)
+
+
+def _create_callback_task(
+    loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, Any], **kwargs: Any
+) -> asyncio.Task[Any]:
+    """Task factory recording the tasks created by callbacks for `_arun_coros`."""
+    task = asyncio.Task(coro, loop=loop, **kwargs)
+    tasks = _callback_tasks.get()
+    if tasks is not None:
+        tasks.append(task)
+    return task
 
 
 def _run_coros(coros: list[Coroutine[Any, Any, Any]]) -> None:
@@ -2810,6 +2865,84 @@ def dispatch_custom_event(
     )
 
 
+class _CallbackLoop:
+    """A long-lived event loop thread for async callbacks dispatched from sync code.
+
+    Running them in a new event loop for every event, or on an executor thread when
+    one is already running, costs far more than the callbacks themselves usually do.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_task_factory(_create_callback_task)  # type: ignore[arg-type]
+        self._pending: set[Future[None]] = set()
+        self._closed = False
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="langchain-callbacks", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, coros: list[Coroutine[Any, Any, Any]], *, wait: bool) -> None:
+        """Run `coros` in order on the loop, in a copy of the current context.
+
+        Args:
+            coros: The coroutines to run.
+            wait: Whether to wait for them to finish.
+
+        Raises:
+            RuntimeError: If the loop is shut down, or if waiting from its own thread,
+                which would never finish.
+        """
+        if wait and threading.current_thread() is self._thread:
+            msg = "Cannot wait for callbacks on the callback loop's own thread."
+            raise RuntimeError(msg)
+        future: Future[None] = Future()
+
+        def start() -> None:
+            task = self._loop.create_task(_arun_coros(coros))
+            task.add_done_callback(lambda _: future.set_result(None))
+
+        with self._lock:
+            if self._closed:
+                msg = "The callback loop is shut down."
+                raise RuntimeError(msg)
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        self._loop.call_soon_threadsafe(start, context=copy_context())
+        if wait:
+            future.result()
+
+    def _discard(self, future: Future[None]) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def shutdown(self) -> None:
+        """Wait for the dispatched coroutines to finish, then stop the loop."""
+        if os.getpid() != self._pid:
+            # The loop's thread does not survive forking.
+            return
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending)
+        concurrent.futures.wait(pending)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _callback_loop() -> _CallbackLoop:
+    callback_loop = _CallbackLoop()
+    atexit.register(callback_loop.shutdown)
+    return callback_loop
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_callback_loop.cache_clear)
+
+
 @functools.lru_cache(maxsize=1)
 def _executor() -> ThreadPoolExecutor:
     # If the user is specifying ASYNC callback handlers to be run from a
@@ -10,7 +10,12 @@ from typing import TYPE_CHECKING
 from langchain_core._import_utils import import_attr
 
 if TYPE_CHECKING:
-    from langchain_core.indexing.api import IndexingResult, aindex, index
+    from langchain_core.indexing.api import (
+        IndexingResult,
+        aindex,
+        hash_documents,
+        index,
+    )
     from langchain_core.indexing.base import (
         DeleteResponse,
         DocumentIndex,
@@ -27,11 +32,13 @@ __all__ = (
     "RecordManager",
     "UpsertResponse",
     "aindex",
+    "hash_documents",
     "index",
 )
 
 _dynamic_imports = {
     "aindex": "api",
+    "hash_documents": "api",
     "index": "api",
     "IndexingResult": "api",
     "DeleteResponse": "base",
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import json
 import uuid
 import warnings
-from itertools import islice
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -20,6 +25,7 @@ from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
 from langchain_core.exceptions import LangChainException
 from langchain_core.indexing.base import DocumentIndex, RecordManager
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from langchain_core.vectorstores import VectorStore
 
 if TYPE_CHECKING:
@@ -31,6 +37,7 @@ if TYPE_CHECKING:
         Iterator,
         Sequence,
     )
+    from concurrent.futures import Future
 
 # Magic UUID to use as a namespace for hashing.
 # Used to try and generate a unique UUID for each document
@@ -154,14 +161,34 @@ class IndexingException(LangChainException):
     """Raised when an indexing operation fails."""
 
 
+# SHA-1 state after hashing the namespace, copied to build uuid5 strings without
+# going through `uuid.UUID`.
+_UUID5_NAMESPACE_HASHER = hashlib.sha1(NAMESPACE_UUID.bytes, usedforsecurity=False)
+
+# Hashing work below this many documents per worker is not worth a process hop.
+_MIN_DOCUMENTS_PER_WORKER = 256
+
+
+def _uuid5(name: str) -> str:
+    """Return `str(uuid.uuid5(NAMESPACE_UUID, name))`."""
+    hasher = _UUID5_NAMESPACE_HASHER.copy()
+    hasher.update(name.encode("utf-8"))
+    digest = bytearray(hasher.digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # Version 5.
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant.
+    hex_ = digest.hex()
+    return f"{hex_[:8]}-{hex_[8:12]}-{hex_[12:16]}-{hex_[16:20]}-{hex_[20:]}"
+
+
 def _calculate_hash(
     text: str, algorithm: Literal["sha1", "sha256", "sha512", "blake2b"]
 ) -> str:
     """Return a hexadecimal digest of *text* using *algorithm*."""
     if algorithm == "sha1":
         # Calculate the SHA-1 hash and return it as a UUID.
-        digest = hashlib.sha1(text.encode("utf-8"), usedforsecurity=False).hexdigest()
-        return str(uuid.uuid5(NAMESPACE_UUID, digest))
+        return _uuid5(
+            hashlib.sha1(text.encode("utf-8"), usedforsecurity=False).hexdigest()
+        )
     if algorithm == "blake2b":
         return hashlib.blake2b(text.encode("utf-8")).hexdigest()
     if algorithm == "sha256":
@@ -172,6 +199,49 @@ def _calculate_hash(
     raise ValueError(msg)
 
 
+@functools.lru_cache(maxsize=1024)
+def _calculate_metadata_hash(
+    serialized_metadata: str, algorithm: Literal["sha1", "sha256", "sha512", "blake2b"]
+) -> str:
+    """Hash serialized metadata, which is often shared by many documents."""
+    return _calculate_hash(serialized_metadata, algorithm)
+
+
+def _calculate_document_hash(
+    page_content: str,
+    metadata: dict[str, Any] | None,
+    algorithm: Literal["sha1", "sha256", "sha512", "blake2b"],
+) -> str:
+    """Hash the content and the metadata of a document into its ID.
+
+    Raises:
+        ValueError: If the metadata cannot be serialized using json.
+    """
+    try:
+        serialized_meta = json.dumps(metadata or {}, sort_keys=True)
+    except Exception as e:
+        msg = (
+            f"Failed to hash metadata: {e}. "
+            f"Please use a dict that can be serialized using json."
+        )
+        raise ValueError(msg) from e
+    # The hashes are calculated separate for the content and the metadata.
+    content_hash = _calculate_hash(page_content, algorithm)
+    metadata_hash = _calculate_metadata_hash(serialized_meta, algorithm)
+    return _calculate_hash(content_hash + metadata_hash, algorithm)
+
+
+def _calculate_document_hashes(
+    contents: list[tuple[str, dict[str, Any] | None]],
+    algorithm: Literal["sha1", "sha256", "sha512", "blake2b"],
+) -> list[str]:
+    """Hash a chunk of `(page_content, metadata)` pairs in a worker process."""
+    return [
+        _calculate_document_hash(page_content, metadata, algorithm)
+        for page_content, metadata in contents
+    ]
+
+
 def _get_document_with_hash(
     document: Document,
     *,
@@ -203,24 +273,13 @@ def _get_document_with_hash(
     Returns:
         Document with a unique identifier based on the hash of the content and metadata.
     """
-    metadata: dict[str, Any] = dict(document.metadata or {})
-
     if callable(key_encoder):
         # If key_encoder is a callable, we use it to generate the hash.
         hash_ = key_encoder(document)
     else:
-        # The hashes are calculated separate for the content and the metadata.
-        content_hash = _calculate_hash(document.page_content, algorithm=key_encoder)
-        try:
-            serialized_meta = json.dumps(metadata, sort_keys=True)
-        except Exception as e:
-            msg = (
-                f"Failed to hash metadata: {e}. "
-                f"Please use a dict that can be serialized using json."
-            )
-            raise ValueError(msg) from e
-        metadata_hash = _calculate_hash(serialized_meta, algorithm=key_encoder)
-        hash_ = _calculate_hash(content_hash + metadata_hash, algorithm=key_encoder)
+        hash_ = _calculate_document_hash(
+            document.page_content, document.metadata, key_encoder
+        )
 
     return Document(
         # Assign a unique identifier based on the hash.
@@ -230,6 +289,133 @@ def _get_document_with_hash(
     )
 
 
+def _get_documents_with_hash(
+    documents: Sequence[Document],
+    *,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    max_workers: int | None = None,
+) -> list[Document]:
+    """Hash a batch of documents, optionally across a process pool."""
+    workers = min(max_workers or 1, len(documents) // _MIN_DOCUMENTS_PER_WORKER)
+    if callable(key_encoder) or workers <= 1:
+        return [
+            _get_document_with_hash(document, key_encoder=key_encoder)
+            for document in documents
+        ]
+
+    # Only plain content and metadata are sent to the workers, a few chunks per
+    # worker so that uneven document sizes still balance out.
+    chunk_size = -(-len(documents) // (workers * 4))
+    chunks = [
+        [(doc.page_content, doc.metadata) for doc in documents[i : i + chunk_size]]
+        for i in range(0, len(documents), chunk_size)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        hashes = executor.map(
+            functools.partial(_calculate_document_hashes, algorithm=key_encoder),
+            chunks,
+        )
+        ids = list(chain.from_iterable(hashes))
+
+    return [
+        Document(id=id_, page_content=doc.page_content, metadata=doc.metadata)
+        for id_, doc in zip(ids, documents, strict=True)
+    ]
+
+
+def hash_documents(
+    documents: Sequence[Document],
+    *,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"] = "sha1",
+    max_workers: int | None = None,
+) -> list[Document]:
+    """Assign content-based IDs to documents, as done by `index` and `aindex`.
+
+    The IDs are the same as the ones `index` and `aindex` compute with the same
+    `key_encoder`, so the result can be used to look documents up in a record
+    manager or to precompute IDs for a large corpus.
+
+    Args:
+        documents: Documents to hash.
+        key_encoder: Hashing algorithm to use for hashing the documents, or a
+            function that returns the ID of a document. Defaults to SHA-1, which
+            is not collision-resistant; see `index` for details.
+        max_workers: Maximum number of processes to hash the documents with.
+
+            Large batches of documents hashed with one of the predefined
+            algorithms are split across a process pool. Small batches and custom
+            `key_encoder` functions are always hashed in the calling process.
+
+            If `None`, the documents are hashed in the calling process.
+
+    Raises:
+        ValueError: If the metadata of a document cannot be serialized using json.
+        ValueError: If `max_workers` is not a positive integer.
+
+    Returns:
+        Copies of the documents with their `id` set to the hash of their content
+        and metadata, in the same order.
+    """
+    if max_workers is not None and max_workers < 1:
+        msg = f"max_workers must be a positive integer, got {max_workers}."
+        raise ValueError(msg)
+    if key_encoder == "sha1":
+        _warn_about_sha1()
+    return _get_documents_with_hash(
+        documents, key_encoder=key_encoder, max_workers=max_workers
+    )
+
+
+def _hash_batch(
+    doc_batch: list[Document],
+    *,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    source_id_assigner: Callable[[Document], str | None],
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    scoped_full_cleanup_source_ids: set[str],
+) -> tuple[list[Document], Sequence[str | None]]:
+    """Hash and deduplicate a batch of documents and assign their source IDs.
+
+    Source IDs seen in `scoped_full` mode are added to
+    `scoped_full_cleanup_source_ids`.
+
+    Raises:
+        ValueError: If a document has no source ID and the cleanup mode needs one.
+
+    Returns:
+        The deduplicated hashed documents and their source IDs.
+    """
+    hashed_docs = list(
+        _deduplicate_in_order(
+            _get_documents_with_hash(doc_batch, key_encoder=key_encoder)
+        )
+    )
+
+    source_ids: Sequence[str | None] = [
+        source_id_assigner(hashed_doc) for hashed_doc in hashed_docs
+    ]
+
+    if cleanup in {"incremental", "scoped_full"}:
+        # Source IDs are required.
+        for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
+            if source_id is None:
+                msg = (
+                    f"Source IDs are required when cleanup mode is "
+                    f"incremental or scoped_full. "
+                    f"Document that starts with "
+                    f"content: {hashed_doc.page_content[:100]} "
+                    f"was not assigned as source id."
+                )
+                raise ValueError(msg)
+            if cleanup == "scoped_full":
+                scoped_full_cleanup_source_ids.add(source_id)
+
+    return hashed_docs, source_ids
+
+
 # This internal abstraction was imported by the langchain package internally, so
 # we keep it here for backwards compatibility.
 class _HashedDocument:
@@ -277,6 +463,236 @@ def _delete(
         raise TypeError(msg)
 
 
+@dataclass
+class _PendingBatch:
+    """A batch of hashed documents whose records have not been committed yet."""
+
+    hashed_docs: list[Document]
+    ids: list[str]
+    source_ids: Sequence[str | None]
+    docs_to_index: list[Document]
+    """Documents to write to the vector store."""
+    uids_to_refresh: list[str]
+    """IDs that already exist and only need their timestamp refreshed."""
+    force_updated: set[str]
+    """IDs that already exist but are rewritten because of `force_update`."""
+    stale: set[str] = field(default_factory=set)
+    """IDs deleted by an earlier batch's cleanup after this batch was planned."""
+
+    def mark_stale(self, deleted_ids: Iterable[str]) -> None:
+        """Record IDs deleted by the incremental cleanup of an earlier batch.
+
+        The batch was planned against the record manager before that cleanup ran,
+        so documents it expected to find may have been removed since.
+        """
+        ids = set(self.ids)
+        self.stale.update(uid for uid in deleted_ids if uid in ids)
+
+    def mark_recorded(self, recorded_ids: Iterable[str]) -> None:
+        """Clear stale IDs that an earlier batch has written and recorded again.
+
+        Those documents are back in the vector store and the record manager, so
+        this batch finds them as it would have when running sequentially.
+        """
+        self.stale.difference_update(recorded_ids)
+
+    def stale_documents(self) -> list[Document]:
+        """Return existing documents removed by a cleanup that must be rewritten."""
+        if not self.stale:
+            return []
+        existing = self.force_updated.union(self.uids_to_refresh)
+        return [
+            doc
+            for doc in self.hashed_docs
+            if doc.id in self.stale and doc.id in existing
+        ]
+
+    def add_counts(self, result: IndexingResult) -> None:
+        """Add this batch to `result` as if it was planned after earlier cleanups."""
+        stale_updated = len(self.stale & self.force_updated)
+        stale_refreshed = len(self.stale.intersection(self.uids_to_refresh))
+        result["num_added"] += (
+            len(self.docs_to_index)
+            - len(self.force_updated)
+            + stale_updated
+            + stale_refreshed
+        )
+        result["num_updated"] += len(self.force_updated) - stale_updated
+        result["num_skipped"] += len(self.uids_to_refresh) - stale_refreshed
+
+
+def _plan_batch(
+    hashed_docs: list[Document],
+    source_ids: Sequence[str | None],
+    exists_batch: Iterable[bool],
+    *,
+    force_update: bool,
+) -> _PendingBatch:
+    """Split a batch into documents to write and documents to refresh."""
+    ids = [cast("str", doc.id) for doc in hashed_docs]
+    docs_to_index: list[Document] = []
+    uids_to_refresh: list[str] = []
+    force_updated: set[str] = set()
+    for hashed_doc, hashed_id, doc_exists in zip(
+        hashed_docs, ids, exists_batch, strict=False
+    ):
+        if doc_exists:
+            if force_update:
+                force_updated.add(hashed_id)
+            else:
+                uids_to_refresh.append(hashed_id)
+                continue
+        docs_to_index.append(hashed_doc)
+    return _PendingBatch(
+        hashed_docs=hashed_docs,
+        ids=ids,
+        source_ids=source_ids,
+        docs_to_index=docs_to_index,
+        uids_to_refresh=uids_to_refresh,
+        force_updated=force_updated,
+    )
+
+
+def _release(uncommitted: Counter[str], ids: Iterable[str]) -> None:
+    """Remove one occurrence of each ID from the uncommitted IDs."""
+    for uid in ids:
+        if uncommitted[uid] > 1:
+            uncommitted[uid] -= 1
+        else:
+            del uncommitted[uid]
+
+
+def _write(
+    destination: VectorStore | DocumentIndex,
+    docs: list[Document],
+    *,
+    batch_size: int,
+    upsert_kwargs: dict[str, Any] | None,
+) -> None:
+    """Write documents to a vector store or document index."""
+    if isinstance(destination, VectorStore):
+        destination.add_documents(
+            docs,
+            ids=[cast("str", doc.id) for doc in docs],
+            batch_size=batch_size,
+            **(upsert_kwargs or {}),
+        )
+    elif isinstance(destination, DocumentIndex):
+        destination.upsert(docs, **(upsert_kwargs or {}))
+
+
+def _index_concurrently(
+    doc_batches: Iterable[list[Document]],
+    record_manager: RecordManager,
+    destination: VectorStore | DocumentIndex,
+    *,
+    index_start_dt: float,
+    max_concurrency: int,
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    source_id_assigner: Callable[[Document], str | None],
+    scoped_full_cleanup_source_ids: set[str],
+    cleanup_batch_size: int,
+    force_update: bool,
+    batch_size: int,
+    upsert_kwargs: dict[str, Any] | None,
+) -> IndexingResult:
+    """Index batches with up to `max_concurrency` vector store writes in flight.
+
+    Batches are hashed and checked against the record manager on the calling thread
+    while earlier batches are written on a thread pool. Records are updated and
+    incremental cleanup runs in batch order once a batch's write has finished, so
+    the record manager goes through the same states as when indexing one batch at
+    a time.
+    """
+    result: IndexingResult = {
+        "num_added": 0,
+        "num_updated": 0,
+        "num_skipped": 0,
+        "num_deleted": 0,
+    }
+    pending: deque[tuple[_PendingBatch, Future[None] | None]] = deque()
+    # IDs of planned batches that are not committed yet. A later batch treats them
+    # as existing, as it would have found their records had it run sequentially.
+    uncommitted: Counter[str] = Counter()
+
+    def commit(batch: _PendingBatch, write: Future[None] | None) -> None:
+        if write is not None:
+            write.result()
+        _release(uncommitted, batch.ids)
+        if stale_docs := batch.stale_documents():
+            _write(
+                destination,
+                stale_docs,
+                batch_size=batch_size,
+                upsert_kwargs=upsert_kwargs,
+            )
+        batch.add_counts(result)
+        record_manager.update(
+            batch.ids, group_ids=batch.source_ids, time_at_least=index_start_dt
+        )
+        for later_batch, _ in pending:
+            later_batch.mark_recorded(batch.ids)
+        if cleanup == "incremental":
+            while uids_to_delete := record_manager.list_keys(
+                group_ids=cast("Sequence[str]", batch.source_ids),
+                before=index_start_dt,
+                limit=cleanup_batch_size,
+            ):
+                _delete(destination, uids_to_delete)
+                record_manager.delete_keys(uids_to_delete)
+                result["num_deleted"] += len(uids_to_delete)
+                for later_batch, _ in pending:
+                    later_batch.mark_stale(uids_to_delete)
+
+    executor = ContextThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        for doc_batch in doc_batches:
+            hashed_docs, source_ids = _hash_batch(
+                doc_batch,
+                key_encoder=key_encoder,
+                source_id_assigner=source_id_assigner,
+                cleanup=cleanup,
+                scoped_full_cleanup_source_ids=scoped_full_cleanup_source_ids,
+            )
+            result["num_skipped"] += len(doc_batch) - len(hashed_docs)
+            ids = [cast("str", doc.id) for doc in hashed_docs]
+            exists_batch = record_manager.exists(ids)
+            batch = _plan_batch(
+                hashed_docs,
+                source_ids,
+                [
+                    doc_exists or uncommitted[uid] > 0
+                    for uid, doc_exists in zip(ids, exists_batch, strict=False)
+                ],
+                force_update=force_update,
+            )
+            write = (
+                executor.submit(
+                    _write,
+                    destination,
+                    batch.docs_to_index,
+                    batch_size=batch_size,
+                    upsert_kwargs=upsert_kwargs,
+                )
+                if batch.docs_to_index
+                else None
+            )
+            uncommitted.update(batch.ids)
+            pending.append((batch, write))
+            while len(pending) > max_concurrency:
+                commit(*pending.popleft())
+        while pending:
+            commit(*pending.popleft())
+    finally:
+        for _, write in pending:
+            if write is not None:
+                write.cancel()
+        executor.shutdown(wait=True)
+    return result
+
+
 # PUBLIC API
 
 
@@ -306,6 +722,7 @@ def index(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
 ) -> IndexingResult:
     """Index data from the loader into the vector store.
 
@@ -388,6 +805,16 @@ def index(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in `langchain-core` 0.3.10"
+        max_concurrency: Maximum number of batches to write to the vector store
+            at the same time.
+
+            When set, upcoming batches are hashed and checked against the record
+            manager while earlier batches are embedded and written on a thread
+            pool. Records are still updated and cleaned up in batch order, so the
+            result is the same as indexing one batch at a time. The vector store
+            must support concurrent writes.
+
+            If `None`, batches are indexed one at a time.
 
     Returns:
         Indexing result which contains information about how many documents
@@ -399,6 +826,7 @@ def index(
         ValueError: If `VectorStore` does not have
             "delete" and "add_documents" required methods.
         ValueError: If source_id_key is not None, but is not a string or callable.
+        ValueError: If `max_concurrency` is not a positive integer.
         TypeError: If `vectorstore` is not a `VectorStore` or a DocumentIndex.
         AssertionError: If `source_id` is None when cleanup mode is incremental.
             (should be unreachable code).
@@ -421,6 +849,10 @@ def index(
         )
         raise ValueError(msg)
 
+    if max_concurrency is not None and max_concurrency < 1:
+        msg = f"max_concurrency must be a positive integer, got {max_concurrency}."
+        raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -467,118 +899,119 @@ def index(
     num_deleted = 0
     scoped_full_cleanup_source_ids: set[str] = set()
 
-    for doc_batch in _batch(batch_size, doc_iterator):
-        # Track original batch size before deduplication
-        original_batch_size = len(doc_batch)
-
-        hashed_docs = list(
-            _deduplicate_in_order(
-                [
-                    _get_document_with_hash(doc, key_encoder=key_encoder)
-                    for doc in doc_batch
-                ]
-            )
+    if max_concurrency is not None:
+        result = _index_concurrently(
+            _batch(batch_size, doc_iterator),
+            record_manager,
+            destination,
+            index_start_dt=index_start_dt,
+            max_concurrency=max_concurrency,
+            cleanup=cleanup,
+            key_encoder=key_encoder,
+            source_id_assigner=source_id_assigner,
+            scoped_full_cleanup_source_ids=scoped_full_cleanup_source_ids,
+            cleanup_batch_size=cleanup_batch_size,
+            force_update=force_update,
+            batch_size=batch_size,
+            upsert_kwargs=upsert_kwargs,
         )
-        # Count documents removed by within-batch deduplication
-        num_skipped += original_batch_size - len(hashed_docs)
+        num_added = result["num_added"]
+        num_updated = result["num_updated"]
+        num_skipped = result["num_skipped"]
+        num_deleted = result["num_deleted"]
+    else:
+        for doc_batch in _batch(batch_size, doc_iterator):
+            # Track original batch size before deduplication
+            original_batch_size = len(doc_batch)
+
+            hashed_docs, source_ids = _hash_batch(
+                doc_batch,
+                key_encoder=key_encoder,
+                source_id_assigner=source_id_assigner,
+                cleanup=cleanup,
+                scoped_full_cleanup_source_ids=scoped_full_cleanup_source_ids,
+            )
+            # Count documents removed by within-batch deduplication
+            num_skipped += original_batch_size - len(hashed_docs)
 
-        source_ids: Sequence[str | None] = [
-            source_id_assigner(hashed_doc) for hashed_doc in hashed_docs
-        ]
+            exists_batch = record_manager.exists(
+                cast("Sequence[str]", [doc.id for doc in hashed_docs])
+            )
 
-        if cleanup in {"incremental", "scoped_full"}:
-            # Source IDs are required.
-            for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
-                if source_id is None:
-                    msg = (
-                        f"Source IDs are required when cleanup mode is "
-                        f"incremental or scoped_full. "
-                        f"Document that starts with "
-                        f"content: {hashed_doc.page_content[:100]} "
-                        f"was not assigned as source id."
+            # Filter out documents that already exist in the record store.
+            uids = []
+            docs_to_index = []
+            uids_to_refresh = []
+            seen_docs: set[str] = set()
+            for hashed_doc, doc_exists in zip(hashed_docs, exists_batch, strict=False):
+                hashed_id = cast("str", hashed_doc.id)
+                if doc_exists:
+                    if force_update:
+                        seen_docs.add(hashed_id)
+                    else:
+                        uids_to_refresh.append(hashed_id)
+                        continue
+                uids.append(hashed_id)
+                docs_to_index.append(hashed_doc)
+
+            # Update refresh timestamp
+            if uids_to_refresh:
+                record_manager.update(uids_to_refresh, time_at_least=index_start_dt)
+                num_skipped += len(uids_to_refresh)
+
+            # Be pessimistic and assume that all vector store write will fail.
+            # First write to vector store
+            if docs_to_index:
+                if isinstance(destination, VectorStore):
+                    destination.add_documents(
+                        docs_to_index,
+                        ids=uids,
+                        batch_size=batch_size,
+                        **(upsert_kwargs or {}),
                     )
-                    raise ValueError(msg)
-                if cleanup == "scoped_full":
-                    scoped_full_cleanup_source_ids.add(source_id)
-            # Source IDs cannot be None after for loop above.
-            source_ids = cast("Sequence[str]", source_ids)
-
-        exists_batch = record_manager.exists(
-            cast("Sequence[str]", [doc.id for doc in hashed_docs])
-        )
-
-        # Filter out documents that already exist in the record store.
-        uids = []
-        docs_to_index = []
-        uids_to_refresh = []
-        seen_docs: set[str] = set()
-        for hashed_doc, doc_exists in zip(hashed_docs, exists_batch, strict=False):
-            hashed_id = cast("str", hashed_doc.id)
-            if doc_exists:
-                if force_update:
-                    seen_docs.add(hashed_id)
-                else:
-                    uids_to_refresh.append(hashed_id)
-                    continue
-            uids.append(hashed_id)
-            docs_to_index.append(hashed_doc)
-
-        # Update refresh timestamp
-        if uids_to_refresh:
-            record_manager.update(uids_to_refresh, time_at_least=index_start_dt)
-            num_skipped += len(uids_to_refresh)
-
-        # Be pessimistic and assume that all vector store write will fail.
-        # First write to vector store
-        if docs_to_index:
-            if isinstance(destination, VectorStore):
-                destination.add_documents(
-                    docs_to_index,
-                    ids=uids,
-                    batch_size=batch_size,
-                    **(upsert_kwargs or {}),
-                )
-            elif isinstance(destination, DocumentIndex):
-                destination.upsert(
-                    docs_to_index,
-                    **(upsert_kwargs or {}),
-                )
-
-            num_added += len(docs_to_index) - len(seen_docs)
-            num_updated += len(seen_docs)
-
-        # And only then update the record store.
-        # Update ALL records, even if they already exist since we want to refresh
-        # their timestamp.
-        record_manager.update(
-            cast("Sequence[str]", [doc.id for doc in hashed_docs]),
-            group_ids=source_ids,
-            time_at_least=index_start_dt,
-        )
-
-        # If source IDs are provided, we can do the deletion incrementally!
-        if cleanup == "incremental":
-            # Get the uids of the documents that were not returned by the loader.
-            # mypy isn't good enough to determine that source IDs cannot be None
-            # here due to a check that's happening above, so we check again.
-            for source_id in source_ids:
-                if source_id is None:
-                    msg = (
-                        "source_id cannot be None at this point. "
-                        "Reached unreachable code."
+                elif isinstance(destination, DocumentIndex):
+                    destination.upsert(
+                        docs_to_index,
+                        **(upsert_kwargs or {}),
                     )
-                    raise AssertionError(msg)
 
-            source_ids_ = cast("Sequence[str]", source_ids)
+                num_added += len(docs_to_index) - len(seen_docs)
+                num_updated += len(seen_docs)
 
-            while uids_to_delete := record_manager.list_keys(
-                group_ids=source_ids_, before=index_start_dt, limit=cleanup_batch_size
-            ):
-                # Then delete from vector store.
-                _delete(destination, uids_to_delete)
-                # First delete from record store.
-                record_manager.delete_keys(uids_to_delete)
-                num_deleted += len(uids_to_delete)
+            # And only then update the record store.
+            # Update ALL records, even if they already exist since we want to refresh
+            # their timestamp.
+            record_manager.update(
+                cast("Sequence[str]", [doc.id for doc in hashed_docs]),
+                group_ids=source_ids,
+                time_at_least=index_start_dt,
+            )
+
+            # If source IDs are provided, we can do the deletion incrementally!
+            if cleanup == "incremental":
+                # Get the uids of the documents that were not returned by the loader.
+                # mypy isn't good enough to determine that source IDs cannot be None
+                # here due to a check that's happening above, so we check again.
+                for source_id in source_ids:
+                    if source_id is None:
+                        msg = (
+                            "source_id cannot be None at this point. "
+                            "Reached unreachable code."
+                        )
+                        raise AssertionError(msg)
+
+                source_ids_ = cast("Sequence[str]", source_ids)
+
+                while uids_to_delete := record_manager.list_keys(
+                    group_ids=source_ids_,
+                    before=index_start_dt,
+                    limit=cleanup_batch_size,
+                ):
+                    # Then delete from vector store.
+                    _delete(destination, uids_to_delete)
+                    # First delete from record store.
+                    record_manager.delete_keys(uids_to_delete)
+                    num_deleted += len(uids_to_delete)
 
     if cleanup == "full" or (
         cleanup == "scoped_full" and scoped_full_cleanup_source_ids
@@ -632,6 +1065,133 @@ async def _adelete(
         raise TypeError(msg)
 
 
+async def _awrite(
+    destination: VectorStore | DocumentIndex,
+    docs: list[Document],
+    *,
+    batch_size: int,
+    upsert_kwargs: dict[str, Any] | None,
+) -> None:
+    """Write documents to a vector store or document index."""
+    if isinstance(destination, VectorStore):
+        await destination.aadd_documents(
+            docs,
+            ids=[cast("str", doc.id) for doc in docs],
+            batch_size=batch_size,
+            **(upsert_kwargs or {}),
+        )
+    elif isinstance(destination, DocumentIndex):
+        await destination.aupsert(docs, **(upsert_kwargs or {}))
+
+
+async def _aindex_concurrently(
+    doc_batches: AsyncIterable[list[Document]],
+    record_manager: RecordManager,
+    destination: VectorStore | DocumentIndex,
+    *,
+    index_start_dt: float,
+    max_concurrency: int,
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    key_encoder: Callable[[Document], str]
+    | Literal["sha1", "sha256", "sha512", "blake2b"],
+    source_id_assigner: Callable[[Document], str | None],
+    scoped_full_cleanup_source_ids: set[str],
+    cleanup_batch_size: int,
+    force_update: bool,
+    batch_size: int,
+    upsert_kwargs: dict[str, Any] | None,
+) -> IndexingResult:
+    """Index batches with up to `max_concurrency` vector store writes in flight.
+
+    Async counterpart of `_index_concurrently`, writing batches in tasks.
+    """
+    result: IndexingResult = {
+        "num_added": 0,
+        "num_updated": 0,
+        "num_skipped": 0,
+        "num_deleted": 0,
+    }
+    pending: deque[tuple[_PendingBatch, asyncio.Task[None] | None]] = deque()
+    # IDs of planned batches that are not committed yet. A later batch treats them
+    # as existing, as it would have found their records had it run sequentially.
+    uncommitted: Counter[str] = Counter()
+
+    async def commit(batch: _PendingBatch, write: asyncio.Task[None] | None) -> None:
+        if write is not None:
+            await write
+        _release(uncommitted, batch.ids)
+        if stale_docs := batch.stale_documents():
+            await _awrite(
+                destination,
+                stale_docs,
+                batch_size=batch_size,
+                upsert_kwargs=upsert_kwargs,
+            )
+        batch.add_counts(result)
+        await record_manager.aupdate(
+            batch.ids, group_ids=batch.source_ids, time_at_least=index_start_dt
+        )
+        for later_batch, _ in pending:
+            later_batch.mark_recorded(batch.ids)
+        if cleanup == "incremental":
+            while uids_to_delete := await record_manager.alist_keys(
+                group_ids=cast("Sequence[str]", batch.source_ids),
+                before=index_start_dt,
+                limit=cleanup_batch_size,
+            ):
+                await _adelete(destination, uids_to_delete)
+                await record_manager.adelete_keys(uids_to_delete)
+                result["num_deleted"] += len(uids_to_delete)
+                for later_batch, _ in pending:
+                    later_batch.mark_stale(uids_to_delete)
+
+    try:
+        async for doc_batch in doc_batches:
+            hashed_docs, source_ids = _hash_batch(
+                doc_batch,
+                key_encoder=key_encoder,
+                source_id_assigner=source_id_assigner,
+                cleanup=cleanup,
+                scoped_full_cleanup_source_ids=scoped_full_cleanup_source_ids,
+            )
+            result["num_skipped"] += len(doc_batch) - len(hashed_docs)
+            ids = [cast("str", doc.id) for doc in hashed_docs]
+            exists_batch = await record_manager.aexists(ids)
+            batch = _plan_batch(
+                hashed_docs,
+                source_ids,
+                [
+                    doc_exists or uncommitted[uid] > 0
+                    for uid, doc_exists in zip(ids, exists_batch, strict=False)
+                ],
+                force_update=force_update,
+            )
+            write = (
+                asyncio.create_task(
+                    _awrite(
+                        destination,
+                        batch.docs_to_index,
+                        batch_size=batch_size,
+                        upsert_kwargs=upsert_kwargs,
+                    )
+                )
+                if batch.docs_to_index
+                else None
+            )
+            uncommitted.update(batch.ids)
+            pending.append((batch, write))
+            while len(pending) > max_concurrency:
+                await commit(*pending.popleft())
+        while pending:
+            await commit(*pending.popleft())
+    finally:
+        writes = [write for _, write in pending if write is not None]
+        for write in writes:
+            write.cancel()
+        await asyncio.gather(*writes, return_exceptions=True)
+    return result
+
+
 async def aindex(
     docs_source: BaseLoader | Iterable[Document] | AsyncIterator[Document],
     record_manager: RecordManager,
@@ -645,6 +1205,7 @@ async def aindex(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
 ) -> IndexingResult:
     """Async index data from the loader into the vector store.
 
@@ -727,6 +1288,16 @@ async def aindex(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in `langchain-core` 0.3.10"
+        max_concurrency: Maximum number of batches to write to the vector store
+            at the same time.
+
+            When set, upcoming batches are hashed and checked against the record
+            manager while earlier batches are embedded and written in separate
+            tasks. Records are still updated and cleaned up in batch order, so the
+            result is the same as indexing one batch at a time. The vector store
+            must support concurrent writes.
+
+            If `None`, batches are indexed one at a time.
 
     Returns:
         Indexing result which contains information about how many documents
@@ -738,6 +1309,7 @@ async def aindex(
         ValueError: If `VectorStore` does not have
             "adelete" and "aadd_documents" required methods.
         ValueError: If source_id_key is not None, but is not a string or callable.
+        ValueError: If `max_concurrency` is not a positive integer.
         TypeError: If `vector_store` is not a `VectorStore` or DocumentIndex.
         AssertionError: If `source_id_key` is None when cleanup mode is
             incremental or `scoped_full` (should be unreachable).
@@ -760,6 +1332,10 @@ async def aindex(
         )
         raise ValueError(msg)
 
+    if max_concurrency is not None and max_concurrency < 1:
+        msg = f"max_concurrency must be a positive integer, got {max_concurrency}."
+        raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -817,119 +1393,122 @@ async def aindex(
     num_deleted = 0
     scoped_full_cleanup_source_ids: set[str] = set()
 
-    async for doc_batch in _abatch(batch_size, async_doc_iterator):
-        # Track original batch size before deduplication
-        original_batch_size = len(doc_batch)
-
-        hashed_docs = list(
-            _deduplicate_in_order(
-                [
-                    _get_document_with_hash(doc, key_encoder=key_encoder)
-                    for doc in doc_batch
-                ]
-            )
+    if max_concurrency is not None:
+        result = await _aindex_concurrently(
+            _abatch(batch_size, async_doc_iterator),
+            record_manager,
+            destination,
+            index_start_dt=index_start_dt,
+            max_concurrency=max_concurrency,
+            cleanup=cleanup,
+            key_encoder=key_encoder,
+            source_id_assigner=source_id_assigner,
+            scoped_full_cleanup_source_ids=scoped_full_cleanup_source_ids,
+            cleanup_batch_size=cleanup_batch_size,
+            force_update=force_update,
+            batch_size=batch_size,
+            upsert_kwargs=upsert_kwargs,
         )
-        # Count documents removed by within-batch deduplication
-        num_skipped += original_batch_size - len(hashed_docs)
-
-        source_ids: Sequence[str | None] = [
-            source_id_assigner(doc) for doc in hashed_docs
-        ]
+        num_added = result["num_added"]
+        num_updated = result["num_updated"]
+        num_skipped = result["num_skipped"]
+        num_deleted = result["num_deleted"]
+    else:
+        async for doc_batch in _abatch(batch_size, async_doc_iterator):
+            # Track original batch size before deduplication
+            original_batch_size = len(doc_batch)
+
+            hashed_docs, source_ids = _hash_batch(
+                doc_batch,
+                key_encoder=key_encoder,
+                source_id_assigner=source_id_assigner,
+                cleanup=cleanup,
+                scoped_full_cleanup_source_ids=scoped_full_cleanup_source_ids,
+            )
+            # Count documents removed by within-batch deduplication
+            num_skipped += original_batch_size - len(hashed_docs)
 
-        if cleanup in {"incremental", "scoped_full"}:
-            # If the cleanup mode is incremental, source IDs are required.
-            for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
-                if source_id is None:
-                    msg = (
-                        f"Source IDs are required when cleanup mode is "
-                        f"incremental or scoped_full. "
-                        f"Document that starts with "
-                        f"content: {hashed_doc.page_content[:100]} "
-                        f"was not assigned as source id."
-                    )
-                    raise ValueError(msg)
-                if cleanup == "scoped_full":
-                    scoped_full_cleanup_source_ids.add(source_id)
-            # Source IDs cannot be None after for loop above.
-            source_ids = cast("Sequence[str]", source_ids)
-
-        exists_batch = await record_manager.aexists(
-            cast("Sequence[str]", [doc.id for doc in hashed_docs])
-        )
+            exists_batch = await record_manager.aexists(
+                cast("Sequence[str]", [doc.id for doc in hashed_docs])
+            )
 
-        # Filter out documents that already exist in the record store.
-        uids: list[str] = []
-        docs_to_index: list[Document] = []
-        uids_to_refresh = []
-        seen_docs: set[str] = set()
-        for hashed_doc, doc_exists in zip(hashed_docs, exists_batch, strict=False):
-            hashed_id = cast("str", hashed_doc.id)
-            if doc_exists:
-                if force_update:
-                    seen_docs.add(hashed_id)
-                else:
-                    uids_to_refresh.append(hashed_id)
-                    continue
-            uids.append(hashed_id)
-            docs_to_index.append(hashed_doc)
-
-        if uids_to_refresh:
-            # Must be updated to refresh timestamp.
-            await record_manager.aupdate(uids_to_refresh, time_at_least=index_start_dt)
-            num_skipped += len(uids_to_refresh)
-
-        # Be pessimistic and assume that all vector store write will fail.
-        # First write to vector store
-        if docs_to_index:
-            if isinstance(destination, VectorStore):
-                await destination.aadd_documents(
-                    docs_to_index,
-                    ids=uids,
-                    batch_size=batch_size,
-                    **(upsert_kwargs or {}),
-                )
-            elif isinstance(destination, DocumentIndex):
-                await destination.aupsert(
-                    docs_to_index,
-                    **(upsert_kwargs or {}),
+            # Filter out documents that already exist in the record store.
+            uids: list[str] = []
+            docs_to_index: list[Document] = []
+            uids_to_refresh = []
+            seen_docs: set[str] = set()
+            for hashed_doc, doc_exists in zip(hashed_docs, exists_batch, strict=False):
+                hashed_id = cast("str", hashed_doc.id)
+                if doc_exists:
+                    if force_update:
+                        seen_docs.add(hashed_id)
+                    else:
+                        uids_to_refresh.append(hashed_id)
+                        continue
+                uids.append(hashed_id)
+                docs_to_index.append(hashed_doc)
+
+            if uids_to_refresh:
+                # Must be updated to refresh timestamp.
+                await record_manager.aupdate(
+                    uids_to_refresh, time_at_least=index_start_dt
                 )
-            num_added += len(docs_to_index) - len(seen_docs)
-            num_updated += len(seen_docs)
-
-        # And only then update the record store.
-        # Update ALL records, even if they already exist since we want to refresh
-        # their timestamp.
-        await record_manager.aupdate(
-            cast("Sequence[str]", [doc.id for doc in hashed_docs]),
-            group_ids=source_ids,
-            time_at_least=index_start_dt,
-        )
-
-        # If source IDs are provided, we can do the deletion incrementally!
-
-        if cleanup == "incremental":
-            # Get the uids of the documents that were not returned by the loader.
-
-            # mypy isn't good enough to determine that source IDs cannot be None
-            # here due to a check that's happening above, so we check again.
-            for source_id in source_ids:
-                if source_id is None:
-                    msg = (
-                        "source_id cannot be None at this point. "
-                        "Reached unreachable code."
+                num_skipped += len(uids_to_refresh)
+
+            # Be pessimistic and assume that all vector store write will fail.
+            # First write to vector store
+            if docs_to_index:
+                if isinstance(destination, VectorStore):
+                    await destination.aadd_documents(
+                        docs_to_index,
+                        ids=uids,
+                        batch_size=batch_size,
+                        **(upsert_kwargs or {}),
                     )
-                    raise AssertionError(msg)
-
-            source_ids_ = cast("Sequence[str]", source_ids)
+                elif isinstance(destination, DocumentIndex):
+                    await destination.aupsert(
+                        docs_to_index,
+                        **(upsert_kwargs or {}),
+                    )
+                num_added += len(docs_to_index) - len(seen_docs)
+                num_updated += len(seen_docs)
+
+            # And only then update the record store.
+            # Update ALL records, even if they already exist since we want to refresh
+            # their timestamp.
+            await record_manager.aupdate(
+                cast("Sequence[str]", [doc.id for doc in hashed_docs]),
+                group_ids=source_ids,
+                time_at_least=index_start_dt,
+            )
 
-            while uids_to_delete := await record_manager.alist_keys(
-                group_ids=source_ids_, before=index_start_dt, limit=cleanup_batch_size
-            ):
-                # Then delete from vector store.
-                await _adelete(destination, uids_to_delete)
-                # First delete from record store.
-                await record_manager.adelete_keys(uids_to_delete)
-                num_deleted += len(uids_to_delete)
+            # If source IDs are provided, we can do the deletion incrementally!
+
+            if cleanup == "incremental":
+                # Get the uids of the documents that were not returned by the loader.
+
+                # mypy isn't good enough to determine that source IDs cannot be None
+                # here due to a check that's happening above, so we check again.
+                for source_id in source_ids:
+                    if source_id is None:
+                        msg = (
+                            "source_id cannot be None at this point. "
+                            "Reached unreachable code."
+                        )
+                        raise AssertionError(msg)
+
+                source_ids_ = cast("Sequence[str]", source_ids)
+
+                while uids_to_delete := await record_manager.alist_keys(
+                    group_ids=source_ids_,
+                    before=index_start_dt,
+                    limit=cleanup_batch_size,
+                ):
+                    # Then delete from vector store.
+                    await _adelete(destination, uids_to_delete)
+                    # First delete from record store.
+                    await record_manager.adelete_keys(uids_to_delete)
+                    num_deleted += len(uids_to_delete)
 
     if cleanup == "full" or (
         cleanup == "scoped_full" and scoped_full_cleanup_source_ids
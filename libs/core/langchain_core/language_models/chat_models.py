@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import builtins  # noqa: TC003  # runtime-evaluated; subclass `dict()` shadows the builtin
 import contextlib
+import hashlib
 import inspect
 import json
 from abc import ABC, abstractmethod
@@ -52,6 +53,7 @@ from langchain_core.language_models.model_profile import (
     _warn_unknown_profile_keys,
 )
 from langchain_core.load import dumpd, dumps
+from langchain_core.load.dump import default as _json_default
 from langchain_core.messages import (
     AIMessage,
     AIMessageChunk,
@@ -1575,16 +1577,32 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
         ls_params["ls_integration"] = "langchain_chat_model"
         return ls_params
 
+    @cached_property
+    def _serialized_llm_string(self) -> str:
+        # Derived from `_serialized`, so it is computed once per model instance.
+        serialized_repr = self._serialized
+        _cleanup_llm_representation(serialized_repr, 1)
+        return json.dumps(serialized_repr, sort_keys=True)
+
+    @cached_property
+    def _llm_string_memo(self) -> builtins.dict[Any, str]:
+        return {}
+
     def _get_llm_string(self, stop: list[str] | None = None, **kwargs: Any) -> str:
         if self.is_lc_serializable():
+            memo_key = _llm_string_memo_key(stop, kwargs)
+            if memo_key is not None and (
+                llm_string := self._llm_string_memo.get(memo_key)
+            ):
+                return llm_string
             params = {**kwargs, "stop": stop}
             param_string = str(sorted(params.items()))
-            # This code is not super efficient as it goes back and forth between
-            # json and dict.
-            serialized_repr = self._serialized
-            _cleanup_llm_representation(serialized_repr, 1)
-            llm_string = json.dumps(serialized_repr, sort_keys=True)
-            return llm_string + "---" + param_string
+            llm_string = self._serialized_llm_string + "---" + param_string
+            if memo_key is not None:
+                if len(self._llm_string_memo) >= _LLM_STRING_MEMO_SIZE:
+                    self._llm_string_memo.clear()
+                self._llm_string_memo[memo_key] = llm_string
+            return llm_string
         params = self._get_invocation_params(stop=stop, **kwargs)
         params = {**params, **kwargs}
         return str(sorted(params.items()))
@@ -1904,15 +1922,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
         if check_cache:
             if llm_cache is not None:
                 llm_string = self._get_llm_string(stop=stop, **kwargs)
-                normalized_messages = [
-                    (
-                        msg.model_copy(update={"id": None})
-                        if getattr(msg, "id", None) is not None
-                        else msg
-                    )
-                    for msg in messages
-                ]
-                prompt = dumps(normalized_messages)
+                prompt = _cache_prompt(messages, llm_cache)
                 cache_val = llm_cache.lookup(prompt, llm_string)
                 if isinstance(cache_val, list):
                     converted_generations = self._convert_cached_generations(cache_val)
@@ -2063,15 +2073,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
         if check_cache:
             if llm_cache is not None:
                 llm_string = self._get_llm_string(stop=stop, **kwargs)
-                normalized_messages = [
-                    (
-                        msg.model_copy(update={"id": None})
-                        if getattr(msg, "id", None) is not None
-                        else msg
-                    )
-                    for msg in messages
-                ]
-                prompt = dumps(normalized_messages)
+                prompt = _cache_prompt(messages, llm_cache)
                 cache_val = await llm_cache.alookup(prompt, llm_string)
                 if isinstance(cache_val, list):
                     converted_generations = self._convert_cached_generations(cache_val)
@@ -2720,6 +2722,68 @@ def _gen_info_and_msg_metadata(
     }
 
 
+_LLM_STRING_MEMO_SIZE = 128
+
+_MEMOIZABLE_PARAM_TYPES = (str, int, float, bool, type(None))
+
+
+def _llm_string_memo_key(stop: list[str] | None, kwargs: dict[str, Any]) -> Any:
+    """Return a hashable key for `_get_llm_string`, or `None` if not memoizable.
+
+    Only scalar keyword arguments are memoized. Their types are part of the key
+    because e.g. `1`, `1.0` and `True` are equal but produce different strings.
+    """
+    if not all(isinstance(value, _MEMOIZABLE_PARAM_TYPES) for value in kwargs.values()):
+        return None
+    return (
+        None if stop is None else tuple(stop),
+        tuple((key, type(value), value) for key, value in sorted(kwargs.items())),
+    )
+
+
+_EMPTY_JSON = {dict: "{}", list: "[]", type(None): "null"}
+
+
+def _hash_messages(messages: Sequence[BaseMessage]) -> str:
+    """Return a BLAKE2 digest of `messages` to use as a cache prompt key.
+
+    Message ids are ignored, matching the serialized prompt key. Every other field
+    is fed to the hash one message at a time, string values as-is and anything
+    else as JSON, with length prefixes so that distinct transcripts never produce
+    the same byte stream.
+    """
+    hasher = hashlib.blake2b(digest_size=32)
+    for message in messages:
+        parts = []
+        for name, value in message:
+            if name == "id":
+                continue
+            if isinstance(value, str):
+                text = "s" + value
+            elif not value and (empty := _EMPTY_JSON.get(type(value))):
+                text = "j" + empty
+            else:
+                text = "j" + json.dumps(value, sort_keys=True, default=_json_default)
+            parts.append(f"{len(name)}:{name}{len(text)}:{text}")
+        hasher.update(f"{len(parts)}|{''.join(parts)}".encode("utf-8", "surrogatepass"))
+    return "blake2b:" + hasher.hexdigest()
+
+
+def _cache_prompt(messages: Sequence[BaseMessage], llm_cache: BaseCache) -> str:
+    """Return the prompt key under which `messages` are cached in `llm_cache`."""
+    if llm_cache.hash_prompt_keys:
+        return _hash_messages(messages)
+    normalized_messages = [
+        (
+            msg.model_copy(update={"id": None})
+            if getattr(msg, "id", None) is not None
+            else msg
+        )
+        for msg in messages
+    ]
+    return dumps(normalized_messages)
+
+
 _MAX_CLEANUP_DEPTH = 100
 
 
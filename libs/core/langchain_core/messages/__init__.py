@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from langchain_core.messages.ai import (
         AIMessage,
         AIMessageChunk,
+        AIMessageChunkAccumulator,
         InputTokenDetails,
         OutputTokenDetails,
         UsageMetadata,
@@ -74,6 +75,7 @@ __all__ = (
     "LC_ID_PREFIX",
     "AIMessage",
     "AIMessageChunk",
+    "AIMessageChunkAccumulator",
     "Annotation",
     "AnyMessage",
     "AudioContentBlock",
@@ -132,6 +134,7 @@ __all__ = (
 _dynamic_imports = {
     "AIMessage": "ai",
     "AIMessageChunk": "ai",
+    "AIMessageChunkAccumulator": "ai",
     "Annotation": "content",
     "AudioContentBlock": "content",
     "BaseMessage": "base",
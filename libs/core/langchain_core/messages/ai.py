@@ -4,7 +4,7 @@ import itertools
 import json
 import logging
 import operator
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Any, Literal, cast, overload
 
 from pydantic import Field, model_validator
@@ -28,7 +28,7 @@ from langchain_core.messages.tool import invalid_tool_call as create_invalid_too
 from langchain_core.messages.tool import tool_call as create_tool_call
 from langchain_core.messages.tool import tool_call_chunk as create_tool_call_chunk
 from langchain_core.utils._merge import merge_dicts, merge_lists
-from langchain_core.utils.json import parse_partial_json
+from langchain_core.utils.json import _parse_partial_json_stream
 from langchain_core.utils.usage import _dict_int_op
 from langchain_core.utils.utils import LC_AUTO_PREFIX, LC_ID_PREFIX
 
@@ -554,7 +554,9 @@ class AIMessageChunk(AIMessage, BaseMessageChunk):
 
         for chunk in self.tool_call_chunks:
             try:
-                args_ = parse_partial_json(chunk["args"]) if chunk["args"] else {}
+                args_ = (
+                    _parse_partial_json_stream(chunk["args"]) if chunk["args"] else {}
+                )
                 if isinstance(args_, dict):
                     tool_calls.append(
                         create_tool_call(
@@ -732,6 +734,83 @@ def add_ai_message_chunks(
     )
 
 
+class AIMessageChunkAccumulator:
+    """Collects streamed `AIMessageChunk`s and merges them on demand.
+
+    Adding chunks one at a time with `+` copies the whole message so far on every
+    chunk, so aggregating a stream that way is quadratic in its length. The
+    accumulator only appends each chunk to a buffer, and `build` merges the buffer in
+    a single `add_ai_message_chunks` call, which joins the text of each content block
+    and the args of each tool call once.
+
+    `build` gives the same message as adding the chunks in order with `+`.
+
+    Example:
+        ```python
+        from langchain_core.messages import AIMessageChunkAccumulator
+
+        accumulator = AIMessageChunkAccumulator()
+        for chunk in model.stream("Tell me a joke"):
+            accumulator.append(chunk)
+        message = accumulator.build()
+        ```
+    """
+
+    def __init__(self, chunks: Iterable[AIMessageChunk] = ()) -> None:
+        """Create an accumulator.
+
+        Args:
+            chunks: Chunks to start with.
+        """
+        self._chunks: list[AIMessageChunk] = list(chunks)
+
+    def append(self, chunk: AIMessageChunk) -> None:
+        """Add a chunk to the end of the message.
+
+        Args:
+            chunk: The chunk to add.
+        """
+        self._chunks.append(chunk)
+
+    def extend(self, chunks: Iterable[AIMessageChunk]) -> None:
+        """Add chunks to the end of the message.
+
+        Args:
+            chunks: The chunks to add, in order.
+        """
+        self._chunks.extend(chunks)
+
+    def build(self) -> AIMessageChunk:
+        """Merge the chunks added so far into one `AIMessageChunk`.
+
+        The result replaces the merged chunks in the buffer, so building again after
+        appending more chunks only merges the new ones into it.
+
+        Returns:
+            The merged chunk.
+
+        Raises:
+            ValueError: If no chunks have been added.
+        """
+        if not self._chunks:
+            msg = "Cannot build a message from an empty accumulator."
+            raise ValueError(msg)
+        if len(self._chunks) > 1:
+            self._chunks = [add_ai_message_chunks(self._chunks[0], *self._chunks[1:])]
+        return self._chunks[0]
+
+    def __len__(self) -> int:
+        """Return the number of chunks waiting to be merged."""
+        return len(self._chunks)
+
+    def __iter__(self) -> Iterator[AIMessageChunk]:
+        """Iterate over the chunks waiting to be merged.
+
+        After `build`, the built chunk stands in for the chunks it was built from.
+        """
+        return iter(self._chunks)
+
+
 def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageMetadata:
     """Recursively add two UsageMetadata objects.
 
@@ -379,8 +379,14 @@ def merge_content(
     """
     merged: str | list[str | dict[Any, Any]]
     merged = "" if first_content is None else first_content
+    # Runs of list contents are merged in a single `merge_lists` call, which is
+    # linear in the size of the run rather than quadratic.
+    lists: list[list[str | dict[Any, Any]]] = []
 
     for content in contents:
+        if lists and not isinstance(content, list):
+            merged = merge_lists(cast("list[Any]", merged), *lists)  # type: ignore[assignment]
+            lists = []
         # If current is a string
         if isinstance(merged, str):
             # If the next chunk is also a string, then merge them naively
@@ -391,7 +397,7 @@ def merge_content(
                 merged = [merged, *content]
         elif isinstance(content, list):
             # If both are lists
-            merged = merge_lists(merged, content)  # type: ignore[assignment]
+            lists.append(content)
         # If the first content is a list, and the second content is a string
         # If the last element of the first content is a string
         # Add the second content to the last element
@@ -403,6 +409,8 @@ def merge_content(
         # Otherwise, add the second content as a new element of the list
         elif merged:
             merged.append(content)
+    if lists:
+        merged = merge_lists(cast("list[Any]", merged), *lists)  # type: ignore[assignment]
     return merged
 
 
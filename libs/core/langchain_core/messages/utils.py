@@ -2241,6 +2241,47 @@ def _convert_to_openai_tool_calls(tool_calls: list[ToolCall]) -> list[dict[str,
     ]
 
 
+def _usage_metadata_scale_factor(
+    ai_message_counts: Iterable[tuple[AIMessage, float]],
+) -> float:
+    """Return the factor by which usage metadata scales an approximate token count.
+
+    Args:
+        ai_message_counts: The AI messages among the counted messages, in order,
+            each paired with the approximate token count of the messages up to and
+            including it.
+
+    Returns:
+        `AI_total_tokens / approx_tokens_up_to_that_AI_message` for the most recent
+        AI message with `usage_metadata['total_tokens']`, clamped to between 1 and
+        1.25. `1.0` if there is no such message, or if the AI messages do not share
+        a `response_metadata['model_provider']`.
+    """
+    ai_model_provider: str | None = None
+    last_ai_total_tokens: int | None = None
+    approx_at_last_ai = 0.0
+    for message, approx_count in ai_message_counts:
+        model_provider = message.response_metadata.get("model_provider")
+        if ai_model_provider is None:
+            ai_model_provider = model_provider
+        elif model_provider != ai_model_provider:
+            return 1.0
+
+        if message.usage_metadata and isinstance(
+            (total_tokens := message.usage_metadata.get("total_tokens")), int
+        ):
+            last_ai_total_tokens = total_tokens
+            approx_at_last_ai = approx_count
+
+    if (
+        ai_model_provider is None
+        or last_ai_total_tokens is None
+        or approx_at_last_ai <= 0
+    ):
+        return 1.0
+    return min(1.25, max(1.0, last_ai_total_tokens / approx_at_last_ai))
+
+
 def count_tokens_approximately(
     messages: Iterable[MessageLikeRepresentation],
     *,
@@ -2301,10 +2342,7 @@ def count_tokens_approximately(
 
     token_count = 0.0
 
-    ai_model_provider: str | None = None
-    invalid_model_provider = False
-    last_ai_total_tokens: int | None = None
-    approx_at_last_ai: float | None = None
+    ai_message_counts: list[tuple[AIMessage, float]] = []
 
     # Count tokens for tools if provided
     if tools:
@@ -2390,29 +2428,10 @@ def count_tokens_approximately(
         token_count += extra_tokens_per_message
 
         if use_usage_metadata_scaling and isinstance(message, AIMessage):
-            model_provider = message.response_metadata.get("model_provider")
-            if ai_model_provider is None:
-                ai_model_provider = model_provider
-            elif model_provider != ai_model_provider:
-                invalid_model_provider = True
-
-            if message.usage_metadata and isinstance(
-                (total_tokens := message.usage_metadata.get("total_tokens")), int
-            ):
-                last_ai_total_tokens = total_tokens
-                approx_at_last_ai = token_count
+            ai_message_counts.append((message, token_count))
 
-    if (
-        use_usage_metadata_scaling
-        and len(converted_messages) > 1
-        and not invalid_model_provider
-        and ai_model_provider is not None
-        and last_ai_total_tokens is not None
-        and approx_at_last_ai
-        and approx_at_last_ai > 0
-    ):
-        scale_factor = last_ai_total_tokens / approx_at_last_ai
-        token_count *= min(1.25, max(1.0, scale_factor))
+    if use_usage_metadata_scaling and len(converted_messages) > 1:
+        token_count *= _usage_metadata_scale_factor(ai_message_counts)
 
     # round up once more time in case extra_tokens_per_message is a float
     return math.ceil(token_count)
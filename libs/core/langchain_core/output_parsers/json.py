@@ -6,7 +6,6 @@ import json
 from json import JSONDecodeError
 from typing import Annotated, Any, TypeVar
 
-import jsonpatch  # type: ignore[import-untyped]
 import pydantic
 from pydantic import SkipValidation
 from pydantic.v1 import BaseModel
@@ -16,7 +15,9 @@ from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers.format_instructions import JSON_FORMAT_INSTRUCTIONS
 from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
 from langchain_core.outputs import Generation
+from langchain_core.utils._json_patch import make_patch
 from langchain_core.utils.json import (
+    _parse_partial_json_stream,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -49,7 +50,7 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
 
     @override
     def _diff(self, prev: Any | None, next: Any) -> Any:
-        return jsonpatch.make_patch(prev, next).patch
+        return make_patch(prev, next)
 
     @staticmethod
     def _get_schema(pydantic_object: type[TBaseModel]) -> dict[str, Any]:
@@ -80,7 +81,7 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
         text = text.strip()
         if partial:
             try:
-                return parse_json_markdown(text)
+                return parse_json_markdown(text, parser=_parse_partial_json_stream)
             except JSONDecodeError:
                 return None
         else:
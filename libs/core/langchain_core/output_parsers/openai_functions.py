@@ -4,7 +4,6 @@ import copy
 import json
 from typing import Any
 
-import jsonpatch  # type: ignore[import-untyped]
 from pydantic import BaseModel, model_validator
 from pydantic.v1 import BaseModel as BaseModelV1
 from typing_extensions import override
@@ -14,8 +13,9 @@ from langchain_core.output_parsers import (
     BaseCumulativeTransformOutputParser,
     BaseGenerationOutputParser,
 )
-from langchain_core.output_parsers.json import parse_partial_json
 from langchain_core.outputs import ChatGeneration, Generation
+from langchain_core.utils._json_patch import make_patch
+from langchain_core.utils.json import _parse_partial_json_stream
 from langchain_core.utils.pydantic import PydanticBaseModel, TypeBaseModel
 
 
@@ -75,7 +75,7 @@ class JsonOutputFunctionsParser(BaseCumulativeTransformOutputParser[Any]):
 
     @override
     def _diff(self, prev: Any | None, next: Any) -> Any:
-        return jsonpatch.make_patch(prev, next).patch
+        return make_patch(prev, next)
 
     def parse_result(self, result: list[Generation], *, partial: bool = False) -> Any:
         """Parse the result of an LLM call to a JSON object.
@@ -109,12 +109,12 @@ class JsonOutputFunctionsParser(BaseCumulativeTransformOutputParser[Any]):
             if partial:
                 try:
                     if self.args_only:
-                        return parse_partial_json(
+                        return _parse_partial_json_stream(
                             function_call["arguments"], strict=self.strict
                         )
                     return {
                         **function_call,
-                        "arguments": parse_partial_json(
+                        "arguments": _parse_partial_json_stream(
                             function_call["arguments"], strict=self.strict
                         ),
                     }
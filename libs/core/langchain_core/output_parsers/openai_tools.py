@@ -15,7 +15,7 @@ from langchain_core.messages.tool import invalid_tool_call
 from langchain_core.messages.tool import tool_call as create_tool_call
 from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
 from langchain_core.outputs import ChatGeneration, Generation
-from langchain_core.utils.json import parse_partial_json
+from langchain_core.utils.json import _parse_partial_json_stream
 from langchain_core.utils.pydantic import (
     TypeBaseModel,
 )
@@ -51,7 +51,7 @@ def parse_tool_call(
 
     if partial:
         try:
-            function_args = parse_partial_json(arguments, strict=strict)
+            function_args = _parse_partial_json_stream(arguments, strict=strict)
         except (JSONDecodeError, TypeError):  # None args raise TypeError
             return None
     # Handle None or empty string arguments for parameter-less tools
@@ -18,6 +18,7 @@ from langchain_core.outputs import (
     GenerationChunk,
 )
 from langchain_core.runnables.config import run_in_executor
+from langchain_core.utils.json import _JsonStream
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Iterator
@@ -126,6 +127,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
     def _transform(self, input: Iterator[str | BaseMessage]) -> Iterator[Any]:
         prev_parsed = None
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        json_stream = _JsonStream()
         for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
             if isinstance(chunk, BaseMessageChunk):
@@ -137,9 +139,14 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
             else:
                 chunk_gen = GenerationChunk(text=chunk)
 
-            acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
-
-            parsed = self.parse_result([acc_gen], partial=True)
+            # `parse_result` needs the whole output after every chunk. Building it
+            # from an `AIMessageChunkAccumulator` would merge the output so far with
+            # the new chunk just like `+` does, so the chunks are added here. Tool
+            # call args and partial JSON are parsed incrementally within the
+            # stream, both when merging the chunks and in `parse_result`.
+            with json_stream.activate():
+                acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
+                parsed = self.parse_result([acc_gen], partial=True)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield self._diff(prev_parsed, parsed)
@@ -153,6 +160,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
     ) -> AsyncIterator[T]:
         prev_parsed = None
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        json_stream = _JsonStream()
         async for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
             if isinstance(chunk, BaseMessageChunk):
@@ -164,9 +172,14 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
             else:
                 chunk_gen = GenerationChunk(text=chunk)
 
-            acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
-
-            parsed = await self.aparse_result([acc_gen], partial=True)
+            # `parse_result` needs the whole output after every chunk. Building it
+            # from an `AIMessageChunkAccumulator` would merge the output so far with
+            # the new chunk just like `+` does, so the chunks are added here. Tool
+            # call args and partial JSON are parsed incrementally within the
+            # stream, both when merging the chunks and in `parse_result`.
+            with json_stream.activate():
+                acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
+                parsed = await self.aparse_result([acc_gen], partial=True)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield await run_in_executor(None, self._diff, prev_parsed, parsed)
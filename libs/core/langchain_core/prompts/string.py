@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from string import Formatter
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -19,6 +20,8 @@ from langchain_core.utils.interactive_env import is_interactive_env
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
+    from jinja2 import Template
+
 try:
     from jinja2 import meta
     from jinja2.sandbox import SandboxedEnvironment
@@ -64,12 +67,24 @@ def jinja2_formatter(template: str, /, **kwargs: Any) -> str:
         )
         raise ImportError(msg)
 
+    return _compile_jinja2(template).render(**kwargs)
+
+
+@lru_cache(maxsize=1)
+def _jinja2_environment() -> SandboxedEnvironment:
     # Use Jinja2's SandboxedEnvironment which blocks access to dunder attributes
     # (e.g., __class__, __globals__) to prevent sandbox escapes.
     # Note: regular attribute access (e.g., {{obj.attr}}) and method calls are
     # still allowed. This is a best-effort measure — do not use with untrusted
     # templates.
-    return SandboxedEnvironment().from_string(template).render(**kwargs)
+    return SandboxedEnvironment()
+
+
+@lru_cache(maxsize=256)
+def _compile_jinja2(template: str) -> Template:
+    # Parsing and compiling a template costs far more than rendering it, and the
+    # same templates are rendered over and over.
+    return _jinja2_environment().from_string(template)
 
 
 def validate_jinja2(template: str, input_variables: list[str]) -> None:
@@ -104,8 +119,7 @@ def _get_jinja2_variables_from_template(template: str) -> set[str]:
             "Please install it with `pip install jinja2`."
         )
         raise ImportError(msg)
-    env = SandboxedEnvironment()
-    ast = env.parse(template)
+    ast = _jinja2_environment().parse(template)
     return meta.find_undeclared_variables(ast)
 
 
@@ -207,8 +221,52 @@ def _create_model_recursive(name: str, defs: Defs) -> type[BaseModel]:
     )
 
 
+_FStringSegment = tuple[str, str | None, str | None, str | None]
+
+
+@lru_cache(maxsize=256)
+def _compile_f_string(template: str) -> tuple[_FStringSegment, ...] | None:
+    """Split an f-string template into literal text and replacement fields.
+
+    Returns `None` for templates that only `formatter` can format as expected: ones
+    with positional, attribute or index fields, nested replacement fields in format
+    specs, or syntax errors.
+    """
+    try:
+        segments = tuple(Formatter().parse(template))
+    except ValueError:
+        return None
+    for _, field_name, format_spec, _ in segments:
+        if field_name is not None and (
+            not field_name
+            or field_name.isdecimal()
+            or "." in field_name
+            or "[" in field_name
+            or "{" in (format_spec or "")
+        ):
+            return None
+    return segments
+
+
+def _f_string_formatter(template: str, /, **kwargs: Any) -> str:
+    """Format an f-string template like `formatter.format`, parsing it only once."""
+    segments = _compile_f_string(template)
+    if segments is None:
+        return formatter.format(template, **kwargs)
+    parts: list[str] = []
+    for literal, field_name, format_spec, conversion in segments:
+        if literal:
+            parts.append(literal)
+        if field_name is not None:
+            value = kwargs[field_name]
+            if conversion is not None:
+                value = formatter.convert_field(value, conversion)
+            parts.append(formatter.format_field(value, format_spec or ""))
+    return "".join(parts)
+
+
 DEFAULT_FORMATTER_MAPPING: dict[str, Callable[..., str]] = {
-    "f-string": formatter.format,
+    "f-string": _f_string_formatter,
     "mustache": mustache_formatter,
     "jinja2": jinja2_formatter,
 }
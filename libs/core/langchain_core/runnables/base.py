@@ -70,6 +70,7 @@ from langchain_core.runnables.utils import (
     ConfigurableFieldSpec,
     Input,
     Output,
+    _ChunkSum,
     accepts_config,
     accepts_run_manager,
     coro_with_context,
@@ -1779,8 +1780,7 @@ class Runnable(ABC, Generic[Input, Output]):
             The output of the `Runnable`.
 
         """
-        final: Input
-        got_first_val = False
+        final = _ChunkSum(on_type_error="restart")
 
         for ichunk in input:
             # The default implementation of transform is to buffer input and
@@ -1790,17 +1790,10 @@ class Runnable(ABC, Generic[Input, Output]):
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk,
             # and we'll iterate until we get to the last chunk.
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            final.add(ichunk)
 
-        if got_first_val:
-            yield from self.stream(final, config, **kwargs)
+        if not final.empty:
+            yield from self.stream(final.value, config, **kwargs)
 
     async def atransform(
         self,
@@ -1824,8 +1817,7 @@ class Runnable(ABC, Generic[Input, Output]):
             The output of the `Runnable`.
 
         """
-        final: Input
-        got_first_val = False
+        final = _ChunkSum(on_type_error="restart")
 
         async for ichunk in input:
             # The default implementation of transform is to buffer input and
@@ -1835,17 +1827,10 @@ class Runnable(ABC, Generic[Input, Output]):
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk,
             # and we'll iterate until we get to the last chunk.
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            final.add(ichunk)
 
-        if got_first_val:
-            async for output in self.astream(final, config, **kwargs):
+        if not final.empty:
+            async for output in self.astream(final.value, config, **kwargs):
                 yield output
 
     def bind(self, **kwargs: Any) -> Runnable[Input, Output]:
@@ -2526,10 +2511,9 @@ class Runnable(ABC, Generic[Input, Output]):
         # tee the input so we can iterate over it twice
         input_for_tracing, input_for_transform = tee(inputs, 2)
         # Start the input iterator to ensure the input Runnable starts before this one
-        final_input: Input | None = next(input_for_tracing, None)
-        final_input_supported = True
-        final_output: Output | None = None
-        final_output_supported = True
+        final_input = _ChunkSum(on_type_error="last")
+        final_input.add(next(input_for_tracing, None))
+        final_output = _ChunkSum(on_type_error="last")
 
         config = ensure_config(config)
         callback_manager = get_callback_manager_for_config(config)
@@ -2566,36 +2550,16 @@ class Runnable(ABC, Generic[Input, Output]):
                     while True:
                         chunk: Output = context.run(next, iterator)
                         yield chunk
-                        if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk  # type: ignore[operator]
-                                except TypeError:
-                                    final_output = chunk
-                                    final_output_supported = False
-                        else:
-                            final_output = chunk
+                        final_output.add(chunk)
                 except (StopIteration, GeneratorExit):
                     pass
                 for ichunk in input_for_tracing:
-                    if final_input_supported:
-                        if final_input is None:
-                            final_input = ichunk
-                        else:
-                            try:
-                                final_input = final_input + ichunk  # type: ignore[operator]
-                            except TypeError:
-                                final_input = ichunk
-                                final_input_supported = False
-                    else:
-                        final_input = ichunk
+                    final_input.add(ichunk)
         except BaseException as e:
-            run_manager.on_chain_error(e, inputs=final_input)
+            run_manager.on_chain_error(e, inputs=final_input.value)
             raise
         else:
-            run_manager.on_chain_end(final_output, inputs=final_input)
+            run_manager.on_chain_end(final_output.value, inputs=final_input.value)
 
     async def _atransform_stream_with_config(
         self,
@@ -2627,10 +2591,9 @@ class Runnable(ABC, Generic[Input, Output]):
         # tee the input so we can iterate over it twice
         input_for_tracing, input_for_transform = atee(inputs, 2)
         # Start the input iterator to ensure the input Runnable starts before this one
-        final_input: Input | None = await anext(input_for_tracing, None)
-        final_input_supported = True
-        final_output: Output | None = None
-        final_output_supported = True
+        final_input = _ChunkSum(on_type_error="last")
+        final_input.add(await anext(input_for_tracing, None))
+        final_output = _ChunkSum(on_type_error="last")
 
         config = ensure_config(config)
         callback_manager = get_async_callback_manager_for_config(config)
@@ -2670,36 +2633,16 @@ class Runnable(ABC, Generic[Input, Output]):
                     while True:
                         chunk = await coro_with_context(anext(iterator), context)
                         yield chunk
-                        if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk
-                                except TypeError:
-                                    final_output = chunk
-                                    final_output_supported = False
-                        else:
-                            final_output = chunk
+                        final_output.add(chunk)
                 except StopAsyncIteration:
                     pass
                 async for ichunk in input_for_tracing:
-                    if final_input_supported:
-                        if final_input is None:
-                            final_input = ichunk
-                        else:
-                            try:
-                                final_input = final_input + ichunk  # type: ignore[operator]
-                            except TypeError:
-                                final_input = ichunk
-                                final_input_supported = False
-                    else:
-                        final_input = ichunk
+                    final_input.add(ichunk)
         except BaseException as e:
-            await run_manager.on_chain_error(e, inputs=final_input)
+            await run_manager.on_chain_error(e, inputs=final_input.value)
             raise
         else:
-            await run_manager.on_chain_end(final_output, inputs=final_input)
+            await run_manager.on_chain_end(final_output.value, inputs=final_input.value)
         finally:
             if iterator_ is not None and hasattr(iterator_, "aclose"):
                 await iterator_.aclose()
@@ -5361,35 +5304,23 @@ class RunnableLambda(Runnable[Input, Output]):
         config: RunnableConfig,
         **kwargs: Any,
     ) -> Iterator[Output]:
-        final: Input
-        got_first_val = False
+        input_sum = _ChunkSum(on_type_error="restart")
         for ichunk in chunks:
             # By definitions, RunnableLambdas consume all input before emitting output.
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk.
             # So we'll iterate until we get to the last chunk!
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            input_sum.add(ichunk)
+        final: Input = input_sum.value
 
         if inspect.isgeneratorfunction(self.func):
-            output: Output | None = None
+            output_sum = _ChunkSum(on_type_error="restart")
             for chunk in call_func_with_variable_args(
                 self.func, final, config, run_manager, **kwargs
             ):
                 yield chunk
-                if output is None:
-                    output = chunk
-                else:
-                    try:
-                        output = output + chunk
-                    except TypeError:
-                        output = chunk
+                output_sum.add(chunk)
+            output: Output | None = output_sum.value
         else:
             output = call_func_with_variable_args(
                 self.func, final, config, run_manager, **kwargs
@@ -5453,21 +5384,14 @@ class RunnableLambda(Runnable[Input, Output]):
         config: RunnableConfig,
         **kwargs: Any,
     ) -> AsyncIterator[Output]:
-        final: Input
-        got_first_val = False
+        input_sum = _ChunkSum(on_type_error="restart")
         async for ichunk in chunks:
             # By definitions, RunnableLambdas consume all input before emitting output.
             # If the input is not addable, then we'll assume that we can
             # only operate on the last chunk.
             # So we'll iterate until we get to the last chunk!
-            if not got_first_val:
-                final = ichunk
-                got_first_val = True
-            else:
-                try:
-                    final = final + ichunk  # type: ignore[operator]
-                except TypeError:
-                    final = ichunk
+            input_sum.add(ichunk)
+        final: Input = input_sum.value
 
         if hasattr(self, "afunc"):
             afunc = self.afunc
@@ -5496,7 +5420,7 @@ class RunnableLambda(Runnable[Input, Output]):
             afunc = f
 
         if is_async_generator(afunc):
-            output: Output | None = None
+            output_sum = _ChunkSum(on_type_error="restart")
             async for chunk in cast(
                 "AsyncIterator[Output]",
                 acall_func_with_variable_args(
@@ -5508,13 +5432,8 @@ class RunnableLambda(Runnable[Input, Output]):
                 ),
             ):
                 yield chunk
-                if output is None:
-                    output = chunk
-                else:
-                    try:
-                        output = output + chunk  # type: ignore[operator]
-                    except TypeError:
-                        output = chunk
+                output_sum.add(chunk)
+            output: Output | None = output_sum.value
         else:
             output = await acall_func_with_variable_args(
                 cast("Callable[..., Any]", afunc),
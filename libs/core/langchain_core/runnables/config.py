@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import threading
 
 # Cannot move uuid to TYPE_CHECKING as RunnableConfig is used in Pydantic models
 import uuid  # noqa: TC003
@@ -656,12 +658,169 @@ class ContextThreadPoolExecutor(ThreadPoolExecutor):
         )
 
 
+class _SharedExecutorView(Executor):
+    """Executor that runs tasks on a shared pool with a per-call concurrency limit.
+
+    A task only goes to the pool if a worker is free; otherwise it runs in the
+    calling thread. This keeps the total number of threads bounded by the pool
+    size and lets nested batches inside pool workers make progress instead of
+    waiting on a saturated pool.
+    """
+
+    def __init__(
+        self,
+        pool: ThreadPoolExecutor,
+        slots: threading.BoundedSemaphore,
+        max_concurrency: int | None,
+    ) -> None:
+        self._pool = pool
+        self._slots = slots
+        self._limit = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency is not None
+            else None
+        )
+        self._futures: set[Future[Any]] = set()
+        self._lock = threading.Lock()
+
+    def _release(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._futures.discard(future)
+        if self._limit is not None:
+            self._limit.release()
+
+    def submit(  # type: ignore[override]
+        self,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[T]:
+        """Submit a function to the shared pool, or run it inline if it is full.
+
+        Blocks while `max_concurrency` tasks of this call are running.
+
+        Args:
+            func: The function to submit.
+            *args: The positional arguments to the function.
+            **kwargs: The keyword arguments to the function.
+
+        Returns:
+            The future for the function.
+        """
+        if self._limit is not None:
+            self._limit.acquire()
+        context = copy_context()
+        if not self._slots.acquire(blocking=False):
+            future: Future[T] = Future()
+            try:
+                future.set_result(context.run(func, *args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+            if self._limit is not None:
+                self._limit.release()
+            return future
+
+        try:
+            future = self._pool.submit(
+                cast("Callable[..., T]", partial(context.run, func, *args, **kwargs))
+            )
+        except BaseException:
+            self._slots.release()
+            if self._limit is not None:
+                self._limit.release()
+            raise
+        with self._lock:
+            self._futures.add(future)
+        # Free the pool slot before this call's slot, so a task waiting on
+        # `max_concurrency` can be sent to the pool.
+        future.add_done_callback(lambda _: self._slots.release())
+        future.add_done_callback(self._release)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Wait for the tasks of this call; the shared pool keeps running.
+
+        Args:
+            wait: Whether to wait for submitted tasks to finish.
+            cancel_futures: Whether to cancel tasks that have not started yet.
+        """
+        with self._lock:
+            futures = list(self._futures)
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+        if wait:
+            concurrent.futures.wait(futures)
+
+
+_shared_executor: tuple[ThreadPoolExecutor, threading.BoundedSemaphore] | None = None
+_shared_executor_lock = threading.Lock()
+
+
+def enable_shared_executor(max_workers: int | None = None) -> None:
+    """Run sync batches on a process-wide thread pool.
+
+    By default, every `Runnable.batch`, `RunnableParallel.invoke` and similar call
+    creates and tears down its own thread pool. Once enabled, these calls share a
+    single long-lived pool instead, so a process serving many concurrent requests
+    reuses a fixed number of threads.
+
+    `max_concurrency` in the config still limits how many tasks of a single call
+    run at once. When all workers are busy, tasks run in the calling thread, which
+    caps the total number of threads even with nested batches.
+
+    Calling this again replaces the pool; tasks already running on the previous
+    pool are not interrupted.
+
+    Args:
+        max_workers: The size of the shared pool.
+
+            Defaults to the `ThreadPoolExecutor` default.
+
+    Example:
+        ```python
+        from langchain_core.runnables import RunnableLambda
+        from langchain_core.runnables.config import enable_shared_executor
+
+        enable_shared_executor(max_workers=64)
+        RunnableLambda(lambda x: x + 1).batch([1, 2, 3], {"max_concurrency": 2})
+        # [2, 3, 4]
+        ```
+    """
+    global _shared_executor  # noqa: PLW0603
+    pool = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="langchain-shared"
+    )
+    with _shared_executor_lock:
+        previous = _shared_executor
+        _shared_executor = (pool, threading.BoundedSemaphore(pool._max_workers))  # noqa: SLF001
+    if previous is not None:
+        previous[0].shutdown(wait=False)
+
+
+def disable_shared_executor(*, wait: bool = True) -> None:
+    """Go back to creating a thread pool per call and shut down the shared pool.
+
+    Args:
+        wait: Whether to wait for tasks running on the shared pool to finish.
+    """
+    global _shared_executor  # noqa: PLW0603
+    with _shared_executor_lock:
+        previous = _shared_executor
+        _shared_executor = None
+    if previous is not None:
+        previous[0].shutdown(wait=wait)
+
+
 @contextmanager
 def get_executor_for_config(
     config: RunnableConfig | None,
 ) -> Generator[Executor, None, None]:
     """Get an executor for a config.
 
+    Uses the shared pool if `enable_shared_executor` was called, otherwise a new
+    thread pool that is shut down on exit.
+
     Args:
         config: The config.
 
@@ -669,9 +828,13 @@ def get_executor_for_config(
         The executor.
     """
     config = config or {}
-    with ContextThreadPoolExecutor(
-        max_workers=config.get("max_concurrency")
-    ) as executor:
+    shared = _shared_executor
+    executor: Executor
+    if shared is not None:
+        executor = _SharedExecutorView(*shared, config.get("max_concurrency"))
+    else:
+        executor = ContextThreadPoolExecutor(max_workers=config.get("max_concurrency"))
+    with executor:
         yield executor
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import ast
 import asyncio
 import inspect
+import itertools
 import sys
 import textwrap
 
@@ -14,17 +15,23 @@ from collections.abc import Mapping, Sequence  # noqa: TC003
 from functools import lru_cache
 from inspect import signature
 from itertools import groupby
+from types import FunctionType, MethodType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Literal,
     NamedTuple,
     Protocol,
     TypeGuard,
     TypeVar,
+    cast,
 )
+from weakref import WeakKeyDictionary
 
 from typing_extensions import override
 
+from langchain_core.messages.ai import AIMessageChunk, AIMessageChunkAccumulator
+
 # Re-export create-model for backwards compatibility
 from langchain_core.utils.pydantic import create_model  # noqa: F401
 
@@ -38,6 +45,7 @@ if TYPE_CHECKING:
         Iterable,
     )
     from contextvars import Context
+    from types import CodeType
 
     from langchain_core.runnables.schema import StreamEvent
 
@@ -82,6 +90,47 @@ async def gather_with_concurrency(
     return await asyncio.gather(*(gated_coro(semaphore, c) for c in coros))
 
 
+_FUNCTION_PARAMETERS: WeakKeyDictionary[CodeType, frozenset[str]] = WeakKeyDictionary()
+_METHOD_PARAMETERS: WeakKeyDictionary[CodeType, frozenset[str]] = WeakKeyDictionary()
+
+
+def _parameter_names(callable: Callable[..., Any]) -> frozenset[str]:  # noqa: A002
+    """Get the names of the parameters in the signature of a callable.
+
+    Runnables check the signature of the functions they call on every call, so the
+    names are cached by code object for plain functions and methods, whose signature
+    only depends on it. Functions with other attributes, which may override their
+    signature, and other callables are inspected every time.
+
+    Args:
+        callable: The callable to inspect.
+
+    Returns:
+        The names of the parameters, or none if the signature cannot be determined.
+    """
+    func: Any = callable
+    is_method = isinstance(func, MethodType)
+    if is_method:
+        func = func.__func__
+    if isinstance(func, FunctionType) and func.__dict__.keys() == {"__wrapped__"}:
+        # A function decorated with `functools.wraps`.
+        func = func.__dict__["__wrapped__"]
+    if not isinstance(func, FunctionType) or func.__dict__:
+        return _signature_parameter_names(callable)
+    cache = _METHOD_PARAMETERS if is_method else _FUNCTION_PARAMETERS
+    names = cache.get(func.__code__)
+    if names is None:
+        names = cache[func.__code__] = _signature_parameter_names(callable)
+    return names
+
+
+def _signature_parameter_names(callable: Callable[..., Any]) -> frozenset[str]:  # noqa: A002
+    try:
+        return frozenset(signature(callable).parameters)
+    except ValueError:
+        return frozenset()
+
+
 def accepts_run_manager(callable: Callable[..., Any]) -> bool:  # noqa: A002
     """Check if a callable accepts a run_manager argument.
 
@@ -91,10 +140,7 @@ def accepts_run_manager(callable: Callable[..., Any]) -> bool:  # noqa: A002
     Returns:
         `True` if the callable accepts a run_manager argument, `False` otherwise.
     """
-    try:
-        return signature(callable).parameters.get("run_manager") is not None
-    except ValueError:
-        return False
+    return "run_manager" in _parameter_names(callable)
 
 
 def accepts_config(callable: Callable[..., Any]) -> bool:  # noqa: A002
@@ -106,10 +152,7 @@ def accepts_config(callable: Callable[..., Any]) -> bool:  # noqa: A002
     Returns:
         `True` if the callable accepts a config argument, `False` otherwise.
     """
-    try:
-        return signature(callable).parameters.get("config") is not None
-    except ValueError:
-        return False
+    return "config" in _parameter_names(callable)
 
 
 def accepts_context(callable: Callable[..., Any]) -> bool:  # noqa: A002
@@ -121,10 +164,7 @@ def accepts_context(callable: Callable[..., Any]) -> bool:  # noqa: A002
     Returns:
         `True` if the callable accepts a context argument, `False` otherwise.
     """
-    try:
-        return signature(callable).parameters.get("context") is not None
-    except ValueError:
-        return False
+    return "context" in _parameter_names(callable)
 
 
 def asyncio_accepts_context() -> bool:
@@ -551,10 +591,10 @@ def add(addables: Iterable[Addable]) -> Addable | None:
     Returns:
         The result of adding the addable objects.
     """
-    final: Addable | None = None
+    final = _ChunkSum()
     for chunk in addables:
-        final = chunk if final is None else final + chunk
-    return final
+        final.add(chunk)
+    return cast("Addable | None", final.value)
 
 
 async def aadd(addables: AsyncIterable[Addable]) -> Addable | None:
@@ -566,10 +606,129 @@ async def aadd(addables: AsyncIterable[Addable]) -> Addable | None:
     Returns:
         The result of adding the addable objects.
     """
-    final: Addable | None = None
+    final = _ChunkSum()
     async for chunk in addables:
-        final = chunk if final is None else final + chunk
-    return final
+        final.add(chunk)
+    return cast("Addable | None", final.value)
+
+
+class _ChunkSum:
+    """Running `+` over the chunks of a stream.
+
+    Chunks are added as they arrive, except for runs of `AIMessageChunk`s, which are
+    collected in an `AIMessageChunkAccumulator` and merged once when the sum is
+    read, and runs of strings or of lists, which are joined once when the sum is
+    read. Adding each chunk with `+` would copy the sum so far every time, making
+    the sum quadratic in the length of the stream.
+
+    As with `final = chunk if final is None else final + chunk`, a chunk added to a
+    sum of `None` replaces it.
+    """
+
+    def __init__(
+        self, on_type_error: Literal["raise", "restart", "last"] = "raise"
+    ) -> None:
+        """Create an empty sum.
+
+        Args:
+            on_type_error: What to do when a chunk can't be added to the sum so far.
+                `'raise'` raises the `TypeError`, `'restart'` starts the sum over
+                from that chunk, and `'last'` stops adding and keeps only the latest
+                chunk from then on.
+        """
+        self._on_type_error = on_type_error
+        self._adding = True
+        self._value: Any = None
+        self._messages: AIMessageChunkAccumulator | None = None
+        # A run of chunks that are all `str` or all `list`.
+        self._parts: list[Any] | None = None
+        self.empty = True
+
+    def add(self, chunk: Any) -> None:
+        """Add a chunk to the sum.
+
+        Args:
+            chunk: The chunk to add.
+
+        Raises:
+            TypeError: If `on_type_error` is `'raise'` and the chunk can't be added.
+        """
+        if not self._adding:
+            self._value = chunk
+            return
+        if isinstance(chunk, AIMessageChunk):
+            if self._messages is not None:
+                self._messages.append(chunk)
+                return
+            if self._value is None or isinstance(self._value, AIMessageChunk):
+                self._messages = AIMessageChunkAccumulator(
+                    [chunk] if self._value is None else [self._value, chunk]
+                )
+                self.empty = False
+                return
+        if type(chunk) in {str, list}:
+            if self._parts is not None and type(self._parts[0]) is type(chunk):
+                self._parts.append(chunk)
+                return
+            value = self.value
+            if value is None or type(value) is type(chunk):
+                self._parts = [chunk] if value is None else [value, chunk]
+                self.empty = False
+                return
+        value = self.value
+        self.empty = False
+        if value is None:
+            self._value = chunk
+            return
+        try:
+            self._value = value + chunk
+        except TypeError:
+            if self._on_type_error == "raise":
+                raise
+            self._value = chunk
+            self._adding = self._on_type_error == "restart"
+
+    @property
+    def value(self) -> Any:
+        """The sum of the chunks added so far, or `None` if there are none.
+
+        Raises:
+            TypeError: If `on_type_error` is `'raise'` and the collected message
+                chunks can't be added together.
+        """
+        if self._messages is not None:
+            self._value = self._build_messages(self._messages)
+            self._messages = None
+        elif self._parts is not None:
+            parts = self._parts
+            if len(parts) == 1:
+                self._value = parts[0]
+            elif type(parts[0]) is str:
+                self._value = "".join(parts)
+            else:
+                self._value = list(itertools.chain.from_iterable(parts))
+            self._parts = None
+        return self._value
+
+    def _build_messages(self, messages: AIMessageChunkAccumulator) -> Any:
+        try:
+            return messages.build()
+        except TypeError:
+            if self._on_type_error == "raise":
+                raise
+        # Add the chunks one at a time to find where the sum starts over.
+        chunks = iter(messages)
+        value: Any = next(chunks)
+        for chunk in chunks:
+            if not self._adding:
+                value = chunk
+                continue
+            try:
+                value = value + chunk
+            except TypeError:
+                value = chunk
+                self._adding = self._on_type_error == "restart"
+        return value
 
 
 class ConfigurableField(NamedTuple):
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import copy
 import threading
 from collections import defaultdict
+from collections.abc import MutableMapping, MutableSequence
 from pprint import pformat
 from typing import (
     TYPE_CHECKING,
@@ -16,17 +16,18 @@ from typing import (
     overload,
 )
 
-import jsonpatch  # type: ignore[import-untyped]
 from typing_extensions import NotRequired, TypedDict, override
 
 from langchain_core.callbacks.base import BaseCallbackManager
 from langchain_core.load import dumps
 from langchain_core.load.load import load
+from langchain_core.messages import AIMessageChunk, BaseMessage
 from langchain_core.outputs import ChatGenerationChunk, GenerationChunk
 from langchain_core.runnables import RunnableConfig, ensure_config
 from langchain_core.tracers._streaming import _StreamingCallbackHandler
 from langchain_core.tracers.base import BaseTracer
 from langchain_core.tracers.memory_stream import _get_or_create_loop, _MemoryStream
+from langchain_core.utils._json_patch import apply_patch, make_patch
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Iterator, Sequence
@@ -147,7 +148,7 @@ class RunLogPatch:
         """
         if type(other) is RunLogPatch:
             ops = self.ops + other.ops
-            state = jsonpatch.apply_patch(None, copy.deepcopy(ops))
+            state = apply_patch(None, ops)
             return RunLog(*ops, state=state)
 
         msg = f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'"
@@ -191,11 +192,13 @@ class RunLog(RunLogPatch):
             TypeError: If the other object is not a `RunLog` or `RunLogPatch`.
 
         Returns:
-            A new `RunLog` representing the combination of the two.
+            A new `RunLog` representing the combination of the two. Its state
+            shares the values the patch leaves unchanged with this one's, so
+            neither should be mutated.
         """
         if type(other) is RunLogPatch:
             ops = self.ops + other.ops
-            state = jsonpatch.apply_patch(self.state, other.ops)
+            state = apply_patch(self.state, other.ops)
             return RunLog(*ops, state=state)
 
         msg = f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'"
@@ -631,6 +634,67 @@ def _get_standardized_outputs(
     return None
 
 
+class _FinalOutputDiff:
+    """Diff successive final outputs of a stream like `jsonpatch` with `dumps`.
+
+    `jsonpatch` serializes outputs that are not dicts or lists, such as strings and
+    messages, twice to tell whether they changed, which makes streaming quadratic in
+    the length of the output. Strings and message contents are compared directly
+    instead, and otherwise each output is serialized once and the result reused
+    when it is the previous output of the next chunk.
+    """
+
+    def __init__(self) -> None:
+        self._serialized: tuple[Any, str] | None = None
+
+    def __call__(self, prev: Any, final: Any) -> list[dict[str, Any]]:
+        """Return `jsonpatch.JsonPatch.from_diff(prev, final, dumps=dumps).patch`."""
+        containers = (MutableMapping, MutableSequence)
+        if isinstance(prev, containers) or isinstance(final, containers):
+            return make_patch(prev, final, dumps=dumps)
+        if prev is final:
+            return []
+        if prev is None:
+            changed = True
+        elif isinstance(prev, str) and isinstance(final, str):
+            changed = prev != final
+        else:
+            changed = _message_changed(prev, final) or (
+                self._dumps(prev) != self._dumps(final)
+            )
+        return [{"op": "replace", "path": "", "value": final}] if changed else []
+
+    def _dumps(self, value: Any) -> str:
+        if self._serialized is not None and self._serialized[0] is value:
+            return self._serialized[1]
+        serialized = dumps(value)
+        self._serialized = (value, serialized)
+        return serialized
+
+
+def _message_changed(prev: Any, final: Any) -> bool:
+    """Whether `prev` and `final` are messages that certainly serialize differently.
+
+    Returns:
+        `True` if they are messages of the same type with different string contents,
+        or with different tool call chunks that `final` serializes.
+    """
+    if (
+        not isinstance(final, BaseMessage)
+        or type(prev) is not type(final)
+        or not final.is_lc_serializable()
+    ):
+        return False
+    if isinstance(final.content, str) and prev.content != final.content:
+        return True
+    return (
+        isinstance(prev, AIMessageChunk)
+        and isinstance(final, AIMessageChunk)
+        and bool(final.tool_call_chunks)
+        and prev.tool_call_chunks != final.tool_call_chunks
+    )
+
+
 @overload
 def _astream_log_implementation(
     runnable: Runnable[Input, Output],
@@ -713,6 +777,7 @@ async def _astream_log_implementation(
         try:
             prev_final_output: Output | None = None
             final_output: Output | None = None
+            diff_final_output = _FinalOutputDiff()
 
             async for chunk in runnable.astream(value, config, **kwargs):
                 prev_final_output = final_output
@@ -730,18 +795,14 @@ async def _astream_log_implementation(
                         {
                             "op": "add",
                             "path": "/streamed_output/-",
-                            # chunk cannot be shared between
-                            # streamed_output and final_output
-                            # otherwise jsonpatch.apply will
-                            # modify both
-                            "value": copy.deepcopy(chunk),
+                            # Sharing chunk with final_output is safe, since
+                            # RunLog applies patches without mutating values.
+                            "value": chunk,
                         }
                     )
                 patches.extend(
                     {**op, "path": f"/final_output{op['path']}"}
-                    for op in jsonpatch.JsonPatch.from_diff(
-                        prev_final_output, final_output, dumps=dumps
-                    )
+                    for op in diff_final_output(prev_final_output, final_output)
                 )
                 await stream.send_stream.send(RunLogPatch(*patches))
         finally:
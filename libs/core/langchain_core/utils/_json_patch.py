@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import copy
+import json
+import operator
+from collections.abc import Callable, Iterable, MutableMapping, MutableSequence
+from itertools import islice
+from typing import Any
+
+import jsonpatch  # type: ignore[import-untyped]
+
+
+def make_patch(
+    src: Any, dst: Any, *, dumps: Callable[[Any], str] = json.dumps
+) -> list[dict[str, Any]]:
+    """Return `jsonpatch.JsonPatch.from_diff(src, dst, dumps=dumps).patch`.
+
+    Values produced from successive chunks of a stream share the objects and arrays
+    that were already complete, and only grow at their end. Comparing those by
+    identity, or member by member when they were copied, keeps the diff proportional
+    to what changed; anything else, or any patch `jsonpatch` would turn into moves,
+    is left to `jsonpatch`.
+
+    Args:
+        src: The previous value.
+        dst: The current value.
+        dumps: The function `jsonpatch` serializes values with to compare them.
+
+    Returns:
+        The JSON Patch operations turning `src` into `dst`.
+    """
+    ops: list[dict[str, Any]] = []
+    added: list[Any] = []
+    removed: list[Any] = []
+    try:
+        if (
+            _container_type(src) is not None
+            and _container_type(src) is _container_type(dst)
+            and _diff_containers((), src, dst, ops, added, removed, dumps)
+            and not _may_move(added, removed, dumps)
+        ):
+            return ops
+    except (TypeError, ValueError, RecursionError):
+        pass
+    patch: list[dict[str, Any]] = jsonpatch.JsonPatch.from_diff(
+        src, dst, dumps=dumps
+    ).patch
+    return patch
+
+
+def apply_patch(doc: Any, ops: list[dict[str, Any]]) -> Any:
+    """Return `jsonpatch.apply_patch(doc, ops)`, sharing what `ops` leave unchanged.
+
+    Rather than deep-copying `doc`, only the objects and arrays `ops` modify are
+    copied, so neither `doc` nor the values in `ops` are mutated. The result shares
+    everything else with `doc`, and both should be treated as read-only.
+
+    Args:
+        doc: The document to patch.
+        ops: The JSON Patch operations to apply.
+
+    Returns:
+        The patched document.
+    """
+    copied: set[int] = set()
+    for op in ops:
+        if op.get("op") == "move":
+            doc = _copy_parents(doc, op.get("from", ""), copied)
+        if op.get("op") != "test":
+            doc = _copy_parents(doc, op.get("path", ""), copied)
+        doc = jsonpatch.apply_patch(doc, [op], in_place=True)
+    return doc
+
+
+def _copy_parents(doc: Any, pointer: str, copied: set[int]) -> Any:
+    """Copy the containers on the way to `pointer` that were not copied yet.
+
+    Returns:
+        The document, or its copy.
+    """
+    if not isinstance(pointer, str) or not pointer.startswith("/"):
+        # The root, or an invalid pointer left to `jsonpatch` to report.
+        return doc
+    parts = [
+        part.replace("~1", "/").replace("~0", "~") for part in pointer.split("/")[1:]
+    ]
+    doc = _copy_container(doc, copied)
+    parent = doc
+    for part in parts[:-1]:
+        key: str | int = part
+        if isinstance(parent, MutableSequence):
+            if not part.isdigit():
+                break
+            key = int(part)
+        elif not isinstance(parent, MutableMapping):
+            break
+        try:
+            child = parent[key]
+        except (KeyError, IndexError):
+            break
+        new_child = _copy_container(child, copied)
+        if new_child is not child:
+            parent[key] = new_child
+        parent = new_child
+    return doc
+
+
+def _copy_container(value: Any, copied: set[int]) -> Any:
+    if id(value) in copied or not isinstance(value, (MutableMapping, MutableSequence)):
+        return value
+    value = copy.copy(value)
+    copied.add(id(value))
+    return value
+
+
+def _container_type(value: Any) -> type | None:
+    """The type of container `jsonpatch` compares `value` as, if it can be skipped.
+
+    Raises:
+        TypeError: If `jsonpatch` compares `value` as a container that is neither a
+            `dict` nor a `list`.
+    """
+    if isinstance(value, dict):
+        return dict
+    if isinstance(value, list):
+        return list
+    if isinstance(value, (MutableMapping, MutableSequence)):
+        msg = f"Unsupported container {type(value)}"
+        raise TypeError(msg)
+    return None
+
+
+def _diff_containers(
+    path: tuple[str | int, ...],
+    src: Any,
+    dst: Any,
+    ops: list[dict[str, Any]],
+    added: list[Any],
+    removed: list[Any],
+    dumps: Callable[[Any], str],
+) -> bool:
+    """Diff two dicts or two lists like `jsonpatch`, if `dst` extends `src`.
+
+    Returns:
+        Whether `dst` has all but the last member of `src`, unchanged and in the same
+        place, so that `ops` is what `jsonpatch` would generate.
+    """
+    if src is dst:
+        return True
+    size = len(src)
+    if len(dst) < size:
+        return False
+    shared = max(size - 1, 0)
+    if isinstance(src, dict):
+        if list(islice(dst, size)) != list(src) or not _all_identical(
+            list(islice(src.values(), shared)), dst.values()
+        ):
+            return False
+        # `jsonpatch` adds the new members before comparing the common ones.
+        for key in islice(dst, size, None):
+            ops.append({"op": "add", "path": _pointer(path, key), "value": dst[key]})
+            added.append(dst[key])
+        if not size:
+            return True
+        key = next(reversed(src))
+        return _diff_member(path, key, src[key], dst[key], ops, added, removed, dumps)
+    if not _all_identical(src[:shared], dst):
+        return False
+    if size:
+        last = src[-1]
+        last_ops: list[dict[str, Any]] = []
+        if not _diff_member(
+            path, size - 1, last, dst[size - 1], last_ops, added, removed, dumps
+        ):
+            return False
+        # If the changed last item equals an item after it, `jsonpatch` matches
+        # them up instead.
+        if last_ops and any(_same_json(last, item, dumps) for item in dst[size:]):
+            return False
+        ops.extend(last_ops)
+    for index in range(size, len(dst)):
+        ops.append({"op": "add", "path": _pointer(path, index), "value": dst[index]})
+        added.append(dst[index])
+    return True
+
+
+def _diff_member(
+    path: tuple[str | int, ...],
+    key: str | int,
+    src: Any,
+    dst: Any,
+    ops: list[dict[str, Any]],
+    added: list[Any],
+    removed: list[Any],
+    dumps: Callable[[Any], str],
+) -> bool:
+    src_type = _container_type(src)
+    dst_type = _container_type(dst)
+    if src_type is not None and src_type is dst_type:
+        return _diff_containers((*path, key), src, dst, ops, added, removed, dumps)
+    if src is dst or (
+        src == dst
+        if type(src) is str and type(dst) is str
+        else dumps(src) == dumps(dst)
+    ):
+        return True
+    ops.append({"op": "replace", "path": _pointer(path, key), "value": dst})
+    if isinstance(key, int):
+        # `jsonpatch` removes and adds changed list items, which may become moves.
+        removed.append(src)
+        added.append(dst)
+    return True
+
+
+def _all_identical(src: list[Any], dst: Iterable[Any]) -> bool:
+    """Whether `dst` starts with the members of `src`, as `_identical` compares them."""
+    dst = list(islice(dst, len(src)))
+    return all(map(operator.is_, src, dst)) or all(map(_identical, src, dst))
+
+
+def _identical(a: Any, b: Any) -> bool:
+    """Whether `a` and `b` are the same value, or copies `jsonpatch` finds no change in.
+
+    Floats are only compared by identity, since equal floats like `0.0` and `-0.0`
+    may serialize differently.
+    """
+    if a is b:
+        return True
+    value_type = type(a)
+    if value_type is not type(b):
+        return False
+    if value_type is dict:
+        return len(a) == len(b) and all(
+            key_a == key_b and _identical(value_a, value_b)
+            for (key_a, value_a), (key_b, value_b) in zip(
+                a.items(), b.items(), strict=True
+            )
+        )
+    if value_type is list:
+        return len(a) == len(b) and all(map(_identical, a, b))
+    return value_type in {str, int, bool} and bool(a == b)
+
+
+def _same_json(a: Any, b: Any, dumps: Callable[[Any], str]) -> bool:
+    """Whether `a` and `b` are equal as JSON, like `jsonpatch` compares them."""
+    if a is b:
+        return True
+    if type(a) is str and type(b) is str:
+        return bool(a == b)
+    return _move_key(a, dumps) == _move_key(b, dumps)
+
+
+def _may_move(
+    added: list[Any], removed: list[Any], dumps: Callable[[Any], str]
+) -> bool:
+    """Whether `jsonpatch` would turn a removed and an added value into a move."""
+    if not removed:
+        return False
+    removed_keys = {_move_key(value, dumps) for value in removed}
+    return any(_move_key(value, dumps) in removed_keys for value in added)
+
+
+def _move_key(value: Any, dumps: Callable[[Any], str]) -> str:
+    """Serialize `value` like `jsonpatch` does to match up equal values."""
+    return dumps(_sorted_members(value))
+
+
+def _sorted_members(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, MutableMapping):
+        return {key: _sorted_members(value[key]) for key in sorted(value)}
+    if isinstance(value, MutableSequence):
+        return [_sorted_members(item) for item in value]
+    return value
+
+
+def _pointer(path: tuple[str | int, ...], key: str | int) -> str:
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in (*path, key)
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 from typing import Any
 
 
@@ -28,9 +29,23 @@ def merge_dicts(left: dict[str, Any], *others: dict[str, Any]) -> dict[str, Any]
         `merged = {"function_call": {"arguments": "{\n"}}`.
     """
     merged = left.copy()
+    # Strings, dicts and lists that need merging more than once are collected here
+    # and merged once at the end, so that merging many dicts (e.g. the chunks of a
+    # stream) is linear rather than quadratic in their total size.
+    pending: dict[str, list[Any]] = {}
     for right in others:
         for right_k, right_v in right.items():
-            if right_k not in merged or (
+            if right_k in pending:
+                if right_v is None:
+                    continue
+                if type(pending[right_k][0]) is not type(right_v):
+                    msg = (
+                        f'additional_kwargs["{right_k}"] already exists in this '
+                        "message, but with a different type."
+                    )
+                    raise TypeError(msg)
+                pending[right_k].append(right_v)
+            elif right_k not in merged or (
                 right_v is not None and merged[right_k] is None
             ):
                 merged[right_k] = right_v
@@ -56,16 +71,16 @@ def merge_dicts(left: dict[str, Any], *others: dict[str, Any]) -> dict[str, Any]
                 #             "should either occur once or have the same value across "
                 #             "all dicts."
                 #         )
-                if (right_k == "index" and merged[right_k].startswith("lc_")) or (
-                    right_k in {"id", "output_version", "model_provider"}
-                    and merged[right_k] == right_v
-                ):
-                    continue
-                merged[right_k] += right_v
-            elif isinstance(merged[right_k], dict):
-                merged[right_k] = merge_dicts(merged[right_k], right_v)
-            elif isinstance(merged[right_k], list):
-                merged[right_k] = merge_lists(merged[right_k], right_v)
+                if right_k in {"index", "id", "output_version", "model_provider"}:
+                    if (right_k == "index" and merged[right_k].startswith("lc_")) or (
+                        right_k != "index" and merged[right_k] == right_v
+                    ):
+                        continue
+                    merged[right_k] += right_v
+                else:
+                    pending[right_k] = [merged[right_k], right_v]
+            elif isinstance(merged[right_k], (dict, list)):
+                pending[right_k] = [merged[right_k], right_v]
             elif merged[right_k] == right_v:
                 continue
             elif isinstance(merged[right_k], bool):
@@ -92,6 +107,13 @@ def merge_dicts(left: dict[str, Any], *others: dict[str, Any]) -> dict[str, Any]
                     f"value has unsupported type {type(merged[right_k])}."
                 )
                 raise TypeError(msg)
+    for key, values in pending.items():
+        if isinstance(values[0], str):
+            merged[key] = "".join(values)
+        elif isinstance(values[0], dict):
+            merged[key] = merge_dicts(*values)
+        else:
+            merged[key] = merge_lists(*values)
     return merged
 
 
@@ -106,11 +128,22 @@ def merge_lists(left: list[Any] | None, *others: list[Any] | None) -> list[Any]
         The merged list.
     """
     merged = left.copy() if left is not None else None
+    # Positions of the indexed dicts in `merged`, keyed by index. Deltas for a
+    # position are collected in `pending` and merged into it once at the end, with
+    # the `id` they would have produced tracked in `merged_ids` for matching.
+    positions: dict[Any, list[int]] = {}
+    pending: dict[int, list[dict[str, Any]]] = {}
+    merged_ids: dict[int, dict[str, Any]] = {}
+    if merged is not None:
+        for i, e_left in enumerate(merged):
+            _add_position(positions, i, e_left)
     for other in others:
         if other is None:
             continue
         if merged is None:
             merged = other.copy()
+            for i, e_left in enumerate(merged):
+                _add_position(positions, i, e_left)
         else:
             for e in other:
                 if (
@@ -125,16 +158,12 @@ def merge_lists(left: list[Any] | None, *others: list[Any] | None) -> list[Any]
                 ):
                     to_merge = [
                         i
-                        for i, e_left in enumerate(merged)
-                        if (
-                            isinstance(e_left, dict)
-                            and "index" in e_left
-                            and e_left["index"] == e["index"]  # index matches
-                            and (  # IDs not inconsistent
-                                e_left.get("id") in {None, ""}
-                                or e.get("id") in {None, ""}
-                                or e_left.get("id") == e.get("id")
-                            )
+                        for i in positions.get(e["index"], ())
+                        if (  # IDs not inconsistent
+                            (left_id := (merged_ids.get(i) or merged[i]).get("id"))
+                            in {None, ""}
+                            or e.get("id") in {None, ""}
+                            or left_id == e.get("id")
                         )
                     ]
                     if to_merge:
@@ -169,14 +198,33 @@ def merge_lists(left: list[Any] | None, *others: list[Any] | None) -> list[Any]
                                 if "type" in e
                                 else e
                             )
-                        merged[to_merge[0]] = merge_dicts(merged[to_merge[0]], new_e)
+                        i = to_merge[0]
+                        pending.setdefault(i, []).append(new_e)
+                        if "id" in new_e:
+                            left_ids = merged_ids.get(i) or {
+                                k: v for k, v in merged[i].items() if k == "id"
+                            }
+                            merged_ids[i] = merge_dicts(left_ids, {"id": new_e["id"]})
                     else:
+                        _add_position(positions, len(merged), e)
                         merged.append(e)
                 else:
+                    _add_position(positions, len(merged), e)
                     merged.append(e)
+    if merged is not None:
+        for i, deltas in pending.items():
+            merged[i] = merge_dicts(merged[i], *deltas)
     return merged
 
 
+def _add_position(positions: dict[Any, list[int]], i: int, e: Any) -> None:
+    """Record the position of `e` in a list being merged, if it has an index."""
+    if isinstance(e, dict) and "index" in e:
+        # An unhashable index can never match the int or str index of a delta.
+        with contextlib.suppress(TypeError):
+            positions.setdefault(e["index"], []).append(i)
+
+
 def merge_obj(left: Any, right: Any) -> Any:
     """Merge two objects.
 
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import json
 import re
-from typing import TYPE_CHECKING, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, cast
 
 from langchain_core.exceptions import OutputParserException
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
 
 def _replace_new_line(match: re.Match[str]) -> str:
@@ -43,6 +45,9 @@ def _custom_parser(multiline_string: str | bytes | bytearray) -> str:
     if isinstance(multiline_string, (bytes, bytearray)):
         multiline_string = multiline_string.decode()
 
+    # Skip the regex, which scans all of the text, when there is nothing to replace.
+    if '"action_input"' not in multiline_string:
+        return multiline_string
     return re.sub(
         r'("action_input"\:\s*")(.*?)(")',
         _replace_new_line,
@@ -136,6 +141,502 @@ def parse_partial_json(s: str, *, strict: bool = False) -> Any:
     return json.loads(s, strict=strict)
 
 
+class _Malformed(Exception):  # noqa: N818
+    """Raised by `PartialJsonParser` when the text is not a prefix of valid JSON."""
+
+
+class _BracketScanner:
+    """Track strings and brackets the way `parse_partial_json` does before parsing."""
+
+    __slots__ = ("closers", "escaped", "in_string", "mismatched")
+
+    def __init__(self) -> None:
+        self.closers: list[str] = []
+        self.in_string = False
+        self.escaped = False
+        self.mismatched = False
+
+    def feed(self, text: str) -> None:
+        if self.mismatched:
+            return
+        closers = self.closers
+        for char in text:
+            if self.in_string:
+                if char == '"' and not self.escaped:
+                    self.in_string = False
+                elif char == "\\":
+                    self.escaped = not self.escaped
+                else:
+                    self.escaped = False
+            elif char == '"':
+                self.in_string = True
+                self.escaped = False
+            elif char == "{":
+                closers.append("}")
+            elif char == "[":
+                closers.append("]")
+            elif char in {"}", "]"}:
+                if closers and closers[-1] == char:
+                    closers.pop()
+                else:
+                    self.mismatched = True
+                    return
+
+
+# Modes of `PartialJsonParser`.
+_PARSING = 0  # the text so far is a prefix of valid JSON
+_NOT_JSON = 1  # the text does not start with a JSON value
+_FALLBACK = 2  # anything else; re-parse with `parse_partial_json`
+
+# Positions of `PartialJsonParser` within the document.
+_VALUE = 0
+_VALUE_OR_END = 1  # after `[`
+_KEY = 2  # after `,` in an object
+_KEY_OR_END = 3  # after `{`
+_COLON = 4
+_AFTER_VALUE = 5
+_STRING = 6
+_NUMBER = 7
+_LITERAL = 8
+_DONE = 9  # the root value is complete
+
+_LITERALS = {"t": ("true", True), "f": ("false", False), "n": ("null", None)}
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_STRING_CHARS_RE = re.compile(r'[^"\\]*')
+# With `strict`, control characters other than newlines are not allowed in strings;
+# `parse_partial_json` escapes newlines before parsing.
+_STRICT_STRING_CHARS_RE = re.compile(r'[^"\\\x00-\x09\x0b-\x1f]*')
+_NUMBER_CHARS_RE = re.compile(r"[-+.eE0-9]*")
+_NUMBER_PREFIX_RE = re.compile(
+    r"-?(?:(?:0|[1-9][0-9]*)(?:\.[0-9]*)?(?:(?<=[0-9])[eE][-+]?[0-9]*)?)?"
+)
+_NUMBER_RE = re.compile(r"(-?(?:0|[1-9][0-9]*))(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+_BRACKETS_OR_QUOTE_RE = re.compile(r'["{}\[\]]')
+_MISSING = object()
+
+
+def _parse_number(match: re.Match[str]) -> Any:
+    integer, frac, exp = match.groups()
+    if frac or exp:
+        return float(integer + (frac or "") + (exp or ""))
+    return int(integer)
+
+
+class PartialJsonParser:
+    """Parse a JSON document incrementally as its text streams in.
+
+    Feeding the text piece by piece and calling `parse` gives the same result as
+    calling `parse_partial_json` on all the text fed so far. The parser keeps its
+    place in the document between calls, so each call only does work proportional to
+    the new text and to the open objects and arrays, rather than to all of the text.
+
+    Values returned by successive calls to `parse` share the objects and arrays that
+    were already complete, so they should be treated as read-only while the document
+    is still streaming.
+
+    Example:
+        ```python
+        from langchain_core.utils.json import PartialJsonParser
+
+        parser = PartialJsonParser()
+        parser.feed('{"name": "Al')
+        parser.parse()  # {'name': 'Al'}
+        parser.feed('ice", "tags": ["a"')
+        parser.parse()  # {'name': 'Alice', 'tags': ['a']}
+        ```
+    """
+
+    def __init__(self, *, strict: bool = False) -> None:
+        """Create a parser for a new document.
+
+        Args:
+            strict: Whether to use strict parsing, as in `parse_partial_json`.
+        """
+        self.strict = strict
+        self._parts: list[str] = []
+        self._length = 0
+        self._mode = _PARSING
+        self._scanner: _BracketScanner | None = None
+        self._state = _VALUE
+        # The open objects and arrays, outermost first, and the key of the member
+        # being parsed in each of them.
+        self._containers: list[dict[str, Any] | list[Any]] = []
+        self._keys: list[str | None] = []
+        # The string, number or literal being parsed.
+        self._token: list[str] = []
+        self._is_key = False
+        self._escape = ""
+        self._high_surrogate = False
+        self._literal: tuple[str, Any] = ("", None)
+        self._root: Any = None
+
+    @property
+    def text(self) -> str:
+        """All the text fed so far."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def feed(self, text: str) -> None:
+        """Add the next piece of the document.
+
+        Args:
+            text: The text following what was fed so far.
+        """
+        if not text:
+            return
+        self._parts.append(text)
+        if self._mode == _PARSING:
+            try:
+                self._consume(text)
+            except _Malformed:
+                if self._mode == _PARSING:
+                    self._mode = _FALLBACK
+                self._scanner = _BracketScanner()
+                self._scanner.feed(self.text)
+        elif self._scanner is not None:
+            self._scanner.feed(text)
+        self._length += len(text)
+
+    def parse(self) -> Any:
+        """Parse the text fed so far.
+
+        Returns:
+            The same as `parse_partial_json` for all the text fed so far.
+
+        Raises:
+            json.JSONDecodeError: If the text fed so far does not contain a value.
+        """
+        if self._mode != _PARSING:
+            if self._scanner is not None and self._scanner.mismatched:
+                return None
+            if self._mode == _NOT_JSON:
+                return json.loads(self.text, strict=self.strict)
+            return parse_partial_json(self.text, strict=self.strict)
+        if self._state == _DONE:
+            return self._root
+        value = self._partial_token()
+        if not self._containers:
+            if value is _MISSING:
+                # Raises the same error as `parse_partial_json`.
+                return json.loads(self.text, strict=self.strict)
+            return value
+        # Copy the open objects and arrays, innermost first, completing each with
+        # the copy of the one it contains. Complete values are shared.
+        innermost = True
+        for container, key in zip(
+            reversed(self._containers), reversed(self._keys), strict=True
+        ):
+            copy = container.copy()
+            if isinstance(copy, dict):
+                if value is not _MISSING:
+                    copy[cast("str", key)] = value
+            elif not innermost:
+                copy[-1] = value
+            elif value is not _MISSING:
+                copy.append(value)
+            value = copy
+            innermost = False
+        return value
+
+    def _partial_token(self) -> Any:
+        """The value of the token being parsed, as `parse_partial_json` completes it."""
+        state = self._state
+        if state == _STRING:
+            if self._is_key or self._escape.startswith("\\u"):
+                return _MISSING
+            if len(self._token) > 1:
+                self._token = ["".join(self._token)]
+            return self._token[0] if self._token else ""
+        if state == _NUMBER:
+            match = _NUMBER_RE.match(self._token[0])
+            return _MISSING if match is None else _parse_number(match)
+        return _MISSING
+
+    def _consume(self, text: str) -> None:
+        pos = 0
+        end = len(text)
+        while pos < end:
+            state = self._state
+            if state == _STRING:
+                pos = self._consume_string(text, pos)
+                continue
+            if state == _NUMBER:
+                run_end = _NUMBER_CHARS_RE.match(text, pos).end()  # type: ignore[union-attr]
+                token = self._token[0] + text[pos:run_end]
+                if not _NUMBER_PREFIX_RE.fullmatch(token):
+                    raise _Malformed
+                self._token[0] = token
+                pos = run_end
+                if pos < end:
+                    number = _NUMBER_RE.fullmatch(token)
+                    if number is None:
+                        raise _Malformed
+                    self._add_value(_parse_number(number))
+                continue
+            if state == _LITERAL:
+                word, literal = self._literal
+                token = (
+                    self._token[0] + text[pos : pos + len(word) - len(self._token[0])]
+                )
+                if not word.startswith(token):
+                    raise _Malformed
+                pos += len(token) - len(self._token[0])
+                self._token[0] = token
+                if token == word:
+                    self._add_value(literal)
+                continue
+            if state == _DONE:
+                # `parse_partial_json` ignores trailing text without brackets or
+                # quotes.
+                if _BRACKETS_OR_QUOTE_RE.search(text, pos):
+                    raise _Malformed
+                return
+            char = text[pos]
+            if char in " \t\n\r":
+                pos = _WHITESPACE_RE.match(text, pos).end()  # type: ignore[union-attr]
+                continue
+            if state in {_VALUE, _VALUE_OR_END}:
+                if char == "{":
+                    self._open({}, _KEY_OR_END)
+                elif char == "[":
+                    self._open([], _VALUE_OR_END)
+                elif char == '"':
+                    self._start_string(is_key=False)
+                elif char == "-" or "0" <= char <= "9":
+                    self._state = _NUMBER
+                    self._token = [""]
+                    continue
+                elif char in _LITERALS:
+                    self._state = _LITERAL
+                    self._literal = _LITERALS[char]
+                    self._token = [""]
+                    continue
+                elif char == "]" and state == _VALUE_OR_END:
+                    self._close()
+                else:
+                    if not self._containers and char not in {"N", "I"}:
+                        # `parse_partial_json` only ever raises an error, or returns
+                        # `None` if the brackets do not match.
+                        self._mode = _NOT_JSON
+                    raise _Malformed
+            elif state in {_KEY, _KEY_OR_END}:
+                if char == '"':
+                    self._start_string(is_key=True)
+                elif char == "}" and state == _KEY_OR_END:
+                    self._close()
+                else:
+                    raise _Malformed
+            elif state == _COLON:
+                if char != ":":
+                    raise _Malformed
+                self._state = _VALUE
+            elif char == ",":
+                self._state = _KEY if isinstance(self._containers[-1], dict) else _VALUE
+            elif char == ("}" if isinstance(self._containers[-1], dict) else "]"):
+                self._close()
+            else:
+                raise _Malformed
+            pos += 1
+
+    def _consume_string(self, text: str, pos: int) -> int:
+        chars_re = _STRICT_STRING_CHARS_RE if self.strict else _STRING_CHARS_RE
+        token = self._token
+        end = len(text)
+        while pos < end:
+            escape = self._escape
+            if escape == "\\":
+                char = text[pos]
+                pos += 1
+                if char == "u":
+                    self._escape = "\\u"
+                    continue
+                if char not in _ESCAPES:
+                    raise _Malformed
+                token.append(_ESCAPES[char])
+                self._escape = ""
+                self._high_surrogate = False
+            elif escape:
+                digits = text[pos : pos + 6 - len(escape)]
+                if not _HEX_DIGITS.issuperset(digits):
+                    raise _Malformed
+                pos += len(digits)
+                escape += digits
+                if len(escape) < 6:  # noqa: PLR2004
+                    self._escape = escape
+                    continue
+                self._escape = ""
+                hex_digits = escape[2:]
+                code = int(hex_digits, 16)
+                if self._high_surrogate and 0xDC00 <= code <= 0xDFFF:  # noqa: PLR2004
+                    # Combine an escaped surrogate pair, like `json.loads`.
+                    last = token.pop()
+                    high = ord(last[-1]) - 0xD800
+                    token.append(
+                        f"{last[:-1]}{chr(0x10000 + (high << 10) + code - 0xDC00)}"
+                    )
+                    self._high_surrogate = False
+                else:
+                    token.append(chr(code))
+                    self._high_surrogate = 0xD800 <= code <= 0xDBFF  # noqa: PLR2004
+            else:
+                run_end = chars_re.match(text, pos).end()  # type: ignore[union-attr]
+                if run_end > pos:
+                    token.append(text[pos:run_end])
+                    self._high_surrogate = False
+                    pos = run_end
+                if pos == end:
+                    break
+                char = text[pos]
+                pos += 1
+                if char == "\\":
+                    self._escape = "\\"
+                elif char == '"':
+                    value = "".join(token)
+                    if self._is_key:
+                        self._keys[-1] = value
+                        self._state = _COLON
+                    else:
+                        self._add_value(value)
+                    return pos
+                else:
+                    raise _Malformed
+        return pos
+
+    def _start_string(self, *, is_key: bool) -> None:
+        self._state = _STRING
+        self._is_key = is_key
+        self._token = []
+        self._escape = ""
+        self._high_surrogate = False
+
+    def _open(self, container: dict[str, Any] | list[Any], state: int) -> None:
+        self._add_to_parent(container)
+        self._containers.append(container)
+        self._keys.append(None)
+        self._state = state
+
+    def _close(self) -> None:
+        self._containers.pop()
+        self._keys.pop()
+        self._value_done()
+
+    def _add_value(self, value: Any) -> None:
+        self._add_to_parent(value)
+        self._value_done()
+
+    def _add_to_parent(self, value: Any) -> None:
+        if not self._containers:
+            self._root = value
+            return
+        parent = self._containers[-1]
+        if isinstance(parent, dict):
+            parent[cast("str", self._keys[-1])] = value
+        else:
+            parent.append(value)
+
+    def _value_done(self) -> None:
+        self._state = _AFTER_VALUE if self._containers else _DONE
+
+
+class _JsonStream:
+    """The parsers of the texts parsed while streaming one output.
+
+    While a stream is active, `_parse_partial_json_stream` resumes the parser of the
+    text that the new text extends, e.g. the accumulated text of the output or the
+    args of one of its tool calls, so that only the new part is parsed. The values
+    for successive texts share the objects and arrays that were already complete,
+    so they should be treated as read-only until the stream ends. Parsers are kept
+    per stream so that values are never shared with another stream.
+    """
+
+    def __init__(self) -> None:
+        """Create the parsers of a new stream."""
+        self._parsers: dict[tuple[str, bool], PartialJsonParser] = {}
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Use this stream's parsers in `_parse_partial_json_stream`.
+
+        Yields:
+            Nothing, once the stream is active.
+        """
+        token = _ACTIVE_JSON_STREAM.set(self)
+        try:
+            yield
+        finally:
+            _ACTIVE_JSON_STREAM.reset(token)
+
+    def parse(self, s: str, *, strict: bool) -> Any:
+        """Parse `s`, resuming the parser of a text it extends.
+
+        Args:
+            s: The JSON string to parse.
+            strict: Whether to use strict parsing.
+
+        Returns:
+            The parsed JSON object.
+        """
+        prefix = None
+        for text, parser_strict in self._parsers:
+            if (
+                parser_strict is strict
+                and (prefix is None or len(text) > len(prefix))
+                and s.startswith(text)
+            ):
+                prefix = text
+        if prefix is None:
+            parser = PartialJsonParser(strict=strict)
+            parser.feed(s)
+        else:
+            parser = self._parsers.pop((prefix, strict))
+            parser.feed(s[len(prefix) :])
+        if parser._mode != _FALLBACK:  # noqa: SLF001
+            self._parsers[s, strict] = parser
+            if len(self._parsers) > _MAX_STREAM_PARSERS:
+                del self._parsers[next(iter(self._parsers))]
+        return parser.parse()
+
+
+_ACTIVE_JSON_STREAM: ContextVar[_JsonStream | None] = ContextVar(
+    "_ACTIVE_JSON_STREAM", default=None
+)
+# The texts of one stream that are still being extended, e.g. its tool call args.
+_MAX_STREAM_PARSERS = 16
+# Shorter texts are cheap enough to parse from scratch.
+_MIN_STREAM_LENGTH = 128
+
+
+def _parse_partial_json_stream(s: str, *, strict: bool = False) -> Any:
+    """Parse a JSON string that may be missing closing braces, resuming earlier work.
+
+    Returns the same as `parse_partial_json`, but while a `_JsonStream` is active and
+    `s` extends a text parsed earlier in that stream, only the new text is parsed.
+
+    Args:
+        s: The JSON string to parse.
+        strict: Whether to use strict parsing.
+
+    Returns:
+        The parsed JSON object.
+    """
+    stream = _ACTIVE_JSON_STREAM.get()
+    if stream is None or len(s) < _MIN_STREAM_LENGTH:
+        return parse_partial_json(s, strict=strict)
+    return stream.parse(s, strict=strict)
+
+
 _json_markdown_re = re.compile(r"```(json)?(.*)", re.DOTALL)
 
 
@@ -7,6 +7,7 @@ and retrieve the data that are 'most similar' to the embedded query.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 import warnings
@@ -17,15 +18,17 @@ from typing import (
     Any,
     ClassVar,
     TypeVar,
+    cast,
 )
 
 from pydantic import ConfigDict, Field, model_validator
 from typing_extensions import Self, override
 
+from langchain_core.callbacks.manager import AsyncCallbackManager, CallbackManager
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.retrievers import BaseRetriever, LangSmithRetrieverParams
-from langchain_core.runnables.config import run_in_executor
+from langchain_core.runnables.config import get_config_list, run_in_executor
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
@@ -34,6 +37,7 @@ if TYPE_CHECKING:
         AsyncCallbackManagerForRetrieverRun,
         CallbackManagerForRetrieverRun,
     )
+    from langchain_core.runnables import RunnableConfig
 
 logger = logging.getLogger(__name__)
 
@@ -656,6 +660,45 @@ class VectorStore(ABC):
             None, self.similarity_search_by_vector, embedding, k=k, **kwargs
         )
 
+    def batch_similarity_search_by_vector(
+        self, embeddings: Sequence[list[float]], k: int = 4, **kwargs: Any
+    ) -> list[list[Document]]:
+        """Return docs most similar to each of several embedding vectors.
+
+        The default implementation calls `similarity_search_by_vector` once per
+        embedding. Implementations that can score many queries at once (e.g. with a
+        single matrix-matrix product) should override it.
+
+        Args:
+            embeddings: Embeddings to look up documents similar to.
+            k: Number of `Document` objects to return per embedding.
+            **kwargs: Arguments to pass to the search method, such as `filter`.
+
+        Returns:
+            One list of `Document` objects per embedding, in the same order.
+        """
+        return [
+            self.similarity_search_by_vector(embedding, k=k, **kwargs)
+            for embedding in embeddings
+        ]
+
+    async def abatch_similarity_search_by_vector(
+        self, embeddings: Sequence[list[float]], k: int = 4, **kwargs: Any
+    ) -> list[list[Document]]:
+        """Async return docs most similar to each of several embedding vectors.
+
+        Args:
+            embeddings: Embeddings to look up documents similar to.
+            k: Number of `Document` objects to return per embedding.
+            **kwargs: Arguments to pass to the search method, such as `filter`.
+
+        Returns:
+            One list of `Document` objects per embedding, in the same order.
+        """
+        return await run_in_executor(
+            None, self.batch_similarity_search_by_vector, embeddings, k=k, **kwargs
+        )
+
     def max_marginal_relevance_search(
         self,
         query: str,
@@ -1084,6 +1127,153 @@ class VectorStoreRetriever(BaseRetriever):
             raise ValueError(msg)
         return docs
 
+    def _supports_batch_search(self) -> bool:
+        """Whether `batch` can be served by a single batched vector search."""
+        return (
+            self.search_type == "similarity"
+            and self.vectorstore.embeddings is not None
+            and type(self.vectorstore).batch_similarity_search_by_vector
+            is not VectorStore.batch_similarity_search_by_vector
+        )
+
+    def _inheritable_metadata(
+        self, config: RunnableConfig, **kwargs: Any
+    ) -> dict[str, Any]:
+        return {**(config.get("metadata") or {}), **self._get_ls_params(**kwargs)}
+
+    @override
+    def batch(
+        self,
+        inputs: list[str],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Retrieve documents for several queries.
+
+        For `'similarity'` search on vector stores that implement
+        `batch_similarity_search_by_vector`, all queries are resolved with a single
+        batched search. Otherwise this falls back to the default `Runnable.batch`.
+
+        Args:
+            inputs: The query strings.
+            config: Configuration for the retriever, or one per input.
+            return_exceptions: Whether to return exceptions instead of raising them.
+            **kwargs: Additional arguments to pass to the retriever.
+
+        Returns:
+            One list of relevant documents per input.
+        """
+        if not inputs or not self._supports_batch_search():
+            return super().batch(
+                inputs, config, return_exceptions=return_exceptions, **kwargs
+            )
+        configs = get_config_list(config, len(inputs))
+        run_managers = [
+            CallbackManager.configure(
+                config_.get("callbacks"),
+                None,
+                verbose=kwargs.get("verbose", False),
+                inheritable_tags=config_.get("tags"),
+                local_tags=self.tags,
+                inheritable_metadata=self._inheritable_metadata(config_, **kwargs),
+                local_metadata=self.metadata,
+            ).on_retriever_start(
+                None,
+                input_,
+                name=config_.get("run_name") or self.get_name(),
+                run_id=config_.pop("run_id", None),
+            )
+            for input_, config_ in zip(inputs, configs, strict=True)
+        ]
+        embeddings = cast("Embeddings", self.vectorstore.embeddings)
+        try:
+            results = self.vectorstore.batch_similarity_search_by_vector(
+                [embeddings.embed_query(input_) for input_ in inputs],
+                **(self.search_kwargs | kwargs),
+            )
+        except Exception as e:
+            for run_manager in run_managers:
+                run_manager.on_retriever_error(e)
+            if return_exceptions:
+                return cast("list[list[Document]]", [e for _ in inputs])
+            raise
+        for run_manager, result in zip(run_managers, results, strict=True):
+            run_manager.on_retriever_end(result)
+        return results
+
+    @override
+    async def abatch(
+        self,
+        inputs: list[str],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Async retrieve documents for several queries.
+
+        For `'similarity'` search on vector stores that implement
+        `batch_similarity_search_by_vector`, all queries are resolved with a single
+        batched search. Otherwise this falls back to the default `Runnable.abatch`.
+
+        Args:
+            inputs: The query strings.
+            config: Configuration for the retriever, or one per input.
+            return_exceptions: Whether to return exceptions instead of raising them.
+            **kwargs: Additional arguments to pass to the retriever.
+
+        Returns:
+            One list of relevant documents per input.
+        """
+        if not inputs or not self._supports_batch_search():
+            return await super().abatch(
+                inputs, config, return_exceptions=return_exceptions, **kwargs
+            )
+        configs = get_config_list(config, len(inputs))
+        run_managers = await asyncio.gather(
+            *(
+                AsyncCallbackManager.configure(
+                    config_.get("callbacks"),
+                    None,
+                    verbose=kwargs.get("verbose", False),
+                    inheritable_tags=config_.get("tags"),
+                    local_tags=self.tags,
+                    inheritable_metadata=self._inheritable_metadata(config_, **kwargs),
+                    local_metadata=self.metadata,
+                ).on_retriever_start(
+                    None,
+                    input_,
+                    name=config_.get("run_name") or self.get_name(),
+                    run_id=config_.pop("run_id", None),
+                )
+                for input_, config_ in zip(inputs, configs, strict=True)
+            )
+        )
+        embeddings = cast("Embeddings", self.vectorstore.embeddings)
+        try:
+            query_embeddings = await asyncio.gather(
+                *(embeddings.aembed_query(input_) for input_ in inputs)
+            )
+            results = await self.vectorstore.abatch_similarity_search_by_vector(
+                query_embeddings, **(self.search_kwargs | kwargs)
+            )
+        except Exception as e:
+            await asyncio.gather(
+                *(run_manager.on_retriever_error(e) for run_manager in run_managers)
+            )
+            if return_exceptions:
+                return cast("list[list[Document]]", [e for _ in inputs])
+            raise
+        await asyncio.gather(
+            *(
+                run_manager.on_retriever_end(result)
+                for run_manager, result in zip(run_managers, results, strict=True)
+            )
+        )
+        return results
+
     def add_documents(self, documents: list[Document], **kwargs: Any) -> list[str]:
         """Add documents to the `VectorStore`.
 
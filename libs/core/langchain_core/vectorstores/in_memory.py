@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
 import uuid
+from itertools import pairwise
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Literal,
 )
 
 from typing_extensions import override
@@ -16,7 +20,11 @@ from langchain_core.documents import Document
 from langchain_core.load import dumpd, load
 from langchain_core.vectorstores import VectorStore
 from langchain_core.vectorstores.utils import _cosine_similarity as cosine_similarity
-from langchain_core.vectorstores.utils import maximal_marginal_relevance
+from langchain_core.vectorstores.utils import (
+    _MetadataIndex,
+    _VectorMatrix,
+    maximal_marginal_relevance,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator, Sequence
@@ -30,6 +38,59 @@ try:
 except ImportError:
     _HAS_NUMPY = False
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+_BINARY_FORMAT_VERSION = 1
+_HEADER_FILE = "header.json"
+_VECTORS_FILE = "vectors.f32"
+_NORMS_FILE = "norms.f32"
+_RECORDS_FILE = "records.jsonl"
+_OFFSETS_FILE = "offsets.u64"
+
+
+def _require_numpy(feature: str) -> None:
+    if not _HAS_NUMPY:
+        msg = f"numpy must be installed to use {feature}. pip install numpy"
+        raise ImportError(msg)
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    # Write to a temporary file and swap it in, so that stores which currently
+    # memory-map `path` keep reading the previous contents. The data reaches the
+    # disk before the swap, so a crash leaves either the old or the new file.
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(path)
+
+
+def _fsync_dir(path: Path) -> None:
+    # Make the files swapped in or removed in `path` durable. Directories can't be
+    # opened on every platform, e.g. on Windows, where this is not needed.
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        with contextlib.suppress(OSError):
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _read_float32(
+    path: Path, shape: tuple[int, ...], *, mmap: bool
+) -> npt.NDArray[np.float32]:
+    if 0 in shape:
+        return np.zeros(shape, dtype=np.float32)
+    if mmap:
+        # Copy-on-write: pages stay shared with other readers until modified.
+        return np.memmap(path, dtype="<f4", mode="c", shape=shape)
+    return np.fromfile(path, dtype="<f4").astype(np.float32).reshape(shape)
+
 
 class InMemoryVectorStore(VectorStore):
     """In-memory vector store implementation.
@@ -112,6 +173,17 @@ class InMemoryVectorStore(VectorStore):
         * thud [{'bar': 'baz'}]
         ```
 
+    Search with metadata filter:
+        Equality and `$in` conditions on metadata keys can be passed as a dict.
+        These are resolved from inverted indexes, so only matching documents are
+        scored.
+
+        ```python
+        results = vector_store.similarity_search(
+            query="thud", k=1, filter={"bar": {"$in": ["baz", "qux"]}}
+        )
+        ```
+
     Search with score:
         ```python
         results = vector_store.similarity_search_with_score(query="qux", k=1)
@@ -156,18 +228,50 @@ class InMemoryVectorStore(VectorStore):
         ```txt
         [Document(id='2', metadata={'bar': 'baz'}, page_content='thud')]
         ```
+
+    Matrix storage:
+        For large corpora, pass `storage="matrix"` to keep vectors in a contiguous,
+        pre-normalized float32 matrix instead of Python lists. Each query is then a
+        single matrix-vector product followed by a partial sort, and deletes are
+        tombstoned and compacted periodically.
+
+        ```python
+        vector_store = InMemoryVectorStore(OpenAIEmbeddings(), storage="matrix")
+        ```
+
+        In this mode the entries of `vector_store.store` do not carry a `'vector'`
+        key; vectors are owned by the matrix and are re-materialized by `dump`.
     """
 
-    def __init__(self, embedding: Embeddings) -> None:
+    def __init__(
+        self,
+        embedding: Embeddings,
+        *,
+        storage: Literal["dict", "matrix"] = "dict",
+    ) -> None:
         """Initialize with the given embedding function.
 
         Args:
             embedding: embedding function to use.
+            storage: Where vectors are kept. `'dict'` stores each vector as a list
+                inside `store`; `'matrix'` keeps them in a contiguous numpy matrix,
+                which is much faster to search on large corpora.
+
+        Raises:
+            ValueError: If `storage` is not a supported value.
+            ImportError: If `storage='matrix'` and numpy is not installed.
         """
+        if storage not in {"dict", "matrix"}:
+            msg = f"storage must be 'dict' or 'matrix', got {storage!r}."
+            raise ValueError(msg)
         # TODO: would be nice to change to
         # dict[str, Document] at some point (will be a breaking change)
         self.store: dict[str, dict[str, Any]] = {}
         self.embedding = embedding
+        self._matrix: _VectorMatrix | None = (
+            _VectorMatrix() if storage == "matrix" else None
+        )
+        self._metadata_index = _MetadataIndex()
 
     @property
     @override
@@ -178,7 +282,11 @@ class InMemoryVectorStore(VectorStore):
     def delete(self, ids: Sequence[str] | None = None, **kwargs: Any) -> None:
         if ids:
             for id_ in ids:
-                self.store.pop(id_, None)
+                record = self.store.pop(id_, None)
+                if record is not None:
+                    self._metadata_index.remove(id_, record["metadata"])
+            if self._matrix is not None:
+                self._matrix.delete(ids)
 
     @override
     async def adelete(self, ids: Sequence[str] | None = None, **kwargs: Any) -> None:
@@ -201,24 +309,7 @@ class InMemoryVectorStore(VectorStore):
             )
             raise ValueError(msg)
 
-        id_iterator: Iterator[str | None] = (
-            iter(ids) if ids else iter(doc.id for doc in documents)
-        )
-
-        ids_ = []
-
-        for doc, vector in zip(documents, vectors, strict=False):
-            doc_id = next(id_iterator)
-            doc_id_ = doc_id or str(uuid.uuid4())
-            ids_.append(doc_id_)
-            self.store[doc_id_] = {
-                "id": doc_id_,
-                "vector": vector,
-                "text": doc.page_content,
-                "metadata": doc.metadata,
-            }
-
-        return ids_
+        return self._upsert(documents, vectors, ids)
 
     @override
     async def aadd_documents(
@@ -234,6 +325,14 @@ class InMemoryVectorStore(VectorStore):
             )
             raise ValueError(msg)
 
+        return self._upsert(documents, vectors, ids)
+
+    def _upsert(
+        self,
+        documents: list[Document],
+        vectors: list[list[float]],
+        ids: list[str] | None,
+    ) -> list[str]:
         id_iterator: Iterator[str | None] = (
             iter(ids) if ids else iter(doc.id for doc in documents)
         )
@@ -243,13 +342,19 @@ class InMemoryVectorStore(VectorStore):
             doc_id = next(id_iterator)
             doc_id_ = doc_id or str(uuid.uuid4())
             ids_.append(doc_id_)
-            self.store[doc_id_] = {
-                "id": doc_id_,
-                "vector": vector,
-                "text": doc.page_content,
-                "metadata": doc.metadata,
-            }
-
+            record: dict[str, Any] = {"id": doc_id_}
+            if self._matrix is None:
+                record["vector"] = vector
+            record["text"] = doc.page_content
+            # Copied so that changes to `doc.metadata` can't desync the index.
+            record["metadata"] = dict(doc.metadata)
+            if (previous := self.store.get(doc_id_)) is not None:
+                self._metadata_index.remove(doc_id_, previous["metadata"])
+            self.store[doc_id_] = record
+            self._metadata_index.add(doc_id_, record["metadata"])
+
+        if self._matrix is not None:
+            self._matrix.upsert(ids_, vectors[: len(ids_)])
         return ids_
 
     @override
@@ -292,22 +397,14 @@ class InMemoryVectorStore(VectorStore):
         self,
         embedding: list[float],
         k: int = 4,
-        filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,  # noqa: A002
     ) -> list[tuple[Document, float, list[float]]]:
-        # Get all docs with fixed order in list
-        docs = list(self.store.values())
-
-        if filter is not None:
-            docs = [
-                doc
-                for doc in docs
-                if filter(
-                    Document(
-                        id=doc["id"], page_content=doc["text"], metadata=doc["metadata"]
-                    )
-                )
-            ]
+        if self._matrix is not None:
+            return self._matrix_search_with_score_by_vector(
+                self._matrix, embedding, k, filter
+            )
 
+        docs = self._candidate_records(filter)
         if not docs:
             return []
 
@@ -331,11 +428,228 @@ class InMemoryVectorStore(VectorStore):
             if (doc_dict := docs[idx])
         ]
 
+    def _matrix_search_with_score_by_vector(
+        self,
+        matrix: _VectorMatrix,
+        embedding: list[float],
+        k: int,
+        filter: Callable[[Document], bool] | dict[str, Any] | None,  # noqa: A002
+    ) -> list[tuple[Document, float, list[float]]]:
+        rows = self._filtered_rows(matrix, filter)
+        if rows is not None and not rows:
+            return []
+
+        top_rows, scores = matrix.search(embedding, k, rows=rows)
+        results = []
+        for row, score in zip(top_rows.tolist(), scores.tolist(), strict=True):
+            if (id_ := matrix.id_at(row)) is None:
+                continue
+            doc_dict = self.store[id_]
+            results.append(
+                (
+                    Document(
+                        id=doc_dict["id"],
+                        page_content=doc_dict["text"],
+                        metadata=doc_dict["metadata"],
+                    ),
+                    float(score),
+                    # Normalized vectors are sufficient for cosine-based MMR.
+                    matrix.normalized(row),
+                )
+            )
+        return results
+
+    def _metadata_filter_ids(self, filter: dict[str, Any]) -> set[str]:  # noqa: A002
+        """Resolve a declarative metadata filter to the set of matching ids.
+
+        Each key of `filter` is a metadata key and each value is either the value
+        to match, `{"$eq": value}`, or `{"$in": [value, ...]}`. All keys must match.
+        """
+        candidates: set[str] | None = None
+        for key, condition in filter.items():
+            if isinstance(condition, dict):
+                if len(condition) != 1:
+                    msg = (
+                        f"Filter condition for {key!r} must have exactly one "
+                        f"operator, got {condition!r}."
+                    )
+                    raise ValueError(msg)
+                ((operator, operand),) = condition.items()
+                if operator == "$eq":
+                    values = [operand]
+                elif operator == "$in":
+                    if not isinstance(operand, (list, tuple, set, frozenset)):
+                        msg = (
+                            f"The '$in' operand for {key!r} must be a list, tuple or "
+                            f"set, got {operand!r}."
+                        )
+                        raise ValueError(msg)
+                    values = list(operand)
+                else:
+                    msg = (
+                        f"Unsupported filter operator {operator!r} for {key!r}. "
+                        "Supported operators are '$eq' and '$in'."
+                    )
+                    raise ValueError(msg)
+            else:
+                values = [condition]
+            ids = self._metadata_index.lookup(key, values, self.store)
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+        return set(self.store) if candidates is None else candidates
+
+    def _candidate_records(
+        self,
+        filter: Callable[[Document], bool] | dict[str, Any] | None,  # noqa: A002
+    ) -> list[dict[str, Any]]:
+        """Return the stored records accepted by `filter`."""
+        if filter is None:
+            # Get all docs with fixed order in list
+            return list(self.store.values())
+        if isinstance(filter, dict):
+            # Sorted so that ties between equally similar documents are broken in
+            # the same order on every run.
+            return [
+                self.store[id_] for id_ in sorted(self._metadata_filter_ids(filter))
+            ]
+        return [
+            doc
+            for doc in self.store.values()
+            if filter(
+                Document(
+                    id=doc["id"], page_content=doc["text"], metadata=doc["metadata"]
+                )
+            )
+        ]
+
+    def _filtered_rows(
+        self,
+        matrix: _VectorMatrix,
+        filter: Callable[[Document], bool] | dict[str, Any] | None,  # noqa: A002
+    ) -> list[int] | None:
+        """Return the matrix rows of the documents accepted by `filter`.
+
+        Returns `None` when there is no filter, meaning every row is a candidate.
+        """
+        if filter is None:
+            return None
+        if isinstance(filter, dict):
+            return sorted(
+                row
+                for id_ in self._metadata_filter_ids(filter)
+                if (row := matrix.row(id_)) is not None
+            )
+        return [
+            row
+            for doc in self.store.values()
+            if filter(
+                Document(
+                    id=doc["id"], page_content=doc["text"], metadata=doc["metadata"]
+                )
+            )
+            and (row := matrix.row(doc["id"])) is not None
+        ]
+
+    def _batch_similarity_search_with_score_by_vector(
+        self,
+        embeddings: Sequence[list[float]],
+        k: int = 4,
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,  # noqa: A002
+    ) -> list[list[tuple[Document, float]]]:
+        if not embeddings:
+            return []
+
+        if self._matrix is not None:
+            matrix = self._matrix
+            rows = self._filtered_rows(matrix, filter)
+            if rows is not None and not rows:
+                return [[] for _ in embeddings]
+            batch_hits = [
+                [
+                    (matrix.id_at(row), score)
+                    for row, score in zip(
+                        top_rows.tolist(), scores.tolist(), strict=True
+                    )
+                ]
+                for top_rows, scores in matrix.batch_search(
+                    list(embeddings), k, rows=rows
+                )
+            ]
+        else:
+            docs = self._candidate_records(filter)
+            if not docs:
+                return [[] for _ in embeddings]
+            # One similarity matrix of shape (n_queries, n_docs) for all queries.
+            similarity = cosine_similarity(
+                list(embeddings), [doc["vector"] for doc in docs]
+            )
+            batch_hits = [
+                [
+                    (docs[idx]["id"], float(row_similarity[idx]))
+                    for idx in row_similarity.argsort()[::-1][:k]
+                ]
+                for row_similarity in similarity
+            ]
+
+        return [
+            [
+                (
+                    Document(
+                        id=doc_dict["id"],
+                        page_content=doc_dict["text"],
+                        metadata=doc_dict["metadata"],
+                    ),
+                    score,
+                )
+                for id_, score in hits
+                if id_ is not None and (doc_dict := self.store[id_])
+            ]
+            for hits in batch_hits
+        ]
+
+    @override
+    def batch_similarity_search_by_vector(
+        self,
+        embeddings: Sequence[list[float]],
+        k: int = 4,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Return docs most similar to each of several embedding vectors.
+
+        All queries are scored against the corpus with a single matrix-matrix
+        product, so this is much cheaper than searching each embedding separately.
+
+        Args:
+            embeddings: Embeddings to look up documents similar to.
+            k: Number of `Document` objects to return per embedding.
+            **kwargs: Other arguments; `filter` is a function or a metadata filter
+                dict, as in `similarity_search_with_score_by_vector`.
+
+        Returns:
+            One list of `Document` objects per embedding, in the same order.
+        """
+        return [
+            [doc for doc, _ in docs_and_scores]
+            for docs_and_scores in self._batch_similarity_search_with_score_by_vector(
+                embeddings, k, filter=kwargs.get("filter")
+            )
+        ]
+
+    @override
+    async def abatch_similarity_search_by_vector(
+        self,
+        embeddings: Sequence[list[float]],
+        k: int = 4,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        return self.batch_similarity_search_by_vector(embeddings, k, **kwargs)
+
     def similarity_search_with_score_by_vector(
         self,
         embedding: list[float],
         k: int = 4,
-        filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,  # noqa: A002
         **_kwargs: Any,
     ) -> list[tuple[Document, float]]:
         """Search for the most similar documents to the given embedding.
@@ -343,7 +657,11 @@ class InMemoryVectorStore(VectorStore):
         Args:
             embedding: The embedding to search for.
             k: The number of documents to return.
-            filter: A function to filter the documents.
+            filter: A function to filter the documents, or a dict of metadata
+                conditions such as `{"tenant": "a", "lang": {"$in": ["en", "fr"]}}`.
+                Dict filters only support equality (`value` or `{"$eq": value}`)
+                and membership (`{"$in": [...]}`), but are answered from inverted
+                indexes so only matching documents are scored.
 
         Returns:
             A list of tuples of `Document` objects and their similarity scores.
@@ -423,7 +741,7 @@ class InMemoryVectorStore(VectorStore):
         fetch_k: int = 20,
         lambda_mult: float = 0.5,
         *,
-        filter: Callable[[Document], bool] | None = None,
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> list[Document]:
         prefetch_hits = self._similarity_search_with_score_by_vector(
@@ -432,12 +750,7 @@ class InMemoryVectorStore(VectorStore):
             filter=filter,
         )
 
-        if not _HAS_NUMPY:
-            msg = (
-                "numpy must be installed to use max_marginal_relevance_search "
-                "pip install numpy"
-            )
-            raise ImportError(msg)
+        _require_numpy("max_marginal_relevance_search")
 
         mmr_chosen_indices = maximal_marginal_relevance(
             np.array(embedding, dtype=np.float32),
@@ -490,10 +803,13 @@ class InMemoryVectorStore(VectorStore):
         texts: list[str],
         embedding: Embeddings,
         metadatas: list[dict[str, Any]] | None = None,
+        *,
+        storage: Literal["dict", "matrix"] = "dict",
         **kwargs: Any,
     ) -> InMemoryVectorStore:
         store = cls(
             embedding=embedding,
+            storage=storage,
         )
         store.add_texts(texts=texts, metadatas=metadatas, **kwargs)
         return store
@@ -505,10 +821,13 @@ class InMemoryVectorStore(VectorStore):
         texts: list[str],
         embedding: Embeddings,
         metadatas: list[dict[str, Any]] | None = None,
+        *,
+        storage: Literal["dict", "matrix"] = "dict",
         **kwargs: Any,
     ) -> InMemoryVectorStore:
         store = cls(
             embedding=embedding,
+            storage=storage,
         )
         await store.aadd_texts(texts=texts, metadatas=metadatas, **kwargs)
         return store
@@ -531,6 +850,9 @@ class InMemoryVectorStore(VectorStore):
         with path_.open("r", encoding="utf-8") as f:
             store = load(json.load(f), allowed_objects=[Document])
         vectorstore = cls(embedding=embedding, **kwargs)
+        if vectorstore._matrix is not None:
+            vectors = [record.pop("vector") for record in store.values()]
+            vectorstore._matrix.upsert(list(store), vectors)
         vectorstore.store = store
         return vectorstore
 
@@ -543,4 +865,155 @@ class InMemoryVectorStore(VectorStore):
         path_: Path = Path(path)
         path_.parent.mkdir(exist_ok=True, parents=True)
         with path_.open("w", encoding="utf-8") as f:
-            json.dump(dumpd(self.store), f, indent=2)
+            json.dump(dumpd(self._records_with_vectors()), f, indent=2)
+
+    def dump_binary(self, path: str) -> None:
+        """Dump the vector store to a directory in a compact binary format.
+
+        Vectors are written L2-normalized as a raw little-endian float32 matrix (with
+        their norms alongside) that `load_binary` can memory-map. Ids, texts and
+        metadata are written as JSON lines with a uint64 offset table, so metadata
+        must be JSON-serializable.
+
+        Args:
+            path: The directory to dump the vector store to.
+        """
+        _require_numpy("dump_binary")
+        dir_ = Path(path)
+        dir_.mkdir(exist_ok=True, parents=True)
+        if self._matrix is not None:
+            ids, normalized, norms = self._matrix.to_normalized()
+        else:
+            matrix = _VectorMatrix()
+            matrix.upsert(
+                list(self.store), [record["vector"] for record in self.store.values()]
+            )
+            ids, normalized, norms = matrix.to_normalized()
+
+        lines = [
+            json.dumps(
+                {
+                    "id": id_,
+                    "text": self.store[id_]["text"],
+                    "metadata": self.store[id_]["metadata"],
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            + b"\n"
+            for id_ in ids
+        ]
+        offsets = np.zeros(len(lines) + 1, dtype="<u8")
+        np.cumsum([len(line) for line in lines], out=offsets[1:])
+
+        # The header of a previous dump is removed first and the new one is written
+        # last, so that an interrupted dump is detected rather than its files read
+        # with the previous header.
+        (dir_ / _HEADER_FILE).unlink(missing_ok=True)
+        _fsync_dir(dir_)
+        _replace_file(dir_ / _VECTORS_FILE, normalized.astype("<f4").tobytes())
+        _replace_file(dir_ / _NORMS_FILE, norms.astype("<f4").tobytes())
+        _replace_file(dir_ / _RECORDS_FILE, b"".join(lines))
+        _replace_file(dir_ / _OFFSETS_FILE, offsets.tobytes())
+        _fsync_dir(dir_)
+        header = {
+            "version": _BINARY_FORMAT_VERSION,
+            "count": len(ids),
+            "dim": int(normalized.shape[1]) if normalized.ndim == 2 else 0,  # noqa: PLR2004
+            "dtype": "<f4",
+        }
+        _replace_file(dir_ / _HEADER_FILE, json.dumps(header).encode("utf-8"))
+        _fsync_dir(dir_)
+
+    @classmethod
+    def load_binary(
+        cls,
+        path: str,
+        embedding: Embeddings,
+        *,
+        mmap: bool = True,
+        **kwargs: Any,
+    ) -> InMemoryVectorStore:
+        """Load a vector store written by `dump_binary`.
+
+        With `storage="matrix"`, the vector file is memory-mapped copy-on-write and
+        searched in place, so loading does not read the vectors up front and
+        processes that load the same index share the OS page cache.
+
+        Args:
+            path: The directory to load the vector store from.
+            embedding: The embedding to use.
+            mmap: Whether to memory-map the vectors instead of reading them.
+            **kwargs: Additional arguments to pass to the constructor.
+
+        Returns:
+            A `VectorStore` object.
+
+        Raises:
+            ValueError: If the directory does not contain a complete, supported dump.
+        """
+        _require_numpy("load_binary")
+        dir_ = Path(path)
+        header_path = dir_ / _HEADER_FILE
+        if not header_path.is_file():
+            msg = f"No complete binary vector store dump in {dir_}."
+            raise ValueError(msg)
+        header = json.loads(header_path.read_text(encoding="utf-8"))
+        if header.get("version") != _BINARY_FORMAT_VERSION:
+            msg = (
+                f"Unsupported binary vector store format version "
+                f"{header.get('version')!r} in {dir_}."
+            )
+            raise ValueError(msg)
+        count, dim = header["count"], header["dim"]
+        sizes = {
+            _VECTORS_FILE: count * dim * 4,
+            _NORMS_FILE: count * 4,
+            _OFFSETS_FILE: (count + 1) * 8,
+        }
+        for name, size in sizes.items():
+            if (dir_ / name).stat().st_size != size:
+                msg = f"The binary vector store dump in {dir_} is inconsistent."
+                raise ValueError(msg)
+        normalized = _read_float32(dir_ / _VECTORS_FILE, (count, dim), mmap=mmap)
+        norms = _read_float32(dir_ / _NORMS_FILE, (count,), mmap=mmap)
+        offsets = np.fromfile(dir_ / _OFFSETS_FILE, dtype="<u8").tolist()
+        data = (dir_ / _RECORDS_FILE).read_bytes()
+        if len(data) != offsets[-1]:
+            msg = f"The binary vector store dump in {dir_} is inconsistent."
+            raise ValueError(msg)
+        records = [json.loads(data[start:end]) for start, end in pairwise(offsets)]
+
+        vectorstore = cls(embedding=embedding, **kwargs)
+        if vectorstore._matrix is not None:
+            if count:
+                vectorstore._matrix = _VectorMatrix.from_normalized(
+                    [record["id"] for record in records], normalized, norms
+                )
+            vectorstore.store = {
+                record["id"]: {
+                    "id": record["id"],
+                    "text": record["text"],
+                    "metadata": record["metadata"],
+                }
+                for record in records
+            }
+        else:
+            vectorstore.store = {
+                record["id"]: {
+                    "id": record["id"],
+                    "vector": (row * norm).tolist(),
+                    "text": record["text"],
+                    "metadata": record["metadata"],
+                }
+                for record, row, norm in zip(records, normalized, norms, strict=True)
+            }
+        return vectorstore
+
+    def _records_with_vectors(self) -> dict[str, dict[str, Any]]:
+        if self._matrix is None:
+            return self.store
+        return {
+            id_: {**record, "vector": self._matrix.get(id_)}
+            for id_, record in self.store.items()
+        }
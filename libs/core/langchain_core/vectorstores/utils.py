@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import logging
 import warnings
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 try:
     import numpy as np
@@ -27,6 +27,8 @@ except ImportError:
     _HAS_SIMSIMD = False
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping, Sequence
+
     import numpy.typing as npt
 
     Matrix = (
@@ -117,6 +119,11 @@ def maximal_marginal_relevance(
 ) -> list[int]:
     """Calculate maximal marginal relevance.
 
+    Candidates are normalized once, and the maximum similarity of every candidate
+    to the already selected set is kept as a running vector that is updated with a
+    single matrix-vector product per selection, so each step is `O(n)` vectorized
+    work instead of re-scoring every candidate against the whole selected set.
+
     Args:
         query_embedding: The query embedding.
         embedding_list: A list of embeddings.
@@ -136,28 +143,403 @@ def maximal_marginal_relevance(
         )
         raise ImportError(msg)
 
-    if min(k, len(embedding_list)) <= 0:
+    k = min(k, len(embedding_list))
+    if k <= 0:
         return []
     if query_embedding.ndim == 1:
         query_embedding = np.expand_dims(query_embedding, axis=0)
     similarity_to_query = _cosine_similarity(query_embedding, embedding_list)[0]
+
+    embeddings = np.array(embedding_list)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    # Zero vectors get a zero row, matching `_cosine_similarity`, which maps the
+    # resulting NaN similarities to 0.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = embeddings / norms
+    normalized[~np.isfinite(normalized)] = 0.0
+
     most_similar = int(np.argmax(similarity_to_query))
     idxs = [most_similar]
-    selected = np.array([embedding_list[most_similar]])
-    while len(idxs) < min(k, len(embedding_list)):
-        best_score = -np.inf
-        idx_to_add = -1
-        similarity_to_selected = _cosine_similarity(embedding_list, selected)
-        for i, query_score in enumerate(similarity_to_query):
-            if i in idxs:
-                continue
-            redundant_score = max(similarity_to_selected[i])
-            equation_score = (
-                lambda_mult * query_score - (1 - lambda_mult) * redundant_score
-            )
-            if equation_score > best_score:
-                best_score = equation_score
-                idx_to_add = i
+    max_similarity_to_selected = normalized @ normalized[most_similar]
+    query_term = lambda_mult * similarity_to_query
+    available = np.ones(len(embedding_list), dtype=bool)
+    available[most_similar] = False
+    while len(idxs) < k:
+        equation_score = query_term - (1 - lambda_mult) * max_similarity_to_selected
+        equation_score[~available] = -np.inf
+        # `argmax` returns the first maximum, matching a strict `>` scan.
+        idx_to_add = int(np.argmax(equation_score))
         idxs.append(idx_to_add)
-        selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
+        available[idx_to_add] = False
+        np.maximum(
+            max_similarity_to_selected,
+            normalized @ normalized[idx_to_add],
+            out=max_similarity_to_selected,
+        )
     return idxs
+
+
+class _VectorMatrix:
+    """Contiguous, pre-normalized float32 storage for in-memory vector search.
+
+    Vectors are L2-normalized on insert and kept in a single row-major buffer that
+    grows geometrically, so cosine similarity against the whole corpus is one
+    matrix-vector product. Deleted rows are tombstoned and reclaimed by `compact`,
+    which runs automatically once tombstones exceed `compaction_ratio` of the used
+    rows.
+    """
+
+    def __init__(
+        self, *, initial_capacity: int = 16, compaction_ratio: float = 0.5
+    ) -> None:
+        """Initialize an empty matrix.
+
+        Args:
+            initial_capacity: Number of rows allocated on first insert.
+            compaction_ratio: Fraction of tombstoned rows that triggers compaction.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if not _HAS_NUMPY:
+            msg = (
+                "_VectorMatrix requires numpy to be installed. "
+                "Please install numpy with `pip install numpy`."
+            )
+            raise ImportError(msg)
+        self._initial_capacity = max(1, initial_capacity)
+        self._compaction_ratio = compaction_ratio
+        self._dim: int | None = None
+        self._data: npt.NDArray[np.float32] = np.empty((0, 0), dtype=np.float32)
+        self._norms: npt.NDArray[np.float32] = np.empty(0, dtype=np.float32)
+        self._alive: npt.NDArray[np.bool_] = np.empty(0, dtype=np.bool_)
+        self._row_ids: list[str | None] = []
+        self._id_to_row: dict[str, int] = {}
+        self._size = 0
+        self._n_deleted = 0
+
+    @classmethod
+    def from_normalized(
+        cls,
+        ids: Sequence[str],
+        normalized: npt.NDArray[np.float32],
+        norms: npt.NDArray[np.float32],
+    ) -> _VectorMatrix:
+        """Build a matrix that adopts already-normalized rows without copying them.
+
+        This lets the matrix sit directly on top of a (copy-on-write) `np.memmap`;
+        the buffer is only copied into memory once it needs to grow.
+
+        Args:
+            ids: Ids of the rows, in row order.
+            normalized: L2-normalized vectors of shape `(len(ids), dim)`.
+            norms: The original norm of each row.
+
+        Returns:
+            The matrix.
+        """
+        matrix = cls()
+        matrix._dim = int(normalized.shape[1])
+        matrix._data = normalized
+        matrix._norms = norms
+        matrix._alive = np.ones(len(ids), dtype=np.bool_)
+        matrix._row_ids = list(ids)
+        matrix._id_to_row = {id_: row for row, id_ in enumerate(ids)}
+        matrix._size = len(ids)
+        return matrix
+
+    def to_normalized(
+        self,
+    ) -> tuple[list[str], npt.NDArray[np.float32], npt.NDArray[np.float32]]:
+        """Return the live ids, normalized rows and norms, compacting first."""
+        self.compact()
+        ids = [id_ for id_ in self._row_ids if id_ is not None]
+        return ids, self._data[: self._size], self._norms[: self._size]
+
+    def __len__(self) -> int:
+        return self._size - self._n_deleted
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self._id_to_row
+
+    @property
+    def dim(self) -> int | None:
+        """Dimensionality of the stored vectors, or `None` if nothing was added."""
+        return self._dim
+
+    def row(self, id_: str) -> int | None:
+        """Return the row currently holding `id_`, if any."""
+        return self._id_to_row.get(id_)
+
+    def id_at(self, row: int) -> str | None:
+        """Return the id stored at `row`, or `None` for a tombstone."""
+        return self._row_ids[row]
+
+    def _reserve(self, n_rows: int) -> None:
+        capacity = self._data.shape[0]
+        if n_rows <= capacity:
+            return
+        new_capacity = max(capacity, self._initial_capacity)
+        while new_capacity < n_rows:
+            new_capacity *= 2
+        data = np.zeros((new_capacity, self._dim or 0), dtype=np.float32)
+        data[: self._size] = self._data[: self._size]
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        norms[: self._size] = self._norms[: self._size]
+        alive = np.zeros(new_capacity, dtype=np.bool_)
+        alive[: self._size] = self._alive[: self._size]
+        self._data, self._norms, self._alive = data, norms, alive
+
+    def upsert(self, ids: Sequence[str], vectors: Matrix) -> None:
+        """Insert or overwrite the vectors stored under `ids`.
+
+        Args:
+            ids: Ids of the vectors, one per row of `vectors`.
+            vectors: A matrix of shape `(len(ids), dim)`.
+
+        Raises:
+            ValueError: If the shapes of `ids` and `vectors` disagree, or if the
+                vectors do not match the dimensionality already stored.
+        """
+        if not ids:
+            return
+        array = np.array(vectors, dtype=np.float32)
+        if array.ndim != 2 or array.shape[0] != len(ids):  # noqa: PLR2004
+            msg = (
+                f"Expected a matrix with one row per id. Got {len(ids)} ids and "
+                f"vectors of shape {array.shape}."
+            )
+            raise ValueError(msg)
+        if self._dim is None:
+            self._dim = int(array.shape[1])
+            self._data = np.empty((0, self._dim), dtype=np.float32)
+        elif array.shape[1] != self._dim:
+            msg = f"Expected vectors of dimension {self._dim}, got {array.shape[1]}."
+            raise ValueError(msg)
+
+        norms = np.linalg.norm(array, axis=1)
+        # Zero vectors keep a zero row so that they score 0 against any query.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            array /= norms[:, None]
+        array[~np.isfinite(array)] = 0.0
+
+        self._reserve(self._size + len(set(ids).difference(self._id_to_row)))
+        rows = np.empty(len(ids), dtype=np.intp)
+        for i, id_ in enumerate(ids):
+            row = self._id_to_row.get(id_)
+            if row is None:
+                row = self._size
+                self._size += 1
+                self._id_to_row[id_] = row
+                self._row_ids.append(id_)
+            rows[i] = row
+        # With repeated ids, numpy assigns the last occurrence, like a dict would.
+        self._data[rows] = array
+        self._norms[rows] = norms
+        self._alive[rows] = True
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Tombstone the rows stored under `ids`, ignoring unknown ids."""
+        for id_ in ids:
+            row = self._id_to_row.pop(id_, None)
+            if row is None:
+                continue
+            self._alive[row] = False
+            self._row_ids[row] = None
+            self._n_deleted += 1
+        if self._n_deleted and self._n_deleted >= self._size * self._compaction_ratio:
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop tombstoned rows, preserving the relative order of live rows."""
+        if not self._n_deleted:
+            return
+        keep = np.flatnonzero(self._alive[: self._size])
+        n_alive = len(keep)
+        self._data[:n_alive] = self._data[keep]
+        self._norms[:n_alive] = self._norms[keep]
+        self._alive[:n_alive] = True
+        self._alive[n_alive : self._size] = False
+        self._row_ids = [self._row_ids[row] for row in keep]
+        self._id_to_row = {
+            id_: row for row, id_ in enumerate(self._row_ids) if id_ is not None
+        }
+        self._size = n_alive
+        self._n_deleted = 0
+
+    def get(self, id_: str) -> list[float] | None:
+        """Reconstruct the original (un-normalized) vector stored under `id_`."""
+        row = self._id_to_row.get(id_)
+        if row is None:
+            return None
+        vector: list[float] = (self._data[row] * self._norms[row]).tolist()
+        return vector
+
+    def normalized(self, row: int) -> list[float]:
+        """Return the normalized vector stored at `row`."""
+        vector: list[float] = self._data[row].tolist()
+        return vector
+
+    def search(
+        self,
+        query: Sequence[float] | npt.NDArray[np.floating],
+        k: int,
+        rows: Sequence[int] | npt.NDArray[np.intp] | None = None,
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.float32]]:
+        """Find the `k` rows most cosine-similar to `query`.
+
+        Args:
+            query: The query vector.
+            k: The number of rows to return.
+            rows: If given, only these rows are scored.
+
+        Returns:
+            The selected rows and their cosine similarity, best match first.
+
+        Raises:
+            ValueError: If `query` does not match the stored dimensionality.
+        """
+        return self.batch_search(np.asarray(query)[None, :], k, rows=rows)[0]
+
+    def batch_search(
+        self,
+        queries: Matrix,
+        k: int,
+        rows: Sequence[int] | npt.NDArray[np.intp] | None = None,
+    ) -> list[tuple[npt.NDArray[np.intp], npt.NDArray[np.float32]]]:
+        """Find the `k` rows most cosine-similar to each of `queries`.
+
+        All queries are scored with a single matrix-matrix product.
+
+        Args:
+            queries: A matrix of shape `(n_queries, dim)`.
+            k: The number of rows to return per query.
+            rows: If given, only these rows are scored.
+
+        Returns:
+            For each query, the selected rows and their cosine similarity, best match
+                first.
+
+        Raises:
+            ValueError: If `queries` do not match the stored dimensionality.
+        """
+        empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32))
+        if len(queries) == 0:
+            return []
+        if self._dim is None or k <= 0:
+            return [empty for _ in range(len(queries))]
+        q = np.array(queries, dtype=np.float32)
+        if q.ndim != 2 or q.shape[1] != self._dim:  # noqa: PLR2004
+            msg = f"Expected queries of dimension {self._dim}, got shape {q.shape}."
+            raise ValueError(msg)
+        q_norms = np.linalg.norm(q, axis=1, keepdims=True)
+        q /= np.where(q_norms == 0, 1, q_norms)
+
+        if rows is None:
+            scores = q @ self._data[: self._size].T
+            if self._n_deleted:
+                scores[:, ~self._alive[: self._size]] = -np.inf
+            n_candidates = len(self)
+        else:
+            rows = np.asarray(rows, dtype=np.intp)
+            scores = q @ self._data[rows].T
+            n_candidates = len(rows)
+
+        k = min(k, n_candidates)
+        if k == 0:
+            return [empty for _ in range(len(q))]
+        n_scores = scores.shape[1]
+        if k < n_scores:
+            top = np.argpartition(scores, n_scores - k, axis=1)[:, n_scores - k :]
+        else:
+            top = np.broadcast_to(np.arange(n_scores), scores.shape)
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        if rows is not None:
+            top = rows[top]
+        return list(zip(top, top_scores, strict=True))
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class _MetadataIndex:
+    """Inverted index from metadata values to document ids.
+
+    Postings for a metadata key are built on the first lookup of that key and are
+    then maintained incrementally by `add` and `remove`, so only keys that are
+    actually filtered on pay for indexing. Unhashable metadata values are not
+    indexed and therefore never match.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._postings: dict[str, dict[Hashable, set[str]]] = {}
+
+    def clear(self) -> None:
+        """Drop all postings; they are rebuilt lazily on the next lookup."""
+        self._postings.clear()
+
+    def add(self, id_: str, metadata: Mapping[str, Any]) -> None:
+        """Index `metadata` of `id_` under every key that is already indexed."""
+        for key, postings in self._postings.items():
+            if key in metadata and _is_hashable(value := metadata[key]):
+                postings.setdefault(value, set()).add(id_)
+
+    def remove(self, id_: str, metadata: Mapping[str, Any]) -> None:
+        """Remove `id_` from the postings of `metadata`."""
+        for key, postings in self._postings.items():
+            if key not in metadata or not _is_hashable(value := metadata[key]):
+                continue
+            ids = postings.get(value)
+            if ids is not None:
+                ids.discard(id_)
+                if not ids:
+                    del postings[value]
+
+    def lookup(
+        self,
+        key: str,
+        values: Iterable[Any],
+        records: Mapping[str, Mapping[str, Any]],
+    ) -> set[str]:
+        """Return the ids whose metadata `key` equals any of `values`.
+
+        Args:
+            key: The metadata key.
+            values: Accepted values for the key.
+            records: All stored records, used to build the postings for `key` on
+                first use. Each record must have `'id'` and `'metadata'` entries.
+
+        Returns:
+            The set of matching ids.
+
+        Raises:
+            ValueError: If one of `values` is not hashable.
+        """
+        postings = self._postings.get(key)
+        if postings is None:
+            postings = {}
+            for record in records.values():
+                metadata = record["metadata"]
+                if key in metadata and _is_hashable(value := metadata[key]):
+                    postings.setdefault(value, set()).add(record["id"])
+            self._postings[key] = postings
+
+        matches: set[str] = set()
+        for value in values:
+            if not _is_hashable(value):
+                msg = (
+                    f"Filter values must be hashable, got {value!r} for metadata "
+                    f"key {key!r}."
+                )
+                raise ValueError(msg)
+            matches.update(postings.get(value, ()))
+        return matches
@@ -0,0 +1,68 @@
+"""Benchmarks for `astream_log` against the number of streamed chunks.
+
+Every chunk of the root run's output becomes a patch to its accumulated final
+output, and every patch is applied to the accumulated run log. Both used to
+serialize or copy everything accumulated so far for each chunk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.runnables import RunnableLambda
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def _message_chunks(num_chunks: int, *, tool_call: bool) -> list[AIMessageChunk]:
+    if tool_call:
+        return [
+            AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    tool_call_chunk(
+                        args=('{"tokens": [' if i == 0 else ", ") + f'"token {i}"',
+                        index=0,
+                    )
+                ],
+            )
+            for i in range(num_chunks)
+        ]
+    return [AIMessageChunk(content=f"token {i} ") for i in range(num_chunks)]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("diff", [False, True])
+@pytest.mark.parametrize("tool_call", [False, True])
+@pytest.mark.parametrize("num_chunks", [100, 1000])
+def test_astream_log_message_chunks(
+    benchmark: BenchmarkFixture, num_chunks: int, *, tool_call: bool, diff: bool
+) -> None:
+    """Stream message chunks through `astream_log`."""
+    chunks = _message_chunks(num_chunks, tool_call=tool_call)
+
+    async def stream(_: Any) -> AsyncIterator[AIMessageChunk]:
+        for chunk in chunks:
+            yield chunk
+
+    runnable = RunnableLambda(stream)
+
+    async def consume() -> None:
+        if diff:
+            async for _ in runnable.astream_log(None):
+                pass
+        else:
+            async for _ in runnable.astream_log(None, diff=False):
+                pass
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        asyncio.run(consume())
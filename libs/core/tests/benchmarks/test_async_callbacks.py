@@ -54,3 +54,20 @@ async def test_async_callbacks_in_sync(benchmark: BenchmarkFixture) -> None:
         for _ in range(5):
             for _ in model.stream("meow", {"callbacks": [MyCustomAsyncHandler()]}):
                 pass
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("run_in_background", [False, True])
+def test_async_callbacks_in_sync_without_loop(
+    benchmark: BenchmarkFixture, *, run_in_background: bool
+) -> None:
+    infinite_cycle = cycle([AIMessage(content=" ".join(["hello", "goodbye"] * 5))])
+    model = GenericFakeChatModel(messages=infinite_cycle)
+    handler = MyCustomAsyncHandler()
+    handler.run_in_background = run_in_background
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def sync_callbacks() -> None:
+        for _ in range(5):
+            for _ in model.stream("meow", {"callbacks": [handler]}):
+                pass
@@ -0,0 +1,59 @@
+"""Benchmarks for chat model cache lookups against transcript length.
+
+Every cached chat model call builds an `llm_string` and a `prompt` key before the
+lookup. The serialized key dumps the whole conversation, so its cost grows with
+the transcript; the hashed key feeds message content to BLAKE2 instead.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from langchain_core.caches import InMemoryCache
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def _make_transcript(num_turns: int) -> list[BaseMessage]:
+    messages: list[BaseMessage] = []
+    for i in range(num_turns):
+        messages.append(
+            HumanMessage(f"Question {i}: " + "lorem ipsum " * 40, id=f"h{i}")
+        )
+        messages.append(
+            AIMessage(
+                "",
+                id=f"a{i}",
+                tool_calls=[
+                    {"name": "search", "args": {"query": f"q{i}"}, "id": f"call_{i}"}
+                ],
+            )
+        )
+        messages.append(
+            ToolMessage("result " * 80, tool_call_id=f"call_{i}", id=f"t{i}")
+        )
+    return messages
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_turns", [10, 100, 1000])
+@pytest.mark.parametrize("hash_prompt_keys", [False, True])
+def test_cached_invoke(
+    benchmark: BenchmarkFixture, num_turns: int, *, hash_prompt_keys: bool
+) -> None:
+    """Cache-hit `invoke` on a transcript of `3 * num_turns` messages."""
+    cache = InMemoryCache(hash_prompt_keys=hash_prompt_keys)
+    model = FakeListChatModel(cache=cache, responses=["hello"])
+    messages = _make_transcript(num_turns)
+    model.invoke(messages)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def invoke() -> None:
+        model.invoke(messages)
+
+    assert cache.stats()["hits"] > 0
@@ -0,0 +1,79 @@
+"""Benchmarks for parsing a JSON document while it streams, against its length.
+
+Cumulative JSON parsers re-parse everything received so far after every chunk.
+Resuming the partial parse from the previous chunk keeps the work per chunk
+proportional to the new text instead of to the whole document.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.output_parsers.openai_tools import JsonOutputToolsParser
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def _make_document(num_items: int) -> str:
+    return json.dumps(
+        {
+            "title": "Search results",
+            "items": [
+                {"id": i, "name": f"item {i}", "tags": ["a", "b"], "score": i / 7}
+                for i in range(num_items)
+            ],
+        }
+    )
+
+
+def _split(text: str, size: int = 8) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("diff", [False, True])
+@pytest.mark.parametrize("num_items", [10, 100, 400])
+def test_stream_json_output_parser(
+    benchmark: BenchmarkFixture, num_items: int, *, diff: bool
+) -> None:
+    """Stream a JSON document through `JsonOutputParser` in small text chunks."""
+    chunks = _split(_make_document(num_items))
+    parser = JsonOutputParser(diff=diff)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def stream() -> None:
+        for _ in parser.transform(iter(chunks)):
+            pass
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_items", [10, 100, 400])
+def test_stream_tool_call_args(benchmark: BenchmarkFixture, num_items: int) -> None:
+    """Stream the arguments of a tool call through `JsonOutputToolsParser`."""
+    chunks = [
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                tool_call_chunk(
+                    name="search" if i == 0 else None,
+                    args=args,
+                    id="call_1" if i == 0 else None,
+                    index=0,
+                )
+            ],
+        )
+        for i, args in enumerate(_split(_make_document(num_items)))
+    ]
+    parser = JsonOutputToolsParser()
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def stream() -> None:
+        for _ in parser.transform(iter(chunks)):
+            pass
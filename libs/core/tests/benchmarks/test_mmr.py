@@ -0,0 +1,95 @@
+"""Benchmarks for maximal marginal relevance selection.
+
+`_legacy_maximal_marginal_relevance` is the previous implementation, which
+re-scored every candidate against the whole selected set on each iteration. It is
+kept here to compare timings and to check that the vectorized implementation
+selects the same indices.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+pytest.importorskip("numpy")
+import numpy as np
+
+from langchain_core.vectorstores.utils import (
+    _cosine_similarity,
+    maximal_marginal_relevance,
+)
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+_FETCH_K = 500
+_K = 50
+_DIM = 1536
+
+
+def _legacy_maximal_marginal_relevance(
+    query_embedding: npt.NDArray[np.floating],
+    embedding_list: list[list[float]],
+    lambda_mult: float = 0.5,
+    k: int = 4,
+) -> list[int]:
+    if min(k, len(embedding_list)) <= 0:
+        return []
+    if query_embedding.ndim == 1:
+        query_embedding = np.expand_dims(query_embedding, axis=0)
+    similarity_to_query = _cosine_similarity(query_embedding, embedding_list)[0]
+    most_similar = int(np.argmax(similarity_to_query))
+    idxs = [most_similar]
+    selected = np.array([embedding_list[most_similar]])
+    while len(idxs) < min(k, len(embedding_list)):
+        best_score = -np.inf
+        idx_to_add = -1
+        similarity_to_selected = _cosine_similarity(embedding_list, selected)
+        for i, query_score in enumerate(similarity_to_query):
+            if i in idxs:
+                continue
+            redundant_score = max(similarity_to_selected[i])
+            equation_score = (
+                lambda_mult * query_score - (1 - lambda_mult) * redundant_score
+            )
+            if equation_score > best_score:
+                best_score = equation_score
+                idx_to_add = i
+        idxs.append(idx_to_add)
+        selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
+    return idxs
+
+
+@pytest.fixture(scope="module")
+def candidates() -> tuple[npt.NDArray[np.floating], list[list[float]]]:
+    rng = np.random.default_rng(42)
+    query = rng.normal(size=_DIM)
+    embeddings = rng.normal(size=(_FETCH_K, _DIM)).tolist()
+    return query, embeddings
+
+
+@pytest.mark.benchmark
+def test_mmr_vectorized(
+    benchmark: BenchmarkFixture,
+    candidates: tuple[npt.NDArray[np.floating], list[list[float]]],
+) -> None:
+    query, embeddings = candidates
+    expected = _legacy_maximal_marginal_relevance(query, embeddings, k=_K)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        assert maximal_marginal_relevance(query, embeddings, k=_K) == expected
+
+
+@pytest.mark.benchmark
+def test_mmr_legacy(
+    benchmark: BenchmarkFixture,
+    candidates: tuple[npt.NDArray[np.floating], list[list[float]]],
+) -> None:
+    query, embeddings = candidates
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        _legacy_maximal_marginal_relevance(query, embeddings, k=_K)
@@ -0,0 +1,68 @@
+"""Benchmarks for formatting the same prompt templates over and over."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from langchain_core.prompts.string import PromptTemplateFormat
+
+TEMPLATES: dict[str, tuple[str, str]] = {
+    "f-string": (
+        "You are {name}, a helpful assistant. Today is {date}. Answer in {language}.",
+        "Context:\n{context}\n\nQuestion: {question:>10}",
+    ),
+    "jinja2": (
+        (
+            "You are {{ name }}, a helpful assistant. Today is {{ date }}. "
+            "Answer in {{ language }}."
+        ),
+        "Context:\n{{ context }}\n\nQuestion: {{ question }}",
+    ),
+}
+
+INPUTS = {
+    "name": "Bot",
+    "date": "Monday",
+    "language": "English",
+    "context": "Some retrieved context. " * 20,
+    "question": "What is the answer?",
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("template_format", ["f-string", "jinja2"])
+def test_prompt_template_format(
+    benchmark: BenchmarkFixture, template_format: PromptTemplateFormat
+) -> None:
+    system, human = TEMPLATES[template_format]
+    prompt = PromptTemplate.from_template(
+        system + "\n" + human, template_format=template_format
+    )
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        for _ in range(1000):
+            prompt.format(**INPUTS)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("template_format", ["f-string", "jinja2"])
+def test_chat_prompt_template_format_messages(
+    benchmark: BenchmarkFixture, template_format: PromptTemplateFormat
+) -> None:
+    system, human = TEMPLATES[template_format]
+    prompt = ChatPromptTemplate.from_messages(
+        [("system", system), ("human", human)], template_format=template_format
+    )
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        for _ in range(1000):
+            prompt.format_messages(**INPUTS)
@@ -0,0 +1,61 @@
+"""Benchmarks for the per-step overhead of a sequence of trivial runnables.
+
+Each step checks whether its function accepts a `config` or `run_manager` before
+calling it, so any cost there is paid once per step per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from langchain_core.runnables import RunnableLambda
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from langchain_core.runnables import Runnable
+
+NUM_STEPS = 10
+
+
+def _sequence() -> Runnable[int, int]:
+    sequence: Runnable[int, int] = RunnableLambda(lambda x: x + 1)
+    for _ in range(NUM_STEPS - 1):
+        sequence |= RunnableLambda(lambda x: x + 1)
+    return sequence
+
+
+@pytest.mark.benchmark
+def test_sequence_invoke(benchmark: BenchmarkFixture) -> None:
+    sequence = _sequence()
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        for i in range(100):
+            sequence.invoke(i)
+
+
+@pytest.mark.benchmark
+def test_sequence_batch(benchmark: BenchmarkFixture) -> None:
+    sequence = _sequence()
+    inputs = list(range(100))
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        sequence.batch(inputs)
+
+
+@pytest.mark.benchmark
+def test_sequence_ainvoke(benchmark: BenchmarkFixture) -> None:
+    sequence = _sequence()
+
+    async def run_sequence() -> None:
+        for i in range(100):
+            await sequence.ainvoke(i)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        asyncio.run(run_sequence())
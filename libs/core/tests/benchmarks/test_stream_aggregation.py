@@ -0,0 +1,77 @@
+"""Benchmarks for aggregating a streamed `AIMessageChunk` against stream length.
+
+Streaming a chat model through a chain sums its chunks for tracing, and any step
+that needs the whole message sums them again. Summing with `+` copies the message
+so far on every chunk, while `AIMessageChunkAccumulator` merges the chunks once.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from langchain_core.messages import AIMessageChunk, AIMessageChunkAccumulator
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.runnables import RunnableLambda
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def _make_chunks(num_chunks: int) -> list[AIMessageChunk]:
+    """Stream of text deltas followed by the argument deltas of one tool call."""
+    text = [
+        AIMessageChunk(content=[{"type": "text", "text": "lorem ", "index": 0}])
+        for _ in range(num_chunks // 2)
+    ]
+    args = [
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                tool_call_chunk(
+                    name="search" if i == 0 else None,
+                    args='{"query": "' if i == 0 else "ipsum ",
+                    id="call_1" if i == 0 else None,
+                    index=1,
+                )
+            ],
+        )
+        for i in range(num_chunks - num_chunks // 2)
+    ]
+    return [*text, *args]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_chunks", [100, 1000, 4000])
+def test_accumulate_message_chunks(
+    benchmark: BenchmarkFixture, num_chunks: int
+) -> None:
+    """Build one message from `num_chunks` chunks with the accumulator."""
+    chunks = _make_chunks(num_chunks)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def accumulate() -> None:
+        accumulator = AIMessageChunkAccumulator()
+        for chunk in chunks:
+            accumulator.append(chunk)
+        accumulator.build()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_chunks", [100, 1000, 4000])
+def test_stream_into_lambda(benchmark: BenchmarkFixture, num_chunks: int) -> None:
+    """Stream chunks through a chain whose last step needs the whole message."""
+    chunks = _make_chunks(num_chunks)
+
+    def model(_: None) -> Iterator[AIMessageChunk]:
+        yield from chunks
+
+    chain = RunnableLambda(model) | RunnableLambda(lambda message: message.text)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def stream() -> None:
+        for _ in chain.stream(None):
+            pass
@@ -1,3 +1,7 @@
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from langchain_core.caches import RETURN_VAL_TYPE, InMemoryCache
@@ -117,3 +121,131 @@ async def test_aclear(cache: InMemoryCache) -> None:
     await cache.aupdate(prompt, llm_string, generations)
     await cache.aclear()
     assert await cache.alookup(prompt, llm_string) is None
+
+
+def test_update_existing_key_does_not_evict() -> None:
+    cache = InMemoryCache(maxsize=2)
+    prompt1, llm_string1, generations1 = cache_item(1)
+    prompt2, llm_string2, generations2 = cache_item(2)
+    cache.update(prompt1, llm_string1, generations1)
+    cache.update(prompt2, llm_string2, generations2)
+    cache.update(prompt1, llm_string1, generations2)
+
+    assert list(cache._cache) == [(prompt1, llm_string1), (prompt2, llm_string2)]
+    assert cache.lookup(prompt1, llm_string1) == generations2
+    assert cache.stats()["evictions"] == 0
+
+
+def test_lru_policy() -> None:
+    cache = InMemoryCache(maxsize=2, policy="lru")
+    prompt1, llm_string1, generations1 = cache_item(1)
+    prompt2, llm_string2, generations2 = cache_item(2)
+    prompt3, llm_string3, generations3 = cache_item(3)
+
+    cache.update(prompt1, llm_string1, generations1)
+    cache.update(prompt2, llm_string2, generations2)
+    assert cache.lookup(prompt1, llm_string1) == generations1
+    cache.update(prompt3, llm_string3, generations3)
+
+    assert cache.lookup(prompt1, llm_string1) == generations1
+    assert cache.lookup(prompt2, llm_string2) is None
+    assert cache.lookup(prompt3, llm_string3) == generations3
+
+
+def test_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("langchain_core.caches.time.monotonic", lambda: now)
+    cache = InMemoryCache(ttl=10)
+    prompt, llm_string, generations = cache_item(1)
+    cache.update(prompt, llm_string, generations)
+
+    now = 1009.0
+    assert cache.lookup(prompt, llm_string) == generations
+    now = 1010.0
+    assert cache.lookup(prompt, llm_string) is None
+    assert cache._cache == {}
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["bytes"] == 0
+
+
+def test_max_bytes() -> None:
+    prompt1, llm_string1, generations1 = cache_item(1)
+    prompt2, llm_string2, generations2 = cache_item(2)
+    cache = InMemoryCache(max_bytes=1)
+    cache.update(prompt1, llm_string1, generations1)
+    assert cache._cache == {}
+
+    cache = InMemoryCache()
+    cache.update(prompt1, llm_string1, generations1)
+    entry_size = cache.stats()["bytes"]
+    assert entry_size > 0
+
+    cache = InMemoryCache(max_bytes=entry_size + 1)
+    cache.update(prompt1, llm_string1, generations1)
+    cache.update(prompt2, llm_string2, generations2)
+    assert list(cache._cache) == [(prompt2, llm_string2)]
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == entry_size
+
+
+def test_stats() -> None:
+    cache = InMemoryCache(maxsize=1)
+    prompt1, llm_string1, generations1 = cache_item(1)
+    prompt2, llm_string2, generations2 = cache_item(2)
+    cache.update(prompt1, llm_string1, generations1)
+    cache.lookup(prompt1, llm_string1)
+    cache.lookup(prompt2, llm_string2)
+    cache.update(prompt2, llm_string2, generations2)
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert stats["size"] == 1
+
+    cache.clear()
+    stats = cache.stats()
+    assert stats["size"] == 0
+    assert stats["bytes"] == 0
+    assert stats["hits"] == 1
+
+
+def test_invalid_options() -> None:
+    with pytest.raises(ValueError, match="ttl must be greater than 0"):
+        InMemoryCache(ttl=0)
+    with pytest.raises(ValueError, match="max_bytes must be greater than 0"):
+        InMemoryCache(max_bytes=0)
+    with pytest.raises(ValueError, match="policy must be"):
+        InMemoryCache(policy="lfu")  # type: ignore[arg-type]
+
+
+def test_copy_and_pickle() -> None:
+    cache = InMemoryCache(maxsize=2)
+    prompt, llm_string, generations = cache_item(1)
+    cache.update(prompt, llm_string, generations)
+
+    for restored in (copy.deepcopy(cache), pickle.loads(pickle.dumps(cache))):
+        assert restored.lookup(prompt, llm_string) == generations
+        restored.update(*cache_item(2))
+        assert cache.lookup(*cache_item(2)[:2]) is None
+
+
+def test_concurrent_updates() -> None:
+    cache = InMemoryCache(maxsize=50, policy="lru")
+
+    def work(offset: int) -> None:
+        for i in range(200):
+            prompt, llm_string, generations = cache_item(offset + i % 100)
+            cache.update(prompt, llm_string, generations)
+            cache.lookup(prompt, llm_string)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(0, 800, 100)))
+
+    stats = cache.stats()
+    assert stats["size"] == 50
+    assert stats["hits"] + stats["misses"] == 1600
+    assert stats["bytes"] == sum(cache._sizes.values())
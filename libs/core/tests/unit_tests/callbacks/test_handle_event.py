@@ -10,21 +10,27 @@ See: https://github.com/langchain-ai/langchain/issues/30870
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
 import pytest
 
-from langchain_core.callbacks.base import BaseCallbackHandler
+from langchain_core.callbacks.base import AsyncCallbackHandler, BaseCallbackHandler
 from langchain_core.callbacks.manager import (
     _ahandle_event_for_handler,
+    _CallbackLoop,
     handle_event,
 )
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.tracers.base import AsyncBaseTracer
 
 if TYPE_CHECKING:
+    from blockbuster import BlockBuster
+
     from langchain_core.tracers.schemas import Run
 
 SERIALIZED = {"id": ["chat_model"]}
@@ -260,3 +266,119 @@ def test_async_tracer_fallback_no_error_logged(
     assert not caplog.records, (
         f"Expected no warnings but got: {[r.message for r in caplog.records]}"
     )
+
+
+_request_id: ContextVar[str | None] = ContextVar("_request_id", default=None)
+
+
+class _RecordingAsyncHandler(AsyncCallbackHandler):
+    """Records the loop, thread and context each token is handled in."""
+
+    def __init__(self, *, run_in_background: bool = False) -> None:
+        self.run_in_background = run_in_background
+        self.tokens: list[str | list[str | dict[str, Any]]] = []
+        self.loops: set[int] = set()
+        self.threads: set[str] = set()
+        self.request_ids: list[str | None] = []
+        self.release = threading.Event()
+        self.done = threading.Event()
+
+    async def on_llm_new_token(
+        self, token: str | list[str | dict[str, Any]], **_: Any
+    ) -> None:
+        if self.run_in_background:
+            while not self.release.is_set():  # noqa: ASYNC110
+                await asyncio.sleep(0.001)
+        self.tokens.append(token)
+        self.loops.add(id(asyncio.get_running_loop()))
+        self.threads.add(threading.current_thread().name)
+        self.request_ids.append(_request_id.get())
+        self.done.set()
+
+
+def test_async_handler_in_sync_context_reuses_callback_loop() -> None:
+    handler = _RecordingAsyncHandler()
+    token = _request_id.set("request-1")
+    try:
+        for text in ["a", "b", "c"]:
+            handle_event([handler], "on_llm_new_token", "ignore_llm", text)
+    finally:
+        _request_id.reset(token)
+
+    assert handler.tokens == ["a", "b", "c"]
+    assert len(handler.loops) == 1
+    assert handler.threads == {"langchain-callbacks"}
+    assert handler.request_ids == ["request-1"] * 3
+
+
+async def test_async_handler_in_sync_context_with_running_loop(
+    blockbuster: BlockBuster,
+) -> None:
+    # Sync callbacks block the running loop until the async handlers are done.
+    blockbuster.deactivate()
+    handler = _RecordingAsyncHandler()
+
+    handle_event([handler], "on_llm_new_token", "ignore_llm", "a")
+
+    assert handler.tokens == ["a"]
+    assert id(asyncio.get_running_loop()) not in handler.loops
+
+
+def test_async_handler_in_sync_context_waits_for_created_tasks() -> None:
+    done: list[str] = []
+
+    class _SpawningHandler(AsyncCallbackHandler):
+        async def on_llm_new_token(
+            self, token: str | list[str | dict[str, Any]], **_: Any
+        ) -> None:
+            async def finish() -> None:
+                await asyncio.sleep(0.01)
+                done.append(str(token))
+
+            asyncio.get_running_loop().create_task(finish())
+
+    handle_event([_SpawningHandler()], "on_llm_new_token", "ignore_llm", "a")
+
+    assert done == ["a"]
+
+
+def test_run_in_background_does_not_wait() -> None:
+    handler = _RecordingAsyncHandler(run_in_background=True)
+
+    handle_event([handler], "on_llm_new_token", "ignore_llm", "a")
+
+    assert handler.tokens == []
+    handler.release.set()
+    assert handler.done.wait(timeout=5)
+    assert handler.tokens == ["a"]
+
+
+def test_callback_loop_shutdown_flushes_background_callbacks() -> None:
+    callback_loop = _CallbackLoop()
+    handler = _RecordingAsyncHandler(run_in_background=True)
+
+    callback_loop.submit([handler.on_llm_new_token("a")], wait=False)
+    threading.Timer(0.05, handler.release.set).start()
+    callback_loop.shutdown()
+
+    assert handler.tokens == ["a"]
+    coro = handler.on_llm_new_token("b")
+    with pytest.raises(RuntimeError):
+        callback_loop.submit([coro], wait=True)
+    coro.close()
+
+
+def test_sync_code_in_async_handler_in_sync_context() -> None:
+    """Sync code run by an async callback cannot wait on the callback loop."""
+    inner = _RecordingAsyncHandler()
+
+    class _OuterHandler(AsyncCallbackHandler):
+        async def on_llm_new_token(
+            self, token: str | list[str | dict[str, Any]], **_: Any
+        ) -> None:
+            handle_event([inner], "on_llm_new_token", "ignore_llm", token * 2)
+
+    handle_event([_OuterHandler()], "on_llm_new_token", "ignore_llm", "a")
+
+    assert inner.tokens == ["aa"]
+    assert "langchain-callbacks" not in inner.threads
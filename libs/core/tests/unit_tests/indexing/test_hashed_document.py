@@ -1,7 +1,13 @@
+import hashlib
+import json
+import uuid
 from typing import Literal
 
+import pytest
+
 from langchain_core.documents import Document
-from langchain_core.indexing.api import _get_document_with_hash
+from langchain_core.indexing import hash_documents
+from langchain_core.indexing.api import NAMESPACE_UUID, _get_document_with_hash
 
 
 def test_hashed_document_hashing() -> None:
@@ -63,3 +69,65 @@ def test_hashing_custom_key_encoder() -> None:
     hashed_document = _get_document_with_hash(document, key_encoder=custom_key_encoder)
     assert hashed_document.id == "quack-like a duck"
     assert isinstance(hashed_document.id, str)
+
+
+def _reference_hash(
+    document: Document, algorithm: Literal["sha1", "sha256", "sha512", "blake2b"]
+) -> str:
+    def calculate(text: str) -> str:
+        digest = hashlib.new(algorithm, text.encode("utf-8")).hexdigest()
+        if algorithm == "sha1":
+            return str(uuid.uuid5(NAMESPACE_UUID, digest))
+        return digest
+
+    metadata = json.dumps(document.metadata, sort_keys=True)
+    return calculate(calculate(document.page_content) + calculate(metadata))
+
+
+@pytest.mark.parametrize("algorithm", ["sha1", "sha256", "sha512", "blake2b"])
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_hash_documents_matches_document_hash(
+    algorithm: Literal["sha1", "sha256", "sha512", "blake2b"],
+    max_workers: int | None,
+) -> None:
+    documents = [
+        Document(
+            page_content=f"Document {i} " * (i % 7),
+            metadata={"source": f"source-{i % 5}", "page": i, "tag": "é"},
+        )
+        for i in range(600)
+    ]
+
+    hashed = hash_documents(documents, key_encoder=algorithm, max_workers=max_workers)
+
+    assert [doc.id for doc in hashed] == [
+        _reference_hash(doc, algorithm) for doc in documents
+    ]
+    assert [doc.page_content for doc in hashed] == [
+        doc.page_content for doc in documents
+    ]
+    assert all(doc.id is None for doc in documents)
+
+
+def test_hash_documents_custom_key_encoder() -> None:
+    documents = [Document(page_content=str(i)) for i in range(600)]
+
+    hashed = hash_documents(
+        documents, key_encoder=lambda doc: f"doc-{doc.page_content}", max_workers=2
+    )
+
+    assert [doc.id for doc in hashed] == [f"doc-{i}" for i in range(600)]
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_hash_documents_unserializable_metadata(max_workers: int | None) -> None:
+    documents = [Document(page_content=str(i), metadata={"i": i}) for i in range(600)]
+    documents[-1].metadata["bad"] = object()
+
+    with pytest.raises(ValueError, match="Failed to hash metadata"):
+        hash_documents(documents, key_encoder="sha256", max_workers=max_workers)
+
+
+def test_hash_documents_max_workers_validation() -> None:
+    with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+        hash_documents([Document(page_content="a")], max_workers=0)
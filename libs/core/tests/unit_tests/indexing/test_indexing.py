@@ -1,7 +1,10 @@
+import threading
+import time
 from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from datetime import datetime, timezone
 from typing import (
     Any,
+    Literal,
 )
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -2961,3 +2964,195 @@ async def test_aindex_with_upsert_kwargs(
         # Check other arguments
         assert kwargs["batch_size"] == 100
         assert kwargs["vector_field"] == "embedding"
+
+
+def _doc(content: str, source: str) -> Document:
+    return Document(page_content=content, metadata={"source": source})
+
+
+# Consecutive runs of the loader. Documents of a source are spread across batches,
+# repeated across batches, and removed between runs.
+CONCURRENT_INDEXING_RUNS: list[list[Document]] = [
+    [_doc(f"doc {i}", str(i % 3)) for i in range(10)],
+    [
+        _doc("new 1", "0"),
+        _doc("doc 0", "0"),
+        _doc("doc 1", "1"),
+        _doc("new 1", "0"),
+        _doc("doc 3", "0"),
+        _doc("new 2", "2"),
+        _doc("doc 1", "1"),
+        _doc("doc 9", "0"),
+    ],
+    [_doc("doc 2", "2"), _doc("new 1", "0"), _doc("doc 7", "1")],
+    [_doc("x", "s"), _doc("y", "s")],
+    # The first batch's cleanup deletes "x", which the next batch writes again.
+    [_doc("a", "s"), _doc("x", "s"), _doc("x", "s")],
+]
+
+
+@pytest.mark.parametrize("cleanup", ["incremental", "full", "scoped_full", None])
+@pytest.mark.parametrize("batch_size", [1, 2, 3])
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+@pytest.mark.parametrize("force_update", [False, True])
+def test_index_concurrently_matches_sequential(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    batch_size: int,
+    max_concurrency: int,
+    *,
+    force_update: bool,
+) -> None:
+    stores = []
+    results = []
+    for concurrency in (None, max_concurrency):
+        record_manager = InMemoryRecordManager(namespace="hello")
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        run_results = []
+        for run, docs in enumerate(CONCURRENT_INDEXING_RUNS):
+            with patch.object(
+                record_manager,
+                "get_time",
+                return_value=datetime(
+                    2021, 1, run + 1, tzinfo=timezone.utc
+                ).timestamp(),
+            ):
+                run_results.append(
+                    index(
+                        docs,
+                        record_manager,
+                        vector_store,
+                        batch_size=batch_size,
+                        cleanup=cleanup,
+                        source_id_key="source",
+                        force_update=force_update,
+                        key_encoder="sha256",
+                        max_concurrency=concurrency,
+                    )
+                )
+        results.append(run_results)
+        stores.append((set(vector_store.store), set(record_manager.list_keys())))
+
+    assert results[0] == results[1]
+    assert stores[0] == stores[1]
+    assert stores[0][0] == stores[0][1]
+
+
+@pytest.mark.parametrize("cleanup", ["incremental", "full", "scoped_full", None])
+@pytest.mark.parametrize("batch_size", [1, 3])
+@pytest.mark.parametrize("force_update", [False, True])
+async def test_aindex_concurrently_matches_sequential(
+    cleanup: Literal["incremental", "full", "scoped_full"] | None,
+    batch_size: int,
+    *,
+    force_update: bool,
+) -> None:
+    stores = []
+    results = []
+    for concurrency in (None, 2):
+        record_manager = InMemoryRecordManager(namespace="hello")
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        run_results = []
+        for run, docs in enumerate(CONCURRENT_INDEXING_RUNS):
+            with patch.object(
+                record_manager,
+                "get_time",
+                return_value=datetime(
+                    2021, 1, run + 1, tzinfo=timezone.utc
+                ).timestamp(),
+            ):
+                run_results.append(
+                    await aindex(
+                        docs,
+                        record_manager,
+                        vector_store,
+                        batch_size=batch_size,
+                        cleanup=cleanup,
+                        source_id_key="source",
+                        force_update=force_update,
+                        key_encoder="sha256",
+                        max_concurrency=concurrency,
+                    )
+                )
+        results.append(run_results)
+        stores.append((set(vector_store.store), set(record_manager.list_keys())))
+
+    assert results[0] == results[1]
+    assert stores[0] == stores[1]
+    assert stores[0][0] == stores[0][1]
+
+
+def test_index_concurrently_overlaps_writes(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+    original = vector_store.add_documents
+
+    def add_documents(documents: list[Document], **kwargs: Any) -> list[str]:
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return original(documents, **kwargs)
+
+    docs = [_doc(f"doc {i}", "0") for i in range(20)]
+    with patch.object(vector_store, "add_documents", add_documents):
+        result = index(
+            docs,
+            record_manager,
+            vector_store,
+            batch_size=2,
+            key_encoder="sha256",
+            max_concurrency=4,
+        )
+
+    assert result == {
+        "num_added": 20,
+        "num_deleted": 0,
+        "num_skipped": 0,
+        "num_updated": 0,
+    }
+    assert len(vector_store.store) == 20
+    assert 1 < max_active <= 5
+
+
+def test_index_concurrently_stops_on_write_error(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    original = vector_store.add_documents
+
+    def add_documents(documents: list[Document], **kwargs: Any) -> list[str]:
+        if any(doc.page_content == "doc 3" for doc in documents):
+            msg = "write failed"
+            raise RuntimeError(msg)
+        return original(documents, **kwargs)
+
+    docs = [_doc(f"doc {i}", "0") for i in range(10)]
+    with (
+        patch.object(vector_store, "add_documents", add_documents),
+        pytest.raises(RuntimeError, match="write failed"),
+    ):
+        index(
+            docs,
+            record_manager,
+            vector_store,
+            batch_size=1,
+            key_encoder="sha256",
+            max_concurrency=2,
+        )
+
+    # Records are only written for batches committed before the failing one.
+    recorded = set(record_manager.list_keys())
+    assert recorded <= set(vector_store.store)
+    assert len(recorded) == 3
+
+
+def test_index_max_concurrency_validation(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    with pytest.raises(ValueError, match="max_concurrency must be a positive integer"):
+        index([], record_manager, vector_store, max_concurrency=0)
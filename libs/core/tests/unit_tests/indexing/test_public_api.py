@@ -8,6 +8,7 @@ def test_all() -> None:
         "aindex",
         "DeleteResponse",
         "DocumentIndex",
+        "hash_documents",
         "index",
         "IndexingResult",
         "InMemoryRecordManager",
@@ -7,13 +7,16 @@ from typing_extensions import override
 
 from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
 from langchain_core.globals import set_llm_cache
-from langchain_core.language_models.chat_models import _cleanup_llm_representation
+from langchain_core.language_models.chat_models import (
+    _cleanup_llm_representation,
+    _hash_messages,
+)
 from langchain_core.language_models.fake_chat_models import (
     FakeListChatModel,
     GenericFakeChatModel,
 )
 from langchain_core.load import dumps
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langchain_core.outputs import ChatGeneration, Generation
 from langchain_core.outputs.chat_result import ChatResult
 
@@ -537,3 +540,67 @@ async def test_cache_key_ignores_message_id_async() -> None:
 
     # Verify only one cache entry exists
     assert len(local_cache._cache) == 1
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_hashed_cache_keys(*, use_async: bool) -> None:
+    """Test that caches can opt into hashed prompt keys."""
+    local_cache = InMemoryCache()
+    local_cache.hash_prompt_keys = True
+    model = FakeListChatModel(cache=local_cache, responses=["hello", "goodbye"])
+
+    async def invoke(messages: list[HumanMessage]) -> BaseMessage:
+        if use_async:
+            return await model.ainvoke(messages)
+        return model.invoke(messages)
+
+    first = [HumanMessage(content="How are you?", id="unique-id-1")]
+    assert (await invoke(first)).content == "hello"
+    # Same content with a different id hits the cache.
+    second = [HumanMessage(content="How are you?", id="unique-id-2")]
+    assert (await invoke(second)).content == "hello"
+    assert len(local_cache) == 1
+    ((prompt, _),) = local_cache._cache
+    assert prompt == _hash_messages(first)
+    assert prompt.startswith("blake2b:")
+
+    assert (await invoke([HumanMessage(content="How are you?!")])).content == (
+        "goodbye"
+    )
+    assert len(local_cache) == 2
+
+
+def test_hash_messages() -> None:
+    ai_message = AIMessage(
+        content="",
+        tool_calls=[{"name": "search", "args": {"query": "foo"}, "id": "call_1"}],
+    )
+    other_call = AIMessage(
+        content="",
+        tool_calls=[{"name": "search", "args": {"query": "bar"}, "id": "call_1"}],
+    )
+    assert _hash_messages([ai_message]) == _hash_messages(
+        [ai_message.model_copy(update={"id": "run-1"})]
+    )
+    assert _hash_messages([ai_message]) != _hash_messages([other_call])
+    # Message boundaries and types are part of the key.
+    assert _hash_messages([HumanMessage("ab")]) != _hash_messages(
+        [HumanMessage("a"), HumanMessage("b")]
+    )
+    assert _hash_messages([HumanMessage("a")]) != _hash_messages([AIMessage("a")])
+
+
+def test_llm_string_is_memoized() -> None:
+    chat = CustomChat(messages=iter([]))
+    llm_string = chat._get_llm_string(stop=["\n"], temperature=1)
+    assert chat._get_llm_string(stop=["\n"], temperature=1) is llm_string
+    assert llm_string.endswith("---[('stop', ['\\n']), ('temperature', 1)]")
+    # Equal but differently typed values must not share a memoized string.
+    assert chat._get_llm_string(stop=["\n"], temperature=True).endswith(
+        "('temperature', True)]"
+    )
+    # Unhashable arguments are still supported, just not memoized.
+    tools = [{"name": "search"}]
+    assert chat._get_llm_string(tools=tools).endswith(
+        "('tools', [{'name': 'search'}])]"
+    )
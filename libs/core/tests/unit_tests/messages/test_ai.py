@@ -1,9 +1,13 @@
+import json
 from typing import Any, cast
 
+import pytest
+
 from langchain_core.load import dumpd, load
 from langchain_core.messages import AIMessage, AIMessageChunk
 from langchain_core.messages import content as types
 from langchain_core.messages.ai import (
+    AIMessageChunkAccumulator,
     InputTokenDetails,
     OutputTokenDetails,
     UsageMetadata,
@@ -14,6 +18,7 @@ from langchain_core.messages.ai import (
 from langchain_core.messages.tool import invalid_tool_call as create_invalid_tool_call
 from langchain_core.messages.tool import tool_call as create_tool_call
 from langchain_core.messages.tool import tool_call_chunk as create_tool_call_chunk
+from langchain_core.utils.json import parse_partial_json
 
 
 def test_serdes_message() -> None:
@@ -201,6 +206,86 @@ def test_add_ai_message_chunks_usage() -> None:
     )
 
 
+def _stream_chunks() -> list[AIMessageChunk]:
+    chunks = [
+        AIMessageChunk(
+            content=[{"type": "text", "text": f"t{i} ", "index": 0}],
+            additional_kwargs={"function_call": {"arguments": f"{i},"}},
+            response_metadata={"model_name": "m"} if i == 0 else {},
+            id="lc_run-1" if i == 0 else None,
+        )
+        for i in range(20)
+    ]
+    for i, part in enumerate(['{"a"', ": ", '"b"}']):
+        chunks.append(
+            AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    create_tool_call_chunk(
+                        name="tool" if i == 0 else None,
+                        args=part,
+                        id="call_1" if i == 0 else None,
+                        index=1,
+                    )
+                ],
+                id="run-abc" if i == 1 else None,
+            )
+        )
+    chunks.append(
+        AIMessageChunk(
+            content="",
+            usage_metadata=UsageMetadata(
+                input_tokens=1, output_tokens=2, total_tokens=3
+            ),
+            chunk_position="last",
+        )
+    )
+    return chunks
+
+
+def test_ai_message_chunk_accumulator_matches_add() -> None:
+    chunks = _stream_chunks()
+    expected = chunks[0]
+    for chunk in chunks[1:]:
+        expected = expected + chunk
+
+    accumulator = AIMessageChunkAccumulator()
+    for chunk in chunks:
+        accumulator.append(chunk)
+    assert len(accumulator) == len(chunks)
+    message = accumulator.build()
+
+    assert message == expected
+    assert message.content == [
+        {"type": "text", "text": "".join(f"t{i} " for i in range(20)), "index": 0}
+    ]
+    assert message.tool_calls == [
+        create_tool_call(name="tool", args={"a": "b"}, id="call_1")
+    ]
+    assert message.id == "run-abc"
+    assert len(accumulator) == 1
+    assert accumulator.build() is message
+
+
+def test_ai_message_chunk_accumulator_builds_incrementally() -> None:
+    chunks = _stream_chunks()
+    accumulator = AIMessageChunkAccumulator(chunks[:10])
+    partial = accumulator.build()
+    assert partial == add_ai_message_chunks(chunks[0], *chunks[1:10])
+
+    accumulator.extend(chunks[10:])
+    assert list(accumulator) == [partial, *chunks[10:]]
+    assert accumulator.build() == add_ai_message_chunks(chunks[0], *chunks[1:])
+
+
+def test_ai_message_chunk_accumulator_single_and_empty() -> None:
+    chunk = AIMessageChunk(content="hi")
+    assert AIMessageChunkAccumulator([chunk]).build() is chunk
+
+    with pytest.raises(ValueError, match="empty accumulator"):
+        AIMessageChunkAccumulator().build()
+
+
 def test_init_tool_calls() -> None:
     # Test we add "type" key on init
     msg = AIMessage("", tool_calls=[{"name": "foo", "args": {"a": "b"}, "id": "abc"}])
@@ -211,6 +296,35 @@ def test_init_tool_calls() -> None:
     msg.tool_calls = [{"name": "bar", "args": {"c": "d"}, "id": "def"}]
 
 
+def test_init_tool_calls_streamed_args() -> None:
+    args = json.dumps(
+        {
+            "query": "lorem ipsum " * 20,
+            "filters": [{"field": "year", "value": year} for year in range(5)],
+        }
+    )
+    message: AIMessageChunk | None = None
+    for start in range(0, len(args), 7):
+        chunk = AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                create_tool_call_chunk(
+                    name="search" if start == 0 else None,
+                    args=args[start : start + 7],
+                    id="call_1" if start == 0 else None,
+                    index=0,
+                )
+            ],
+        )
+        message = chunk if message is None else message + chunk
+        assert message.tool_calls[0]["args"] == parse_partial_json(args[: start + 7])
+
+    assert message is not None
+    assert message.tool_calls == [
+        create_tool_call(name="search", args=json.loads(args), id="call_1")
+    ]
+
+
 def test_content_blocks() -> None:
     message = AIMessage(
         "",
@@ -5,6 +5,7 @@ EXPECTED_ALL = [
     "_message_from_dict",
     "AIMessage",
     "AIMessageChunk",
+    "AIMessageChunkAccumulator",
     "Annotation",
     "AnyMessage",
     "AudioContentBlock",
@@ -1,16 +1,22 @@
+import copy
 import json
+import sys
 from collections.abc import AsyncIterator, Iterator
+from types import FrameType
 from typing import Any
 
+import jsonpatch  # type: ignore[import-untyped]
 import pytest
 from pydantic import BaseModel, Field
 
 from langchain_core.exceptions import OutputParserException
-from langchain_core.output_parsers.json import (
-    SimpleJsonOutputParser,
-)
+from langchain_core.output_parsers.json import SimpleJsonOutputParser
+from langchain_core.utils._json_patch import make_patch
 from langchain_core.utils.function_calling import convert_to_openai_function
 from langchain_core.utils.json import (
+    PartialJsonParser,
+    _JsonStream,
+    _parse_partial_json_stream,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -264,6 +270,147 @@ def test_parse_partial_json(json_strings: tuple[str, str]) -> None:
     assert parsed == json.loads(expected)
 
 
+PARTIAL_JSON_DOCUMENTS = [
+    '{"foo": "bar", "list": [1, -2.5e3, true, null, {"a": [false]}], "": {}}',
+    '  [ "a\\"b\\\\c\\u00e9\\ud83d\\ude00\\ud83d \\/\\n", 0.5, -0, 1E+2 ] ',
+    '{"raw": "line\nbreak\ttab", "dup": 1, "dup": "two", "x/y~": []}',
+    '"just a string"',
+    "12.75e-1",
+    '{"done": true} and some trailing text',
+    '```json\n{"fenced": "value"}\n```',
+    '{"a": 1} ["b"]',
+    '{"a": [1, 2}',
+    '{"a": "bad \\x escape"}',
+    '{"a": 012}',
+    '{"big": Infinity, "small": -Infinity}',
+    "Infinity",
+]
+
+
+def _parse_or_error(parse: Any, *args: Any, **kwargs: Any) -> Any:
+    try:
+        return parse(*args, **kwargs)
+    except json.JSONDecodeError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("document", PARTIAL_JSON_DOCUMENTS)
+def test_partial_json_parser_matches_parse_partial_json(
+    document: str, *, strict: bool
+) -> None:
+    parser = PartialJsonParser(strict=strict)
+    stream = _JsonStream()
+    # Long enough for the stream to resume its parser.
+    padding = " " * 200
+    for end in range(1, len(document) + 1):
+        parser.feed(document[end - 1])
+        expected = _parse_or_error(parse_partial_json, document[:end], strict=strict)
+        assert _parse_or_error(parser.parse) == expected, document[:end]
+        with stream.activate():
+            streamed = _parse_or_error(
+                _parse_partial_json_stream, padding + document[:end], strict=strict
+            )
+        assert streamed == _parse_or_error(
+            parse_partial_json, padding + document[:end], strict=strict
+        ), document[:end]
+    assert parser.text == document
+
+
+def test_partial_json_parser_shares_complete_values() -> None:
+    parser = PartialJsonParser()
+    parser.feed('{"done": {"a": 1}, "items": ["x"')
+    first = parser.parse()
+    parser.feed(', "y')
+    second = parser.parse()
+
+    assert first == {"done": {"a": 1}, "items": ["x"]}
+    assert second == {"done": {"a": 1}, "items": ["x", "y"]}
+    assert second["done"] is first["done"]
+    assert second["items"] is not first["items"]
+
+    parser.feed('"]}')
+    assert parser.parse() == {"done": {"a": 1}, "items": ["x", "y"]}
+    assert parser.parse() is parser.parse()
+
+
+def test_parse_partial_json_stream_keeps_streams_apart() -> None:
+    text = json.dumps({"inner": {"b": 1}, "padding": "x" * 128, "items": [[1]]})
+    expected = {"inner": {"b": 1}, "padding": "x" * 128, "items": [[1]]}
+    stream = _JsonStream()
+    with stream.activate():
+        first = _parse_partial_json_stream(text[:-3])
+        assert _parse_partial_json_stream(text[:-1])["inner"] is first["inner"]
+    first["inner"]["b"] = 999
+    first["items"][0].append(2)
+
+    # Other streams, and parsing outside a stream, start from scratch.
+    with _JsonStream().activate():
+        assert _parse_partial_json_stream(text[:-1]) == expected
+    assert _parse_partial_json_stream(text[:-1]) == expected
+
+
+def _lines_executed(num_items: int, *, diff: bool) -> int:
+    """Count the Python lines run to stream a document, a steadier measure than time."""
+    document = json.dumps(
+        {
+            "items": [
+                {"id": i, "name": f"item {i}", "tags": ["a"]} for i in range(num_items)
+            ]
+        }
+    )
+    chunks = [document[i : i + 8] for i in range(0, len(document), 8)]
+    parser = SimpleJsonOutputParser(diff=diff)
+    lines = 0
+
+    def trace(_frame: FrameType, event: str, _arg: Any) -> Any:
+        nonlocal lines
+        if event == "line":
+            lines += 1
+        return trace
+
+    previous = sys.gettrace()
+    sys.settrace(trace)
+    try:
+        for _ in parser.transform(iter(chunks)):
+            pass
+    finally:
+        sys.settrace(previous)
+    return lines
+
+
+@pytest.mark.parametrize("diff", [False, True])
+def test_json_output_parser_streams_in_linear_time(*, diff: bool) -> None:
+    # Parsing all the text so far on every chunk runs over 3 times as many lines for
+    # a document twice as long.
+    assert _lines_executed(200, diff=diff) < 2.5 * _lines_executed(100, diff=diff)
+
+
+def test_json_patch_matches_make_patch() -> None:
+    document = json.dumps(
+        {
+            "title": "a/b ~ c",
+            "items": [
+                {"id": i, "tags": ["x", "y"], "ok": i % 2 == 0} for i in range(5)
+            ],
+            "same": ["x", "x", 1, 1.0, True],
+            "nested": [[], [[1]], {}],
+        }
+    )
+    parser = PartialJsonParser()
+    prev = None
+    for end in range(len(document)):
+        parser.feed(document[end])
+        try:
+            parsed = parser.parse()
+        except json.JSONDecodeError:
+            continue
+        if parsed != prev:
+            expected = jsonpatch.make_patch(copy.deepcopy(prev), parsed).patch
+            assert make_patch(prev, parsed) == expected
+            prev = parsed
+
+
 STREAMED_TOKENS = """
 {
 
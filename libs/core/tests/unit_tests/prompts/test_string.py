@@ -1,9 +1,14 @@
+import re
+
 import pytest
 from packaging import version
 
 from langchain_core.prompts.string import (
+    _compile_jinja2,
+    _f_string_formatter,
     check_valid_template,
     get_template_variables,
+    jinja2_formatter,
     mustache_schema,
 )
 from langchain_core.utils.formatting import formatter
@@ -88,3 +93,44 @@ def test_f_string_templates_allow_safe_format_specs(
 ) -> None:
     assert get_template_variables(template, "f-string") == expected_variables
     assert formatter.format(template, **kwargs) == expected_output
+
+
+@pytest.mark.parametrize(
+    ("template", "kwargs"),
+    [
+        ("", {}),
+        ("no fields", {}),
+        ("{a} and {b}{a}", {"a": 1, "b": "two"}),
+        ("{{escaped}} {a}}}", {"a": "x"}),
+        ("{a!r} {a!s} {a!a} {b:>5} {b:.2f}", {"a": "é", "b": 1.5}),
+        ("{my-var} {émoji}", {"my-var": 1, "émoji": 2}),
+        ("{a}", {}),
+        ("{a!x}", {"a": 1}),
+        ("{a:d}", {"a": "x"}),
+        ("{}", {}),
+        ("{0}", {}),
+        ("{a.real} {a[0]}", {"a": [1]}),
+        ("{a:{b}}", {"a": 1.5, "b": ".1f"}),
+        ("{a", {"a": 1}),
+        ("{a} }", {}),
+    ],
+)
+def test_f_string_formatter_matches_formatter(
+    template: str, kwargs: dict[str, object]
+) -> None:
+    for _ in range(2):
+        try:
+            expected = formatter.format(template, **kwargs)
+        except Exception as e:
+            with pytest.raises(type(e), match=re.escape(str(e))):
+                _f_string_formatter(template, **kwargs)
+        else:
+            assert _f_string_formatter(template, **kwargs) == expected
+
+
+def test_jinja2_formatter_compiles_template_once() -> None:
+    template = "Hello {{ name }}{% if punctuation %}{{ punctuation }}{% endif %}"
+
+    assert jinja2_formatter(template, name="world") == "Hello world"
+    assert jinja2_formatter(template, name="you", punctuation="!") == "Hello you!"
+    assert _compile_jinja2(template) is _compile_jinja2(template)
@@ -1,6 +1,9 @@
 import json
+import threading
+import time
 import uuid
-from contextvars import copy_context
+from collections.abc import Iterator
+from contextvars import ContextVar, copy_context
 from typing import Any, cast
 
 import pytest
@@ -13,13 +16,22 @@ from langchain_core.callbacks.manager import (
 )
 from langchain_core.callbacks.stdout import StdOutCallbackHandler
 from langchain_core.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
-from langchain_core.runnables import RunnableBinding, RunnablePassthrough
+from langchain_core.runnables import (
+    RunnableBinding,
+    RunnableLambda,
+    RunnableParallel,
+    RunnablePassthrough,
+)
 from langchain_core.runnables.config import (
+    ContextThreadPoolExecutor,
     RunnableConfig,
     _get_langsmith_inheritable_metadata_from_config,
     _merge_metadata_dicts,
     _set_config_context,
+    disable_shared_executor,
+    enable_shared_executor,
     ensure_config,
+    get_executor_for_config,
     merge_configs,
     run_in_executor,
 )
@@ -414,3 +426,91 @@ class TestMergeMetadataDicts:
         assert merged["metadata"] == {
             "lc_versions": {"a": "1", "b": "2", "c": "3"},
         }
+
+
+@pytest.fixture
+def shared_executor() -> Iterator[None]:
+    enable_shared_executor(max_workers=4)
+    try:
+        yield
+    finally:
+        disable_shared_executor()
+
+
+@pytest.mark.usefixtures("shared_executor")
+def test_shared_executor_reuses_threads() -> None:
+    thread_names: set[str] = set()
+
+    def record(x: int) -> int:
+        thread_names.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return x
+
+    runnable = RunnableLambda(record)
+    for _ in range(5):
+        assert runnable.batch(list(range(8))) == list(range(8))
+
+    pool_threads = {
+        name for name in thread_names if name.startswith("langchain-shared")
+    }
+    assert 0 < len(pool_threads) <= 4
+    assert thread_names <= pool_threads | {threading.current_thread().name}
+
+
+@pytest.mark.usefixtures("shared_executor")
+def test_shared_executor_honors_max_concurrency() -> None:
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def track(x: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return x
+
+    assert RunnableLambda(track).batch(list(range(10)), {"max_concurrency": 2}) == (
+        list(range(10))
+    )
+    assert peak == 2
+
+
+def test_shared_executor_nested_batches_do_not_deadlock() -> None:
+    enable_shared_executor(max_workers=1)
+    try:
+        inner: RunnableLambda[int, int] = RunnableLambda(lambda x: x * 2)
+        outer: RunnableLambda[int, int] = RunnableLambda(
+            lambda x: sum(inner.batch([x, x]))
+        )
+        assert outer.batch([1, 2, 3]) == [4, 8, 12]
+        assert RunnableParallel(a=outer, b=outer).invoke(1) == {"a": 4, "b": 4}
+    finally:
+        disable_shared_executor()
+
+
+@pytest.mark.usefixtures("shared_executor")
+def test_shared_executor_copies_context_and_propagates_errors() -> None:
+    var: ContextVar[str] = ContextVar("var", default="unset")
+    var.set("caller")
+
+    def read(x: int) -> str:
+        if x < 0:
+            msg = "negative"
+            raise ValueError(msg)
+        return var.get()
+
+    runnable = RunnableLambda(read)
+    assert runnable.batch([1, 2]) == ["caller", "caller"]
+    outputs: list[Any] = runnable.batch([1, -1], return_exceptions=True)
+    assert outputs[0] == "caller"
+    assert isinstance(outputs[1], ValueError)
+
+
+def test_get_executor_for_config_without_shared_executor() -> None:
+    with get_executor_for_config({"max_concurrency": 3}) as executor:
+        assert isinstance(executor, ContextThreadPoolExecutor)
+        assert executor._max_workers == 3
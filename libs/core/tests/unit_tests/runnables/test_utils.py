@@ -1,11 +1,20 @@
+import functools
+import inspect
 from collections.abc import Callable
 from typing import Any
 
 import pytest
 
+from langchain_core.messages import AIMessageChunk
 from langchain_core.runnables.base import RunnableLambda
 from langchain_core.runnables.utils import (
     AddableDict,
+    _ChunkSum,
+    _parameter_names,
+    accepts_config,
+    accepts_context,
+    accepts_run_manager,
+    add,
     get_function_nonlocals,
     get_lambda_source,
     indent_lines_after_first,
@@ -100,3 +109,161 @@ def test_addable_dict_add_none_seeded_key_is_unaffected() -> None:
     left = AddableDict({"data": None})
     right = AddableDict({"data": {"a": 1}})
     assert (left + right) == AddableDict({"data": {"a": 1}})
+
+
+def _message_chunks() -> list[AIMessageChunk]:
+    return [
+        AIMessageChunk(content=f"{i} ", additional_kwargs={"args": f"{i},"})
+        for i in range(10)
+    ]
+
+
+def test_add_message_chunks() -> None:
+    chunks = _message_chunks()
+    expected = chunks[0]
+    for chunk in chunks[1:]:
+        expected += chunk
+    assert add(chunks) == expected
+    assert add(["a", "b", "c"]) == "abc"
+    assert add([]) is None
+    assert _ChunkSum().empty
+
+
+def test_chunk_sum_joins_strings_and_lists() -> None:
+    first = [1]
+    assert add([first]) is first
+    assert add([first, [2, 3], [], [4]]) == [1, 2, 3, 4]
+    assert first == [1]
+    assert add(["a", "", "b"]) == "ab"
+
+    restart = _ChunkSum(on_type_error="restart")
+    last = _ChunkSum(on_type_error="last")
+    for chunk in ["a", "b", [1], [2], "c", "d"]:
+        restart.add(chunk)
+        last.add(chunk)
+    assert restart.value == "cd"
+    assert last.value == "d"
+
+
+def test_chunk_sum_mixed_chunks() -> None:
+    chunks: list[Any] = [*_message_chunks()[:3], "text", *_message_chunks()[3:]]
+
+    restart = _ChunkSum(on_type_error="restart")
+    last = _ChunkSum(on_type_error="last")
+    for chunk in chunks:
+        restart.add(chunk)
+        last.add(chunk)
+    assert not restart.empty
+
+    # An AIMessageChunk can't be added to a str, so the sum starts over there.
+    assert restart.value == add(_message_chunks()[3:])
+    assert last.value == chunks[-1]
+    with pytest.raises(TypeError):
+        add(chunks)
+
+
+def test_chunk_sum_message_type_error() -> None:
+    chunks = [
+        AIMessageChunk(content="a", additional_kwargs={"n": "1"}),
+        AIMessageChunk(content="b"),
+        AIMessageChunk(content="c", additional_kwargs={"n": 2}),
+        AIMessageChunk(content="d"),
+    ]
+
+    restart = _ChunkSum(on_type_error="restart")
+    last = _ChunkSum(on_type_error="last")
+    for chunk in chunks:
+        restart.add(chunk)
+        last.add(chunk)
+
+    assert restart.value == chunks[2] + chunks[3]
+    assert last.value == chunks[3]
+    with pytest.raises(TypeError):
+        add(chunks)
+
+
+def _make_closure(offset: int) -> Callable[[int, Any], int]:
+    def func(x: int, config: Any) -> int:  # noqa: ARG001
+        return x + offset
+
+    return func
+
+
+class _Step:
+    def method(self, config: Any, *, run_manager: Any = None) -> None:
+        pass
+
+    def __call__(self, x: Any, context: Any) -> None:
+        pass
+
+
+def _decorated(
+    func: Callable[[Any, Any], None],
+) -> Callable[..., None]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _run_manager_step(x: Any, run_manager: Any) -> None:
+    pass
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda x: x,
+        lambda x, config: x,  # noqa: ARG005
+        _make_closure(1),
+        _Step().method,
+        _Step.method,
+        _Step(),
+        _decorated(_run_manager_step),
+        functools.partial(_run_manager_step, 1),
+        len,
+        dict,
+    ],
+)
+def test_parameter_names_match_signature(func: Callable[..., Any]) -> None:
+    try:
+        expected = set(inspect.signature(func).parameters)
+    except ValueError:
+        expected = set()
+
+    for _ in range(2):
+        assert _parameter_names(func) == expected
+        assert accepts_config(func) == ("config" in expected)
+        assert accepts_context(func) == ("context" in expected)
+        assert accepts_run_manager(func) == ("run_manager" in expected)
+
+
+def test_parameter_names_cached_by_code() -> None:
+    first, second = _make_closure(1), _make_closure(2)
+    assert first.__code__ is second.__code__
+
+    assert _parameter_names(first) is _parameter_names(second)
+
+
+def test_parameter_names_bound_method_drops_first_parameter() -> None:
+    def func(config: Any, x: Any) -> None:
+        pass
+
+    class Holder:
+        method = func
+
+    assert accepts_config(func)
+    assert not accepts_config(Holder().method)
+    assert accepts_config(func)
+
+
+def test_parameter_names_respects_signature_override() -> None:
+    def func(x: Any) -> None:
+        pass
+
+    assert not accepts_config(func)
+    func.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [inspect.Parameter("config", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    )
+    assert accepts_config(func)
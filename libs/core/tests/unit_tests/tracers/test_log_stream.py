@@ -0,0 +1,144 @@
+import copy
+from collections.abc import AsyncIterator
+from typing import Any
+
+import jsonpatch  # type: ignore[import-untyped]
+import pytest
+
+from langchain_core.documents import Document
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessageChunk, HumanMessage
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.runnables import RunnableLambda
+from langchain_core.runnables.utils import AddableDict
+from langchain_core.tracers.log_stream import RunLog, RunLogPatch, _FinalOutputDiff
+from langchain_core.utils._json_patch import apply_patch
+
+STREAMS: list[list[Any]] = [
+    ["Hello", " world", "", "!", "", "Hello"],
+    [
+        AIMessageChunk(content="Hello", id="run-1"),
+        AIMessageChunk(content=""),
+        AIMessageChunk(content=" world", id="lc_run-1"),
+        AIMessageChunk(content="", response_metadata={"finish_reason": "stop"}),
+        AIMessageChunk(content="", usage_metadata=None),
+        AIMessageChunk(content="", chunk_position="last"),
+    ],
+    [
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                tool_call_chunk(name="search", args="", id="call_1", index=0)
+            ],
+        ),
+        *(
+            AIMessageChunk(
+                content="", tool_call_chunks=[tool_call_chunk(args=part, index=0)]
+            )
+            for part in ['{"q', 'uery": ', '"weather"', "}"]
+        ),
+        AIMessageChunk(content="", tool_call_chunks=[tool_call_chunk(index=0)]),
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[tool_call_chunk(name="lookup", args="{}", index=1)],
+        ),
+    ],
+    [
+        AIMessageChunk(content=[{"type": "text", "text": "Hi", "index": 0}]),
+        AIMessageChunk(content=[{"type": "text", "text": " there", "index": 0}]),
+        AIMessageChunk(content=[]),
+    ],
+    [
+        AddableDict(question="What?"),
+        AddableDict(answer="It"),
+        AddableDict(answer=" is"),
+        AddableDict(answer=""),
+        AddableDict(docs=[Document(page_content="a")]),
+        AddableDict(docs=[Document(page_content="b")]),
+        AddableDict(message=AIMessageChunk(content="x")),
+        AddableDict(message=AIMessageChunk(content="")),
+        AddableDict(message=AIMessageChunk(content="y")),
+        AddableDict(question="!"),
+        AddableDict(lc="escaped"),
+    ],
+    [[1], [2, 3], [], [{"a": "b"}], [{"a": "b"}], ["x"]],
+    # Outputs that cannot be added restart the final output.
+    ["a", "b", 1, 2, None, HumanMessage(content="x"), HumanMessage(content="x")],
+    [None, None, "a"],
+]
+
+
+@pytest.mark.parametrize("chunks", STREAMS)
+def test_final_output_diff_matches_from_diff(chunks: list[Any]) -> None:
+    diff = _FinalOutputDiff()
+    prev_final_output: Any = None
+    final_output: Any = None
+    for chunk in chunks:
+        prev_final_output = final_output
+        if final_output is None:
+            final_output = chunk
+        else:
+            try:
+                final_output = final_output + chunk
+            except TypeError:
+                prev_final_output = None
+                final_output = chunk
+        expected = jsonpatch.JsonPatch.from_diff(
+            copy.deepcopy(prev_final_output), final_output, dumps=dumps
+        ).patch
+        assert diff(prev_final_output, final_output) == expected
+
+
+def test_apply_patch_shares_unchanged_values() -> None:
+    doc: dict[str, Any] = {
+        "logs": {"a": {"items": [1]}, "b": {"items": [2]}},
+        "out": [{"x": 1}],
+    }
+    before = copy.deepcopy(doc)
+    value: dict[str, Any] = {"items": []}
+    ops: list[dict[str, Any]] = [
+        {"op": "add", "path": "/logs/c", "value": value},
+        {"op": "add", "path": "/logs/c/items/-", "value": 3},
+        {"op": "add", "path": "/logs/a/items/-", "value": 4},
+        {"op": "move", "from": "/out/0", "path": "/logs/a~1b"},
+        {"op": "copy", "from": "/logs/b", "path": "/copied"},
+        {"op": "remove", "path": "/logs/b/items/0"},
+        {"op": "test", "path": "/copied/items/0", "value": 2},
+    ]
+
+    patched = apply_patch(doc, ops)
+
+    assert patched == jsonpatch.apply_patch(before, ops)
+    assert doc == before
+    assert value == {"items": []}
+    assert patched["logs"]["a"] is not doc["logs"]["a"]
+    assert patched["logs"]["a/b"] is doc["out"][0]
+
+
+async def test_astream_log_states_match_apply_patch() -> None:
+    async def stream(value: str) -> AsyncIterator[AddableDict]:
+        for token in value.split():
+            yield AddableDict(tokens=[token], text=token + " ")
+
+    chain = RunnableLambda(lambda x: x) | RunnableLambda(stream)
+    states: list[tuple[RunLog, Any]] = []
+    expected_state: Any = None
+    log = RunLog(state=None)  # type: ignore[arg-type]
+    async for patch in chain.astream_log("a b c d", diff=True):
+        assert isinstance(patch, RunLogPatch)
+        expected_state = jsonpatch.apply_patch(expected_state, patch.ops)
+        log += patch
+        assert log.state == expected_state
+        states.append((log, copy.deepcopy(log.state)))
+
+    # Applying patches leaves the states of earlier logs unchanged.
+    for state_log, state in states:
+        assert state_log.state == state
+    assert expected_state["final_output"] == {
+        "tokens": ["a", "b", "c", "d"],
+        "text": "a b c d ",
+    }
+    # Chunks are shared with the final output, which must not change them.
+    assert log.state["streamed_output"] == [
+        {"tokens": [token], "text": token + " "} for token in "abcd"
+    ]
@@ -485,6 +485,70 @@ def test_merge_lists_all_none() -> None:
     assert result is None
 
 
+def test_merge_lists_many_deltas_match_pairwise() -> None:
+    """Merging many deltas at once gives the same list as merging them in turn."""
+    left: list[Any] = [{"index": 0, "type": "text", "text": "a"}, "plain"]
+    others: list[list[Any] | None] = [
+        [{"index": 0, "type": "text", "text": "b"}],
+        [{"index": 1, "type": "tool_call_chunk", "args": "{", "id": None}],
+        None,
+        [{"index": 1, "args": '"x"', "id": "call_1"}],
+        # Same index, different id: a new block rather than a delta.
+        [{"index": 1, "args": "[", "id": "call_2"}],
+        [{"index": 1, "args": ": 1}", "id": "call_1"}],
+        [{"index": "lc_abc", "type": "non_standard", "value": {"a": "1"}}],
+        [{"index": "lc_abc", "type": "non_standard", "value": {"a": "2"}}],
+        [{"index": 0, "type": "text", "text": "c", "annotations": [{"x": 1}]}],
+    ]
+    left_copy = deepcopy(left)
+    others_copy = deepcopy(others)
+
+    pairwise: list[Any] | None = left
+    for other in others:
+        pairwise = merge_lists(pairwise, other)
+    result = merge_lists(left, *others)
+
+    assert result == pairwise
+    assert result == [
+        {"index": 0, "type": "text", "text": "abc", "annotations": [{"x": 1}]},
+        "plain",
+        {"index": 1, "type": "tool_call_chunk", "args": '{"x": 1}', "id": "call_1"},
+        {"index": 1, "args": "[", "id": "call_2"},
+        {"index": "lc_abc", "type": "non_standard", "value": {"a": "12"}},
+    ]
+    assert left == left_copy
+    assert others == others_copy
+
+
+def test_merge_dicts_many_match_pairwise() -> None:
+    """Merging many dicts at once gives the same dict as merging them in turn."""
+    dicts: list[dict[str, Any]] = [
+        {"function_call": {"name": "f", "arguments": None}, "id": "a", "n": 1},
+        {"function_call": {"arguments": "{"}, "id": "a", "n": 2, "tags": ["x"]},
+        {"function_call": {"arguments": '"k": '}, "text": "he", "tags": ["y"]},
+        {"function_call": {"arguments": "1}"}, "text": "llo", "extra": None},
+    ]
+    pairwise = dicts[0]
+    for right in dicts[1:]:
+        pairwise = merge_dicts(pairwise, right)
+
+    assert (
+        merge_dicts(*dicts)
+        == pairwise
+        == {
+            "function_call": {"name": "f", "arguments": '{"k": 1}'},
+            "id": "a",
+            "n": 3,
+            "tags": ["x", "y"],
+            "text": "hello",
+            "extra": None,
+        }
+    )
+
+    with pytest.raises(TypeError):
+        merge_dicts({"text": "a"}, {"text": "b"}, {"text": 1})
+
+
 @pytest.mark.parametrize(
     ("left", "right", "expected"),
     [
@@ -1,14 +1,19 @@
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock
+from typing import TYPE_CHECKING, Any, Literal
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from langchain_tests.integration_tests.vectorstores import VectorStoreIntegrationTests
 
 from langchain_core.documents import Document
 from langchain_core.embeddings.fake import DeterministicFakeEmbedding
-from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import InMemoryVectorStore, in_memory
+from tests.unit_tests.fake.callbacks import FakeCallbackHandler
 from tests.unit_tests.stubs import _any_id_document
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class TestInMemoryStandard(VectorStoreIntegrationTests):
     @pytest.fixture
@@ -16,6 +21,13 @@ class TestInMemoryStandard(VectorStoreIntegrationTests):
         return InMemoryVectorStore(embedding=self.get_embeddings())
 
 
+class TestInMemoryMatrixStandard(VectorStoreIntegrationTests):
+    @pytest.fixture
+    def vectorstore(self) -> InMemoryVectorStore:
+        pytest.importorskip("numpy")
+        return InMemoryVectorStore(embedding=self.get_embeddings(), storage="matrix")
+
+
 async def test_inmemory_similarity_search() -> None:
     """Test end to end similarity search."""
     store = await InMemoryVectorStore.afrom_texts(
@@ -220,3 +232,363 @@ async def test_inmemory_call_embeddings_async() -> None:
     # Ensure the async embedding function is called
     assert embeddings_mock.aembed_documents.await_count == 1
     assert embeddings_mock.aembed_query.await_count == 1
+
+
+def test_inmemory_invalid_storage() -> None:
+    with pytest.raises(ValueError, match="storage must be"):
+        InMemoryVectorStore(
+            embedding=DeterministicFakeEmbedding(size=3),
+            storage="list",  # type: ignore[arg-type]
+        )
+
+
+async def test_inmemory_matrix_matches_dict_storage() -> None:
+    """Matrix storage returns the same ranking and scores as dict storage."""
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=16)
+    texts = [f"text {i}" for i in range(50)]
+    metadatas = [{"i": i} for i in range(50)]
+    dict_store = InMemoryVectorStore.from_texts(texts, embedding, metadatas)
+    matrix_store = await InMemoryVectorStore.afrom_texts(
+        texts, embedding, metadatas, storage="matrix"
+    )
+    assert "vector" not in next(iter(matrix_store.store.values()))
+
+    for query in ["text 3", "text 42", "unrelated"]:
+        expected = dict_store.similarity_search_with_score(query, k=5)
+        actual = matrix_store.similarity_search_with_score(query, k=5)
+        assert [doc.page_content for doc, _ in actual] == [
+            doc.page_content for doc, _ in expected
+        ]
+        assert [score for _, score in actual] == pytest.approx(
+            [score for _, score in expected], abs=1e-5
+        )
+
+    def _filter(doc: Document) -> bool:
+        return doc.metadata["i"] % 2 == 0
+
+    expected_docs = dict_store.similarity_search("text 7", k=3, filter=_filter)
+    actual_docs = matrix_store.similarity_search("text 7", k=3, filter=_filter)
+    assert [doc.page_content for doc in actual_docs] == [
+        doc.page_content for doc in expected_docs
+    ]
+
+    expected_docs = dict_store.max_marginal_relevance_search("a query", k=4)
+    actual_docs = matrix_store.max_marginal_relevance_search("a query", k=4)
+    assert [doc.page_content for doc in actual_docs] == [
+        doc.page_content for doc in expected_docs
+    ]
+
+
+def test_inmemory_matrix_delete_and_upsert() -> None:
+    pytest.importorskip("numpy")
+    store = InMemoryVectorStore(
+        embedding=DeterministicFakeEmbedding(size=6), storage="matrix"
+    )
+    store.add_texts(["foo", "bar", "baz", "qux"], ids=["1", "2", "3", "4"])
+
+    store.delete(["1"])
+    assert sorted(store.store.keys()) == ["2", "3", "4"]
+    assert [doc.id for doc in store.similarity_search("foo", k=10)] != []
+    assert "1" not in {doc.id for doc in store.similarity_search("foo", k=10)}
+
+    # Deleting half the rows triggers compaction; the remaining rows still resolve.
+    store.delete(["2", "missing"])
+    output = store.similarity_search("baz", k=10)
+    assert {doc.id for doc in output} == {"3", "4"}
+    assert output[0].page_content == "baz"
+
+    # Overwriting an id replaces its vector rather than adding a new row.
+    store.add_texts(["foo"], ids=["3"])
+    output = store.similarity_search("foo", k=10)
+    assert len(output) == 2
+    assert output[0] == Document(id="3", page_content="foo")
+
+
+def test_inmemory_matrix_dump_load(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore.from_texts(
+        ["foo", "bar", "baz"], embedding, storage="matrix"
+    )
+    output = store.similarity_search_with_score("foo", k=2)
+
+    test_file = str(tmp_path / "test.json")
+    store.dump(test_file)
+
+    # Files written from matrix storage load into either storage mode.
+    dict_store = InMemoryVectorStore.load(test_file, embedding)
+    assert dict_store.similarity_search("foo", k=2) == [doc for doc, _ in output]
+    matrix_store = InMemoryVectorStore.load(test_file, embedding, storage="matrix")
+    loaded_output = matrix_store.similarity_search_with_score("foo", k=2)
+    assert [doc for doc, _ in loaded_output] == [doc for doc, _ in output]
+    assert [score for _, score in loaded_output] == pytest.approx(
+        [score for _, score in output]
+    )
+
+
+@pytest.mark.parametrize("storage", ["dict", "matrix"])
+async def test_inmemory_batch_similarity_search_by_vector(
+    storage: Literal["dict", "matrix"],
+) -> None:
+    """Batched search returns the same results as one search per query."""
+    if storage == "matrix":
+        pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=8)
+    store = InMemoryVectorStore.from_texts(
+        [f"text {i}" for i in range(20)],
+        embedding,
+        [{"even": i % 2 == 0} for i in range(20)],
+        storage=storage,
+    )
+    queries = [embedding.embed_query(q) for q in ["text 1", "text 12", "other"]]
+
+    expected = [store.similarity_search_by_vector(q, k=3) for q in queries]
+    assert store.batch_similarity_search_by_vector(queries, k=3) == expected
+    assert await store.abatch_similarity_search_by_vector(queries, k=3) == expected
+
+    def _filter(doc: Document) -> bool:
+        return doc.metadata["even"]
+
+    expected = [
+        store.similarity_search_by_vector(q, k=3, filter=_filter) for q in queries
+    ]
+    actual = store.batch_similarity_search_by_vector(queries, k=3, filter=_filter)
+    assert actual == expected
+    assert all(doc.metadata["even"] for docs in actual for doc in docs)
+
+    assert store.batch_similarity_search_by_vector([], k=3) == []
+    assert store.batch_similarity_search_by_vector(
+        queries, k=3, filter=lambda _: False
+    ) == [[], [], []]
+
+
+async def test_inmemory_retriever_batch_uses_batched_search() -> None:
+    embedding = DeterministicFakeEmbedding(size=8)
+    store = InMemoryVectorStore.from_texts(["foo", "bar", "baz"], embedding)
+    retriever = store.as_retriever(search_kwargs={"k": 1})
+    handler = FakeCallbackHandler()
+
+    with patch.object(
+        store,
+        "batch_similarity_search_by_vector",
+        wraps=store.batch_similarity_search_by_vector,
+    ) as batch_search:
+        output = retriever.batch(["foo", "baz"], {"callbacks": [handler]})
+    assert batch_search.call_count == 1
+    assert output == [
+        [_any_id_document(page_content="foo")],
+        [_any_id_document(page_content="baz")],
+    ]
+    assert handler.retriever_starts == 2
+    assert handler.retriever_ends == 2
+
+    output = await retriever.abatch(["bar"])
+    assert output == [[_any_id_document(page_content="bar")]]
+
+    # Search types that the batched search cannot serve fall back to invoke.
+    mmr_retriever = store.as_retriever(search_type="mmr", search_kwargs={"k": 1})
+    with patch.object(store, "batch_similarity_search_by_vector") as batch_search:
+        output = mmr_retriever.batch(["foo"])
+    batch_search.assert_not_called()
+    assert output == [[_any_id_document(page_content="foo")]]
+
+
+@pytest.mark.parametrize("storage", ["dict", "matrix"])
+async def test_inmemory_metadata_filter(storage: Literal["dict", "matrix"]) -> None:
+    """Dict filters match the equivalent callable filters."""
+    if storage == "matrix":
+        pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=8)
+    store = InMemoryVectorStore(embedding=embedding, storage=storage)
+    store.add_texts(
+        [f"text {i}" for i in range(30)],
+        metadatas=[
+            {"tenant": f"t{i % 3}", "lang": ["en", "fr"][i % 2], "tags": ["x"]}
+            for i in range(30)
+        ],
+        ids=[str(i) for i in range(30)],
+    )
+
+    cases: list[tuple[dict[str, Any], Callable[[Document], bool]]] = [
+        ({"tenant": "t1"}, lambda doc: doc.metadata["tenant"] == "t1"),
+        ({"tenant": {"$eq": "t2"}}, lambda doc: doc.metadata["tenant"] == "t2"),
+        (
+            {"tenant": {"$in": ["t0", "t2"]}, "lang": "fr"},
+            lambda doc: (
+                doc.metadata["tenant"] in {"t0", "t2"} and doc.metadata["lang"] == "fr"
+            ),
+        ),
+        ({}, lambda _: True),
+    ]
+    for dict_filter, callable_filter in cases:
+        expected = store.similarity_search("text 5", k=4, filter=callable_filter)
+        assert store.similarity_search("text 5", k=4, filter=dict_filter) == expected
+        assert (
+            await store.asimilarity_search("text 5", k=4, filter=dict_filter)
+            == expected
+        )
+        assert store.max_marginal_relevance_search(
+            "text 5", k=2, filter=dict_filter
+        ) == store.max_marginal_relevance_search("text 5", k=2, filter=callable_filter)
+
+    # Missing keys, unknown values and unhashable metadata never match.
+    assert store.similarity_search("text 5", filter={"missing": 1}) == []
+    assert store.similarity_search("text 5", filter={"tenant": "t9"}) == []
+    assert store.similarity_search("text 5", filter={"tags": "x"}) == []
+    assert store.similarity_search("text 5", filter={"tenant": {"$in": []}}) == []
+
+    # The index follows upserts and deletes.
+    store.add_texts(["text 5"], metadatas=[{"tenant": "t9"}], ids=["5"])
+    assert [
+        doc.id for doc in store.similarity_search("q", filter={"tenant": "t9"})
+    ] == ["5"]
+    assert "5" not in {
+        doc.id for doc in store.similarity_search("q", k=30, filter={"tenant": "t2"})
+    }
+    store.delete(["5"])
+    assert store.similarity_search("q", filter={"tenant": "t9"}) == []
+
+    assert store.batch_similarity_search_by_vector(
+        [embedding.embed_query("text 5")], k=3, filter={"lang": "en"}
+    ) == [store.similarity_search("text 5", k=3, filter={"lang": "en"})]
+
+
+def test_inmemory_metadata_filter_errors() -> None:
+    store = InMemoryVectorStore.from_texts(
+        ["foo"], DeterministicFakeEmbedding(size=3), [{"a": 1}]
+    )
+    with pytest.raises(ValueError, match="Unsupported filter operator"):
+        store.similarity_search("foo", filter={"a": {"$gt": 0}})
+    with pytest.raises(ValueError, match="exactly one operator"):
+        store.similarity_search("foo", filter={"a": {"$eq": 1, "$in": [1]}})
+    with pytest.raises(ValueError, match="must be hashable"):
+        store.similarity_search("foo", filter={"a": [1]})
+    with pytest.raises(ValueError, match="must be a list, tuple or set"):
+        store.similarity_search("foo", filter={"a": {"$in": "abc"}})
+
+
+def test_inmemory_metadata_filter_copies_metadata() -> None:
+    """Changing a document's metadata after adding it does not affect filtering."""
+    store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=3))
+    doc = Document(page_content="foo", metadata={"a": 1})
+    store.add_documents([doc], ids=["1"])
+    doc.metadata["a"] = 2
+
+    assert [d.id for d in store.similarity_search("foo", filter={"a": 1})] == ["1"]
+    assert store.similarity_search("foo", filter={"a": 2}) == []
+
+
+def test_inmemory_metadata_filter_tie_order() -> None:
+    """Ties come back in the same order whatever order the documents were added."""
+
+    def search(ids: list[str]) -> list[str | None]:
+        store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=3))
+        store.add_texts(["same"] * len(ids), metadatas=[{"a": 1}] * len(ids), ids=ids)
+        results = store.similarity_search("same", k=4, filter={"a": {"$in": [1]}})
+        return [doc.id for doc in results]
+
+    assert search(["c", "a", "d", "b"]) == search(["b", "d", "a", "c"])
+
+
+@pytest.mark.parametrize("storage", ["dict", "matrix"])
+@pytest.mark.parametrize("mmap", [True, False])
+def test_inmemory_dump_load_binary(
+    tmp_path: Path, storage: Literal["dict", "matrix"], *, mmap: bool
+) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore(embedding=embedding, storage=storage)
+    store.add_texts(
+        ["foo", "bar", "baz", "qux"],
+        metadatas=[{"i": 0}, {"i": 1, "nested": {"a": [1, 2]}}, {"i": 2}, {"i": 3}],
+        ids=["1", "2", "3", "4"],
+    )
+    store.delete(["3"])
+    output = store.similarity_search_with_score("foo", k=3)
+
+    store.dump_binary(str(tmp_path / "index"))
+    for storage_ in ("dict", "matrix"):
+        loaded = InMemoryVectorStore.load_binary(
+            str(tmp_path / "index"), embedding, mmap=mmap, storage=storage_
+        )
+        assert loaded.get_by_ids(["1", "2", "3", "4"]) == store.get_by_ids(
+            ["1", "2", "4"]
+        )
+        loaded_output = loaded.similarity_search_with_score("foo", k=3)
+        assert [doc for doc, _ in loaded_output] == [doc for doc, _ in output]
+        assert [score for _, score in loaded_output] == pytest.approx(
+            [score for _, score in output], abs=1e-5
+        )
+
+    # A loaded store stays writable, and can be dumped over its own files.
+    loaded.add_texts(["new"], ids=["5"])
+    loaded.add_texts(["bar"], ids=["1"])
+    loaded.delete(["2"])
+    loaded.dump_binary(str(tmp_path / "index"))
+    assert loaded.similarity_search("bar", k=10)[0].id == "1"
+    reloaded = InMemoryVectorStore.load_binary(
+        str(tmp_path / "index"), embedding, storage="matrix"
+    )
+    assert sorted(reloaded.store) == ["1", "4", "5"]
+    assert reloaded.similarity_search("bar", k=1) == [
+        Document(id="1", page_content="bar")
+    ]
+
+
+def test_inmemory_dump_load_binary_empty(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=3)
+    InMemoryVectorStore(embedding=embedding).dump_binary(str(tmp_path))
+    loaded = InMemoryVectorStore.load_binary(str(tmp_path), embedding, storage="matrix")
+    assert loaded.store == {}
+    assert loaded.similarity_search("foo") == []
+    loaded.add_texts(["foo"])
+    assert len(loaded.similarity_search("foo")) == 1
+
+
+def test_inmemory_dump_binary_interrupted(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=3)
+    InMemoryVectorStore.from_texts(["foo", "bar"], embedding).dump_binary(str(tmp_path))
+    store = InMemoryVectorStore.from_texts(["baz", "qux"], embedding)
+
+    # Stop overwriting the dump right before its header is written.
+    original = in_memory._replace_file
+
+    def replace_file(path: Path, data: bytes) -> None:
+        if path.name == "header.json":
+            msg = "interrupted"
+            raise OSError(msg)
+        original(path, data)
+
+    with (
+        patch.object(in_memory, "_replace_file", replace_file),
+        pytest.raises(OSError, match="interrupted"),
+    ):
+        store.dump_binary(str(tmp_path))
+    with pytest.raises(ValueError, match="No complete binary vector store dump"):
+        InMemoryVectorStore.load_binary(str(tmp_path), embedding)
+
+    store.dump_binary(str(tmp_path))
+    loaded = InMemoryVectorStore.load_binary(str(tmp_path), embedding)
+    assert sorted(record["text"] for record in loaded.store.values()) == ["baz", "qux"]
+
+
+@pytest.mark.parametrize("name", ["vectors.f32", "norms.f32", "records.jsonl"])
+def test_inmemory_load_binary_inconsistent(tmp_path: Path, name: str) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=3)
+    InMemoryVectorStore.from_texts(["foo"], embedding).dump_binary(str(tmp_path))
+    (tmp_path / name).write_bytes((tmp_path / name).read_bytes()[:-1])
+    with pytest.raises(ValueError, match="is inconsistent"):
+        InMemoryVectorStore.load_binary(str(tmp_path), embedding)
+
+
+def test_inmemory_load_binary_unsupported_version(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    embedding = DeterministicFakeEmbedding(size=3)
+    InMemoryVectorStore.from_texts(["foo"], embedding).dump_binary(str(tmp_path))
+    (tmp_path / "header.json").write_text('{"version": 99}')
+    with pytest.raises(ValueError, match="Unsupported binary vector store format"):
+        InMemoryVectorStore.load_binary(str(tmp_path), embedding)
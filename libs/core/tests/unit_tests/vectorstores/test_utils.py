@@ -8,7 +8,11 @@ pytest.importorskip("numpy")
 import numpy as np
 import numpy.typing as npt
 
-from langchain_core.vectorstores.utils import _cosine_similarity
+from langchain_core.vectorstores.utils import (
+    _cosine_similarity,
+    _VectorMatrix,
+    maximal_marginal_relevance,
+)
 
 
 class TestCosineSimilarity:
@@ -163,3 +167,135 @@ class TestCosineSimilarity:
             ]
         )
         np.testing.assert_array_almost_equal(result, expected)
+
+
+class TestMaximalMarginalRelevance:
+    """Tests for maximal_marginal_relevance function."""
+
+    def test_empty(self) -> None:
+        query = np.array([1.0, 0.0])
+        assert maximal_marginal_relevance(query, [], k=4) == []
+        assert maximal_marginal_relevance(query, [[1.0, 0.0]], k=0) == []
+
+    def test_k_larger_than_candidates(self) -> None:
+        query = np.array([1.0, 0.0])
+        embeddings = [[0.0, 1.0], [1.0, 0.0], [1.0, 1.0]]
+        assert sorted(maximal_marginal_relevance(query, embeddings, k=10)) == [
+            0,
+            1,
+            2,
+        ]
+
+    def test_relevance_only(self) -> None:
+        """With `lambda_mult=1`, MMR ranks purely by similarity to the query."""
+        query = np.array([1.0, 0.0])
+        embeddings = [[0.0, 1.0], [1.0, 0.1], [1.0, 0.5], [1.0, 0.0]]
+        assert maximal_marginal_relevance(query, embeddings, lambda_mult=1.0, k=4) == [
+            3,
+            1,
+            2,
+            0,
+        ]
+
+    def test_diversity(self) -> None:
+        """A near-duplicate of the first pick loses to a more diverse candidate."""
+        query = np.array([1.0, 0.0])
+        embeddings = [[1.0, 0.1], [1.0, 0.12], [1.0, -0.5]]
+        assert maximal_marginal_relevance(query, embeddings, lambda_mult=0.5, k=2) == [
+            0,
+            2,
+        ]
+        assert maximal_marginal_relevance(query, embeddings, lambda_mult=0.99, k=2) == [
+            0,
+            1,
+        ]
+
+    def test_zero_vector_candidate(self) -> None:
+        query = np.array([1.0, 0.0])
+        embeddings = [[1.0, 0.0], [0.0, 0.0], [-1.0, 0.0]]
+        assert maximal_marginal_relevance(query, embeddings, lambda_mult=0.5, k=3) == [
+            0,
+            1,
+            2,
+        ]
+
+    def test_matches_exhaustive_selection(self) -> None:
+        """Incremental selection matches recomputing MMR scores from scratch."""
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=8)
+        embeddings = rng.normal(size=(40, 8))
+        lambda_mult = 0.3
+
+        unit = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        to_query = unit @ (query / np.linalg.norm(query))
+        expected = [int(np.argmax(to_query))]
+        while len(expected) < 10:
+            redundancy = (unit @ unit[expected].T).max(axis=1)
+            scores = lambda_mult * to_query - (1 - lambda_mult) * redundancy
+            scores[expected] = -np.inf
+            expected.append(int(np.argmax(scores)))
+
+        assert (
+            maximal_marginal_relevance(
+                query, embeddings.tolist(), lambda_mult=lambda_mult, k=10
+            )
+            == expected
+        )
+
+
+class TestVectorMatrix:
+    """Tests for the _VectorMatrix storage used by InMemoryVectorStore."""
+
+    def test_search_orders_by_cosine_similarity(self) -> None:
+        matrix = _VectorMatrix(initial_capacity=1)
+        vectors = [[1.0, 0.0], [0.0, 2.0], [3.0, 3.0], [-1.0, 0.0]]
+        matrix.upsert(["a", "b", "c", "d"], vectors)
+        assert len(matrix) == 4
+
+        rows, scores = matrix.search([2.0, 0.0], k=3)
+        assert [matrix.id_at(row) for row in rows] == ["a", "c", "b"]
+        np.testing.assert_allclose(
+            scores, _cosine_similarity([[1, 0]], vectors)[0][:3][[0, 2, 1]], rtol=1e-6
+        )
+
+    def test_search_restricted_rows(self) -> None:
+        matrix = _VectorMatrix()
+        matrix.upsert(["a", "b", "c"], [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+        rows, _ = matrix.search([1.0, 0.0], k=5, rows=[1, 2])
+        assert [matrix.id_at(row) for row in rows] == ["c", "b"]
+
+    def test_delete_and_compact(self) -> None:
+        matrix = _VectorMatrix(compaction_ratio=1.0)
+        matrix.upsert(["a", "b", "c"], [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+        matrix.delete(["a", "unknown"])
+        assert len(matrix) == 2
+        assert "a" not in matrix
+        rows, _ = matrix.search([1.0, 0.0], k=5)
+        assert [matrix.id_at(row) for row in rows] == ["c", "b"]
+
+        matrix.compact()
+        assert matrix.row("b") == 0
+        assert matrix.row("c") == 1
+        assert matrix.get("c") == pytest.approx([1.0, 1.0])
+
+    def test_upsert_overwrites_and_preserves_norm(self) -> None:
+        matrix = _VectorMatrix()
+        matrix.upsert(["a", "a"], [[1.0, 0.0], [0.0, 3.0]])
+        assert len(matrix) == 1
+        assert matrix.get("a") == pytest.approx([0.0, 3.0])
+        assert matrix.normalized(0) == pytest.approx([0.0, 1.0])
+
+    def test_zero_vector_scores_zero(self) -> None:
+        matrix = _VectorMatrix()
+        matrix.upsert(["zero", "one"], [[0.0, 0.0], [1.0, 0.0]])
+        rows, scores = matrix.search([1.0, 0.0], k=2)
+        assert [matrix.id_at(row) for row in rows] == ["one", "zero"]
+        assert scores.tolist() == [1.0, 0.0]
+
+    def test_dimension_mismatch(self) -> None:
+        matrix = _VectorMatrix()
+        matrix.upsert(["a"], [[1.0, 0.0]])
+        with pytest.raises(ValueError, match="dimension"):
+            matrix.upsert(["b"], [[1.0, 0.0, 0.0]])
+        with pytest.raises(ValueError, match="dimension"):
+            matrix.search([1.0, 0.0, 0.0], k=1)
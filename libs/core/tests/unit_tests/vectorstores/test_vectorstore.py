@@ -292,3 +292,34 @@ async def test_default_afrom_documents(vs_class: type[VectorStore]) -> None:
     store = await vs_class.afrom_documents([original_document], embeddings, ids=["6"])
     assert original_document.id == "7"  # original document should not be modified
     assert await store.aget_by_ids(["6"]) == [Document(id="6", page_content="baz")]
+
+
+def test_default_batch_similarity_search_by_vector() -> None:
+    class _VectorStore(CustomAddTextsVectorstore):
+        @override
+        def similarity_search_by_vector(
+            self, embedding: list[float], k: int = 4, **kwargs: Any
+        ) -> list[Document]:
+            return [Document(page_content=str(embedding), metadata=kwargs)][:k]
+
+    store = _VectorStore()
+    assert store.batch_similarity_search_by_vector([[1.0], [2.0]], k=1, filter="x") == [
+        [Document(page_content="[1.0]", metadata={"filter": "x"})],
+        [Document(page_content="[2.0]", metadata={"filter": "x"})],
+    ]
+    assert store.batch_similarity_search_by_vector([[1.0]], k=0) == [[]]
+
+
+async def test_default_abatch_similarity_search_by_vector() -> None:
+    class _VectorStore(CustomAddTextsVectorstore):
+        @override
+        def similarity_search_by_vector(
+            self, embedding: list[float], k: int = 4, **kwargs: Any
+        ) -> list[Document]:
+            return [Document(page_content=str(embedding))]
+
+    store = _VectorStore()
+    assert await store.abatch_similarity_search_by_vector([[1.0], [2.0]]) == [
+        [Document(page_content="[1.0]")],
+        [Document(page_content="[2.0]")],
+    ]
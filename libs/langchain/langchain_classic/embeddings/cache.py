@@ -11,9 +11,11 @@ from __future__ import annotations
 
 import hashlib
 import json
+import struct
 import uuid
 import warnings
 from collections.abc import Callable, Sequence
+from importlib import util
 from typing import Literal, cast
 
 from langchain_core.embeddings import Embeddings
@@ -78,9 +80,66 @@ def _value_serializer(value: Sequence[float]) -> bytes:
     return json.dumps(value).encode()
 
 
+# Binary values start with a header holding a magic number, the dtype code and the
+# dimension, followed by the little-endian floats. The magic number cannot start a
+# JSON document, so both formats can be read from the same store.
+_BINARY_HEADER = struct.Struct("<4sB3xI")
+_BINARY_MAGIC = b"\xffLCE"
+# Value format -> (dtype code, NumPy dtype, `struct` format character).
+_BINARY_FORMATS = {"float32": (1, "<f4", "f"), "float16": (2, "<f2", "e")}
+_BINARY_DTYPES = {code: (dtype, char) for code, dtype, char in _BINARY_FORMATS.values()}
+
+_HAS_NUMPY = util.find_spec("numpy") is not None
+
+
+def _make_binary_value_serializer(
+    value_format: Literal["float32", "float16"],
+) -> Callable[[Sequence[float]], bytes]:
+    """Create a serializer that packs a value into the binary format."""
+    code, dtype, char = _BINARY_FORMATS[value_format]
+
+    def _binary_value_serializer(value: Sequence[float]) -> bytes:
+        header = _BINARY_HEADER.pack(_BINARY_MAGIC, code, len(value))
+        msg = f"Embedding has values too large for the {value_format} value format."
+        if _HAS_NUMPY:
+            import numpy as np
+
+            packed = np.asarray(value, dtype=dtype)
+            # NumPy turns finite values that overflow into infinities, where
+            # `struct` raises. Raise the same error for both.
+            overflowed = np.isinf(packed)
+            if overflowed.any() and np.isfinite(np.asarray(value)[overflowed]).any():
+                raise ValueError(msg)
+            return header + packed.tobytes()
+        try:
+            return header + struct.pack(f"<{len(value)}{char}", *value)
+        except OverflowError:
+            raise ValueError(msg) from None
+
+    return _binary_value_serializer
+
+
 def _value_deserializer(serialized_value: bytes) -> list[float]:
-    """Deserialize a value."""
-    return cast("list[float]", json.loads(serialized_value.decode()))
+    """Deserialize a value stored as JSON or in the binary format."""
+    if not serialized_value.startswith(_BINARY_MAGIC):
+        return cast("list[float]", json.loads(serialized_value.decode()))
+
+    _, code, dimension = _BINARY_HEADER.unpack_from(serialized_value)
+    if code not in _BINARY_DTYPES:
+        msg = f"Unsupported embedding dtype code: {code}"
+        raise ValueError(msg)
+    dtype, char = _BINARY_DTYPES[code]
+    if _HAS_NUMPY:
+        import numpy as np
+
+        # `frombuffer` views the stored bytes without an intermediate copy, and
+        # `tolist` converts them to the Python floats the store returns.
+        return np.frombuffer(
+            serialized_value, dtype=dtype, count=dimension, offset=_BINARY_HEADER.size
+        ).tolist()
+    return list(
+        struct.unpack_from(f"<{dimension}{char}", serialized_value, _BINARY_HEADER.size)
+    )
 
 
 # The warning is global; track emission, so it appears only once.
@@ -105,6 +164,26 @@ def _warn_about_sha1_encoder() -> None:
         _warned_about_sha1 = True
 
 
+def _expand_duplicates(
+    texts: list[str],
+    unique_texts: list[str],
+    vectors: list[list[float] | None],
+) -> list[list[float]]:
+    """Map the vectors of the unique texts back onto the original texts."""
+    # Nones should have been resolved by now
+    unique_vectors = cast("list[list[float]]", vectors)
+    if len(unique_texts) == len(texts):
+        return unique_vectors
+    by_text = dict(zip(unique_texts, unique_vectors, strict=True))
+    seen: set[str] = set()
+    expanded: list[list[float]] = []
+    for text in texts:
+        # Repeated texts get their own copy, as they would from the store.
+        expanded.append(list(by_text[text]) if text in seen else by_text[text])
+        seen.add(text)
+    return expanded
+
+
 class CacheBackedEmbeddings(Embeddings):
     """Interface for caching results from embedding models.
 
@@ -175,15 +254,17 @@ class CacheBackedEmbeddings(Embeddings):
         Returns:
             A list of embeddings for the given texts.
         """
+        # Identical texts are looked up and embedded once.
+        unique_texts = list(dict.fromkeys(texts))
         vectors: list[list[float] | None] = self.document_embedding_store.mget(
-            texts,
+            unique_texts,
         )
         all_missing_indices: list[int] = [
             i for i, vector in enumerate(vectors) if vector is None
         ]
 
         for missing_indices in batch_iterate(self.batch_size, all_missing_indices):
-            missing_texts = [texts[i] for i in missing_indices]
+            missing_texts = [unique_texts[i] for i in missing_indices]
             missing_vectors = self.underlying_embeddings.embed_documents(missing_texts)
             self.document_embedding_store.mset(
                 list(zip(missing_texts, missing_vectors, strict=False)),
@@ -193,10 +274,7 @@ class CacheBackedEmbeddings(Embeddings):
             ):
                 vectors[index] = updated_vector
 
-        return cast(
-            "list[list[float]]",
-            vectors,
-        )  # Nones should have been resolved by now
+        return _expand_duplicates(texts, unique_texts, vectors)
 
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed a list of texts.
@@ -211,8 +289,10 @@ class CacheBackedEmbeddings(Embeddings):
         Returns:
             A list of embeddings for the given texts.
         """
+        # Identical texts are looked up and embedded once.
+        unique_texts = list(dict.fromkeys(texts))
         vectors: list[list[float] | None] = await self.document_embedding_store.amget(
-            texts
+            unique_texts
         )
         all_missing_indices: list[int] = [
             i for i, vector in enumerate(vectors) if vector is None
@@ -221,7 +301,7 @@ class CacheBackedEmbeddings(Embeddings):
         # batch_iterate supports None batch_size which returns all elements at once
         # as a single batch.
         for missing_indices in batch_iterate(self.batch_size, all_missing_indices):
-            missing_texts = [texts[i] for i in missing_indices]
+            missing_texts = [unique_texts[i] for i in missing_indices]
             missing_vectors = await self.underlying_embeddings.aembed_documents(
                 missing_texts,
             )
@@ -233,10 +313,7 @@ class CacheBackedEmbeddings(Embeddings):
             ):
                 vectors[index] = updated_vector
 
-        return cast(
-            "list[list[float]]",
-            vectors,
-        )  # Nones should have been resolved by now
+        return _expand_duplicates(texts, unique_texts, vectors)
 
     def embed_query(self, text: str) -> list[float]:
         """Embed query text.
@@ -295,6 +372,7 @@ class CacheBackedEmbeddings(Embeddings):
         query_embedding_cache: bool | ByteStore = False,
         key_encoder: Callable[[str], str]
         | Literal["sha1", "blake2b", "sha256", "sha512"] = "sha1",
+        value_format: Literal["json", "float32", "float16"] = "json",
     ) -> CacheBackedEmbeddings:
         """On-ramp that adds the necessary serialization and encoding to the store.
 
@@ -321,6 +399,22 @@ class CacheBackedEmbeddings(Embeddings):
                 just creating a new cache, to avoid (the potential for)
                 collisions with existing keys or having duplicate keys
                 for the same text in the cache.
+            value_format: How to serialize embeddings in the cache.
+
+                * `'json'` - a JSON list of floats
+                * `'float32'` - little-endian 32-bit floats after a small header,
+                    about a fifth of the size of JSON and much faster to decode
+                * `'float16'` - little-endian 16-bit floats, half the size of
+                    `'float32'` at reduced precision. Caching an embedding with
+                    a finite value beyond 65504 in magnitude raises a
+                    `ValueError`.
+
+                Values in any of these formats can be read whatever the setting,
+                so an existing JSON cache can be switched to a binary format.
+
+        Raises:
+            ValueError: If `key_encoder` or `value_format` is not supported, or a
+                `namespace` is given with a custom `key_encoder`.
 
         Returns:
             An instance of CacheBackedEmbeddings that uses the provided cache.
@@ -344,10 +438,22 @@ class CacheBackedEmbeddings(Embeddings):
             )
             raise ValueError(msg)  # noqa: TRY004
 
+        value_serializer: Callable[[Sequence[float]], bytes]
+        if value_format == "json":
+            value_serializer = _value_serializer
+        elif value_format in _BINARY_FORMATS:
+            value_serializer = _make_binary_value_serializer(value_format)
+        else:
+            msg = (
+                f"Unsupported value_format: {value_format}. "
+                "Expected 'json', 'float32' or 'float16'."
+            )
+            raise ValueError(msg)
+
         document_embedding_store = EncoderBackedStore[str, list[float]](
             document_embedding_cache,
             key_encoder,
-            _value_serializer,
+            value_serializer,
             _value_deserializer,
         )
         if query_embedding_cache is True:
@@ -358,7 +464,7 @@ class CacheBackedEmbeddings(Embeddings):
             query_embedding_store = EncoderBackedStore[str, list[float]](
                 query_embedding_cache,
                 key_encoder,
-                _value_serializer,
+                value_serializer,
                 _value_deserializer,
             )
 
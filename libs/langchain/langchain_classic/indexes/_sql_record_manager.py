@@ -16,9 +16,18 @@ allow it to work with a variety of SQL as a backend.
 
 import contextlib
 import decimal
+import functools
+import re
 import uuid
-from collections.abc import AsyncGenerator, Generator, Sequence
-from typing import Any
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Generator,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import Any, TypeVar
 
 from langchain_core.indexing import RecordManager
 from sqlalchemy import (
@@ -30,16 +39,18 @@ from sqlalchemy import (
     and_,
     create_engine,
     delete,
+    event,
     select,
     text,
 )
+from sqlalchemy import update as sql_update
 from sqlalchemy.engine import URL, Engine
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     create_async_engine,
 )
-from sqlalchemy.orm import Query, Session, declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 try:
     from sqlalchemy.ext.asyncio import async_sessionmaker
@@ -49,6 +60,33 @@ except ImportError:
 
 Base = declarative_base()
 
+T = TypeVar("T")
+
+# Maximum number of bound parameters per statement. SQLite builds before 3.32
+# are limited to 999, PostgreSQL to 32767.
+_MAX_BOUND_PARAMETERS = {"sqlite": 999, "postgresql": 32767}
+
+_PRAGMA_NAME = re.compile(r"[A-Za-z_]+")
+_PRAGMA_VALUE = re.compile(r"-?\w+")
+
+
+def _chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive chunks of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _set_sqlite_pragmas(
+    dbapi_connection: Any, _connection_record: Any, *, statements: Sequence[str]
+) -> None:
+    """Run `PRAGMA` statements on a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in statements:
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
 
 class UpsertionRecord(Base):  # type: ignore[valid-type,misc]
     """Table used to keep track of when a key was last updated."""
@@ -93,6 +131,7 @@ class SQLRecordManager(RecordManager):
         db_url: None | str | URL = None,
         engine_kwargs: dict[str, Any] | None = None,
         async_mode: bool = False,
+        sqlite_pragmas: Mapping[str, str | int] | None = None,
     ) -> None:
         """Initialize the SQLRecordManager.
 
@@ -108,9 +147,22 @@ class SQLRecordManager(RecordManager):
                 engine.
             async_mode: Whether to create an async engine. Driver should support async
                 operations. It only applies if `db_url` is provided.
+            sqlite_pragmas: `PRAGMA` settings to apply to every new connection of a
+                SQLite engine.
+
+                They are applied as the engine opens connections, so when an
+                existing `engine` is passed, connections it opened before, including
+                those idle in its pool, keep their settings. Pass the pragmas before
+                the engine is first used, or dispose of its pool.
+
+                For large indexing jobs on a file database,
+                `{"journal_mode": "WAL", "synchronous": "NORMAL"}` lets readers
+                proceed during writes and avoids a sync to disk on every commit.
 
         Raises:
             ValueError: If both db_url and engine are provided or neither.
+            ValueError: If `sqlite_pragmas` are given for a non-SQLite engine or
+                are not valid pragma names and values.
             AssertionError: If something unexpected happens during engine configuration.
         """
         super().__init__(namespace=namespace)
@@ -145,6 +197,40 @@ class SQLRecordManager(RecordManager):
         self.dialect = _engine.dialect.name
         self.session_factory = _session_factory
 
+        if sqlite_pragmas:
+            self._configure_sqlite_pragmas(sqlite_pragmas)
+
+    def _configure_sqlite_pragmas(self, pragmas: Mapping[str, str | int]) -> None:
+        """Apply `PRAGMA` settings to every new connection of the engine."""
+        if self.dialect != "sqlite":
+            msg = f"sqlite_pragmas are not supported for dialect {self.dialect}"
+            raise ValueError(msg)
+
+        statements = []
+        for name, value in pragmas.items():
+            if not _PRAGMA_NAME.fullmatch(name) or not _PRAGMA_VALUE.fullmatch(
+                str(value)
+            ):
+                msg = f"Invalid SQLite pragma: {name}={value!r}"
+                raise ValueError(msg)
+            statements.append(f"PRAGMA {name}={value}")
+
+        sync_engine = (
+            self.engine.sync_engine
+            if isinstance(self.engine, AsyncEngine)
+            else self.engine
+        )
+        event.listen(
+            sync_engine,
+            "connect",
+            functools.partial(_set_sqlite_pragmas, statements=statements),
+        )
+
+    @property
+    def _keys_per_statement(self) -> int:
+        """Number of keys that fit in one statement next to the namespace."""
+        return _MAX_BOUND_PARAMETERS.get(self.dialect, 999) - 1
+
     def create_schema(self) -> None:
         """Create the database schema."""
         if isinstance(self.engine, AsyncEngine):
@@ -250,24 +336,93 @@ class SQLRecordManager(RecordManager):
                 raise AssertionError(msg)  # noqa: TRY004
             return dt
 
-    def update(
+    @staticmethod
+    def _check_update_time(update_time: float, time_at_least: float | None) -> None:
+        """Check the server time against the floor given by the caller."""
+        if time_at_least and update_time < time_at_least:
+            # Safeguard against time sync issues
+            msg = f"Time sync issue: {update_time} < {time_at_least}"
+            raise AssertionError(msg)
+
+    def _get_records_to_upsert(
         self,
         keys: Sequence[str],
-        *,
-        group_ids: Sequence[str | None] | None = None,
-        time_at_least: float | None = None,
-    ) -> None:
-        """Upsert records into the SQLite database."""
+        group_ids: Sequence[str | None] | None,
+        update_time: float,
+    ) -> list[dict[str, Any]]:
+        """Build the rows to upsert."""
         if group_ids is None:
             group_ids = [None] * len(keys)
 
-        if len(keys) != len(group_ids):
+        return [
+            {
+                "key": key,
+                "namespace": self.namespace,
+                "updated_at": update_time,
+                "group_id": group_id,
+            }
+            for key, group_id in zip(keys, group_ids, strict=False)
+        ]
+
+    def _check_group_ids(
+        self, keys: Sequence[str], group_ids: Sequence[str | None] | None
+    ) -> None:
+        if group_ids is not None and len(keys) != len(group_ids):
             msg = (
                 f"Number of keys ({len(keys)}) does not match number of "
                 f"group_ids ({len(group_ids)})"
             )
             raise ValueError(msg)
 
+    def _upsert_statement(self) -> Any:
+        """Build an upsert statement to execute once per record."""
+        if self.dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import Insert as SqliteInsertType
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+            # Note: uses SQLite insert to make on_conflict_do_update work.
+            # This code needs to be generalized a bit to work with more dialects.
+            sqlite_insert_stmt: SqliteInsertType = sqlite_insert(UpsertionRecord)
+            return sqlite_insert_stmt.on_conflict_do_update(
+                [UpsertionRecord.key, UpsertionRecord.namespace],
+                set_={
+                    "updated_at": sqlite_insert_stmt.excluded.updated_at,
+                    "group_id": sqlite_insert_stmt.excluded.group_id,
+                },
+            )
+        if self.dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import Insert as PgInsertType
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+            # Note: uses postgresql insert to make on_conflict_do_update work.
+            # This code needs to be generalized a bit to work with more dialects.
+            pg_insert_stmt: PgInsertType = pg_insert(UpsertionRecord)
+            return pg_insert_stmt.on_conflict_do_update(
+                constraint="uix_key_namespace",  # Name of constraint
+                set_={
+                    "updated_at": pg_insert_stmt.excluded.updated_at,
+                    "group_id": pg_insert_stmt.excluded.group_id,
+                },
+            )
+        msg = f"Unsupported dialect {self.dialect}"
+        raise NotImplementedError(msg)
+
+    def _upsert_chunks(
+        self, records: list[dict[str, Any]]
+    ) -> Iterator[Sequence[dict[str, Any]]]:
+        """Split records into `executemany` batches sized to the parameter limit."""
+        return _chunked(records, self._keys_per_statement // 4)
+
+    def update(
+        self,
+        keys: Sequence[str],
+        *,
+        group_ids: Sequence[str | None] | None = None,
+        time_at_least: float | None = None,
+    ) -> None:
+        """Upsert records into the SQLite database."""
+        self._check_group_ids(keys, group_ids)
+
         # Get the current time from the server.
         # This makes an extra round trip to the server, should not be a big deal
         # if the batch size is large enough.
@@ -276,60 +431,16 @@ class SQLRecordManager(RecordManager):
         # Here, we're just being extra careful to minimize the chance of
         # data loss due to incorrectly deleting records.
         update_time = self.get_time()
+        self._check_update_time(update_time, time_at_least)
+        records_to_upsert = self._get_records_to_upsert(keys, group_ids, update_time)
+        if not records_to_upsert:
+            return
 
-        if time_at_least and update_time < time_at_least:
-            # Safeguard against time sync issues
-            msg = f"Time sync issue: {update_time} < {time_at_least}"
-            raise AssertionError(msg)
-
-        records_to_upsert = [
-            {
-                "key": key,
-                "namespace": self.namespace,
-                "updated_at": update_time,
-                "group_id": group_id,
-            }
-            for key, group_id in zip(keys, group_ids, strict=False)
-        ]
-
+        stmt = self._upsert_statement()
         with self._make_session() as session:
-            if self.dialect == "sqlite":
-                from sqlalchemy.dialects.sqlite import Insert as SqliteInsertType
-                from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-
-                # Note: uses SQLite insert to make on_conflict_do_update work.
-                # This code needs to be generalized a bit to work with more dialects.
-                sqlite_insert_stmt: SqliteInsertType = sqlite_insert(
-                    UpsertionRecord,
-                ).values(records_to_upsert)
-                stmt = sqlite_insert_stmt.on_conflict_do_update(
-                    [UpsertionRecord.key, UpsertionRecord.namespace],
-                    set_={
-                        "updated_at": sqlite_insert_stmt.excluded.updated_at,
-                        "group_id": sqlite_insert_stmt.excluded.group_id,
-                    },
-                )
-            elif self.dialect == "postgresql":
-                from sqlalchemy.dialects.postgresql import Insert as PgInsertType
-                from sqlalchemy.dialects.postgresql import insert as pg_insert
-
-                # Note: uses postgresql insert to make on_conflict_do_update work.
-                # This code needs to be generalized a bit to work with more dialects.
-                pg_insert_stmt: PgInsertType = pg_insert(UpsertionRecord).values(
-                    records_to_upsert,
-                )
-                stmt = pg_insert_stmt.on_conflict_do_update(  # type: ignore[assignment]
-                    constraint="uix_key_namespace",  # Name of constraint
-                    set_={
-                        "updated_at": pg_insert_stmt.excluded.updated_at,
-                        "group_id": pg_insert_stmt.excluded.group_id,
-                    },
-                )
-            else:
-                msg = f"Unsupported dialect {self.dialect}"
-                raise NotImplementedError(msg)
-
-            session.execute(stmt)
+            # Each chunk is sent as a single `executemany` call.
+            for chunk in self._upsert_chunks(records_to_upsert):
+                session.execute(stmt, chunk)
             session.commit()
 
     async def aupdate(
@@ -340,15 +451,7 @@ class SQLRecordManager(RecordManager):
         time_at_least: float | None = None,
     ) -> None:
         """Upsert records into the SQLite database."""
-        if group_ids is None:
-            group_ids = [None] * len(keys)
-
-        if len(keys) != len(group_ids):
-            msg = (
-                f"Number of keys ({len(keys)}) does not match number of "
-                f"group_ids ({len(group_ids)})"
-            )
-            raise ValueError(msg)
+        self._check_group_ids(keys, group_ids)
 
         # Get the current time from the server.
         # This makes an extra round trip to the server, should not be a big deal
@@ -358,96 +461,156 @@ class SQLRecordManager(RecordManager):
         # Here, we're just being extra careful to minimize the chance of
         # data loss due to incorrectly deleting records.
         update_time = await self.aget_time()
+        self._check_update_time(update_time, time_at_least)
+        records_to_upsert = self._get_records_to_upsert(keys, group_ids, update_time)
+        if not records_to_upsert:
+            return
 
-        if time_at_least and update_time < time_at_least:
-            # Safeguard against time sync issues
-            msg = f"Time sync issue: {update_time} < {time_at_least}"
-            raise AssertionError(msg)
-
-        records_to_upsert = [
-            {
-                "key": key,
-                "namespace": self.namespace,
-                "updated_at": update_time,
-                "group_id": group_id,
-            }
-            for key, group_id in zip(keys, group_ids, strict=False)
-        ]
-
+        stmt = self._upsert_statement()
         async with self._amake_session() as session:
-            if self.dialect == "sqlite":
-                from sqlalchemy.dialects.sqlite import Insert as SqliteInsertType
-                from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-
-                # Note: uses SQLite insert to make on_conflict_do_update work.
-                # This code needs to be generalized a bit to work with more dialects.
-                sqlite_insert_stmt: SqliteInsertType = sqlite_insert(
-                    UpsertionRecord,
-                ).values(records_to_upsert)
-                stmt = sqlite_insert_stmt.on_conflict_do_update(
-                    [UpsertionRecord.key, UpsertionRecord.namespace],
-                    set_={
-                        "updated_at": sqlite_insert_stmt.excluded.updated_at,
-                        "group_id": sqlite_insert_stmt.excluded.group_id,
-                    },
-                )
-            elif self.dialect == "postgresql":
-                from sqlalchemy.dialects.postgresql import Insert as PgInsertType
-                from sqlalchemy.dialects.postgresql import insert as pg_insert
-
-                # Note: uses SQLite insert to make on_conflict_do_update work.
-                # This code needs to be generalized a bit to work with more dialects.
-                pg_insert_stmt: PgInsertType = pg_insert(UpsertionRecord).values(
-                    records_to_upsert,
-                )
-                stmt = pg_insert_stmt.on_conflict_do_update(  # type: ignore[assignment]
-                    constraint="uix_key_namespace",  # Name of constraint
-                    set_={
-                        "updated_at": pg_insert_stmt.excluded.updated_at,
-                        "group_id": pg_insert_stmt.excluded.group_id,
-                    },
-                )
-            else:
-                msg = f"Unsupported dialect {self.dialect}"
-                raise NotImplementedError(msg)
-
-            await session.execute(stmt)
+            # Each chunk is sent as a single `executemany` call.
+            for chunk in self._upsert_chunks(records_to_upsert):
+                await session.execute(stmt, chunk)
             await session.commit()
 
+    def _exists_statement(self, keys: Sequence[str]) -> Any:
+        return select(UpsertionRecord.key).where(
+            and_(
+                UpsertionRecord.key.in_(keys),
+                UpsertionRecord.namespace == self.namespace,
+            ),
+        )
+
     def exists(self, keys: Sequence[str]) -> list[bool]:
         """Check if the given keys exist in the SQLite database."""
-        session: Session
+        found_keys: set[str] = set()
         with self._make_session() as session:
-            filtered_query: Query = session.query(UpsertionRecord.key).filter(
+            for chunk in _chunked(keys, self._keys_per_statement):
+                found_keys.update(
+                    session.execute(self._exists_statement(chunk)).scalars()
+                )
+        return [k in found_keys for k in keys]
+
+    async def aexists(self, keys: Sequence[str]) -> list[bool]:
+        """Check if the given keys exist in the SQLite database."""
+        found_keys: set[str] = set()
+        async with self._amake_session() as session:
+            for chunk in _chunked(keys, self._keys_per_statement):
+                found_keys.update(
+                    (await session.execute(self._exists_statement(chunk))).scalars()
+                )
+        return [k in found_keys for k in keys]
+
+    def _touch_statement(self, keys: Sequence[str], update_time: float) -> Any:
+        return (
+            sql_update(UpsertionRecord)
+            .where(
                 and_(
                     UpsertionRecord.key.in_(keys),
                     UpsertionRecord.namespace == self.namespace,
                 ),
             )
-            records = filtered_query.all()
-        found_keys = {r.key for r in records}
+            .values(updated_at=update_time)
+            .returning(UpsertionRecord.key)
+            .execution_options(synchronize_session=False)
+        )
+
+    def exists_and_touch(
+        self, keys: Sequence[str], *, time_at_least: float | None = None
+    ) -> list[bool]:
+        """Check which keys exist and refresh the update time of those that do.
+
+        This combines `exists` with an `update` of the existing keys that keeps
+        their group IDs, using one `UPDATE ... RETURNING` statement per chunk of
+        keys. It requires SQLite 3.35+ or PostgreSQL.
+
+        Args:
+            keys: A list of keys to check.
+            time_at_least: Optional timestamp. The update time must be at least
+                this value, see `update`.
+
+        Returns:
+            A list of boolean values indicating the existence of each key.
+        """
+        update_time = self.get_time()
+        self._check_update_time(update_time, time_at_least)
+
+        found_keys: set[str] = set()
+        with self._make_session() as session:
+            for chunk in _chunked(keys, self._keys_per_statement - 1):
+                found_keys.update(
+                    session.execute(self._touch_statement(chunk, update_time)).scalars()
+                )
+            session.commit()
         return [k in found_keys for k in keys]
 
-    async def aexists(self, keys: Sequence[str]) -> list[bool]:
-        """Check if the given keys exist in the SQLite database."""
+    async def aexists_and_touch(
+        self, keys: Sequence[str], *, time_at_least: float | None = None
+    ) -> list[bool]:
+        """Check which keys exist and refresh the update time of those that do.
+
+        This combines `aexists` with an `aupdate` of the existing keys that keeps
+        their group IDs, using one `UPDATE ... RETURNING` statement per chunk of
+        keys. It requires SQLite 3.35+ or PostgreSQL.
+
+        Args:
+            keys: A list of keys to check.
+            time_at_least: Optional timestamp. The update time must be at least
+                this value, see `aupdate`.
+
+        Returns:
+            A list of boolean values indicating the existence of each key.
+        """
+        update_time = await self.aget_time()
+        self._check_update_time(update_time, time_at_least)
+
+        found_keys: set[str] = set()
         async with self._amake_session() as session:
-            records = (
-                (
-                    await session.execute(
-                        select(UpsertionRecord.key).where(
-                            and_(
-                                UpsertionRecord.key.in_(keys),
-                                UpsertionRecord.namespace == self.namespace,
-                            ),
-                        ),
-                    )
+            for chunk in _chunked(keys, self._keys_per_statement - 1):
+                found_keys.update(
+                    (
+                        await session.execute(self._touch_statement(chunk, update_time))
+                    ).scalars()
                 )
-                .scalars()
-                .all()
-            )
-        found_keys = set(records)
+            await session.commit()
         return [k in found_keys for k in keys]
 
+    def _list_keys_statement(
+        self,
+        *,
+        before: float | None,
+        after: float | None,
+        group_ids: Sequence[str] | None,
+    ) -> Any:
+        query: Any = select(UpsertionRecord.key).where(
+            UpsertionRecord.namespace == self.namespace,
+        )
+        if after:
+            query = query.where(UpsertionRecord.updated_at > after)
+        if before:
+            query = query.where(UpsertionRecord.updated_at < before)
+        if group_ids:
+            query = query.where(UpsertionRecord.group_id.in_(group_ids))
+        return query
+
+    def _keys_page_statement(
+        self,
+        *,
+        before: float | None,
+        after: float | None,
+        group_ids: Sequence[str] | None,
+        last_key: str | None,
+        page_size: int,
+    ) -> Any:
+        # Seek past the previous page through the key index rather than
+        # skipping over it with an OFFSET.
+        query = self._list_keys_statement(
+            before=before, after=after, group_ids=group_ids
+        )
+        if last_key is not None:
+            query = query.where(UpsertionRecord.key > last_key)
+        return query.order_by(UpsertionRecord.key).limit(page_size)
+
     def list_keys(
         self,
         *,
@@ -457,23 +620,13 @@ class SQLRecordManager(RecordManager):
         limit: int | None = None,
     ) -> list[str]:
         """List records in the SQLite database based on the provided date range."""
-        session: Session
+        query = self._list_keys_statement(
+            before=before, after=after, group_ids=group_ids
+        )
+        if limit:
+            query = query.limit(limit)
         with self._make_session() as session:
-            query: Query = session.query(UpsertionRecord).filter(
-                UpsertionRecord.namespace == self.namespace,
-            )
-
-            if after:
-                query = query.filter(UpsertionRecord.updated_at > after)
-            if before:
-                query = query.filter(UpsertionRecord.updated_at < before)
-            if group_ids:
-                query = query.filter(UpsertionRecord.group_id.in_(group_ids))
-
-            if limit:
-                query = query.limit(limit)
-            records = query.all()
-        return [r.key for r in records]
+            return list(session.execute(query).scalars())
 
     async def alist_keys(
         self,
@@ -484,49 +637,123 @@ class SQLRecordManager(RecordManager):
         limit: int | None = None,
     ) -> list[str]:
         """List records in the SQLite database based on the provided date range."""
-        session: AsyncSession
+        query = self._list_keys_statement(
+            before=before, after=after, group_ids=group_ids
+        )
+        if limit:
+            query = query.limit(limit)
         async with self._amake_session() as session:
-            query: Query = select(UpsertionRecord.key).filter(  # type: ignore[assignment]
-                UpsertionRecord.namespace == self.namespace,
+            return list((await session.execute(query)).scalars())
+
+    def yield_keys(
+        self,
+        *,
+        before: float | None = None,
+        after: float | None = None,
+        group_ids: Sequence[str] | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[str]:
+        """Lazily yield the keys matching the filters of `list_keys`.
+
+        Keys are read in key order, one page per query. Each page resumes after
+        the last key of the previous one, so paging stays cheap on large tables.
+
+        Args:
+            before: Filter to list records updated before this time.
+            after: Filter to list records updated after this time.
+            group_ids: Filter to list records with specific group IDs.
+            page_size: Number of keys to read per query.
+
+        Raises:
+            ValueError: If `page_size` is not a positive integer.
+
+        Yields:
+            The matching keys.
+        """
+        if page_size < 1:
+            msg = f"page_size must be a positive integer, got {page_size}."
+            raise ValueError(msg)
+
+        last_key: str | None = None
+        while True:
+            query = self._keys_page_statement(
+                before=before,
+                after=after,
+                group_ids=group_ids,
+                last_key=last_key,
+                page_size=page_size,
             )
+            with self._make_session() as session:
+                keys: list[str] = list(session.execute(query).scalars())
+            yield from keys
+            if len(keys) < page_size:
+                return
+            last_key = keys[-1]
+
+    async def ayield_keys(
+        self,
+        *,
+        before: float | None = None,
+        after: float | None = None,
+        group_ids: Sequence[str] | None = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """Lazily yield the keys matching the filters of `alist_keys`.
+
+        Keys are read in key order, one page per query. Each page resumes after
+        the last key of the previous one, so paging stays cheap on large tables.
 
-            # mypy does not recognize .all() or .filter()
-            if after:
-                query = query.filter(UpsertionRecord.updated_at > after)
-            if before:
-                query = query.filter(UpsertionRecord.updated_at < before)
-            if group_ids:
-                query = query.filter(UpsertionRecord.group_id.in_(group_ids))
+        Args:
+            before: Filter to list records updated before this time.
+            after: Filter to list records updated after this time.
+            group_ids: Filter to list records with specific group IDs.
+            page_size: Number of keys to read per query.
+
+        Raises:
+            ValueError: If `page_size` is not a positive integer.
+
+        Yields:
+            The matching keys.
+        """
+        if page_size < 1:
+            msg = f"page_size must be a positive integer, got {page_size}."
+            raise ValueError(msg)
 
-            if limit:
-                query = query.limit(limit)
-            records = (await session.execute(query)).scalars().all()
-        return list(records)
+        last_key: str | None = None
+        while True:
+            query = self._keys_page_statement(
+                before=before,
+                after=after,
+                group_ids=group_ids,
+                last_key=last_key,
+                page_size=page_size,
+            )
+            async with self._amake_session() as session:
+                keys: list[str] = list((await session.execute(query)).scalars())
+            for key in keys:
+                yield key
+            if len(keys) < page_size:
+                return
+            last_key = keys[-1]
+
+    def _delete_statement(self, keys: Sequence[str]) -> Any:
+        return delete(UpsertionRecord).where(
+            and_(
+                UpsertionRecord.key.in_(keys),
+                UpsertionRecord.namespace == self.namespace,
+            ),
+        )
 
     def delete_keys(self, keys: Sequence[str]) -> None:
         """Delete records from the SQLite database."""
-        session: Session
         with self._make_session() as session:
-            filtered_query: Query = session.query(UpsertionRecord).filter(
-                and_(
-                    UpsertionRecord.key.in_(keys),
-                    UpsertionRecord.namespace == self.namespace,
-                ),
-            )
-
-            filtered_query.delete()
+            for chunk in _chunked(keys, self._keys_per_statement):
+                session.execute(self._delete_statement(chunk))
             session.commit()
 
     async def adelete_keys(self, keys: Sequence[str]) -> None:
         """Delete records from the SQLite database."""
         async with self._amake_session() as session:
-            await session.execute(
-                delete(UpsertionRecord).where(
-                    and_(
-                        UpsertionRecord.key.in_(keys),
-                        UpsertionRecord.namespace == self.namespace,
-                    ),
-                ),
-            )
-
+            for chunk in _chunked(keys, self._keys_per_statement):
+                await session.execute(self._delete_statement(chunk))
             await session.commit()
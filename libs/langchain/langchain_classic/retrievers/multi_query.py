@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from collections.abc import Sequence
 
@@ -13,6 +12,7 @@ from langchain_core.prompts import BasePromptTemplate
 from langchain_core.prompts.prompt import PromptTemplate
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables import Runnable
+from langchain_core.vectorstores import VectorStoreRetriever
 from typing_extensions import override
 
 from langchain_classic.chains.llm import LLMChain
@@ -150,14 +150,9 @@ class MultiQueryRetriever(BaseRetriever):
         Returns:
             List of retrieved Documents
         """
-        document_lists = await asyncio.gather(
-            *(
-                self.retriever.ainvoke(
-                    query,
-                    config={"callbacks": run_manager.get_child()},
-                )
-                for query in queries
-            ),
+        document_lists = await self.retriever.abatch(
+            queries,
+            config={"callbacks": run_manager.get_child()},
         )
         return [doc for docs in document_lists for doc in docs]
 
@@ -219,6 +214,17 @@ class MultiQueryRetriever(BaseRetriever):
         Returns:
             List of retrieved Documents
         """
+        if (
+            isinstance(self.retriever, VectorStoreRetriever)
+            and self.retriever._supports_batch_search()  # noqa: SLF001
+        ):
+            # A single batched vector search serves all the queries.
+            document_lists = self.retriever.batch(
+                queries,
+                config={"callbacks": run_manager.get_child()},
+            )
+            return [doc for docs in document_lists for doc in docs]
+
         documents = []
         for query in queries:
             docs = self.retriever.invoke(
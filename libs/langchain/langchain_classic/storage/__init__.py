@@ -18,6 +18,7 @@ from langchain_classic._api import create_importer
 from langchain_classic.storage._lc_store import create_kv_docstore, create_lc_store
 from langchain_classic.storage.encoder_backed import EncoderBackedStore
 from langchain_classic.storage.file_system import LocalFileStore
+from langchain_classic.storage.packed_file import PackedFileStore
 
 if TYPE_CHECKING:
     from langchain_community.storage import (
@@ -49,6 +50,7 @@ __all__ = [
     "InMemoryStore",
     "InvalidKeyException",
     "LocalFileStore",
+    "PackedFileStore",
     "RedisStore",
     "UpstashRedisByteStore",
     "UpstashRedisStore",
@@ -0,0 +1,629 @@
+"""A `ByteStore` that packs values into append-only segment files."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from langchain_core.runnables.config import run_in_executor
+from langchain_core.stores import ByteStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_SUFFIX = ".seg"
+_INDEX_FILE = "index.bin"
+
+# Segment header: magic, format version, flags.
+_SEGMENT_HEADER = struct.Struct("<4sBB")
+_SEGMENT_MAGIC = b"LCPS"
+_COMPACTED = 1
+
+# Record header: CRC-32 of the rest of the record, key length, value length.
+_RECORD_HEADER = struct.Struct("<III")
+_LENGTHS = struct.Struct("<II")
+_TOMBSTONE = 0xFFFFFFFF
+_CRC = struct.Struct("<I")
+
+# Index file header: magic, format version, end segment, end offset, entry count.
+_INDEX_HEADER = struct.Struct("<4sBIQQ")
+_INDEX_MAGIC = b"LCPI"
+# Index entry: segment, value offset, value length, key length.
+_INDEX_ENTRY = struct.Struct("<IQII")
+
+_VERSION = 1
+
+# Location of a value: segment id, offset of the value, length of the value.
+_Entry = tuple[int, int, int]
+
+
+def _record(key: bytes, value: bytes | None) -> bytes:
+    """Encode a record, or a tombstone if `value` is `None`."""
+    lengths = _LENGTHS.pack(len(key), _TOMBSTONE if value is None else len(value))
+    body = lengths + key + (value or b"")
+    return _CRC.pack(zlib.crc32(body)) + body
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+class PackedFileStore(ByteStore):
+    """`ByteStore` that packs values into a few append-only files on disk.
+
+    Unlike `LocalFileStore`, which writes one file per key, values are appended
+    to segment files and located through an in-memory index. This keeps the
+    number of files small for stores with millions of keys, such as embedding
+    caches, and turns batches of writes into a single append.
+
+    * Values are read through memory maps of the segment files.
+    * Deleted and overwritten values stay on disk until the segments are
+      compacted, which happens in a background thread once enough of the store
+      is stale, or when calling `compact`.
+    * The index is saved when the store is closed so it can be loaded on the next
+      open. Records written after it was saved are replayed from the segments;
+      without a usable index, all segments are replayed.
+
+    The store can be shared between threads, but not between processes.
+
+    Examples:
+        ```python
+        from langchain_classic.storage import PackedFileStore
+
+        with PackedFileStore("/path/to/root") as store:
+            store.mset([("key1", b"value1"), ("key2", b"value2")])
+            store.mget(["key1", "key2"])  # Returns [b"value1", b"value2"]
+            store.mdelete(["key1"])
+            list(store.yield_keys())  # Returns ["key2"]
+        ```
+    """
+
+    def __init__(
+        self,
+        root_path: str | Path,
+        *,
+        max_segment_size: int = 64 * 1024 * 1024,
+        fsync: bool = False,
+        compaction_threshold: float | None = 0.5,
+    ) -> None:
+        """Open the store, creating the root directory if needed.
+
+        Args:
+            root_path: The directory holding the segment and index files.
+            max_segment_size: Size in bytes after which a new segment is started.
+            fsync: Whether to `fsync` the segment once per `mset` or `mdelete`
+                call, so that the whole batch is durable when the call returns.
+            compaction_threshold: Fraction of stale bytes at which segments are
+                compacted in a background thread, once the store is larger than
+                `max_segment_size`. If `None`, segments are only compacted when
+                calling `compact`.
+
+        Raises:
+            ValueError: If `max_segment_size` is not positive or
+                `compaction_threshold` is not between 0 and 1.
+        """
+        if max_segment_size <= 0:
+            msg = f"max_segment_size must be positive, got {max_segment_size}."
+            raise ValueError(msg)
+        if compaction_threshold is not None and not 0 < compaction_threshold <= 1:
+            msg = (
+                "compaction_threshold must be between 0 and 1, "
+                f"got {compaction_threshold}."
+            )
+            raise ValueError(msg)
+
+        self.root_path = Path(root_path).absolute()
+        self.max_segment_size = max_segment_size
+        self.fsync = fsync
+        self.compaction_threshold = compaction_threshold
+
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._compaction_thread: threading.Thread | None = None
+        self._index: dict[str, _Entry] = {}
+        self._segment_sizes: dict[int, int] = {}
+        self._live_bytes: dict[int, int] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+        self._active_id = 0
+        self._active_fd = -1
+        self._closed = False
+
+        self.root_path.mkdir(parents=True, exist_ok=True)
+        self._open()
+
+    # Segment files
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.root_path / f"{segment_id:010d}{_SEGMENT_SUFFIX}"
+
+    def _create_segment(self, segment_id: int) -> None:
+        """Start a new active segment."""
+        fd = os.open(
+            self._segment_path(segment_id),
+            os.O_WRONLY
+            | os.O_CREAT
+            | os.O_EXCL
+            | os.O_APPEND
+            | getattr(os, "O_BINARY", 0),
+            0o666,
+        )
+        _write_all(fd, _SEGMENT_HEADER.pack(_SEGMENT_MAGIC, _VERSION, 0))
+        self._active_fd = fd
+        self._active_id = segment_id
+        self._segment_sizes[segment_id] = _SEGMENT_HEADER.size
+        self._live_bytes[segment_id] = 0
+
+    def _map(self, segment_id: int, end: int) -> mmap.mmap:
+        """Return a memory map of a segment covering at least `end` bytes."""
+        segment_map = self._maps.get(segment_id)
+        if segment_map is None or len(segment_map) < end:
+            if segment_map is not None:
+                segment_map.close()
+            with self._segment_path(segment_id).open("rb") as f:
+                segment_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment_id] = segment_map
+        return segment_map
+
+    def _close_map(self, segment_id: int) -> None:
+        segment_map = self._maps.pop(segment_id, None)
+        if segment_map is not None:
+            segment_map.close()
+
+    # Recovery
+
+    def _open(self) -> None:
+        for tmp_path in self.root_path.glob(f"*{_SEGMENT_SUFFIX}.tmp"):
+            tmp_path.unlink()
+
+        segment_ids = sorted(
+            int(path.name.removesuffix(_SEGMENT_SUFFIX))
+            for path in self.root_path.glob(f"*{_SEGMENT_SUFFIX}")
+            if path.name.removesuffix(_SEGMENT_SUFFIX).isdigit()
+        )
+        # A compacted segment replaces all segments before it. They are left over
+        # if the process stopped before compaction removed them.
+        for position in range(len(segment_ids) - 1, 0, -1):
+            if self._segment_flags(segment_ids[position]) & _COMPACTED:
+                for segment_id in segment_ids[:position]:
+                    self._segment_path(segment_id).unlink()
+                segment_ids = segment_ids[position:]
+                break
+
+        # A segment without a complete header was created right before the
+        # process stopped, so it holds no records.
+        for segment_id in list(segment_ids):
+            path = self._segment_path(segment_id)
+            if path.stat().st_size < _SEGMENT_HEADER.size:
+                path.unlink()
+                segment_ids.remove(segment_id)
+
+        start = self._load_index(segment_ids)
+        if start is None:
+            self._index.clear()
+            start = (segment_ids[0], _SEGMENT_HEADER.size) if segment_ids else None
+
+        for segment_id in segment_ids:
+            self._segment_sizes[segment_id] = (
+                self._segment_path(segment_id).stat().st_size
+            )
+            self._live_bytes.setdefault(segment_id, 0)
+        for key, (segment_id, _, length) in self._index.items():
+            self._live_bytes[segment_id] += self._record_size(key, length)
+
+        if start is not None:
+            for segment_id in segment_ids:
+                if segment_id >= start[0]:
+                    offset = (
+                        start[1] if segment_id == start[0] else _SEGMENT_HEADER.size
+                    )
+                    self._replay(segment_id, offset)
+
+        if segment_ids:
+            self._active_id = segment_ids[-1]
+            self._active_fd = os.open(
+                self._segment_path(self._active_id),
+                os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0),
+            )
+        else:
+            self._create_segment(1)
+
+    def _segment_flags(self, segment_id: int) -> int:
+        with self._segment_path(segment_id).open("rb") as f:
+            header = f.read(_SEGMENT_HEADER.size)
+        if len(header) < _SEGMENT_HEADER.size:
+            return 0
+        magic, _, flags = _SEGMENT_HEADER.unpack(header)
+        return flags if magic == _SEGMENT_MAGIC else 0
+
+    @staticmethod
+    def _record_size(key: str, length: int) -> int:
+        return _RECORD_HEADER.size + len(key.encode("utf-8")) + length
+
+    def _replay(self, segment_id: int, offset: int) -> None:
+        """Apply the records of a segment from `offset` to the index."""
+        path = self._segment_path(segment_id)
+        data = path.read_bytes()
+        while offset + _RECORD_HEADER.size <= len(data):
+            crc, key_length, value_length = _RECORD_HEADER.unpack_from(data, offset)
+            value_offset = offset + _RECORD_HEADER.size + key_length
+            end = value_offset + (0 if value_length == _TOMBSTONE else value_length)
+            if end > len(data) or zlib.crc32(data[offset + _CRC.size : end]) != crc:
+                break
+            key = data[offset + _RECORD_HEADER.size : value_offset].decode("utf-8")
+            self._discard(key)
+            if value_length != _TOMBSTONE:
+                self._index[key] = (segment_id, value_offset, value_length)
+                self._live_bytes[segment_id] += end - offset
+            offset = end
+
+        if offset < len(data):
+            # The tail is a partially written record.
+            logger.warning(
+                "Truncating %d bytes of incomplete records from %s.",
+                len(data) - offset,
+                path,
+            )
+            with path.open("r+b") as f:
+                f.truncate(offset)
+            self._segment_sizes[segment_id] = offset
+
+    def _load_index(self, segment_ids: list[int]) -> tuple[int, int] | None:
+        """Load the saved index, returning where to resume replaying segments."""
+        index_path = self.root_path / _INDEX_FILE
+        try:
+            data = index_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            (crc,) = _CRC.unpack_from(data, len(data) - _CRC.size)
+            body = data[: -_CRC.size]
+            magic, version, end_segment, end_offset, count = _INDEX_HEADER.unpack_from(
+                body
+            )
+            if zlib.crc32(body) != crc or magic != _INDEX_MAGIC or version != _VERSION:
+                return None
+            offset = _INDEX_HEADER.size
+            index: dict[str, _Entry] = {}
+            for _ in range(count):
+                segment_id, value_offset, value_length, key_length = (
+                    _INDEX_ENTRY.unpack_from(body, offset)
+                )
+                offset += _INDEX_ENTRY.size
+                key = body[offset : offset + key_length].decode("utf-8")
+                offset += key_length
+                index[key] = (segment_id, value_offset, value_length)
+        except (struct.error, UnicodeDecodeError, ValueError):
+            return None
+
+        sizes = {
+            segment_id: self._segment_path(segment_id).stat().st_size
+            for segment_id in segment_ids
+        }
+        if end_offset > sizes.get(end_segment, -1) or any(
+            value_offset + value_length > sizes.get(segment_id, -1)
+            for segment_id, value_offset, value_length in index.values()
+        ):
+            return None
+        self._index = index
+        return end_segment, end_offset
+
+    def _save_index(self) -> None:
+        """Save the index so that the next open does not replay all segments."""
+        parts = [
+            _INDEX_HEADER.pack(
+                _INDEX_MAGIC,
+                _VERSION,
+                self._active_id,
+                self._segment_sizes[self._active_id],
+                len(self._index),
+            )
+        ]
+        for key, (segment_id, value_offset, value_length) in self._index.items():
+            encoded_key = key.encode("utf-8")
+            parts.append(
+                _INDEX_ENTRY.pack(
+                    segment_id, value_offset, value_length, len(encoded_key)
+                )
+            )
+            parts.append(encoded_key)
+        body = b"".join(parts)
+
+        tmp_path = self.root_path / f"{_INDEX_FILE}.tmp"
+        tmp_path.write_bytes(body + _CRC.pack(zlib.crc32(body)))
+        tmp_path.replace(self.root_path / _INDEX_FILE)
+
+    # Writes
+
+    def _discard(self, key: str) -> None:
+        """Drop a key from the index, accounting its record as stale."""
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._live_bytes[entry[0]] -= self._record_size(key, entry[2])
+
+    def _append(self, items: Sequence[tuple[str, bytes | None]]) -> int | None:
+        """Append records to the active segment and update the index.
+
+        Returns:
+            The file descriptor to `fsync`, if `fsync` is enabled.
+        """
+        with self._lock:
+            if self._closed:
+                msg = "Cannot write to a closed store."
+                raise ValueError(msg)
+            if self._segment_sizes[self._active_id] >= self.max_segment_size:
+                self._roll()
+
+            offset = self._segment_sizes[self._active_id]
+            parts = []
+            for key, value in items:
+                record = _record(key.encode("utf-8"), value)
+                parts.append(record)
+                self._discard(key)
+                if value is not None:
+                    self._index[key] = (
+                        self._active_id,
+                        offset + len(record) - len(value),
+                        len(value),
+                    )
+                    self._live_bytes[self._active_id] += len(record)
+                offset += len(record)
+
+            _write_all(self._active_fd, b"".join(parts))
+            self._segment_sizes[self._active_id] = offset
+            fd = self._active_fd if self.fsync else None
+
+        self._maybe_compact()
+        return fd
+
+    def _roll(self) -> None:
+        """Seal the active segment and start a new one."""
+        os.close(self._active_fd)
+        self._create_segment(self._active_id + 1)
+
+    # Compaction
+
+    def _stale_fraction(self) -> float:
+        total = sum(self._segment_sizes.values())
+        return 1 - sum(self._live_bytes.values()) / total if total else 0
+
+    def _maybe_compact(self) -> None:
+        if self.compaction_threshold is None:
+            return
+        with self._lock:
+            if (
+                self._closed
+                or (
+                    self._compaction_thread is not None
+                    and self._compaction_thread.is_alive()
+                )
+                or sum(self._segment_sizes.values()) < self.max_segment_size
+                or self._stale_fraction() < self.compaction_threshold
+            ):
+                return
+            self._compaction_thread = threading.Thread(
+                target=self._compact_in_background,
+                name="PackedFileStore-compaction",
+                daemon=True,
+            )
+            self._compaction_thread.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        except Exception:
+            logger.exception("Failed to compact %s.", self.root_path)
+
+    def compact(self) -> None:
+        """Rewrite the live values into a single segment and drop stale records.
+
+        Writes can continue while the live values are copied; values written in
+        the meantime go to a new segment.
+        """
+        with self._compaction_lock:
+            with self._lock:
+                if self._closed:
+                    return
+                if self._segment_sizes[self._active_id] > _SEGMENT_HEADER.size:
+                    self._roll()
+                sealed = sorted(
+                    segment_id
+                    for segment_id in self._segment_sizes
+                    if segment_id != self._active_id
+                )
+                if not sealed:
+                    return
+                sealed_ids = set(sealed)
+                live = [
+                    (key, entry)
+                    for key, entry in self._index.items()
+                    if entry[0] in sealed_ids
+                ]
+                maps = {
+                    segment_id: self._map(segment_id, self._segment_sizes[segment_id])
+                    for segment_id in sealed
+                }
+
+            # The compacted segment takes the id of the last sealed segment, so it
+            # stays ordered before the segments written since.
+            target = sealed[-1]
+            tmp_path = self.root_path / f"{target:010d}{_SEGMENT_SUFFIX}.tmp"
+            moved: list[tuple[str, _Entry, _Entry]] = []
+            with tmp_path.open("wb") as f:
+                f.write(_SEGMENT_HEADER.pack(_SEGMENT_MAGIC, _VERSION, _COMPACTED))
+                offset = _SEGMENT_HEADER.size
+                for key, entry in live:
+                    segment_id, value_offset, value_length = entry
+                    value = maps[segment_id][value_offset : value_offset + value_length]
+                    record = _record(key.encode("utf-8"), value)
+                    f.write(record)
+                    moved.append(
+                        (
+                            key,
+                            entry,
+                            (target, offset + len(record) - value_length, value_length),
+                        )
+                    )
+                    offset += len(record)
+                f.flush()
+                os.fsync(f.fileno())
+
+            with self._lock:
+                # The saved index points into the segments being replaced.
+                (self.root_path / _INDEX_FILE).unlink(missing_ok=True)
+                for segment_id in sealed:
+                    self._close_map(segment_id)
+                    del self._segment_sizes[segment_id]
+                    del self._live_bytes[segment_id]
+                tmp_path.replace(self._segment_path(target))
+                for segment_id in sealed[:-1]:
+                    self._segment_path(segment_id).unlink()
+
+                self._segment_sizes[target] = offset
+                self._live_bytes[target] = 0
+                for key, old_entry, new_entry in moved:
+                    # Keys written or deleted since the copy keep their new state.
+                    if self._index.get(key) == old_entry:
+                        self._index[key] = new_entry
+                        self._live_bytes[target] += self._record_size(key, new_entry[2])
+
+    # ByteStore interface
+
+    def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get the values associated with the given keys.
+
+        Args:
+            keys: A sequence of keys.
+
+        Returns:
+            A sequence of optional values associated with the keys.
+            If a key is not found, the corresponding value will be `None`.
+        """
+        values: list[bytes | None] = []
+        with self._lock:
+            if self._closed:
+                msg = "Cannot read from a closed store."
+                raise ValueError(msg)
+            for key in keys:
+                entry = self._index.get(key)
+                if entry is None:
+                    values.append(None)
+                    continue
+                segment_id, value_offset, value_length = entry
+                end = value_offset + value_length
+                values.append(self._map(segment_id, end)[value_offset:end])
+        return values
+
+    async def amget(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Async get the values associated with the given keys.
+
+        Values are read from memory maps, so no thread is used.
+
+        Args:
+            keys: A sequence of keys.
+
+        Returns:
+            A sequence of optional values associated with the keys.
+            If a key is not found, the corresponding value will be `None`.
+        """
+        return self.mget(keys)
+
+    def mset(self, key_value_pairs: Sequence[tuple[str, bytes]]) -> None:
+        """Set the values for the given keys.
+
+        Args:
+            key_value_pairs: A sequence of key-value pairs.
+        """
+        fd = self._append(key_value_pairs)
+        if fd is not None:
+            os.fsync(fd)
+
+    async def amset(self, key_value_pairs: Sequence[tuple[str, bytes]]) -> None:
+        """Async set the values for the given keys.
+
+        Records are appended without a thread; only the `fsync` runs in one.
+
+        Args:
+            key_value_pairs: A sequence of key-value pairs.
+        """
+        fd = self._append(key_value_pairs)
+        if fd is not None:
+            await run_in_executor(None, os.fsync, fd)
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        """Delete the given keys and their associated values.
+
+        Args:
+            keys: A sequence of keys to delete.
+        """
+        with self._lock:
+            present = [key for key in keys if key in self._index]
+        if not present:
+            return
+        fd = self._append([(key, None) for key in present])
+        if fd is not None:
+            os.fsync(fd)
+
+    def yield_keys(self, *, prefix: str | None = None) -> Iterator[str]:
+        """Get an iterator over keys that match the given prefix.
+
+        Args:
+            prefix: The prefix to match.
+
+        Yields:
+            Keys that match the given prefix.
+        """
+        with self._lock:
+            keys = list(self._index)
+        if prefix:
+            yield from (key for key in keys if key.startswith(prefix))
+        else:
+            yield from keys
+
+    def close(self) -> None:
+        """Wait for a running compaction, save the index and close the files."""
+        with self._compaction_lock, self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for segment_id in list(self._maps):
+                self._close_map(segment_id)
+            if self.fsync:
+                os.fsync(self._active_fd)
+            os.close(self._active_fd)
+            self._save_index()
+
+    def __enter__(self) -> Self:
+        """Return the store."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the store."""
+        self.close()
+
+    def __del__(self) -> None:
+        """Release the files of a store that was not closed."""
+        with contextlib.suppress(Exception):
+            if not self._closed:
+                for segment_map in self._maps.values():
+                    segment_map.close()
+                os.close(self._active_fd)
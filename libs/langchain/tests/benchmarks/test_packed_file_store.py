@@ -0,0 +1,46 @@
+"""Benchmarks for `PackedFileStore` against `LocalFileStore`.
+
+Each run writes a batch of embedding-sized values and reads them back, as
+`CacheBackedEmbeddings` does when warming up and then hitting its cache.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from langchain_classic.storage import LocalFileStore, PackedFileStore
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+_NUM_KEYS = 2000
+# A 1536-dimensional embedding serialized as JSON takes roughly this many bytes.
+_VALUE_SIZE = 12 * 1024
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("store_cls", [LocalFileStore, PackedFileStore])
+def test_store_write_then_read(
+    benchmark: BenchmarkFixture,
+    tmp_path: Path,
+    store_cls: type[LocalFileStore | PackedFileStore],
+) -> None:
+    """Write a batch of values to a fresh store and read them back."""
+    pairs = [(f"namespace{i}", os.urandom(_VALUE_SIZE)) for i in range(_NUM_KEYS)]
+    keys = [key for key, _ in pairs]
+    runs = iter(range(1_000_000))
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        store = store_cls(tmp_path / str(next(runs)))
+        for start in range(0, _NUM_KEYS, 100):
+            store.mset(pairs[start : start + 100])
+        assert store.mget(keys)[-1] == pairs[-1][1]
+        if isinstance(store, PackedFileStore):
+            store.close()
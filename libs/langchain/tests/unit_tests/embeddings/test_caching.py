@@ -3,7 +3,9 @@
 import contextlib
 import hashlib
 import importlib
+import math
 import warnings
+from typing import Literal
 
 import pytest
 from langchain_core.embeddings import Embeddings
@@ -251,3 +253,131 @@ def test_custom_encoder() -> None:
     cbe.embed_documents([txt])
 
     assert list(cbe.document_embedding_store.yield_keys()) == ["CUSTOM_X"]
+
+
+class CountingEmbeddings(MockEmbeddings):
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    @override
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(texts)
+        return [[len(text) / 4, -0.5, 1e-3] for text in texts]
+
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+@pytest.mark.parametrize(
+    ("value_format", "size", "tolerance"),
+    [("float32", 12 + 3 * 4, 1e-7), ("float16", 12 + 3 * 2, 1e-3)],
+)
+def test_binary_value_format(
+    monkeypatch: pytest.MonkeyPatch,
+    value_format: Literal["float32", "float16"],
+    size: int,
+    tolerance: float,
+    *,
+    has_numpy: bool,
+) -> None:
+    if has_numpy:
+        pytest.importorskip("numpy")
+    module = importlib.import_module(CacheBackedEmbeddings.__module__)
+    monkeypatch.setattr(module, "_HAS_NUMPY", has_numpy)
+    store = InMemoryStore()
+    cbe = CacheBackedEmbeddings.from_bytes_store(
+        CountingEmbeddings(),
+        store,
+        key_encoder=lambda text: text,
+        value_format=value_format,
+    )
+
+    expected = [[0.25, -0.5, 1e-3], [0.5, -0.5, 1e-3]]
+    assert cbe.embed_documents(["a", "bb"]) == expected
+    (value,) = store.mget(["a"])
+    assert value is not None
+    assert len(value) == size
+
+    cached = cbe.embed_documents(["a", "bb"])
+    for vector, expected_vector in zip(cached, expected, strict=True):
+        assert vector == pytest.approx(expected_vector, abs=tolerance)
+        assert all(type(x) is float for x in vector)
+
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+@pytest.mark.parametrize(
+    ("value_format", "too_large"), [("float32", 1e39), ("float16", 65520.0)]
+)
+def test_binary_value_format_overflow(
+    monkeypatch: pytest.MonkeyPatch,
+    value_format: Literal["float32", "float16"],
+    too_large: float,
+    *,
+    has_numpy: bool,
+) -> None:
+    if has_numpy:
+        pytest.importorskip("numpy")
+    module = importlib.import_module(CacheBackedEmbeddings.__module__)
+    monkeypatch.setattr(module, "_HAS_NUMPY", has_numpy)
+    serializer = module._make_binary_value_serializer(value_format)
+
+    with pytest.raises(ValueError, match=f"too large for the {value_format}"):
+        serializer([0.5, -too_large])
+    # Infinities are kept, and values that round to a finite value are rounded.
+    infinities = [math.inf, -math.inf]
+    assert module._value_deserializer(serializer(infinities)) == infinities
+    assert module._value_deserializer(serializer([65519.0])) == [
+        65504.0 if value_format == "float16" else 65519.0
+    ]
+
+
+def test_binary_value_format_reads_json_values() -> None:
+    store = InMemoryStore()
+    embeddings = CountingEmbeddings()
+    json_cbe = CacheBackedEmbeddings.from_bytes_store(
+        embeddings, store, key_encoder=lambda text: text
+    )
+    json_cbe.embed_documents(["a"])
+    assert store.mget(["a"]) == [b"[0.25, -0.5, 0.001]"]
+
+    binary_cbe = CacheBackedEmbeddings.from_bytes_store(
+        embeddings, store, key_encoder=lambda text: text, value_format="float32"
+    )
+    assert binary_cbe.embed_documents(["a", "bb"]) == [
+        [0.25, -0.5, 1e-3],
+        [0.5, -0.5, 1e-3],
+    ]
+    assert embeddings.calls == [["a"], ["bb"]]
+    # Binary values can be read back by a store configured for JSON.
+    (vector,) = json_cbe.embed_documents(["bb"])
+    assert vector == pytest.approx([0.5, -0.5, 1e-3])
+    assert embeddings.calls == [["a"], ["bb"]]
+
+
+def test_unsupported_value_format() -> None:
+    with pytest.raises(ValueError, match="Unsupported value_format"):
+        CacheBackedEmbeddings.from_bytes_store(
+            MockEmbeddings(),
+            InMemoryStore(),
+            key_encoder="sha256",
+            value_format="float64",  # type: ignore[arg-type]
+        )
+
+
+async def test_embed_documents_deduplicates_texts() -> None:
+    embeddings = CountingEmbeddings()
+    cbe = CacheBackedEmbeddings.from_bytes_store(
+        embeddings, InMemoryStore(), key_encoder="sha256", batch_size=2
+    )
+    texts = ["a", "bb", "a", "ccc", "bb", "a"]
+
+    vectors = cbe.embed_documents(texts)
+
+    assert embeddings.calls == [["a", "bb"], ["ccc"]]
+    assert vectors == [[len(text) / 4, -0.5, 1e-3] for text in texts]
+    assert vectors[0] is not vectors[2]
+
+    assert await cbe.aembed_documents(["ccc", "dddd", "dddd"]) == [
+        [0.75, -0.5, 1e-3],
+        [1.0, -0.5, 1e-3],
+        [1.0, -0.5, 1e-3],
+    ]
+    assert embeddings.calls[2:] == [["dddd"]]
@@ -0,0 +1,125 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from langchain_classic.indexes._sql_record_manager import SQLRecordManager
+
+_KEYS = [f"key-{i:05d}" for i in range(2500)]
+
+
+@pytest.fixture
+def manager() -> SQLRecordManager:
+    record_manager = SQLRecordManager("kittens", db_url="sqlite:///:memory:")
+    record_manager.create_schema()
+    return record_manager
+
+
+@pytest_asyncio.fixture
+async def amanager() -> SQLRecordManager:
+    pytest.importorskip("aiosqlite")
+    record_manager = SQLRecordManager(
+        "kittens",
+        db_url="sqlite+aiosqlite:///:memory:",
+        async_mode=True,
+    )
+    await record_manager.acreate_schema()
+    return record_manager
+
+
+def test_bulk_operations_exceed_parameter_limit(manager: SQLRecordManager) -> None:
+    group_ids = [f"group-{i % 3}" for i in range(len(_KEYS))]
+    manager.update(_KEYS, group_ids=group_ids)
+
+    assert manager.exists([*_KEYS, "missing"]) == [True] * len(_KEYS) + [False]
+    assert sorted(manager.list_keys()) == _KEYS
+    assert len(manager.list_keys(group_ids=["group-0"])) == 834
+
+    manager.delete_keys(_KEYS[:2000])
+    assert sorted(manager.list_keys()) == _KEYS[2000:]
+
+
+def test_exists_and_touch(manager: SQLRecordManager) -> None:
+    with patch.object(manager, "get_time", return_value=1.0):
+        manager.update(_KEYS[:1500], group_ids=["a"] * 1500)
+    other = SQLRecordManager("other", engine=manager.engine)
+    with patch.object(other, "get_time", return_value=1.0):
+        other.update(_KEYS)
+
+    with patch.object(manager, "get_time", return_value=2.0):
+        found = manager.exists_and_touch(_KEYS[1000:])
+
+    assert found == [True] * 500 + [False] * 1000
+    assert sorted(manager.list_keys(before=1.5)) == _KEYS[:1000]
+    assert sorted(manager.list_keys(after=1.5, group_ids=["a"])) == _KEYS[1000:1500]
+    # Missing keys are not created and other namespaces are left untouched.
+    assert manager.exists(_KEYS[1500:1501]) == [False]
+    assert len(other.list_keys(before=1.5)) == len(_KEYS)
+
+
+def test_exists_and_touch_time_at_least(manager: SQLRecordManager) -> None:
+    manager.update(["a"])
+    with (
+        patch.object(manager, "get_time", return_value=1.0),
+        pytest.raises(AssertionError, match="Time sync issue"),
+    ):
+        manager.exists_and_touch(["a"], time_at_least=2.0)
+
+
+def test_yield_keys(manager: SQLRecordManager) -> None:
+    with patch.object(manager, "get_time", return_value=1.0):
+        manager.update(_KEYS[::2], group_ids=["even"] * len(_KEYS[::2]))
+    with patch.object(manager, "get_time", return_value=2.0):
+        manager.update(_KEYS[1::2], group_ids=["odd"] * len(_KEYS[1::2]))
+
+    assert list(manager.yield_keys(page_size=100)) == _KEYS
+    assert list(manager.yield_keys(page_size=1250)) == _KEYS
+    assert list(manager.yield_keys(before=1.5, page_size=7)) == _KEYS[::2]
+    assert list(manager.yield_keys(group_ids=["odd"], page_size=300)) == _KEYS[1::2]
+    assert list(manager.yield_keys(after=3.0)) == []
+
+    with pytest.raises(ValueError, match="page_size must be a positive integer"):
+        list(manager.yield_keys(page_size=0))
+
+
+async def test_abulk_operations(amanager: SQLRecordManager) -> None:
+    with patch.object(amanager, "aget_time", return_value=1.0):
+        await amanager.aupdate(_KEYS)
+    assert await amanager.aexists([*_KEYS, "missing"]) == [True] * len(_KEYS) + [False]
+
+    with patch.object(amanager, "aget_time", return_value=2.0):
+        found = await amanager.aexists_and_touch(["missing", *_KEYS[:1200]])
+    assert found == [False] + [True] * 1200
+    assert sorted(await amanager.alist_keys(before=1.5)) == _KEYS[1200:]
+    assert [key async for key in amanager.ayield_keys(after=1.5, page_size=500)] == (
+        _KEYS[:1200]
+    )
+
+    await amanager.adelete_keys(_KEYS[:2000])
+    assert sorted(await amanager.alist_keys()) == _KEYS[2000:]
+
+
+def test_sqlite_pragmas(tmp_path: Path) -> None:
+    manager = SQLRecordManager(
+        "kittens",
+        db_url=f"sqlite:///{tmp_path / 'records.db'}",
+        sqlite_pragmas={"journal_mode": "WAL", "synchronous": "NORMAL"},
+    )
+    manager.create_schema()
+    manager.update(["a"])
+
+    with manager._make_session() as session:
+        assert session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert session.execute(text("PRAGMA synchronous")).scalar() == 1
+    assert manager.exists(["a"]) == [True]
+
+
+@pytest.mark.parametrize(
+    "pragmas",
+    [{"journal_mode": "WAL; DROP TABLE upsertion_record"}, {"cache size": -2000}],
+)
+def test_sqlite_pragmas_validation(pragmas: dict[str, str | int]) -> None:
+    with pytest.raises(ValueError, match="Invalid SQLite pragma"):
+        SQLRecordManager("kittens", db_url="sqlite://", sqlite_pragmas=pragmas)
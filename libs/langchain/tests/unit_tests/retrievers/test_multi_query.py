@@ -1,8 +1,17 @@
+from typing import Any
+
 import pytest
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import RunnableLambda
+from langchain_core.vectorstores import InMemoryVectorStore, VectorStoreRetriever
+from typing_extensions import override
 
 from langchain_classic.retrievers.multi_query import (
     LineListOutputParser,
+    MultiQueryRetriever,
     _unique_documents,
 )
 
@@ -52,3 +61,58 @@ def test__unique_documents(documents: list[Document], expected: list[Document])
 def test_line_list_output_parser(text: str, expected: list[str]) -> None:
     parser = LineListOutputParser()
     assert parser.parse(text) == expected
+
+
+class _EchoRetriever(BaseRetriever):
+    queries: list[str] = []
+
+    @override
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        self.queries.append(query)
+        return [Document(page_content=query)]
+
+    @override
+    def batch(self, *args: Any, **kwargs: Any) -> list[list[Document]]:
+        msg = "batch should not be called"
+        raise AssertionError(msg)
+
+
+def _multi_query_retriever(retriever: BaseRetriever) -> MultiQueryRetriever:
+    return MultiQueryRetriever(
+        retriever=retriever, llm_chain=RunnableLambda(lambda _: ["a", "b"])
+    )
+
+
+def test_retrieve_documents_sequentially() -> None:
+    retriever = _EchoRetriever()
+    documents = _multi_query_retriever(retriever).retrieve_documents(
+        ["foo", "bar"], CallbackManagerForRetrieverRun.get_noop_manager()
+    )
+    assert retriever.queries == ["foo", "bar"]
+    assert documents == [Document(page_content="foo"), Document(page_content="bar")]
+
+
+def test_retrieve_documents_batches_vector_search(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InMemoryVectorStore.from_texts(
+        ["foo", "bar"], DeterministicFakeEmbedding(size=8)
+    )
+    retriever = store.as_retriever(search_kwargs={"k": 1})
+    batched: list[list[str]] = []
+    original_batch = VectorStoreRetriever.batch
+
+    def batch(
+        self: VectorStoreRetriever, inputs: list[str], *args: Any, **kwargs: Any
+    ) -> list[list[Document]]:
+        batched.append(inputs)
+        return original_batch(self, inputs, *args, **kwargs)
+
+    monkeypatch.setattr(VectorStoreRetriever, "batch", batch)
+    documents = _multi_query_retriever(retriever).retrieve_documents(
+        ["foo", "bar"], CallbackManagerForRetrieverRun.get_noop_manager()
+    )
+    assert batched == [["foo", "bar"]]
+    assert [doc.page_content for doc in documents] == ["foo", "bar"]
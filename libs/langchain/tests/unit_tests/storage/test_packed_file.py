@@ -0,0 +1,196 @@
+import threading
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from langchain_classic.storage.packed_file import PackedFileStore
+
+
+@pytest.fixture
+def packed_store(tmp_path: Path) -> Generator[PackedFileStore, None, None]:
+    store = PackedFileStore(tmp_path, compaction_threshold=None)
+    yield store
+    store.close()
+
+
+def _segments(path: Path) -> list[str]:
+    return sorted(file.name for file in path.glob("*.seg"))
+
+
+def test_mset_mget_mdelete(packed_store: PackedFileStore) -> None:
+    packed_store.mset([("key1", b"value1"), ("key2", b"value2"), ("empty", b"")])
+    packed_store.mset([("key1", b"updated")])
+
+    assert packed_store.mget(["key1", "key2", "empty", "missing"]) == [
+        b"updated",
+        b"value2",
+        b"",
+        None,
+    ]
+
+    packed_store.mdelete(["key2", "missing"])
+    assert packed_store.mget(["key2"]) == [None]
+    assert sorted(packed_store.yield_keys()) == ["empty", "key1"]
+
+
+def test_yield_keys_prefix(packed_store: PackedFileStore) -> None:
+    packed_store.mset([("a/1", b"1"), ("a/2", b"2"), ("b/1", b"3")])
+    assert sorted(packed_store.yield_keys(prefix="a/")) == ["a/1", "a/2"]
+    assert sorted(packed_store.yield_keys(prefix="c")) == []
+
+
+async def test_async_methods(packed_store: PackedFileStore) -> None:
+    await packed_store.amset([("key1", b"value1"), ("key2", b"value2")])
+    await packed_store.amdelete(["key1"])
+    assert await packed_store.amget(["key1", "key2"]) == [None, b"value2"]
+    assert [key async for key in packed_store.ayield_keys()] == ["key2"]
+
+
+@pytest.mark.parametrize("close", [True, False])
+def test_reopen(tmp_path: Path, *, close: bool) -> None:
+    store = PackedFileStore(tmp_path, max_segment_size=64, fsync=True)
+    store.mset([(f"key{i}", f"value{i}".encode()) for i in range(20)])
+    store.mset([("key0", b"updated")])
+    store.mdelete(["key1"])
+    if close:
+        store.close()
+        assert (tmp_path / "index.bin").exists()
+    else:
+        del store
+
+    store = PackedFileStore(tmp_path)
+    expected = [b"updated", None] + [f"value{i}".encode() for i in range(2, 20)]
+    assert store.mget([f"key{i}" for i in range(20)]) == expected
+
+    # Writes after the saved index are replayed from the segments.
+    store.mset([("key1", b"back")])
+    store.close()
+    store = PackedFileStore(tmp_path)
+    (tmp_path / "index.bin").unlink()
+    store.mset([("key2", b"again")])
+    del store
+
+    store = PackedFileStore(tmp_path)
+    assert store.mget(["key1", "key2", "key3"]) == [b"back", b"again", b"value3"]
+    store.close()
+
+
+def test_reopen_truncates_partial_record(tmp_path: Path) -> None:
+    store = PackedFileStore(tmp_path)
+    store.mset([("key1", b"value1"), ("key2", b"value2")])
+    del store
+    segment = tmp_path / _segments(tmp_path)[-1]
+    segment.write_bytes(segment.read_bytes()[:-3])
+
+    store = PackedFileStore(tmp_path)
+    assert store.mget(["key1", "key2"]) == [b"value1", None]
+    store.mset([("key3", b"value3")])
+    store.close()
+
+    store = PackedFileStore(tmp_path)
+    assert store.mget(["key1", "key2", "key3"]) == [b"value1", None, b"value3"]
+    store.close()
+
+
+def test_corrupt_index_is_ignored(tmp_path: Path) -> None:
+    store = PackedFileStore(tmp_path)
+    store.mset([("key1", b"value1")])
+    store.close()
+    index_path = tmp_path / "index.bin"
+    index_path.write_bytes(index_path.read_bytes()[:-1] + b"\x00")
+
+    store = PackedFileStore(tmp_path)
+    assert store.mget(["key1"]) == [b"value1"]
+    store.close()
+
+
+def test_compact(tmp_path: Path) -> None:
+    store = PackedFileStore(tmp_path, max_segment_size=100, compaction_threshold=None)
+    for i in range(50):
+        store.mset([(f"key{i % 10}", f"value{i}".encode())])
+    store.mdelete(["key9"])
+    assert len(_segments(tmp_path)) > 5
+
+    store.compact()
+
+    assert len(_segments(tmp_path)) == 2
+    expected = [f"value{40 + i}".encode() for i in range(9)] + [None]
+    assert store.mget([f"key{i}" for i in range(10)]) == expected
+    store.mset([("key0", b"new")])
+    store.close()
+
+    store = PackedFileStore(tmp_path)
+    assert store.mget([f"key{i}" for i in range(10)]) == [b"new", *expected[1:]]
+    store.close()
+
+
+def test_leftover_segments_after_compaction(tmp_path: Path) -> None:
+    store = PackedFileStore(tmp_path, max_segment_size=32, compaction_threshold=None)
+    store.mset([("key1", b"value1")])
+    store.mset([("key2", b"value2")])
+    store.mdelete(["key1"])
+    segments = {name: (tmp_path / name).read_bytes() for name in _segments(tmp_path)}
+    store.compact()
+    store.close()
+    (tmp_path / "index.bin").unlink()
+    # Restore the segments replaced by the compaction, as if the process stopped
+    # before removing them.
+    for name, data in segments.items():
+        if not (tmp_path / name).exists():
+            (tmp_path / name).write_bytes(data)
+
+    store = PackedFileStore(tmp_path)
+    assert store.mget(["key1", "key2"]) == [None, b"value2"]
+    store.close()
+
+
+def test_background_compaction(tmp_path: Path) -> None:
+    store = PackedFileStore(tmp_path, max_segment_size=1024, compaction_threshold=0.5)
+    for _ in range(20):
+        store.mset([(f"key{i}", b"x" * 100) for i in range(5)])
+
+    assert store._compaction_thread is not None
+    store._compaction_thread.join()
+    assert store._stale_fraction() < 0.5
+    assert store.mget([f"key{i}" for i in range(5)]) == [b"x" * 100] * 5
+    store.close()
+
+
+def test_concurrent_writes_during_compaction(tmp_path: Path) -> None:
+    store = PackedFileStore(tmp_path, max_segment_size=512, compaction_threshold=None)
+    store.mset([(f"key{i}", b"old") for i in range(200)])
+
+    def write() -> None:
+        for i in range(200):
+            store.mset([(f"key{i}", b"new")])
+            if i % 3 == 0:
+                store.mdelete([f"key{i}"])
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    store.compact()
+    writer.join()
+    store.compact()
+
+    expected = [None if i % 3 == 0 else b"new" for i in range(200)]
+    assert store.mget([f"key{i}" for i in range(200)]) == expected
+    store.close()
+    store = PackedFileStore(tmp_path)
+    assert store.mget([f"key{i}" for i in range(200)]) == expected
+    store.close()
+
+
+def test_closed_store(packed_store: PackedFileStore) -> None:
+    packed_store.close()
+    with pytest.raises(ValueError, match="closed store"):
+        packed_store.mset([("key", b"value")])
+    with pytest.raises(ValueError, match="closed store"):
+        packed_store.mget(["key"])
+
+
+def test_invalid_arguments(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_segment_size must be positive"):
+        PackedFileStore(tmp_path, max_segment_size=0)
+    with pytest.raises(ValueError, match="compaction_threshold must be between"):
+        PackedFileStore(tmp_path, compaction_threshold=1.5)
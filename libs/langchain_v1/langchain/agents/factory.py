@@ -5,7 +5,9 @@ from __future__ import annotations
 import functools
 import importlib
 import itertools
+import operator
 import re
+import threading
 from dataclasses import dataclass, field, fields
 from typing import (
     TYPE_CHECKING,
@@ -625,6 +627,73 @@ def _is_openai_compatible_model(model: BaseChatModel) -> bool:
     return isinstance(model, base_chat_openai.BaseChatOpenAI)
 
 
+@dataclass(frozen=True)
+class _BoundModel:
+    """A model bound to a set of tools by `_BoundModelCache`."""
+
+    model: BaseChatModel
+    tools: tuple[BaseTool | dict[str, Any], ...]
+    kwargs: dict[str, Any]
+    bound: Runnable[Any, Any]
+
+
+class _BoundModelCache:
+    """Reuse the models bound to the same tools across agent steps and runs.
+
+    `bind_tools` converts every tool to the provider's format and creates a new
+    binding, while most agents call the same model with the same tools at every
+    step. Models and tools are matched by identity, so middleware that swaps the
+    model or changes the tools gets a new binding. Binding arguments are matched by
+    equality.
+
+    Tools mutated in place after they were bound are not detected.
+    """
+
+    def __init__(self, maxsize: int = 8) -> None:
+        self._maxsize = maxsize
+        # Most recently used last.
+        self._entries: list[_BoundModel] = []
+        self._lock = threading.Lock()
+
+    def bind_tools(
+        self,
+        model: BaseChatModel,
+        tools: Sequence[BaseTool | dict[str, Any]],
+        /,
+        **kwargs: Any,
+    ) -> Runnable[Any, Any]:
+        """Bind `tools` to `model`, reusing an earlier binding if possible."""
+        key = tuple(tools)
+        with self._lock:
+            for i, entry in enumerate(self._entries):
+                if _is_same_binding(entry, model, key, kwargs):
+                    self._entries.append(self._entries.pop(i))
+                    return entry.bound
+
+        bound = model.bind_tools(list(key), **kwargs)
+        with self._lock:
+            self._entries.append(_BoundModel(model, key, kwargs, bound))
+            del self._entries[: -self._maxsize]
+        return bound
+
+
+def _is_same_binding(
+    entry: _BoundModel,
+    model: BaseChatModel,
+    tools: tuple[BaseTool | dict[str, Any], ...],
+    kwargs: dict[str, Any],
+) -> bool:
+    if entry.model is not model or len(entry.tools) != len(tools):
+        return False
+    if not all(map(operator.is_, entry.tools, tools)):
+        return False
+    try:
+        return bool(entry.kwargs == kwargs)
+    except (TypeError, ValueError):
+        # E.g. settings holding arrays, which cannot be compared.
+        return False
+
+
 def _handle_structured_output_error(
     exception: Exception,
     response_format: ResponseFormat[Any],
@@ -1295,6 +1364,8 @@ def create_agent(
 
         return {"messages": [output]}
 
+    bound_models = _BoundModelCache()
+
     def _get_bound_model(
         request: ModelRequest[ContextT],
     ) -> tuple[Runnable[Any, Any], ResponseFormat[Any] | None]:
@@ -1399,7 +1470,7 @@ def create_agent(
             ):
                 bind_kwargs["strict"] = True
             return (
-                request.model.bind_tools(final_tools, **bind_kwargs),
+                bound_models.bind_tools(request.model, final_tools, **bind_kwargs),
                 effective_response_format,
             )
 
@@ -1422,8 +1493,8 @@ def create_agent(
             # Force tool use if we have structured output tools
             tool_choice = "any" if structured_output_tools else request.tool_choice
             return (
-                request.model.bind_tools(
-                    final_tools, tool_choice=tool_choice, **request.model_settings
+                bound_models.bind_tools(
+                    request.model, final_tools, tool_choice=tool_choice, **request.model_settings
                 ),
                 effective_response_format,
             )
@@ -1431,8 +1502,11 @@ def create_agent(
         # No structured output - standard model binding
         if final_tools:
             return (
-                request.model.bind_tools(
-                    final_tools, tool_choice=request.tool_choice, **request.model_settings
+                bound_models.bind_tools(
+                    request.model,
+                    final_tools,
+                    tool_choice=request.tool_choice,
+                    **request.model_settings,
                 ),
                 None,
             )
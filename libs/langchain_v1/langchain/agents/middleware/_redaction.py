@@ -6,8 +6,10 @@ import hashlib
 import ipaddress
 import operator
 import re
+import threading
+import time
 from collections.abc import Callable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Literal
 from urllib.parse import urlparse
 
@@ -440,10 +442,162 @@ class ResolvedRedactionRule:
         return updated, matches
 
 
+_ASCII_DIGITS = frozenset("0123456789")
+
+
+def _may_contain_email(content: str, chars: frozenset[str]) -> bool:  # noqa: ARG001
+    return "@" in chars and "." in chars
+
+
+def _may_contain_credit_card(content: str, chars: frozenset[str]) -> bool:  # noqa: ARG001
+    return any(char.isdecimal() for char in chars)
+
+
+def _may_contain_ip(content: str, chars: frozenset[str]) -> bool:  # noqa: ARG001
+    return "." in chars and not chars.isdisjoint(_ASCII_DIGITS)
+
+
+def _may_contain_mac_address(content: str, chars: frozenset[str]) -> bool:  # noqa: ARG001
+    return ":" in chars or "-" in chars
+
+
+def _may_contain_url(content: str, chars: frozenset[str]) -> bool:
+    return "/" in chars or "www." in content
+
+
+_BUILTIN_PREFILTERS: dict[Detector, Callable[[str, frozenset[str]], bool]] = {
+    detect_email: _may_contain_email,
+    detect_credit_card: _may_contain_credit_card,
+    detect_ip: _may_contain_ip,
+    detect_mac_address: _may_contain_mac_address,
+    detect_url: _may_contain_url,
+}
+"""Necessary conditions for each built-in detector to find a match.
+
+Each prefilter receives the content and the set of characters it contains, and
+returns `False` only when the detector cannot match.
+"""
+
+
+@dataclass
+class RedactionRuleStats:
+    """Cumulative work done by one rule of a `RedactionEngine`."""
+
+    pii_type: str
+    scanned: int = 0
+    """Number of texts the rule's detector ran on."""
+    skipped: int = 0
+    """Number of texts ruled out by the prefilter without running the detector."""
+    matches: int = 0
+    """Number of matches the detector reported."""
+    seconds: float = 0.0
+    """Time spent detecting and applying the strategy."""
+
+
+class RedactionEngine:
+    """Apply several redaction rules to content in a single call.
+
+    Rules run in order, each on the output of the previous one, exactly as if they
+    were applied one after another. Built-in detectors are skipped when a single
+    pass over the content shows they cannot match (for example, the email detector
+    on text without an `@`), so configuring many rules costs little on text that
+    contains none of them.
+
+    Per-rule counts and timings are accumulated and exposed through `stats`.
+    """
+
+    def __init__(self, rules: Sequence[ResolvedRedactionRule]) -> None:
+        """Initialize the engine.
+
+        Args:
+            rules: Resolved rules to apply, in order.
+        """
+        self.rules = tuple(rules)
+        self._prefilters = tuple(_BUILTIN_PREFILTERS.get(rule.detector) for rule in self.rules)
+        self._stats = [RedactionRuleStats(rule.pii_type) for rule in self.rules]
+        self._lock = threading.Lock()
+
+    def apply(self, content: str) -> tuple[str, dict[str, list[PIIMatch]]]:
+        """Apply every rule to content.
+
+        Args:
+            content: The text content to scan and redact.
+
+        Returns:
+            A tuple of (updated content, matches keyed by PII type).
+
+        Raises:
+            PIIDetectionError: If a rule with the `block` strategy finds a match.
+        """
+        matches_by_type: dict[str, list[PIIMatch]] = {}
+        if not self.rules:
+            return content, matches_by_type
+
+        updated = content
+        chars: frozenset[str] | None = None
+        # (rule index, matches, seconds) for rules that ran, (index, -1, 0) for skips.
+        work: list[tuple[int, int, float]] = []
+        try:
+            rules = zip(self.rules, self._prefilters, strict=True)
+            for index, (rule, prefilter) in enumerate(rules):
+                if prefilter is not None:
+                    if chars is None:
+                        chars = frozenset(updated)
+                    if not prefilter(updated, chars):
+                        work.append((index, -1, 0.0))
+                        continue
+                start = time.perf_counter()
+                matches: list[PIIMatch] = []
+                try:
+                    updated_by_rule, matches = rule.apply(updated)
+                finally:
+                    work.append((index, len(matches), time.perf_counter() - start))
+                if matches:
+                    matches_by_type.setdefault(rule.pii_type, []).extend(matches)
+                    updated = updated_by_rule
+                    chars = None
+        finally:
+            self._record(work)
+        return updated, matches_by_type
+
+    def redact(self, content: str) -> str:
+        """Apply every rule to content and return only the updated content.
+
+        Args:
+            content: The text content to scan and redact.
+
+        Returns:
+            The updated content.
+
+        Raises:
+            PIIDetectionError: If a rule with the `block` strategy finds a match.
+        """
+        return self.apply(content)[0]
+
+    @property
+    def stats(self) -> list[RedactionRuleStats]:
+        """Snapshot of the per-rule counts and timings accumulated so far."""
+        with self._lock:
+            return [replace(stats) for stats in self._stats]
+
+    def _record(self, work: list[tuple[int, int, float]]) -> None:
+        with self._lock:
+            for index, matches, seconds in work:
+                stats = self._stats[index]
+                if matches < 0:
+                    stats.skipped += 1
+                else:
+                    stats.scanned += 1
+                    stats.matches += matches
+                    stats.seconds += seconds
+
+
 __all__ = [
     "PIIDetectionError",
     "PIIMatch",
+    "RedactionEngine",
     "RedactionRule",
+    "RedactionRuleStats",
     "ResolvedRedactionRule",
     "apply_strategy",
     "detect_credit_card",
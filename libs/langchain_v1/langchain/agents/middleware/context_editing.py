@@ -12,8 +12,9 @@ from __future__ import annotations
 from collections.abc import Awaitable, Callable, Iterable, Sequence
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, cast
 
+from langchain_core.language_models import BaseLanguageModel
 from langchain_core.messages import (
     AIMessage,
     AnyMessage,
@@ -41,6 +42,42 @@ TokenCounter = Callable[
 ]
 
 
+class _IncrementalTokenCounter:
+    """Token counter whose count for a message list is a sum over its messages.
+
+    Edits can then keep a running total by subtracting the count of each message they
+    replace and adding the count of its replacement, instead of recounting the whole
+    transcript. Per-message counts are cached, so each message is counted at most once.
+    """
+
+    def __init__(
+        self,
+        count_tokens: TokenCounter,
+        count_message_tokens: Callable[[BaseMessage], int],
+    ) -> None:
+        self._count_tokens = count_tokens
+        self._count_message_tokens = count_message_tokens
+        # Keyed by object identity, since an edited copy keeps the message id. The
+        # message is kept alive so its identity cannot be reused.
+        self._message_counts: dict[int, tuple[BaseMessage, int]] = {}
+
+    def __call__(self, messages: Sequence[BaseMessage]) -> int:
+        return self._count_tokens(messages)
+
+    def count_message(self, message: BaseMessage) -> int:
+        """Count the tokens contributed by a single message."""
+        cached = self._message_counts.get(id(message))
+        if cached is not None:
+            return cached[1]
+        count = self._count_message_tokens(message)
+        self._message_counts[id(message)] = (message, count)
+        return count
+
+
+def _count_message_tokens_approximately(message: BaseMessage) -> int:
+    return count_tokens_approximately([message])
+
+
 class ContextEdit(Protocol):
     """Protocol describing a context editing strategy."""
 
@@ -100,16 +137,23 @@ class ClearToolUsesEdit(ContextEdit):
         cleared_tokens = 0
         excluded_tools = set(self.exclude_tools)
 
+        # Index of the closest preceding AI message for every tool message.
+        ai_indices: dict[int, int] = {}
+        last_ai_idx: int | None = None
+        for idx, msg in enumerate(messages):
+            if isinstance(msg, AIMessage):
+                last_ai_idx = idx
+            elif last_ai_idx is not None and isinstance(msg, ToolMessage):
+                ai_indices[idx] = last_ai_idx
+
         for idx, tool_message in candidates:
             if tool_message.response_metadata.get("context_editing", {}).get("cleared"):
                 continue
 
-            ai_message = next(
-                (m for m in reversed(messages[:idx]) if isinstance(m, AIMessage)), None
-            )
-
-            if ai_message is None:
+            ai_idx = ai_indices.get(idx)
+            if ai_idx is None:
                 continue
+            ai_message = cast("AIMessage", messages[ai_idx])
 
             tool_call = next(
                 (
@@ -126,7 +170,7 @@ class ClearToolUsesEdit(ContextEdit):
             if (tool_message.name or tool_call["name"]) in excluded_tools:
                 continue
 
-            messages[idx] = tool_message.model_copy(
+            cleared_message = tool_message.model_copy(
                 update={
                     "artifact": None,
                     "content": self.placeholder,
@@ -139,16 +183,25 @@ class ClearToolUsesEdit(ContextEdit):
                     },
                 }
             )
+            messages[idx] = cleared_message
+            replaced: list[tuple[BaseMessage, BaseMessage]] = [(tool_message, cleared_message)]
 
             if self.clear_tool_inputs:
-                messages[messages.index(ai_message)] = self._build_cleared_tool_input_message(
+                cleared_ai_message = self._build_cleared_tool_input_message(
                     ai_message,
                     tool_message.tool_call_id,
                 )
+                messages[ai_idx] = cleared_ai_message
+                replaced.append((ai_message, cleared_ai_message))
 
             if self.clear_at_least > 0:
-                new_token_count = count_tokens(messages)
-                cleared_tokens = max(0, tokens - new_token_count)
+                if isinstance(count_tokens, _IncrementalTokenCounter):
+                    cleared_tokens += sum(
+                        count_tokens.count_message(old) - count_tokens.count_message(new)
+                        for old, new in replaced
+                    )
+                else:
+                    cleared_tokens = tokens - count_tokens(messages)
                 if cleared_tokens >= self.clear_at_least:
                     break
 
@@ -236,17 +289,43 @@ class ContextEditingMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT,
             return self.token_counter
 
         if self.token_count_method == "approximate":  # noqa: S105
-            return count_tokens_approximately
+            return _IncrementalTokenCounter(
+                count_tokens_approximately, _count_message_tokens_approximately
+            )
 
+        model = request.model
         system_msg = [request.system_message] if request.system_message else []
 
         def count_tokens(messages: Sequence[BaseMessage]) -> int:
-            return request.model.get_num_tokens_from_messages(
-                system_msg + list(messages), request.tools
+            return model.get_num_tokens_from_messages(system_msg + list(messages), request.tools)
+
+        if (
+            type(model).get_num_tokens_from_messages
+            is BaseLanguageModel.get_num_tokens_from_messages
+        ):
+            # The default implementation sums independent per-message counts. Providers
+            # that override it may count the conversation as a whole (for example via
+            # an API that rejects a lone tool result), so they are always recounted.
+            return _IncrementalTokenCounter(
+                count_tokens, lambda message: model.get_num_tokens_from_messages([message])
             )
 
         return count_tokens
 
+    def _apply_edits(self, request: ModelRequest[ContextT]) -> list[AnyMessage]:
+        """Return a copy of the request messages with all edits applied."""
+        count_tokens = self._resolve_token_counter(request)
+
+        if all(type(edit) is ClearToolUsesEdit for edit in self.edits):
+            # `ClearToolUsesEdit` replaces the messages it edits instead of mutating
+            # them, so a shallow copy leaves the request's messages untouched.
+            edited_messages = list(request.messages)
+        else:
+            edited_messages = deepcopy(list(request.messages))
+        for edit in self.edits:
+            edit.apply(edited_messages, count_tokens=count_tokens)
+        return edited_messages
+
     def wrap_model_call(
         self,
         request: ModelRequest[ContextT],
@@ -265,12 +344,7 @@ class ContextEditingMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT,
         if not request.messages:
             return handler(request)
 
-        count_tokens = self._resolve_token_counter(request)
-
-        edited_messages = deepcopy(list(request.messages))
-        for edit in self.edits:
-            edit.apply(edited_messages, count_tokens=count_tokens)
-
+        edited_messages = self._apply_edits(request)
         return handler(request.override(messages=edited_messages))
 
     async def awrap_model_call(
@@ -291,12 +365,7 @@ class ContextEditingMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT,
         if not request.messages:
             return await handler(request)
 
-        count_tokens = self._resolve_token_counter(request)
-
-        edited_messages = deepcopy(list(request.messages))
-        for edit in self.edits:
-            edit.apply(edited_messages, count_tokens=count_tokens)
-
+        edited_messages = self._apply_edits(request)
         return await handler(request.override(messages=edited_messages))
 
 
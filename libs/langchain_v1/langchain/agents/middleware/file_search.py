@@ -11,16 +11,26 @@ import json
 import operator
 import os
 import re
+import stat
 import subprocess
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
 from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Literal
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Literal
 
 from langchain_core.tools import tool
 
 from langchain.agents.middleware.types import AgentMiddleware, AgentState, ContextT, ResponseT
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
 
 def _is_within_root(candidate: Path, root: Path) -> bool:
     """Return True iff `candidate` resolves to a path inside `root` (symlinks resolved).
@@ -105,6 +115,237 @@ def _match_include_pattern(basename: str, pattern: str) -> bool:
     return any(fnmatch.fnmatch(basename, candidate) for candidate in expanded)
 
 
+def _match_glob_parts(parts: Sequence[str], pattern_parts: Sequence[str]) -> bool:
+    """Return True if a relative file path matches a glob like `Path.glob` does.
+
+    Each pattern part matches one path part, except `**`, which matches any number
+    of directories.
+    """
+    if not pattern_parts:
+        return not parts
+    head, rest = pattern_parts[0], pattern_parts[1:]
+    if head == "**":
+        return any(_match_glob_parts(parts[i:], rest) for i in range(len(parts)))
+    return (
+        bool(parts) and fnmatch.fnmatchcase(parts[0], head) and _match_glob_parts(parts[1:], rest)
+    )
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    """Return the set of all 3-character substrings of `text`."""
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+# The bytes of a packed trigram, lowest first, as `(byte, char)` pairs that stand
+# for that byte of the code point of the trigram's `char`th character. Latin-1
+# trigrams only need the first three bytes; others leave out the third byte of the
+# middle character to fit in 8.
+_LATIN_1_LAYOUT: tuple[tuple[int, int], ...] = ((0, 0), (0, 1), (0, 2))
+_UNICODE_LAYOUT: tuple[tuple[int, int], ...] = (
+    *_LATIN_1_LAYOUT,
+    (1, 0),
+    (1, 1),
+    (1, 2),
+    (2, 0),
+    (2, 2),
+)
+
+
+def _packed_trigrams(text: str) -> array[int]:
+    """Return the trigrams of `text` packed into ints, sorted and deduplicated.
+
+    Each trigram is packed from the bytes of its code points, in 4 bytes for
+    Latin-1 text and 8 otherwise, so that a whole text is packed without a
+    Python-level loop. Packing may map distinct trigrams outside the Basic
+    Multilingual Plane to the same int, which only lets extra files through the
+    index.
+    """
+    try:
+        planes = [text.encode("latin-1")]
+        typecode, layout = "I", _LATIN_1_LAYOUT
+    except UnicodeEncodeError:
+        data = text.encode("utf-32-le", "surrogatepass")
+        planes = [data[0::4], data[1::4], data[2::4]]
+        typecode, layout = "Q", _UNICODE_LAYOUT
+
+    count = max(len(text) - 2, 0)
+    itemsize = array(typecode).itemsize
+    words = bytearray(itemsize * count)
+    for offset, (byte, char) in enumerate(layout):
+        words[offset::itemsize] = planes[byte][char : char + count]
+    packed = array(typecode, words)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return array(typecode, sorted(set(packed)))
+
+
+def _contains_trigrams(packed: array[int], required: Iterable[int]) -> bool:
+    """Return whether the sorted `packed` trigrams include all `required` ones."""
+    for trigram in required:
+        i = bisect_left(packed, trigram)
+        if i == len(packed) or packed[i] != trigram:
+            return False
+    return True
+
+
+# Escapes of a single letter that never stand for literal text in a match.
+_CLASS_ESCAPES = frozenset("AbBdDsSwWZ")
+# Escapes of a single letter that stand for one control character.
+_CONTROL_ESCAPES = frozenset("afnrtv")
+_QUANTIFIER_BODY = re.compile(r"\{\d*(?:,\d*)?\}")
+
+
+def _required_trigrams(pattern: str) -> frozenset[str]:
+    """Return trigrams that every line matching the regex `pattern` contains.
+
+    Only literal text outside groups, character classes and quantifiers is taken
+    into account, and patterns with alternation or inline flags, which may make
+    that text optional or case-insensitive, have no required trigrams. Neither do
+    patterns with syntax the scanner does not handle, such as numeric escapes.
+    """
+    if "|" in pattern or "(?" in pattern:
+        return frozenset()
+
+    literals: list[str] = []
+    current: list[str] = []
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        literal = None
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if not escaped:
+                return frozenset()
+            if not escaped.isalnum():
+                literal = escaped
+            elif escaped not in _CLASS_ESCAPES and escaped not in _CONTROL_ESCAPES:
+                # Hex, Unicode, named and octal escapes and backreferences span
+                # more than one character.
+                return frozenset()
+            i += 2
+        elif char == "[":
+            # Skip the character class, including a leading `^` or `]`.
+            i += 1
+            if pattern[i : i + 1] == "^":
+                i += 1
+            if pattern[i : i + 1] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            if i >= len(pattern):
+                return frozenset()
+            i += 1
+        elif char == "{":
+            # A `{m,n}` quantifier; the repeated item was already left out.
+            quantifier = _QUANTIFIER_BODY.match(pattern, i)
+            if quantifier is None:
+                return frozenset()
+            i = quantifier.end()
+        else:
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char not in ".^$*+?}":
+                literal = char
+            i += 1
+
+        if literal is None or depth or pattern[i : i + 1] in {"*", "+", "?", "{"}:
+            literals.append("".join(current))
+            current = []
+        else:
+            current.append(literal)
+    literals.append("".join(current))
+
+    return frozenset().union(*(_trigrams(literal) for literal in literals))
+
+
+@dataclass(frozen=True)
+class _IndexedFile:
+    """A file tracked by `_FileIndex`."""
+
+    mtime_ns: int
+    size: int
+    trigrams: array[int] | None
+    """The sorted packed trigrams of the file's content, or `None` if it cannot be
+    searched."""
+
+
+class _FileIndex:
+    """In-process index of the files under a root directory.
+
+    Tracks the modification time of every file and the trigrams of the content of
+    every searchable one, packed into ints and kept in sorted arrays. Each lookup
+    re-stats the files, but only new and modified files are read again.
+    """
+
+    def __init__(self, root_path: Path, max_file_size_bytes: int) -> None:
+        self.root_path = root_path
+        self.max_file_size_bytes = max_file_size_bytes
+        self._files: dict[str, _IndexedFile] = {}
+        self._lock = threading.Lock()
+
+    def files(self) -> dict[str, _IndexedFile]:
+        """Refresh the index and return its files by path relative to the root."""
+        with self._lock:
+            self._refresh()
+            return dict(self._files)
+
+    def candidates(self, pattern: str) -> list[str]:
+        """Return the sorted relative paths of the files that may match `pattern`."""
+        required = sorted(_packed_trigrams(trigram)[0] for trigram in _required_trigrams(pattern))
+        return sorted(
+            path
+            for path, indexed in self.files().items()
+            if indexed.trigrams is not None and _contains_trigrams(indexed.trigrams, required)
+        )
+
+    def _refresh(self) -> None:
+        seen: set[str] = set()
+        # Walk the tree without following symlinked directories so it cannot leave
+        # the root, like the Python fallback search.
+        for walk_root, _dirs, names in os.walk(self.root_path, followlinks=False):
+            for name in names:
+                file_path = Path(walk_root) / name
+                if file_path.is_symlink() and not _is_within_root(file_path, self.root_path):
+                    continue
+                try:
+                    file_stat = file_path.stat()
+                except OSError:
+                    continue
+                if not stat.S_ISREG(file_stat.st_mode):
+                    continue
+
+                relative = str(file_path.relative_to(self.root_path))
+                seen.add(relative)
+                indexed = self._files.get(relative)
+                if (
+                    indexed is None
+                    or indexed.mtime_ns != file_stat.st_mtime_ns
+                    or indexed.size != file_stat.st_size
+                ):
+                    self._files[relative] = _IndexedFile(
+                        mtime_ns=file_stat.st_mtime_ns,
+                        size=file_stat.st_size,
+                        trigrams=self._read_trigrams(file_path, file_stat.st_size),
+                    )
+
+        for relative in self._files.keys() - seen:
+            del self._files[relative]
+
+    def _read_trigrams(self, file_path: Path, size: int) -> array[int] | None:
+        if size > self.max_file_size_bytes:
+            return None
+        # Files that cannot be decoded are never searched, so skip them before
+        # collecting any trigrams.
+        try:
+            text = file_path.read_text()
+        except (OSError, UnicodeDecodeError):
+            return None
+        return _packed_trigrams(text)
+
+
 class FilesystemFileSearchMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT]):
     """Provides Glob and Grep search over filesystem files.
 
@@ -136,6 +377,7 @@ class FilesystemFileSearchMiddleware(AgentMiddleware[AgentState[ResponseT], Cont
         root_path: str,
         use_ripgrep: bool = True,
         max_file_size_mb: int = 10,
+        use_index: bool = False,
     ) -> None:
         """Initialize the search middleware.
 
@@ -145,10 +387,26 @@ class FilesystemFileSearchMiddleware(AgentMiddleware[AgentState[ResponseT], Cont
 
                 Falls back to Python if `ripgrep` unavailable.
             max_file_size_mb: Maximum file size to search in MB.
+            use_index: Whether to keep an in-process index of the files under
+                `root_path` across searches.
+
+                The index records the modification time of every file and the
+                trigrams of its content, and is refreshed on each search by
+                re-reading only new and modified files. Grep searches then only
+                read the files that can contain the literal text of the pattern,
+                and take precedence over `ripgrep`. Symlinked directories are not
+                searched.
+
+                The index is built on the first search, which reads every file
+                under `root_path` and is therefore slower than an unindexed
+                search; it pays off over the searches that follow. It holds 4
+                bytes per distinct trigram of each file (8 for files with text
+                outside Latin-1), typically a fraction of the size of the files.
         """
         self.root_path = Path(root_path).resolve()
         self.use_ripgrep = use_ripgrep
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self._index = _FileIndex(self.root_path, self.max_file_size_bytes) if use_index else None
 
         # Create tool instances as closures that capture self
         @tool
@@ -187,6 +445,9 @@ class FilesystemFileSearchMiddleware(AgentMiddleware[AgentState[ResponseT], Cont
             if pattern.startswith("/") or any(part == ".." for part in pattern.split("/")):
                 return "No files found"
 
+            if self._index is not None:
+                return self._index_glob(self._index, pattern, base_full)
+
             # Use pathlib glob
             matching: list[tuple[str, str]] = []
             for match in base_full.glob(pattern):
@@ -241,6 +502,16 @@ class FilesystemFileSearchMiddleware(AgentMiddleware[AgentState[ResponseT], Cont
             if include and not _is_valid_include_pattern(include):
                 return "Invalid include pattern"
 
+            if self._index is not None:
+                matches = self._index_search(
+                    self._index,
+                    pattern,
+                    path,
+                    include,
+                    first_only=output_mode not in {"content", "count"},
+                )
+                return self._format_grep_matches(matches, output_mode) or "No matches found"
+
             # Try ripgrep first if enabled
             results = None
             if self.use_ripgrep:
@@ -398,34 +669,110 @@ class FilesystemFileSearchMiddleware(AgentMiddleware[AgentState[ResponseT], Cont
 
         return results
 
-    @staticmethod
+    def _index_glob(self, index: _FileIndex, pattern: str, base_full: Path) -> str:
+        """Match a glob pattern against the indexed files."""
+        base_parts = base_full.relative_to(self.root_path).parts
+        pattern_parts = PurePosixPath(pattern).parts
+
+        matching: list[tuple[str, int]] = []
+        for relative, indexed in index.files().items():
+            parts = Path(relative).parts
+            if parts[: len(base_parts)] == base_parts and _match_glob_parts(
+                parts[len(base_parts) :], pattern_parts
+            ):
+                matching.append(("/" + relative, indexed.mtime_ns))
+
+        if not matching:
+            return "No files found"
+
+        matching.sort(key=operator.itemgetter(1), reverse=True)
+        return "\n".join(p for p, _ in matching)
+
+    def _index_search(
+        self,
+        index: _FileIndex,
+        pattern: str,
+        base_path: str,
+        include: str | None,
+        *,
+        first_only: bool,
+    ) -> Iterator[tuple[str, int, str]]:
+        """Search the indexed files.
+
+        Yields `(virtual_path, line_number, line)` matches ordered by path, reading
+        only the files whose content contains the literal text of `pattern`.
+
+        Args:
+            index: The index of the files under the root.
+            pattern: The regular expression to search for.
+            base_path: The virtual directory to search in.
+            include: Optional glob that file names must match.
+            first_only: Whether to stop reading a file at its first match.
+        """
+        try:
+            base_full = self._validate_and_resolve_path(base_path)
+        except ValueError:
+            return
+
+        if not base_full.is_dir():
+            return
+
+        prefix = ""
+        if base_full != self.root_path:
+            prefix = str(base_full.relative_to(self.root_path)) + os.sep
+
+        regex = re.compile(pattern)
+        for relative in index.candidates(pattern):
+            file_path = self.root_path / relative
+            if not relative.startswith(prefix):
+                continue
+            if include and not _match_include_pattern(file_path.name, include):
+                continue
+
+            try:
+                content = file_path.read_text()
+            except (OSError, UnicodeDecodeError):
+                continue
+
+            for line_num, line in enumerate(content.splitlines(), 1):
+                if regex.search(line):
+                    yield "/" + relative, line_num, line
+                    if first_only:
+                        break
+
+    @classmethod
     def _format_grep_results(
+        cls,
         results: dict[str, list[tuple[int, str]]],
         output_mode: str,
     ) -> str:
         """Format grep results based on output mode."""
-        if output_mode == "files_with_matches":
-            # Just return file paths
-            return "\n".join(sorted(results.keys()))
+        matches = (
+            (file_path, line_num, line)
+            for file_path in sorted(results.keys())
+            for line_num, line in results[file_path]
+        )
+        return cls._format_grep_matches(matches, output_mode)
 
+    @staticmethod
+    def _format_grep_matches(
+        matches: Iterable[tuple[str, int, str]],
+        output_mode: str,
+    ) -> str:
+        """Format `(file_path, line_number, line)` matches ordered by path."""
         if output_mode == "content":
             # Return file:line:content format
-            lines = []
-            for file_path in sorted(results.keys()):
-                for line_num, line in results[file_path]:
-                    lines.append(f"{file_path}:{line_num}:{line}")
-            return "\n".join(lines)
+            return "\n".join(
+                f"{file_path}:{line_num}:{line}" for file_path, line_num, line in matches
+            )
 
         if output_mode == "count":
             # Return file:count format
-            lines = []
-            for file_path in sorted(results.keys()):
-                count = len(results[file_path])
-                lines.append(f"{file_path}:{count}")
-            return "\n".join(lines)
-
-        # Default to files_with_matches
-        return "\n".join(sorted(results.keys()))
+            counts = Counter(file_path for file_path, _, _ in matches)
+            return "\n".join(f"{file_path}:{count}" for file_path, count in counts.items())
+
+        # Default to files_with_matches: just return file paths
+        return "\n".join(dict.fromkeys(file_path for file_path, _, _ in matches))
 
 
 __all__ = [
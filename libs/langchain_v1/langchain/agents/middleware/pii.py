@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
@@ -12,9 +15,10 @@ from typing_extensions import override
 from langchain.agents.middleware._redaction import (
     PIIDetectionError,
     PIIMatch,
+    RedactionEngine,
     RedactionRule,
+    RedactionRuleStats,
     ResolvedRedactionRule,
-    apply_strategy,
     detect_credit_card,
     detect_email,
     detect_ip,
@@ -30,7 +34,7 @@ from langchain.agents.middleware.types import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from langgraph.runtime import Runtime
     from langgraph.stream._types import ProtocolEvent
@@ -46,6 +50,9 @@ detectors (the credit-card regex tops out at 19 characters; URLs and emails
 are typically well under 100) while bounding first-token latency.
 """
 
+_MAX_SCANNED_MESSAGES = 1024
+"""Number of clean message ids each `PIIMiddleware` remembers between turns."""
+
 
 class _PIIStreamTransformer(StreamTransformer):
     """Mutates `content-block-delta` text on `messages` events in flight.
@@ -57,7 +64,7 @@ class _PIIStreamTransformer(StreamTransformer):
     Holds a sliding buffer of the most recent text per (run_id, content
     block index) so PII patterns that straddle delta boundaries are caught.
     Anything older than `lookback` characters is redacted with the resolved
-    rule's strategy and emitted as the new delta text; the trailing tail
+    rules' strategies and emitted as the new delta text; the trailing tail
     stays in the buffer until a later delta extends it past the cap or the
     block's finish event flushes the snapshot.
     """
@@ -69,11 +76,11 @@ class _PIIStreamTransformer(StreamTransformer):
         self,
         scope: tuple[str, ...] = (),
         *,
-        rule: ResolvedRedactionRule,
+        rule: ResolvedRedactionRule | RedactionEngine,
         lookback: int = _DEFAULT_STREAM_LOOKBACK,
     ) -> None:
         super().__init__(scope)
-        self._rule = rule
+        self._engine = rule if isinstance(rule, RedactionEngine) else RedactionEngine([rule])
         self._lookback = lookback
         # Text/reasoning deltas keyed by `(run_id, content_block_index)`.
         self._buffers: dict[tuple[str, int], str] = {}
@@ -178,9 +185,7 @@ class _PIIStreamTransformer(StreamTransformer):
         elif kind == "tool-error":
             msg = data.get("message")
             if isinstance(msg, str) and msg:
-                matches = self._rule.detector(msg)
-                if matches:
-                    data["message"] = apply_strategy(msg, matches, self._rule.strategy)
+                data["message"] = self._engine.redact(msg)
             if isinstance(tool_call_id, str):
                 self._tool_buffers.pop(tool_call_id, None)
 
@@ -203,13 +208,11 @@ class _PIIStreamTransformer(StreamTransformer):
             held = self._tool_buffers.get(tool_call_id, "")
             combined = held + delta
 
-            matches = self._rule.detector(combined)
-            if matches:
-                # `apply_strategy` raises `PIIDetectionError` under
-                # `strategy="block"`, failing the run immediately —
-                # cleaner than withholding deltas until `after_model`
-                # raises later.
-                combined = apply_strategy(combined, matches, self._rule.strategy)
+            # The engine raises `PIIDetectionError` under
+            # `strategy="block"`, failing the run immediately —
+            # cleaner than withholding deltas until `after_model`
+            # raises later.
+            combined = self._engine.redact(combined)
 
             emit_end = max(0, len(combined) - self._lookback)
             self._tool_buffers[tool_call_id] = combined[emit_end:]
@@ -268,13 +271,10 @@ class _PIIStreamTransformer(StreamTransformer):
         if isinstance(value, str):
             if not value:
                 return value
-            matches = self._rule.detector(value)
-            if not matches:
-                return value
-            # `apply_strategy` raises `PIIDetectionError` under `block`
-            # — the run fails immediately rather than buffering until a
+            # The engine raises `PIIDetectionError` under `block` — the
+            # run fails immediately rather than buffering until a
             # state-level hook can raise.
-            return apply_strategy(value, matches, self._rule.strategy)
+            return self._engine.redact(value)
         if isinstance(value, BaseMessage):
             return self._redact_base_message(value)
         if isinstance(value, dict):
@@ -291,9 +291,9 @@ class _PIIStreamTransformer(StreamTransformer):
 
         content = value.content
         if isinstance(content, str) and content:
-            matches = self._rule.detector(content)
-            if matches:
-                update["content"] = apply_strategy(content, matches, self._rule.strategy)
+            redacted = self._engine.redact(content)
+            if redacted != content:
+                update["content"] = redacted
         elif isinstance(content, list) and content:
             # Structured content-blocks shape:
             # `[{"type": "text", "text": "..."}, {"type": "tool_call", ...}, ...]`.
@@ -377,12 +377,10 @@ class _PIIStreamTransformer(StreamTransformer):
         # that straddle the lookback boundary — the detector's regex
         # needs a complete, boundary-anchored hit, so a truncated prefix
         # would fail to match and the partial PII would leak on the
-        # wire. Under `strategy="block"`, `apply_strategy` raises
+        # wire. Under `strategy="block"`, the engine raises
         # `PIIDetectionError` here, failing the run as soon as PII
         # arrives rather than buffering until `after_model`.
-        matches = self._rule.detector(combined)
-        if matches:
-            combined = apply_strategy(combined, matches, self._rule.strategy)
+        combined = self._engine.redact(combined)
 
         emit_end = max(0, len(combined) - self._lookback)
         self._buffers[key] = combined[emit_end:]
@@ -420,12 +418,10 @@ class _PIIStreamTransformer(StreamTransformer):
         if not isinstance(args, str) or not args:
             return
 
-        matches = self._rule.detector(args)
-        if matches:
-            # `apply_strategy` raises `PIIDetectionError` under
-            # `strategy="block"` — the run fails the moment a complete
-            # PII pattern surfaces in the cumulative args string.
-            args = apply_strategy(args, matches, self._rule.strategy)
+        # The engine raises `PIIDetectionError` under `strategy="block"`
+        # — the run fails the moment a complete PII pattern surfaces in
+        # the cumulative args string.
+        args = self._engine.redact(args)
 
         emit_end = max(0, len(args) - self._lookback)
         fields["args"] = args[:emit_end]
@@ -460,16 +456,13 @@ class _PIIStreamTransformer(StreamTransformer):
         """Re-redact a string content-block field on `content-block-finish`.
 
         Used for `text` and `reasoning` content blocks. Under
-        `strategy="block"` `apply_strategy` raises `PIIDetectionError`,
+        `strategy="block"` the engine raises `PIIDetectionError`,
         failing the run immediately.
         """
         text = content.get(field)
         if not isinstance(text, str) or not text:
             return
-        matches = self._rule.detector(text)
-        if not matches:
-            return
-        content[field] = apply_strategy(text, matches, self._rule.strategy)
+        content[field] = self._engine.redact(text)
 
     def _drop_run(self, run_id: str) -> None:
         # Release any buffered tails for this run_id — content-block-finish
@@ -522,7 +515,7 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
 
     Example:
         ```python
-        from langchain.agents.middleware import PIIMiddleware
+        from langchain.agents.middleware import PIIMiddleware, RedactionRule
         from langchain.agents import create_agent
 
         # Redact all emails in user input
@@ -550,6 +543,21 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
                 PIIMiddleware("api_key", detector=r"sk-[a-zA-Z0-9]{32}", strategy="block"),
             ],
         )
+
+        # Several PII types handled by one middleware, scanning each message once
+        agent = create_agent(
+            "openai:gpt-5.5",
+            middleware=[
+                PIIMiddleware(
+                    "email",
+                    additional_rules=[
+                        RedactionRule("credit_card", strategy="mask"),
+                        RedactionRule("ip", strategy="hash"),
+                    ],
+                    apply_to_tool_results=True,
+                ),
+            ],
+        )
         ```
     """
 
@@ -564,6 +572,7 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
         apply_to_input: bool = True,
         apply_to_output: bool = False,
         apply_to_tool_results: bool = False,
+        additional_rules: Sequence[RedactionRule] = (),
     ) -> None:
         """Initialize the PII detection middleware.
 
@@ -616,9 +625,15 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
                 `run.messages` / `run.tool_calls` / `run.values` never
                 see PII on the wire.
             apply_to_tool_results: Whether to check tool result messages after tool execution.
+            additional_rules: Further PII types to handle in the same middleware.
+
+                Rules are applied in order after the one configured by `pii_type`,
+                `strategy`, and `detector`, with the same result as stacking one
+                `PIIMiddleware` per rule, but each message is scanned once.
 
         Raises:
-            ValueError: If `pii_type` is not built-in and no detector is provided.
+            ValueError: If `pii_type` (or the type of an additional rule) is not
+                built-in and no detector is provided.
         """
         super().__init__()
 
@@ -634,6 +649,13 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
         self.pii_type = self._resolved_rule.pii_type
         self.strategy = self._resolved_rule.strategy
         self.detector = self._resolved_rule.detector
+        self._engine = RedactionEngine(
+            [self._resolved_rule, *(rule.resolve() for rule in additional_rules)]
+        )
+        # Ids of messages found free of PII, mapped to the digest of the content
+        # that was scanned, so unchanged messages are not rescanned every turn.
+        self._clean_messages: OrderedDict[str, bytes] = OrderedDict()
+        self._clean_messages_lock = threading.Lock()
 
         # Stream transformer scrubs the streamed surface of the same
         # messages that the state-level hooks scrub in graph state.
@@ -651,23 +673,56 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
             self.transformers = (
                 partial(
                     _PIIStreamTransformer,
-                    rule=self._resolved_rule,
+                    rule=self._engine,
                 ),
             )
 
     @property
     def name(self) -> str:
         """Name of the middleware."""
-        return f"{self.__class__.__name__}[{self.pii_type}]"
+        pii_types = ",".join(rule.pii_type for rule in self._engine.rules)
+        return f"{self.__class__.__name__}[{pii_types}]"
+
+    @property
+    def rule_stats(self) -> list[RedactionRuleStats]:
+        """Per-rule scan counts, match counts, and timings accumulated so far."""
+        return self._engine.stats
 
     def _process_content(self, content: str) -> tuple[str, list[PIIMatch]]:
-        """Apply the configured redaction rule to the provided content."""
-        matches = self.detector(content)
-        if not matches:
-            return content, []
-        sanitized = apply_strategy(content, matches, self.strategy)
+        """Apply the configured redaction rules to the provided content."""
+        sanitized, matches_by_type = self._engine.apply(content)
+        matches = [match for matches in matches_by_type.values() for match in matches]
         return sanitized, matches
 
+    def _process_message(self, message: BaseMessage) -> tuple[str, list[PIIMatch]]:
+        """Apply the configured redaction rules to a message's content.
+
+        Messages with an id that were already found clean with the same content
+        are not scanned again.
+        """
+        content = str(message.content)
+        if message.id is None:
+            return self._process_content(content)
+
+        # A collision would skip redaction, so use a cryptographic digest rather
+        # than the builtin `hash`.
+        content_digest = hashlib.blake2b(
+            content.encode("utf-8", "surrogatepass"), digest_size=32
+        ).digest()
+        with self._clean_messages_lock:
+            if self._clean_messages.get(message.id) == content_digest:
+                self._clean_messages.move_to_end(message.id)
+                return content, []
+
+        new_content, matches = self._process_content(content)
+        if not matches:
+            with self._clean_messages_lock:
+                self._clean_messages[message.id] = content_digest
+                self._clean_messages.move_to_end(message.id)
+                if len(self._clean_messages) > _MAX_SCANNED_MESSAGES:
+                    self._clean_messages.popitem(last=False)
+        return new_content, matches
+
     @hook_config(can_jump_to=["end"])
     @override
     def before_model(
@@ -711,8 +766,7 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
 
             if last_user_idx is not None and last_user_msg and last_user_msg.content:
                 # Detect PII in message content
-                content = str(last_user_msg.content)
-                new_content, matches = self._process_content(content)
+                new_content, matches = self._process_message(last_user_msg)
 
                 if matches:
                     updated_message: AnyMessage = HumanMessage(
@@ -742,8 +796,7 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
                         if not tool_msg.content:
                             continue
 
-                        content = str(tool_msg.content)
-                        new_content, matches = self._process_content(content)
+                        new_content, matches = self._process_message(tool_msg)
 
                         if not matches:
                             continue
@@ -825,8 +878,7 @@ class PIIMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT])
             return None
 
         # Detect PII in message content
-        content = str(last_ai_msg.content)
-        new_content, matches = self._process_content(content)
+        new_content, matches = self._process_message(last_ai_msg)
 
         if not matches:
             return None
@@ -35,8 +35,8 @@ from langchain.agents.middleware._execution import (
 from langchain.agents.middleware._redaction import (
     PIIDetectionError,
     PIIMatch,
+    RedactionEngine,
     RedactionRule,
-    ResolvedRedactionRule,
 )
 from langchain.agents.middleware.types import (
     AgentMiddleware,
@@ -593,9 +593,7 @@ class ShellToolMiddleware(AgentMiddleware[ShellToolState[ResponseT], ContextT, R
         else:
             self._execution_policy = HostExecutionPolicy()
         rules = redaction_rules or ()
-        self._redaction_rules: tuple[ResolvedRedactionRule, ...] = tuple(
-            rule.resolve() for rule in rules
-        )
+        self._redaction_engine = RedactionEngine([rule.resolve() for rule in rules])
         self._startup_commands = self._normalize_commands(startup_commands)
         self._shutdown_commands = self._normalize_commands(shutdown_commands)
 
@@ -779,13 +777,7 @@ class ShellToolMiddleware(AgentMiddleware[ShellToolState[ResponseT], ContextT, R
 
     def _apply_redactions(self, content: str) -> tuple[str, dict[str, list[PIIMatch]]]:
         """Apply configured redaction rules to command output."""
-        matches_by_type: dict[str, list[PIIMatch]] = {}
-        updated = content
-        for rule in self._redaction_rules:
-            updated, matches = rule.apply(updated)
-            if matches:
-                matches_by_type.setdefault(rule.pii_type, []).extend(matches)
-        return updated, matches_by_type
+        return self._redaction_engine.apply(content)
 
     @overload
     def _run_shell_tool(
@@ -1,9 +1,10 @@
 """Summarization middleware."""
 
 import logging
+import math
 import uuid
 import warnings
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from functools import partial
 from typing import Any, Literal, TypedDict, cast
 
@@ -16,6 +17,7 @@ from langchain_core.messages import (
 )
 from langchain_core.messages.human import HumanMessage
 from langchain_core.messages.utils import (
+    _usage_metadata_scale_factor,
     count_tokens_approximately,
     get_buffer_string,
     trim_messages,
@@ -229,6 +231,55 @@ def _get_approximate_token_counter(model: BaseChatModel) -> TokenCounter:
     return partial(count_tokens_approximately, use_usage_metadata_scaling=True)
 
 
+_TOKEN_COUNT_CACHE_SLACK = 1000
+
+
+class _ApproximateTokenCounts:
+    """Per-message approximate token counts, reused across model calls.
+
+    Without usage-metadata scaling, `count_tokens_approximately` rounds each message
+    to a whole number of tokens and sums them, so the count of any suffix of a
+    transcript is a difference of prefix sums. Counts are cached by message id and
+    reused while the message object is unchanged.
+    """
+
+    def __init__(self, count_messages: TokenCounter) -> None:
+        self._count_messages = count_messages
+        self._counts: dict[str, tuple[AnyMessage, int]] = {}
+
+    def prefix_sums(self, messages: Sequence[AnyMessage]) -> list[int]:
+        """Return `sums` such that `sums[j] - sums[i]` counts `messages[i:j]`."""
+        counts = self._counts
+        sums = [0]
+        total = 0
+        for message in messages:
+            entry = counts.get(message.id) if message.id is not None else None
+            if entry is not None and entry[0] is message:
+                count = entry[1]
+            else:
+                count = self._count_messages([message])
+                if message.id is not None:
+                    counts[message.id] = (message, count)
+            total += count
+            sums.append(total)
+        if len(counts) > 2 * len(messages) + _TOKEN_COUNT_CACHE_SLACK:
+            ids = {message.id for message in messages}
+            self._counts = {id_: entry for id_, entry in counts.items() if id_ in ids}
+        return sums
+
+    @staticmethod
+    def scaled_total(messages: Sequence[AnyMessage], sums: Sequence[int]) -> int:
+        """Apply `count_tokens_approximately`'s usage-metadata scaling to `sums[-1]`."""
+        if len(messages) <= 1:
+            return sums[-1]
+        scale_factor = _usage_metadata_scale_factor(
+            (message, sums[index + 1])
+            for index, message in enumerate(messages)
+            if isinstance(message, AIMessage)
+        )
+        return math.ceil(sums[-1] * scale_factor)
+
+
 class SummarizationMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, ResponseT]):
     """Summarizes conversation history when token limits are approached.
 
@@ -370,11 +421,14 @@ class SummarizationMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, R
         self._trigger_conditions = self._legacy_trigger_conditions(self.trigger)
 
         self.keep = self._validate_context_size(keep, "keep")
+        self._approximate_token_counts: _ApproximateTokenCounts | None = None
         if token_counter is count_tokens_approximately:
             self.token_counter = _get_approximate_token_counter(self.model)
             self._partial_token_counter: TokenCounter = partial(  # type: ignore[call-arg]
                 self.token_counter, use_usage_metadata_scaling=False
             )
+            self._approximate_token_counts = _ApproximateTokenCounts(self._partial_token_counter)
+            self._default_token_counters = (self.token_counter, self._partial_token_counter)
         else:
             self.token_counter = token_counter
             self._partial_token_counter = token_counter
@@ -413,7 +467,7 @@ class SummarizationMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, R
         messages = state["messages"]
         self._ensure_message_ids(messages)
 
-        total_tokens = self.token_counter(messages)
+        total_tokens = self._count_tokens(messages)
         if not self._should_summarize(messages, total_tokens):
             return None
 
@@ -454,7 +508,7 @@ class SummarizationMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, R
         messages = state["messages"]
         self._ensure_message_ids(messages)
 
-        total_tokens = self.token_counter(messages)
+        total_tokens = self._count_tokens(messages)
         if not self._should_summarize(messages, total_tokens):
             return None
 
@@ -656,6 +710,21 @@ class SummarizationMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, R
                 return True
         return False
 
+    def _token_prefix_sums(self, messages: list[AnyMessage]) -> list[int] | None:
+        """Return cached prefix sums if the default token counters are in use."""
+        if self._approximate_token_counts is None or (
+            (self.token_counter, self._partial_token_counter) != self._default_token_counters
+        ):
+            return None
+        return self._approximate_token_counts.prefix_sums(messages)
+
+    def _count_tokens(self, messages: list[AnyMessage]) -> int:
+        """Count tokens in `messages` with `token_counter`, reusing cached counts."""
+        sums = self._token_prefix_sums(messages)
+        if sums is None:
+            return self.token_counter(messages)
+        return _ApproximateTokenCounts.scaled_total(messages, sums)
+
     def _determine_cutoff_index(self, messages: list[AnyMessage]) -> int:
         """Choose cutoff index respecting retention configuration."""
         kind, value = self.keep
@@ -687,7 +756,20 @@ class SummarizationMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, R
         if target_token_count <= 0:
             target_token_count = 1
 
-        if self.token_counter(messages) <= target_token_count:
+        sums = self._token_prefix_sums(messages)
+        if sums is None:
+            total_tokens = self.token_counter(messages)
+
+            def suffix_tokens(start: int) -> int:
+                return self._partial_token_counter(messages[start:])
+
+        else:
+            total_tokens = _ApproximateTokenCounts.scaled_total(messages, sums)
+
+            def suffix_tokens(start: int) -> int:
+                return sums[-1] - sums[start]
+
+        if total_tokens <= target_token_count:
             return 0
 
         # Use binary search to identify the earliest message index that keeps the
@@ -700,7 +782,7 @@ class SummarizationMiddleware(AgentMiddleware[AgentState[ResponseT], ContextT, R
                 break
 
             mid = (left + right) // 2
-            if self._partial_token_counter(messages[mid:]) <= target_token_count:
+            if suffix_tokens(mid) <= target_token_count:
                 cutoff_candidate = mid
                 right = mid
             else:
@@ -1,9 +1,16 @@
+from collections.abc import Callable, Sequence
+from itertools import cycle
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from langchain_core.language_models import LanguageModelInput
 from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool, StructuredTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from pytest_benchmark.fixture import BenchmarkFixture
+from typing_extensions import override
 
 from langchain.agents import create_agent
 from langchain.agents.middleware import (
@@ -13,8 +20,6 @@ from langchain.agents.middleware import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-
     from langchain.agents.middleware import AgentMiddleware
 
 
@@ -42,3 +47,45 @@ def test_create_agent_instantiation_with_middleware(
         )
 
     benchmark(instantiate_agent)
+
+
+class _ToolCallingFakeChatModel(GenericFakeChatModel):
+    """Fake chat model that converts its tools like provider integrations do."""
+
+    @override
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable[..., Any] | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        formatted_tools = [convert_to_openai_tool(tool) for tool in tools]
+        return self.bind(tools=formatted_tools, tool_choice=tool_choice, **kwargs)
+
+
+def _lookup(query: str, limit: int = 10) -> str:
+    """Look up records matching a query."""
+    return f"{limit} records for {query}"
+
+
+@pytest.mark.benchmark
+def test_agent_steps_with_many_tools(benchmark: BenchmarkFixture) -> None:
+    """Run 20 model steps of an agent with 40 tools."""
+    tools = [
+        StructuredTool.from_function(_lookup, name=f"lookup_{i}", description=f"Lookup {i}.")
+        for i in range(40)
+    ]
+    steps = [
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "lookup_0", "args": {"query": "x"}, "id": f"call_{i}"}],
+        )
+        for i in range(19)
+    ]
+    model = _ToolCallingFakeChatModel(messages=cycle([*steps, AIMessage(content="done")]))
+    agent = create_agent(model=model, tools=tools)
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        agent.invoke({"messages": [HumanMessage("hi")]})
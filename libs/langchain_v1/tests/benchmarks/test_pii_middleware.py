@@ -0,0 +1,54 @@
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.runtime import Runtime
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain.agents import AgentState
+from langchain.agents.middleware import PIIMiddleware, RedactionRule
+
+_TOOL_OUTPUT = "\n".join(
+    f"row {i}: status ok, latency {i % 97} ms, region us-east-{i % 3}" for i in range(200)
+)
+
+
+def _state() -> AgentState[Any]:
+    tool_calls = [{"name": "query", "args": {}, "id": f"call-{i}"} for i in range(5)]
+    return AgentState[Any](
+        messages=[
+            HumanMessage("Summarize the latest service health report", id="human"),
+            AIMessage("", tool_calls=tool_calls, id="ai"),
+            *(
+                ToolMessage(_TOOL_OUTPUT, tool_call_id=f"call-{i}", id=f"tool-{i}")
+                for i in range(5)
+            ),
+        ]
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("combined", [False, True])
+def test_pii_before_model_many_rules(benchmark: BenchmarkFixture, *, combined: bool) -> None:
+    """Scan tool results for five PII types on every model call."""
+    pii_types = ["email", "credit_card", "ip", "mac_address", "url"]
+    state = _state()
+    runtime = Runtime()
+
+    @benchmark  # type: ignore[untyped-decorator]
+    def run() -> None:
+        if combined:
+            middleware = [
+                PIIMiddleware(
+                    pii_types[0],
+                    additional_rules=[RedactionRule(pii_type) for pii_type in pii_types[1:]],
+                    apply_to_tool_results=True,
+                )
+            ]
+        else:
+            middleware = [
+                PIIMiddleware(pii_type, apply_to_tool_results=True) for pii_type in pii_types
+            ]
+        for _ in range(10):
+            for instance in middleware:
+                instance.before_model(state, runtime)
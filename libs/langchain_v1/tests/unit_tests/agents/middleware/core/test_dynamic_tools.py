@@ -5,15 +5,21 @@ that are not declared upfront when creating the agent.
 """
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
 import pytest
-from langchain_core.messages import HumanMessage, ToolCall, ToolMessage
-from langchain_core.tools import tool
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolCall, ToolMessage
+from langchain_core.outputs import ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool, tool
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
+from pydantic import Field
+from typing_extensions import override
 
 from langchain.agents.factory import create_agent
 from langchain.agents.middleware.types import (
@@ -419,3 +425,106 @@ async def test_dynamic_tool_chained_middleware(*, use_async: bool) -> None:
     # Verify middleware chain was called
     assert "first_model" in call_log
     assert "first_tool" in call_log
+
+
+class BindRecordingModel(FakeToolCallingModel):
+    """Model that records its tool bindings and the tools of every call."""
+
+    bindings: list[list[str]] = Field(default_factory=list)
+    called_with: list[list[str]] = Field(default_factory=list)
+
+    @override
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable[..., Any] | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        self.bindings.append([t.name for t in tools if isinstance(t, BaseTool)])
+        return super().bind_tools(tools, tool_choice=tool_choice, **kwargs)
+
+    @override
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.called_with.append([t["function"]["name"] for t in kwargs["tools"]])
+        return super()._generate(messages, stop, run_manager, **kwargs)
+
+
+class AlternatingDynamicToolMiddleware(DynamicToolMiddleware):
+    """Middleware that adds the dynamic tool to every other model call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def _override(self, request: ModelRequest) -> ModelRequest:
+        self.calls += 1
+        if self.calls % 2 == 0:
+            return request.override(tools=[*request.tools, dynamic_tool])
+        return request
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelCallResult:
+        return handler(self._override(request))
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelCallResult:
+        return await handler(self._override(request))
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_bound_tools_reused_across_steps(*, use_async: bool) -> None:
+    """Tools are bound once per tool set, not at every step of every run."""
+    model = BindRecordingModel(
+        tool_calls=[
+            [ToolCall(name="static_tool", args={"value": "a"}, id="1")],
+            [ToolCall(name="static_tool", args={"value": "b"}, id="2")],
+            [],
+        ]
+    )
+
+    agent = create_agent(
+        model=model,
+        tools=[static_tool],
+        middleware=[AlternatingDynamicToolMiddleware()],
+        checkpointer=InMemorySaver(),
+    )
+
+    await invoke_agent(agent, "first", use_async=use_async)
+    await invoke_agent(agent, "second", use_async=use_async)
+
+    assert model.bindings == [["static_tool"], ["static_tool", "dynamic_tool"]]
+    assert model.called_with == [["static_tool"], ["static_tool", "dynamic_tool"]] * 3
+
+
+async def test_bound_tools_rebound_when_model_settings_change() -> None:
+    """Changing the binding arguments binds the tools again."""
+    model = BindRecordingModel()
+    settings = [{"temperature": 0}, {"temperature": 0}, {"temperature": 1}]
+
+    class SettingsMiddleware(AgentMiddleware):
+        def wrap_model_call(
+            self,
+            request: ModelRequest,
+            handler: Callable[[ModelRequest], ModelResponse],
+        ) -> ModelCallResult:
+            return handler(request.override(model_settings=settings.pop(0)))
+
+    agent = create_agent(model=model, tools=[static_tool], middleware=[SettingsMiddleware()])
+    for _ in range(3):
+        agent.invoke({"messages": [HumanMessage("hi")]})
+
+    assert model.bindings == [["static_tool"], ["static_tool"]]
+    assert len(model.called_with) == 3
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, cast
 
+import pytest
 from langchain_core.language_models.fake_chat_models import FakeChatModel
 from langchain_core.messages import (
     AIMessage,
@@ -12,6 +13,7 @@ from langchain_core.messages import (
     MessageLikeRepresentation,
     ToolMessage,
 )
+from langchain_core.messages.utils import count_tokens_approximately
 from typing_extensions import override
 
 from langchain.agents.middleware.context_editing import (
@@ -578,3 +580,86 @@ async def test_custom_token_counter_forces_clearing_async() -> None:
     cleared_tool = modified_request.messages[1]
     assert isinstance(cleared_tool, ToolMessage)
     assert cleared_tool.content == "[cleared]"
+
+
+class _SummingTokenCountingChatModel(FakeChatModel):
+    """Fake chat model relying on the default per-message `get_num_tokens_from_messages`."""
+
+    counted_texts: list[str]
+
+    @override
+    def get_num_tokens(self, text: str) -> int:
+        self.counted_texts.append(text)
+        return len(text)
+
+
+def _long_tool_conversation(num_tools: int) -> list[AIMessage | ToolMessage]:
+    conversation: list[AIMessage | ToolMessage] = []
+    for i in range(num_tools):
+        call_id = f"call-{i}"
+        conversation.extend(
+            (
+                AIMessage(
+                    content="",
+                    tool_calls=[{"id": call_id, "name": "tool", "args": {"input": "x" * i}}],
+                ),
+                ToolMessage(content=f"output {i} " * (10 + i), tool_call_id=call_id),
+            )
+        )
+    return conversation
+
+
+def test_incremental_token_accounting_matches_recounting() -> None:
+    edit = ClearToolUsesEdit(trigger=100, clear_at_least=700, keep=2, clear_tool_inputs=True)
+    _state, request = _make_state_and_request(_long_tool_conversation(20))
+
+    edited: list[AnyMessage] = []
+
+    def mock_handler(req: ModelRequest) -> ModelResponse:
+        edited.extend(req.messages)
+        return ModelResponse(result=[AIMessage(content="mock response")])
+
+    ContextEditingMiddleware(edits=[edit]).wrap_model_call(request, mock_handler)
+
+    # A plain function counter recounts the whole transcript after every edit.
+    expected = list(request.messages)
+    edit.apply(expected, count_tokens=count_tokens_approximately)
+
+    assert edited == expected
+    cleared = [msg for msg in edited if isinstance(msg, ToolMessage) and msg.content == "[cleared]"]
+    assert 0 < len(cleared) < 18
+
+
+@pytest.mark.filterwarnings("ignore:Counting tokens in tool schemas")
+def test_model_token_counting_counts_each_message_once() -> None:
+    model = _SummingTokenCountingChatModel(counted_texts=[])
+    conversation: list[AnyMessage] = list(_long_tool_conversation(10))
+    request = ModelRequest(
+        model=model,
+        messages=conversation,
+        tool_choice=None,
+        tools=[],
+        response_format=None,
+        state=cast("AgentState[Any]", {"messages": conversation}),
+        runtime=_fake_runtime(),
+        model_settings={},
+    )
+    middleware = ContextEditingMiddleware(
+        edits=[ClearToolUsesEdit(trigger=100, clear_at_least=200, keep=0)],
+        token_count_method="model",  # noqa: S106
+    )
+
+    edited: list[AnyMessage] = []
+
+    def mock_handler(req: ModelRequest) -> ModelResponse:
+        edited.extend(req.messages)
+        return ModelResponse(result=[AIMessage(content="mock response")])
+
+    middleware.wrap_model_call(request, mock_handler)
+
+    num_cleared = sum(
+        1 for msg in edited if isinstance(msg, ToolMessage) and msg.content == "[cleared]"
+    )
+    assert num_cleared == 3
+    # One count of the transcript, then the old and new version of each cleared message.
+    assert len(model.counted_texts) == len(conversation) + 2 * num_cleared
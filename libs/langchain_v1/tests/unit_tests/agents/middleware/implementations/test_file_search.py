@@ -601,3 +601,196 @@ class TestGrepEdgeCases:
 
         # Large file should be skipped
         assert "/small.txt" in result
+
+
+def _make_tree(root: Path) -> None:
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "docs").mkdir()
+    (root / "README.md").write_text("# Project\nhello world\n", encoding="utf-8")
+    (root / "src" / "main.py").write_text(
+        "import os\n\ndef hello():\n    return 'hello(world)'\n", encoding="utf-8"
+    )
+    (root / "src" / "pkg" / "util.py").write_text(
+        "def helper(x):\n    return x + 1\nclass Hello:\n    pass\n", encoding="utf-8"
+    )
+    (root / "src" / "pkg" / "types.pyi").write_text(
+        "def helper(x: int) -> int: ...\n", encoding="utf-8"
+    )
+    (root / "docs" / ".hidden.md").write_text("hello again\n", encoding="utf-8")
+    (root / "docs" / "binary.bin").write_bytes(b"\xff\xfe hello \x00")
+
+
+class TestIndexedFileSearch:
+    """Tests for searches backed by the in-process file index."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "path", "include"),
+        [
+            ("hello", "/", None),
+            ("hel+o", "/", None),
+            ("hello\\(world\\)", "/", None),
+            ("def [a-z]+\\(", "/", None),
+            ("^import os$", "/", None),
+            ("helper|Hello", "/", None),
+            ("(?i)HELLO", "/", None),
+            ("x", "/src", "*.{py,pyi}"),
+            ("hello", "/docs", None),
+            ("hello", "/missing", None),
+            ("nothing matches this", "/", None),
+        ],
+    )
+    @pytest.mark.parametrize("output_mode", ["files_with_matches", "content", "count"])
+    def test_grep_matches_python_fallback(
+        self,
+        tmp_path: Path,
+        pattern: str,
+        path: str,
+        include: str | None,
+        output_mode: Any,
+    ) -> None:
+        _make_tree(tmp_path)
+        fallback = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_ripgrep=False)
+        indexed = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_index=True)
+
+        expected = fallback.grep_search.invoke(
+            {"pattern": pattern, "path": path, "include": include, "output_mode": output_mode}
+        )
+        for _ in range(2):
+            result = indexed.grep_search.invoke(
+                {"pattern": pattern, "path": path, "include": include, "output_mode": output_mode}
+            )
+            assert result == expected
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"[0-9]{1,3}\.[0-9]{1,3}",
+            "a{3,5}",
+            "ba{2}c",
+            "b{,2}aaa",
+            r"\x41BC",
+            r"\u0041BC",
+            r"\U00000041BC",
+            r"\N{LATIN CAPITAL LETTER A}BC",
+            r"\101BC",
+            r"(A)\1BC",
+            r"\tTAB",
+            "x{y}z",
+        ],
+    )
+    def test_grep_quantifiers_and_escapes_match_unindexed(
+        self, tmp_path: Path, pattern: str
+    ) -> None:
+        (tmp_path / "hosts.txt").write_text("addr 10.0.0.1\n", encoding="utf-8")
+        (tmp_path / "letters.txt").write_text("aaaaa\nbaac\nABC\nAABC\n", encoding="utf-8")
+        (tmp_path / "other.txt").write_text("\tTAB x{y}z\n", encoding="utf-8")
+        unindexed = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_ripgrep=False)
+        indexed = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_index=True)
+
+        for output_mode in ("files_with_matches", "content"):
+            args = {"pattern": pattern, "output_mode": output_mode}
+            expected = unindexed.grep_search.invoke(args)
+            assert expected != "No matches found"
+            assert indexed.grep_search.invoke(args) == expected
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["café", "naïve", "日本語", "日本人", "☕ cup", "x😀😁", "😀😁y", "a😀b", "a😁b", "ab"],
+    )
+    def test_grep_non_latin_1_matches_unindexed(self, tmp_path: Path, pattern: str) -> None:
+        (tmp_path / "latin.txt").write_text("naïve café\nab\n", encoding="utf-8")
+        (tmp_path / "cjk.txt").write_text("日本語 ☕ cup\n", encoding="utf-8")
+        (tmp_path / "emoji.txt").write_text("x😀😁y\na😀b\n", encoding="utf-8")
+        unindexed = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_ripgrep=False)
+        indexed = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_index=True)
+
+        for output_mode in ("files_with_matches", "content"):
+            args = {"pattern": pattern, "output_mode": output_mode}
+            assert indexed.grep_search.invoke(args) == unindexed.grep_search.invoke(args)
+
+    @pytest.mark.parametrize(
+        ("pattern", "path"),
+        [
+            ("*.md", "/"),
+            ("**/*.py", "/"),
+            ("**/*", "/"),
+            ("src/**/*.py", "/"),
+            ("*/*.py", "/"),
+            ("*.py", "/src"),
+            ("pkg/*.py?", "/src"),
+            ("**/.hidden.md", "/"),
+            ("*.rs", "/"),
+        ],
+    )
+    def test_glob_matches_pathlib(self, tmp_path: Path, pattern: str, path: str) -> None:
+        _make_tree(tmp_path)
+        unindexed = FilesystemFileSearchMiddleware(root_path=str(tmp_path))
+        indexed = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_index=True)
+
+        expected = unindexed.glob_search.invoke({"pattern": pattern, "path": path})
+        result = indexed.glob_search.invoke({"pattern": pattern, "path": path})
+
+        assert set(result.split("\n")) == set(expected.split("\n"))
+
+    def test_index_refreshes_changed_files_only(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _make_tree(tmp_path)
+        middleware = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_index=True)
+        read: list[str] = []
+        original_read_text = Path.read_text
+
+        def read_text(self: Path, *args: Any, **kwargs: Any) -> str:
+            read.append(self.name)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", read_text)
+
+        assert middleware.grep_search.invoke({"pattern": "helper"}) == (
+            "/src/pkg/types.pyi\n/src/pkg/util.py"
+        )
+        # Every file is indexed, then only the files with the literal are searched.
+        assert sorted(read) == [
+            ".hidden.md",
+            "README.md",
+            "binary.bin",
+            "main.py",
+            "types.pyi",
+            "types.pyi",
+            "util.py",
+            "util.py",
+        ]
+
+        read.clear()
+        (tmp_path / "src" / "main.py").write_text("helper()\n", encoding="utf-8")
+        os.utime(tmp_path / "src" / "main.py", ns=(0, 0))
+        (tmp_path / "src" / "pkg" / "types.pyi").unlink()
+        (tmp_path / "new.py").write_text("no match\n", encoding="utf-8")
+
+        assert middleware.grep_search.invoke({"pattern": "helper"}) == (
+            "/src/main.py\n/src/pkg/util.py"
+        )
+        assert sorted(read) == ["main.py", "main.py", "new.py", "util.py"]
+        assert middleware.glob_search.invoke({"pattern": "**/*.py"}).split("\n")[-1] == (
+            "/src/main.py"
+        )
+
+    def test_index_skips_large_files_and_symlinks_outside_root(self, tmp_path: Path) -> None:
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "large.txt").write_text("x" * (2 * 1024 * 1024), encoding="utf-8")
+        (root / "small.txt").write_text("x", encoding="utf-8")
+        outside = tmp_path / "outside.txt"
+        outside.write_text("x TOPSECRET\n", encoding="utf-8")
+        try:
+            (root / "link.txt").symlink_to(outside)
+        except OSError:
+            pytest.skip("Symlink creation not supported")
+
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(root), use_index=True, max_file_size_mb=1
+        )
+
+        assert middleware.grep_search.invoke({"pattern": "x"}) == "/small.txt"
+        assert middleware.grep_search.invoke({"pattern": "TOPSECRET"}) == "No matches found"
+        assert "/link.txt" not in middleware.glob_search.invoke({"pattern": "*"})
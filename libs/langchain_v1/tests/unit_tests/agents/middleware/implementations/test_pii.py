@@ -28,7 +28,7 @@ from langchain.agents import AgentState
 from langchain.agents import middleware as middleware_package
 from langchain.agents.factory import create_agent
 from langchain.agents.middleware import PIIMatch as PublicPIIMatch
-from langchain.agents.middleware._redaction import RedactionRule
+from langchain.agents.middleware._redaction import RedactionEngine, RedactionRule
 from langchain.agents.middleware.pii import (
     PIIDetectionError,
     PIIMatch,
@@ -736,6 +736,139 @@ class TestMultipleMiddleware:
         assert "test@example.com" not in content
         assert "10.0.0.1" not in content
 
+    def test_additional_rules_match_stacked_middleware(self) -> None:
+        middleware = PIIMiddleware(
+            "email",
+            additional_rules=[
+                RedactionRule("ip", strategy="mask"),
+                RedactionRule("api_key", detector=r"sk-[a-z0-9]{8}", strategy="hash"),
+            ],
+        )
+        stacked = [
+            PIIMiddleware("email"),
+            PIIMiddleware("ip", strategy="mask"),
+            PIIMiddleware("api_key", detector=r"sk-[a-z0-9]{8}", strategy="hash"),
+        ]
+        message = HumanMessage("Email: test@example.com, IP: 192.168.1.1, key sk-abcd1234")
+
+        result = middleware.before_model(AgentState[Any](messages=[message]), Runtime())
+        expected: list[Any] = [message]
+        for stacked_middleware in stacked:
+            stacked_result = stacked_middleware.before_model(
+                AgentState[Any](messages=expected), Runtime()
+            )
+            assert stacked_result is not None
+            expected = stacked_result["messages"]
+
+        assert result is not None
+        assert result["messages"][0].content == expected[0].content
+        assert middleware.name == "PIIMiddleware[email,ip,api_key]"
+
+    def test_additional_rule_block_strategy(self) -> None:
+        middleware = PIIMiddleware(
+            "email", additional_rules=[RedactionRule("ip", strategy="block")]
+        )
+        state = AgentState[Any](messages=[HumanMessage("Email: test@example.com, IP: 10.0.0.1")])
+
+        with pytest.raises(PIIDetectionError) as exc_info:
+            middleware.before_model(state, Runtime())
+
+        assert exc_info.value.pii_type == "ip"
+
+    def test_clean_messages_are_not_rescanned(self) -> None:
+        scanned: list[str] = []
+
+        def detect_secret(content: str) -> list[PIIMatch]:
+            scanned.append(content)
+            return [
+                PIIMatch(type="secret", value=m.group(), start=m.start(), end=m.end())
+                for m in re.finditer(r"secret-\d+", content)
+            ]
+
+        middleware = PIIMiddleware("secret", detector=detect_secret)
+        clean = HumanMessage("nothing to see here", id="human-1")
+        state = AgentState[Any](messages=[clean])
+
+        assert middleware.before_model(state, Runtime()) is None
+        assert middleware.before_model(state, Runtime()) is None
+        assert scanned == ["nothing to see here"]
+
+        # The same id with new content is scanned again.
+        changed = HumanMessage("my secret-42", id="human-1")
+        result = middleware.before_model(AgentState[Any](messages=[changed]), Runtime())
+        assert result is not None
+        assert result["messages"][0].content == "my [REDACTED_SECRET]"
+        assert scanned == ["nothing to see here", "my secret-42"]
+
+        # Messages with matches are not remembered.
+        middleware.before_model(AgentState[Any](messages=[changed]), Runtime())
+        assert scanned == ["nothing to see here", "my secret-42", "my secret-42"]
+
+        # Messages without ids are always scanned.
+        anonymous = AgentState[Any](messages=[HumanMessage("nothing to see here")])
+        assert middleware.before_model(anonymous, Runtime()) is None
+        assert len(scanned) == 4
+
+    def test_rule_stats(self) -> None:
+        middleware = PIIMiddleware(
+            "email",
+            additional_rules=[RedactionRule("url"), RedactionRule("number", detector=r"\d+")],
+            apply_to_output=True,
+        )
+        state = AgentState[Any](messages=[AIMessage("Reach me at test@example.com")])
+
+        result = middleware.after_model(state, Runtime())
+
+        assert result is not None
+        stats = {rule_stats.pii_type: rule_stats for rule_stats in middleware.rule_stats}
+        assert (stats["email"].scanned, stats["email"].matches) == (1, 1)
+        # No `/` or `www.` in the content, so the URL detector never runs.
+        assert (stats["url"].scanned, stats["url"].skipped) == (0, 1)
+        assert (stats["number"].scanned, stats["number"].matches) == (1, 0)
+        assert stats["email"].seconds > 0
+
+
+class TestRedactionEngine:
+    """Test applying several rules at once."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "",
+            "plain text without anything interesting",
+            "Email test@example.com and card 4532-0151-1283-0366",
+            "Server 192.168.1.1 at 00:1A:2B:3C:4D:5E, see https://example.com/a?b=1",
+            "Visit www.example.com or example.com/path, not example.com",
+            "Mixed: a@b.co 10.0.0.1 aa-bb-cc-dd-ee-ff http://localhost sk-abcd1234",
+            "Digits ٤٥٣٢٠١٥١١٢٨٣٠٣٦٦ and 4532 0151 1283 0366",
+        ],
+    )
+    @pytest.mark.parametrize("strategy", ["redact", "mask", "hash"])
+    def test_matches_sequential_rules(self, content: str, strategy: str) -> None:
+        rules = [
+            RedactionRule(pii_type, strategy=strategy).resolve()  # type: ignore[arg-type]
+            for pii_type in ("email", "credit_card", "ip", "mac_address", "url")
+        ]
+        rules.append(RedactionRule("api_key", detector=r"sk-[a-z0-9]{8}").resolve())
+
+        expected = content
+        expected_matches: dict[str, list[PIIMatch]] = {}
+        for rule in rules:
+            expected, matches = rule.apply(expected)
+            if matches:
+                expected_matches[rule.pii_type] = matches
+
+        assert RedactionEngine(rules).apply(content) == (expected, expected_matches)
+
+    def test_stream_transformer_applies_all_rules(self) -> None:
+        engine = RedactionEngine([RedactionRule("email").resolve(), RedactionRule("ip").resolve()])
+        transformer = _PIIStreamTransformer(rule=engine)
+
+        redacted = transformer._redact_value({"text": "test@example.com from 10.0.0.1"})
+
+        assert redacted == {"text": "[REDACTED_EMAIL] from [REDACTED_IP]"}
+        assert [stats.scanned for stats in engine.stats] == [1, 1]
+
 
 # ============================================================================
 # Stream Transformer Tests
@@ -1,6 +1,7 @@
 from collections.abc import Iterable
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 from unittest.mock import patch
 
 import pytest
@@ -2343,6 +2344,85 @@ async def test_create_summary_passes_lc_source_metadata(use_async: bool) -> None
     )
 
 
+def _long_transcript(num_turns: int) -> list[AnyMessage]:
+    messages: list[AnyMessage] = []
+    for i in range(num_turns):
+        messages.append(HumanMessage(content=f"question {i} " * (i % 7 + 1), id=f"h{i}"))
+        messages.append(
+            AIMessage(
+                content="",
+                id=f"a{i}",
+                tool_calls=[{"name": "search", "args": {"q": str(i)}, "id": f"c{i}"}],
+                response_metadata={"model_provider": "openai"},
+                usage_metadata={
+                    "input_tokens": 20 * i,
+                    "output_tokens": 5,
+                    "total_tokens": 20 * i + 5,
+                },
+            )
+        )
+        messages.append(
+            ToolMessage(content="result " * (i % 5 + 1), tool_call_id=f"c{i}", id=f"t{i}")
+        )
+    return messages
+
+
+@pytest.mark.parametrize("keep", [("tokens", 300), ("fraction", 0.4)])
+def test_summarization_middleware_cached_token_counts_match_token_counter(
+    keep: ContextSize,
+) -> None:
+    """Cached prefix sums give the same totals and cutoffs as recounting."""
+    middleware = SummarizationMiddleware(
+        model=ProfileChatModel(), trigger=("tokens", 100), keep=keep
+    )
+    recounting = SummarizationMiddleware(
+        model=ProfileChatModel(), trigger=("tokens", 100), keep=keep
+    )
+    # Wrapping the default counters disables the cache.
+    recounting.token_counter = partial(recounting.token_counter)
+    recounting._partial_token_counter = partial(recounting._partial_token_counter)
+
+    messages = _long_transcript(40)
+    for end in range(1, len(messages) + 1):
+        prefix = messages[:end]
+        assert middleware._count_tokens(prefix) == recounting.token_counter(prefix)
+        assert middleware._find_token_based_cutoff(prefix) == recounting._find_token_based_cutoff(
+            prefix
+        )
+
+    # Mixed providers disable usage-metadata scaling.
+    mixed = [*messages, AIMessage(content="hi", response_metadata={"model_provider": "x"})]
+    assert middleware._count_tokens(mixed) == recounting.token_counter(mixed)
+
+
+def test_summarization_middleware_counts_each_message_once() -> None:
+    """Only new or replaced messages are counted on later model calls."""
+    middleware = SummarizationMiddleware(
+        model=ProfileChatModel(), trigger=("tokens", 100_000), keep=("tokens", 50)
+    )
+    token_counts = middleware._approximate_token_counts
+    assert token_counts is not None
+    counted: list[str | None] = []
+
+    def count_messages(messages: Iterable[MessageLikeRepresentation]) -> int:
+        message_list = list(messages)
+        counted.extend(cast("BaseMessage", message).id for message in message_list)
+        return count_tokens_approximately(message_list)
+
+    token_counts._count_messages = count_messages
+
+    messages = _long_transcript(20)
+    middleware._count_tokens(messages)
+    middleware._find_token_based_cutoff(messages)
+    assert len(counted) == len(messages)
+
+    counted.clear()
+    messages.append(HumanMessage(content="follow up", id="new"))
+    messages[0] = HumanMessage(content="edited", id=messages[0].id)
+    middleware._count_tokens(messages)
+    assert sorted(counted, key=str) == ["h0", "new"]
+
+
 class TestSummarizationStreamingEndToEnd:
     """End-to-end: a real summarization call must not leak into `run.messages`."""
 
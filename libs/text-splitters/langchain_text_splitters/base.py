@@ -5,6 +5,7 @@ from __future__ import annotations
 import copy
 import logging
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
@@ -167,17 +168,26 @@ class TextSplitter(BaseDocumentTransformer, ABC):
     def _merge_splits(self, splits: Iterable[str], separator: str) -> list[str]:
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
+        splits = list(splits)
+        return self._merge_measured_splits(
+            zip(splits, map(self._length_function, splits), strict=True), separator
+        )
+
+    def _merge_measured_splits(
+        self, splits: Iterable[tuple[str, int]], separator: str
+    ) -> list[str]:
+        """Merge `(piece, length)` pairs into chunks.
+
+        Lengths are measured by the caller, so each piece is measured exactly once
+        no matter how many chunks it overlaps into.
+        """
         separator_len = self._length_function(separator)
 
         docs = []
-        current_doc: list[str] = []
+        current_doc: deque[tuple[str, int]] = deque()
         total = 0
-        for d in splits:
-            len_ = self._length_function(d)
-            if (
-                total + len_ + (separator_len if len(current_doc) > 0 else 0)
-                > self._chunk_size
-            ):
+        for d, len_ in splits:
+            if total + len_ + (separator_len if current_doc else 0) > self._chunk_size:
                 if total > self._chunk_size:
                     logger.warning(
                         "Created a chunk of size %d, which is longer than the "
@@ -185,25 +195,25 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         total,
                         self._chunk_size,
                     )
-                if len(current_doc) > 0:
-                    doc = self._join_docs(current_doc, separator)
+                if current_doc:
+                    doc = self._join_docs(
+                        [piece for piece, _ in current_doc], separator
+                    )
                     if doc is not None:
                         docs.append(doc)
                     # Keep on popping if:
                     # - we have a larger chunk than in the chunk overlap
                     # - or if we still have any chunks and the length is long
                     while total > self._chunk_overlap or (
-                        total + len_ + (separator_len if len(current_doc) > 0 else 0)
+                        total + len_ + (separator_len if current_doc else 0)
                         > self._chunk_size
                         and total > 0
                     ):
-                        total -= self._length_function(current_doc[0]) + (
-                            separator_len if len(current_doc) > 1 else 0
-                        )
-                        current_doc = current_doc[1:]
-            current_doc.append(d)
+                        _, popped_len = current_doc.popleft()
+                        total -= popped_len + (separator_len if current_doc else 0)
+            current_doc.append((d, len_))
             total += len_ + (separator_len if len(current_doc) > 1 else 0)
-        doc = self._join_docs(current_doc, separator)
+        doc = self._join_docs([piece for piece, _ in current_doc], separator)
         if doc is not None:
             docs.append(doc)
         return docs
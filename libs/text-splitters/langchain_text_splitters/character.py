@@ -132,11 +132,12 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         good_splits = []
         separator_ = "" if self._keep_separator else separator
         for s in splits:
-            if self._length_function(s) < self._chunk_size:
-                good_splits.append(s)
+            length = self._length_function(s)
+            if length < self._chunk_size:
+                good_splits.append((s, length))
             else:
                 if good_splits:
-                    merged_text = self._merge_splits(good_splits, separator_)
+                    merged_text = self._merge_good_splits(good_splits, separator_)
                     final_chunks.extend(merged_text)
                     good_splits = []
                 if not new_separators:
@@ -145,10 +146,18 @@ class RecursiveCharacterTextSplitter(TextSplitter):
                     other_info = self._split_text(s, new_separators)
                     final_chunks.extend(other_info)
         if good_splits:
-            merged_text = self._merge_splits(good_splits, separator_)
+            merged_text = self._merge_good_splits(good_splits, separator_)
             final_chunks.extend(merged_text)
         return final_chunks
 
+    def _merge_good_splits(
+        self, splits: list[tuple[str, int]], separator: str
+    ) -> list[str]:
+        """Merge measured splits, going through `_merge_splits` if it is overridden."""
+        if type(self)._merge_splits is not TextSplitter._merge_splits:  # noqa: SLF001
+            return self._merge_splits([piece for piece, _ in splits], separator)
+        return self._merge_measured_splits(splits, separator)
+
     @override
     def split_text(self, text: str) -> list[str]:
         """Split the input text into smaller chunks based on predefined separators.
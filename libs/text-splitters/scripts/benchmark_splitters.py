@@ -0,0 +1,113 @@
+"""Measure text splitter throughput in MB/s on a synthetic multi-MB corpus.
+
+Usage:
+
+    make benchmark
+    uv run python scripts/benchmark_splitters.py --size-mb 4 --rounds 3
+
+Token-based splitters need `tiktoken` and its encoding files; they are skipped with
+a note if either is unavailable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from langchain_text_splitters import (
+    CharacterTextSplitter,
+    RecursiveCharacterTextSplitter,
+    TokenTextSplitter,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langchain_text_splitters.base import TextSplitter
+
+_VOCABULARY = """
+the quick brown fox jumps over lazy dog language model retrieval augmented
+generation vector store embedding chunk overlap separator paragraph sentence
+document token budget context window summary agent tool call result
+"""
+
+
+def make_corpus(size_bytes: int, seed: int = 0) -> str:
+    """Build a deterministic corpus of paragraphs, lines and sentences."""
+    rng = random.Random(seed)
+    words = _VOCABULARY.split()
+    paragraphs: list[str] = []
+    size = 0
+    while size < size_bytes:
+        lines = []
+        for _ in range(rng.randint(1, 6)):
+            sentences = [
+                " ".join(rng.choices(words, k=rng.randint(4, 24))).capitalize() + "."
+                for _ in range(rng.randint(1, 5))
+            ]
+            lines.append(" ".join(sentences))
+        paragraph = "\n".join(lines)
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
+def _splitters() -> dict[str, Callable[[], TextSplitter]]:
+    return {
+        "character": lambda: CharacterTextSplitter(
+            separator="\n\n", chunk_size=1000, chunk_overlap=200
+        ),
+        "recursive": lambda: RecursiveCharacterTextSplitter(
+            chunk_size=1000, chunk_overlap=200
+        ),
+        # A pure Python length function, to show the cost of measuring pieces
+        # without needing tokenizer files.
+        "recursive (word count)": lambda: RecursiveCharacterTextSplitter(
+            chunk_size=200, chunk_overlap=40, length_function=_word_count
+        ),
+        "recursive (tiktoken)": lambda: (
+            RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                chunk_size=256, chunk_overlap=64
+            )
+        ),
+        "token (tiktoken)": lambda: TokenTextSplitter(chunk_size=256, chunk_overlap=64),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    # Oversized-chunk warnings are expected for the character splitter.
+    logging.getLogger("langchain_text_splitters").setLevel(logging.ERROR)
+
+    corpus = make_corpus(int(args.size_mb * 1_000_000))
+    size_mb = len(corpus.encode()) / 1_000_000
+    print(f"corpus: {size_mb:.2f} MB, best of {args.rounds} rounds")  # noqa: T201
+    print(f"{'splitter':<24} {'MB/s':>8} {'chunks':>8}")  # noqa: T201
+    for name, make_splitter in _splitters().items():
+        try:
+            splitter = make_splitter()
+            splitter.split_text(corpus[:1000])
+        except Exception as err:  # noqa: BLE001
+            print(f"{name:<24} skipped: {type(err).__name__}")  # noqa: T201
+            continue
+        best = float("inf")
+        chunks: list[str] = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            chunks = splitter.split_text(corpus)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<24} {size_mb / best:>8.2f} {len(chunks):>8}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,7 @@ from langchain_text_splitters.markdown import (
 from langchain_text_splitters.python import PythonCodeTextSplitter
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from bs4 import Tag
 
@@ -417,6 +417,45 @@ def test_merge_splits() -> None:
     assert output == expected_output
 
 
+def test_recursive_splitter_uses_overridden_merge_splits() -> None:
+    """Subclasses that override `_merge_splits` still have it called."""
+
+    class UpperMergeSplitter(RecursiveCharacterTextSplitter):
+        def _merge_splits(self, splits: Iterable[str], separator: str) -> list[str]:
+            return [chunk.upper() for chunk in super()._merge_splits(splits, separator)]
+
+    text = "foo bar baz qux"
+    expected = RecursiveCharacterTextSplitter(chunk_size=7, chunk_overlap=0).split_text(
+        text
+    )
+    splitter = UpperMergeSplitter(chunk_size=7, chunk_overlap=0)
+    assert splitter.split_text(text) == [chunk.upper() for chunk in expected]
+
+
+@pytest.mark.parametrize(
+    "splitter_cls", [CharacterTextSplitter, RecursiveCharacterTextSplitter]
+)
+def test_length_function_called_once_per_piece(
+    splitter_cls: type[CharacterTextSplitter | RecursiveCharacterTextSplitter],
+) -> None:
+    """Pieces are measured once, even when they overlap into several chunks."""
+    measured: list[str] = []
+
+    def length_function(text: str) -> int:
+        measured.append(text)
+        return len(text)
+
+    words = [f"word{i}" for i in range(50)]
+    splitter = splitter_cls(
+        chunk_size=30, chunk_overlap=20, length_function=length_function
+    )
+    chunks = splitter.split_text("\n\n".join(words))
+
+    assert len(chunks) > 10
+    pieces = [piece.strip() for piece in measured if piece.strip()]
+    assert sorted(pieces) == sorted(words)
+
+
 def test_create_documents() -> None:
     """Test create documents method."""
     texts = ["foo bar", "baz"]